@@ -15,7 +15,12 @@ from app.core.config import settings
 from app.models.base import Base
 
 # Importar todos los modelos para que estén disponibles para las migraciones
-import app.models  # Esto carga todos los modelos
+from app.models import load_all_models
+
+load_all_models()  # app.models es perezoso; esto carga todos los dominios
+
+# Operaciones personalizadas (op.create_monthly_partitions, ...)
+import app.database.migration_ops  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
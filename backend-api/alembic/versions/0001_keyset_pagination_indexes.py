@@ -0,0 +1,43 @@
+"""keyset pagination indexes on (created_at, id)
+
+Revision ID: 0001_keyset_indexes
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_keyset_indexes'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYSET_TABLES = ("audit_logs", "notifications", "tasks", "analytics_events")
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; tables stay writable meanwhile
+    with op.get_context().autocommit_block():
+        for table in KEYSET_TABLES:
+            op.create_index(
+                f"ix_{table}_created_at_id",
+                table,
+                ["created_at", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in KEYSET_TABLES:
+            op.drop_index(
+                f"ix_{table}_created_at_id",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
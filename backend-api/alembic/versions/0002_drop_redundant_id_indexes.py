@@ -0,0 +1,80 @@
+"""drop redundant ix_<table>_id indexes duplicating the primary key
+
+BaseModel.id was declared primary_key=True *and* index=True, so every table
+carries a second B-tree on id next to its <table>_pkey. Only the PK index is
+kept. The switch to time-ordered UUIDv7 ids on append-heavy tables is an
+application-side default and needs no schema change: uuid4 and uuid7 values
+share the same UUID column type and coexist in one index.
+
+Revision ID: 0002_drop_id_indexes
+Revises: 0001_keyset_indexes
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_drop_id_indexes'
+down_revision: Union[str, None] = '0001_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Non-unique single-column indexes on "id" in tables whose primary key is "id"
+REDUNDANT_ID_INDEXES_SQL = sa.text("""
+    SELECT t.relname AS table_name, i.relname AS index_name
+    FROM pg_index x
+    JOIN pg_class i ON i.oid = x.indexrelid
+    JOIN pg_class t ON t.oid = x.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = x.indkey[0]
+    WHERE n.nspname = current_schema()
+      AND NOT x.indisprimary
+      AND NOT x.indisunique
+      AND x.indnatts = 1
+      AND a.attname = 'id'
+      AND i.relname = 'ix_' || t.relname || '_id'
+""")
+
+PK_ON_ID_TABLES_SQL = sa.text("""
+    SELECT t.relname AS table_name
+    FROM pg_index x
+    JOIN pg_class t ON t.oid = x.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = x.indkey[0]
+    WHERE n.nspname = current_schema()
+      AND x.indisprimary
+      AND x.indnatts = 1
+      AND a.attname = 'id'
+""")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    redundant = bind.execute(REDUNDANT_ID_INDEXES_SQL).all()
+    # DROP INDEX CONCURRENTLY avoids an ACCESS EXCLUSIVE lock on hot tables
+    with op.get_context().autocommit_block():
+        for table_name, index_name in redundant:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = [row.table_name for row in bind.execute(PK_ON_ID_TABLES_SQL)]
+    with op.get_context().autocommit_block():
+        for table_name in tables:
+            op.create_index(
+                f"ix_{table_name}_id",
+                table_name,
+                ["id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
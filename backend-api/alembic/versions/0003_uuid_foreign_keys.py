@@ -0,0 +1,370 @@
+"""convert Integer / String(36) foreign keys to native UUID, online
+
+Every primary key is UUID(as_uuid=True) but foreign keys were declared as
+Integer or String(36). Each non-uuid FK column is converted without a long
+ACCESS EXCLUSIVE lock:
+
+1. add a nullable <column>__uuid shadow column (metadata-only)
+2. a trigger keeps the shadow in sync for rows written from now on
+3. existing rows are backfilled in primary-key batches, one commit each
+4. indexes and the FK constraint (NOT VALID) are built on the shadow
+   column CONCURRENTLY
+5. a short transaction drops the old column and renames shadow, indexes
+   and constraint into place
+6. the FK and NOT NULL are validated without blocking writes
+
+String values that are not UUIDs become NULL. Integer columns can never
+have referenced a UUID key, so they are only converted while empty; the
+migration stops if one holds data.
+
+Revision ID: 0003_uuid_foreign_keys
+Revises: 0002_drop_id_indexes
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+import hashlib
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_uuid_foreign_keys'
+down_revision: Union[str, None] = '0002_drop_id_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 5000
+LOCK_TIMEOUT = "5s"
+UUID_PATTERN = "^[0-9a-fA-F]{8}-?([0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}$"
+
+# (table, column, referenced table) as declared by the models at this revision
+FK_COLUMNS = (
+    ("analytics_events", "user_id", "users"),
+    ("audit_alerts", "audit_log_type_id", "audit_log_types"),
+    ("audit_logs", "user_id", "users"),
+    ("audit_retention_policies", "audit_log_type_id", "audit_log_types"),
+    ("audit_statistics", "most_active_user_id", "users"),
+    ("calendar_events", "event_type_id", "event_types"),
+    ("calendar_events", "created_by_user_id", "users"),
+    ("calendar_subscriptions", "user_id", "users"),
+    ("calendar_views", "user_id", "users"),
+    ("careers", "faculty_id", "faculties"),
+    ("classes", "course_id", "courses"),
+    ("classes", "career_id", "careers"),
+    ("classes", "instructor_id", "users"),
+    ("comment_reactions", "comment_id", "comments"),
+    ("comment_reactions", "user_id", "users"),
+    ("comment_read_status", "comment_id", "comments"),
+    ("comment_read_status", "user_id", "users"),
+    ("comment_templates", "created_by_id", "users"),
+    ("comments", "parent_comment_id", "comments"),
+    ("comments", "user_id", "users"),
+    ("configuration_histories", "configuration_id", "configurations"),
+    ("configuration_histories", "changed_by_user_id", "users"),
+    ("configuration_histories", "approved_by_user_id", "users"),
+    ("course_classes_drafts", "user_id", "users"),
+    ("course_classes_drafts", "request_id", "requests"),
+    ("courses", "project_id", "projects"),
+    ("courses", "instructor_id", "users"),
+    ("custom_dashboards", "user_id", "users"),
+    ("dashboard_widgets", "dashboard_id", "custom_dashboards"),
+    ("deliverables", "task_id", "tasks"),
+    ("deliverables", "deliverable_type_id", "deliverable_types"),
+    ("deliverables", "deliverable_status_id", "status_options"),
+    ("equipments", "inventory_item_id", "inventory_items"),
+    ("event_attendees", "event_id", "calendar_events"),
+    ("event_attendees", "user_id", "users"),
+    ("event_resources", "event_id", "calendar_events"),
+    ("generated_reports", "template_id", "report_templates"),
+    ("generated_reports", "generated_by_user_id", "users"),
+    ("inventory_items", "category_id", "inventory_categories"),
+    ("inventory_items", "assigned_to_id", "users"),
+    ("inventory_movements", "item_id", "inventory_items"),
+    ("inventory_movements", "user_id", "users"),
+    ("inventory_movements", "assigned_to_id", "users"),
+    ("inventory_movements", "processed_by_id", "users"),
+    ("inventory_reservations", "item_id", "inventory_items"),
+    ("inventory_reservations", "reserved_by_id", "users"),
+    ("inventory_reservations", "approved_by_id", "users"),
+    ("kpi_values", "kpi_definition_id", "kpi_definitions"),
+    ("maintenance_records", "item_id", "inventory_items"),
+    ("maintenance_records", "performed_by_id", "users"),
+    ("notification_batches", "template_id", "notification_templates"),
+    ("notification_batches", "channel_id", "notification_channels"),
+    ("notification_batches", "created_by_id", "users"),
+    ("notification_logs", "notification_id", "notifications"),
+    ("notification_logs", "batch_id", "notification_batches"),
+    ("notification_logs", "recipient_id", "users"),
+    ("notification_schedules", "template_id", "notification_templates"),
+    ("notification_schedules", "channel_id", "notification_channels"),
+    ("notification_schedules", "created_by_id", "users"),
+    ("notification_templates", "notification_type_id", "notification_types"),
+    ("notification_templates", "channel_id", "notification_channels"),
+    ("notification_type_channels", "notification_type_id", "notification_types"),
+    ("notification_type_channels", "channel_id", "notification_channels"),
+    ("notifications", "user_id", "users"),
+    ("notifications", "notification_type_id", "notification_types"),
+    ("notifications", "channel_id", "notification_channels"),
+    ("podcast_episodes", "podcast_id", "podcasts"),
+    ("podcast_episodes_drafts", "user_id", "users"),
+    ("podcast_episodes_drafts", "request_id", "requests"),
+    ("podcasts", "project_id", "projects"),
+    ("podcasts", "host_id", "users"),
+    ("podcasts", "producer_id", "users"),
+    ("professor_units", "professor_id", "professors"),
+    ("professor_units", "unit_id", "units"),
+    ("project_documents", "project_id", "projects"),
+    ("project_documents", "uploaded_by_id", "users"),
+    ("project_members", "project_id", "projects"),
+    ("project_members", "user_id", "users"),
+    ("project_resources", "project_id", "projects"),
+    ("project_resources", "inventory_item_id", "inventory_items"),
+    ("project_templates", "service_type_id", "service_types"),
+    ("project_units", "project_id", "projects"),
+    ("project_units", "unit_id", "units"),
+    ("projects", "project_type_id", "project_types"),
+    ("projects", "manager_id", "users"),
+    ("quick_filters", "created_by_id", "users"),
+    ("recurring_events", "parent_event_id", "calendar_events"),
+    ("report_templates", "created_by_user_id", "users"),
+    ("request_attachments", "request_id", "requests"),
+    ("request_attachments", "uploaded_by_user_id", "users"),
+    ("request_comments", "request_id", "requests"),
+    ("request_comments", "user_id", "users"),
+    ("request_comments", "parent_comment_id", "request_comments"),
+    ("requests", "client_id", "users"),
+    ("requests", "unit_id", "units"),
+    ("requests", "service_type_id", "service_types"),
+    ("requests", "evaluated_by_user_id", "users"),
+    ("requests", "converted_project_id", "projects"),
+    ("requests", "template_id", "project_templates"),
+    ("saved_searches", "user_id", "users"),
+    ("scheduled_reports", "created_by_id", "users"),
+    ("search_analytics", "user_id", "users"),
+    ("search_histories", "user_id", "users"),
+    ("service_types", "category_id", "service_categories"),
+    ("status_options", "status_type_id", "status_types"),
+    ("supplies", "inventory_item_id", "inventory_items"),
+    ("supply_deliveries", "supply_id", "supplies"),
+    ("supply_deliveries", "delivered_by_id", "users"),
+    ("task_approvals", "task_id", "tasks"),
+    ("task_approvals", "approval_status_id", "status_options"),
+    ("task_approvals", "reviewer_id", "users"),
+    ("task_assignments", "task_id", "tasks"),
+    ("task_assignments", "user_id", "users"),
+    ("task_assignments", "assigned_by_id", "users"),
+    ("task_attachments", "task_id", "tasks"),
+    ("task_attachments", "uploaded_by_id", "users"),
+    ("task_comments", "task_id", "tasks"),
+    ("task_comments", "author_id", "users"),
+    ("task_dependencies", "predecessor_id", "tasks"),
+    ("task_dependencies", "successor_id", "tasks"),
+    ("task_equipments", "task_id", "tasks"),
+    ("task_equipments", "equipment_id", "equipments"),
+    ("task_equipments", "assigned_by_id", "users"),
+    ("task_links", "task_id", "tasks"),
+    ("task_links", "link_platform_id", "link_platforms"),
+    ("task_links", "link_status_id", "status_options"),
+    ("task_time_logs", "task_id", "tasks"),
+    ("task_time_logs", "user_id", "users"),
+    ("tasks", "project_id", "projects"),
+    ("tasks", "assigned_to_id", "users"),
+    ("tasks", "created_by_id", "users"),
+    ("tasks", "parent_task_id", "tasks"),
+    ("units", "unit_type_id", "unit_types"),
+    ("units", "parent_unit_id", "units"),
+    ("user_devices", "user_id", "users"),
+    ("user_notification_preferences", "user_id", "users"),
+    ("user_notification_preferences", "notification_type_id", "notification_types"),
+    ("user_notification_preferences", "channel_id", "notification_channels"),
+    ("users", "user_type_id", "user_types"),
+    ("users", "employee_role_id", "employee_roles"),
+)
+
+
+def _short(kind: str, table: str, column: str) -> str:
+    """Identifier under Postgres' 63-byte limit, stable per (table, column)"""
+    digest = hashlib.md5(f"{table}.{column}".encode()).hexdigest()[:12]
+    return f"{kind}_{digest}"
+
+
+def _column_info(bind, table: str, column: str):
+    return bind.execute(sa.text("""
+        SELECT data_type, is_nullable = 'YES' AS nullable
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column
+    """), {"table": table, "column": column}).first()
+
+
+def _table_exists(bind, table: str) -> bool:
+    return bind.execute(sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}).scalar()
+
+
+def _indexes_on(bind, table: str, column: str):
+    """Plain (non-expression, non-partial) indexes that include `column`"""
+    return bind.execute(sa.text("""
+        SELECT i.relname AS index_name,
+               x.indisunique AS is_unique,
+               con.conname AS constraint_name,
+               ARRAY(
+                   SELECT a.attname::text
+                   FROM unnest(x.indkey) WITH ORDINALITY AS k(attnum, ord)
+                   JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = k.attnum
+                   ORDER BY k.ord
+               ) AS columns
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_attribute col ON col.attrelid = x.indrelid AND col.attname = :column
+        LEFT JOIN pg_constraint con ON con.conindid = x.indexrelid AND con.contype = 'u'
+        WHERE x.indrelid = CAST(:table AS regclass)
+          AND NOT x.indisprimary
+          AND x.indexprs IS NULL
+          AND x.indpred IS NULL
+          AND col.attnum = ANY(x.indkey)
+    """), {"table": table, "column": column}).all()
+
+
+def _convert(bind, table: str, column: str, target: str, data_type: str, nullable: bool) -> None:
+    shadow = f"{column}__uuid"
+    function = _short("fk_uuid_sync", table, column)
+    trigger = f"{function}_trg"
+    temp_fk = _short("fk_uuid_tmp", table, column)
+    final_fk = f"{table}_{column}_fkey"
+
+    if data_type == "integer":
+        has_values = bind.execute(sa.text(
+            f'SELECT EXISTS (SELECT 1 FROM "{table}" WHERE "{column}" IS NOT NULL)'
+        )).scalar()
+        if has_values:
+            raise RuntimeError(
+                f"{table}.{column} is an integer FK to a UUID key and holds data; "
+                "map it to UUIDs manually before running this migration"
+            )
+        convert_new = "NULL"
+        convert_row = "NULL"
+    else:
+        convert_new = f"CASE WHEN NEW.\"{column}\" ~ '{UUID_PATTERN}' THEN NEW.\"{column}\"::uuid END"
+        convert_row = f"CASE WHEN t.\"{column}\" ~ '{UUID_PATTERN}' THEN t.\"{column}\"::uuid END"
+
+    logger.info("Converting %s.%s (%s) to uuid", table, column, data_type)
+
+    # 1-2. shadow column kept in sync by a trigger
+    op.execute(f'ALTER TABLE "{table}" ADD COLUMN IF NOT EXISTS "{shadow}" uuid')
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION "{function}"() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW."{shadow}" := {convert_new};
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute(f'DROP TRIGGER IF EXISTS "{trigger}" ON "{table}"')
+    op.execute(
+        f'CREATE TRIGGER "{trigger}" BEFORE INSERT OR UPDATE OF "{column}" ON "{table}" '
+        f'FOR EACH ROW EXECUTE FUNCTION "{function}"()'
+    )
+
+    # 3. backfill in primary-key order, one short transaction per batch
+    if data_type != "integer":
+        backfill = sa.text(f"""
+            WITH batch AS (
+                SELECT id FROM "{table}"
+                WHERE CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid)
+                ORDER BY id
+                LIMIT {BATCH_SIZE}
+            )
+            UPDATE "{table}" AS t SET "{shadow}" = {convert_row}
+            FROM batch
+            WHERE t.id = batch.id
+            RETURNING t.id
+        """)
+        after = None
+        while True:
+            ids = bind.execute(backfill, {"after": after}).scalars().all()
+            if not ids:
+                break
+            after = str(max(ids))
+
+    # 4. indexes and FK on the shadow column, built without blocking writes
+    renames = []
+    for index in _indexes_on(bind, table, column):
+        temp_index = _short("ix_uuid_tmp", table, index.index_name)
+        columns = ", ".join(
+            f'"{shadow}"' if name == column else f'"{name}"' for name in index.columns
+        )
+        unique = "UNIQUE " if index.is_unique else ""
+        op.execute(
+            f'CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS "{temp_index}" ON "{table}" ({columns})'
+        )
+        renames.append((temp_index, index.index_name, index.constraint_name))
+
+    has_target = _table_exists(bind, target)
+    if has_target:
+        op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{temp_fk}"')
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{temp_fk}" '
+            f'FOREIGN KEY ("{shadow}") REFERENCES "{target}" (id) NOT VALID'
+        )
+
+    # 5. swap: only catalog changes while holding the table lock
+    swap = [
+        "BEGIN",
+        f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'",
+        f'DROP TRIGGER "{trigger}" ON "{table}"',
+        f'ALTER TABLE "{table}" DROP COLUMN "{column}"',
+        f'ALTER TABLE "{table}" RENAME COLUMN "{shadow}" TO "{column}"',
+    ]
+    for temp_index, index_name, constraint_name in renames:
+        swap.append(f'ALTER INDEX "{temp_index}" RENAME TO "{index_name}"')
+        if constraint_name:
+            swap.append(
+                f'ALTER TABLE "{table}" ADD CONSTRAINT "{constraint_name}" UNIQUE USING INDEX "{index_name}"'
+            )
+    if has_target:
+        swap.append(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{final_fk}"')
+        swap.append(f'ALTER TABLE "{table}" RENAME CONSTRAINT "{temp_fk}" TO "{final_fk}"')
+    swap.append("COMMIT")
+    op.execute(";\n".join(swap))
+    op.execute(f'DROP FUNCTION IF EXISTS "{function}"()')
+
+    # 6. validation scans take SHARE UPDATE EXCLUSIVE; reads and writes continue
+    if has_target:
+        op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{final_fk}"')
+    if not nullable:
+        check = _short("ck_uuid_nn", table, column)
+        op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{check}" CHECK ("{column}" IS NOT NULL) NOT VALID')
+        op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{check}"')
+        # Postgres 12+ skips the table scan thanks to the validated CHECK
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET NOT NULL')
+        op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{check}"')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        for table, column, target in FK_COLUMNS:
+            info = _column_info(bind, table, column)
+            if info is None or info.data_type == "uuid":
+                continue
+            _convert(bind, table, column, target, info.data_type, info.nullable)
+
+
+def downgrade() -> None:
+    # Back to text keys; rewrites each table under lock, so run off-hours.
+    # Integer columns were empty on upgrade and come back as VARCHAR(36).
+    for table, column, _target in FK_COLUMNS:
+        info = _column_info(op.get_bind(), table, column)
+        if info is None or info.data_type != "uuid":
+            continue
+        op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{table}_{column}_fkey"')
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(36),
+            postgresql_using=f'"{column}"::text',
+        )
@@ -0,0 +1,201 @@
+"""monthly range partitioning for append-only log and event tables
+
+Converts audit_logs, analytics_events, search_analytics, search_histories and
+notification_logs into tables partitioned by month on their timestamp column.
+Existing rows are not copied: the current table is renamed to <table>_legacy
+and attached as the partition FROM (MINVALUE) TO (<first day of next month>),
+with validated CHECK constraints so the attach needs no table scan. Monthly
+partitions from there on are created ahead of time, and
+app.jobs.cleanup_jobs.maintain_partitions keeps them rolling. The legacy
+partition is dropped by retention like any other once its range expires.
+
+The primary key becomes (<timestamp>, id), because Postgres requires the
+partition key in every unique index. On audit_logs that PK replaces the
+(created_at, id) keyset index.
+
+Revision ID: 0004_monthly_partitions
+Revises: 0003_uuid_foreign_keys
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.partitioning import add_months, list_partitions, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_monthly_partitions'
+down_revision: Union[str, None] = '0003_uuid_foreign_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_AHEAD = 3
+BATCH_SIZE = 5000
+LOCK_TIMEOUT = "5s"
+LEGACY_SUFFIX = "_legacy"
+
+# (table, partition key, expression filling NULL keys before conversion)
+TABLES = (
+    ("audit_logs", "created_at", None),
+    ("analytics_events", "event_timestamp", "COALESCE(created_at, now())"),
+    ("search_analytics", "searched_at", "created_at"),
+    ("search_histories", "searched_at", "created_at"),
+    ("notification_logs", "created_at", "COALESCE(updated_at, now())"),
+)
+
+
+def _is_plain_table(bind, table: str) -> bool:
+    return bind.execute(sa.text(
+        "SELECT relkind = 'r' FROM pg_class WHERE oid = to_regclass(:table)"
+    ), {"table": table}).scalar() is True
+
+
+def _primary_key_name(bind, table: str) -> str:
+    return bind.execute(sa.text(
+        "SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass) AND contype = 'p'"
+    ), {"table": table}).scalar()
+
+
+def _secondary_indexes(bind, table: str):
+    """(name, definition) of indexes not backing a constraint"""
+    return bind.execute(sa.text("""
+        SELECT i.relname, pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE x.indrelid = CAST(:table AS regclass)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+    """), {"table": table}).all()
+
+
+def _foreign_keys(bind, table: str):
+    return bind.execute(sa.text("""
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'
+    """), {"table": table}).all()
+
+
+def _convert(bind, table: str, column: str, fill_nulls, boundary) -> None:
+    legacy = f"{table}{LEGACY_SUFFIX}"
+    key_index = f"{legacy}_key"
+    not_null_check = f"{legacy}_nn"
+    range_check = f"{legacy}_range"
+    bound = f"'{boundary.isoformat()} 00:00:00+00'"
+
+    if table == "audit_logs":
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_created_at_id")
+
+    # Range partitions reject NULL keys
+    if fill_nulls:
+        while bind.execute(sa.text(f"""
+            UPDATE "{table}" SET "{column}" = {fill_nulls}
+            WHERE ctid IN (SELECT ctid FROM "{table}" WHERE "{column}" IS NULL LIMIT {BATCH_SIZE})
+        """)).rowcount:
+            pass
+
+    # Validated CHECKs let SET NOT NULL and ATTACH PARTITION skip their table scans
+    op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{not_null_check}"')
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{not_null_check}" CHECK ("{column}" IS NOT NULL) NOT VALID')
+    op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{not_null_check}"')
+    op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET NOT NULL')
+    op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{range_check}"')
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{range_check}" CHECK ("{column}" < {bound}) NOT VALID')
+    op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{range_check}"')
+
+    # Becomes the legacy partition's share of the new (key, id) primary key
+    op.execute(f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "{key_index}" ON "{table}" ("{column}", id)')
+
+    primary_key = _primary_key_name(bind, table)
+    indexes = [(name, ddl) for name, ddl in _secondary_indexes(bind, table) if name != key_index]
+    foreign_keys = _foreign_keys(bind, table)
+
+    swap = [
+        "BEGIN",
+        f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'",
+        f'ALTER TABLE "{table}" RENAME TO "{legacy}"',
+        f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{primary_key}"',
+    ]
+    # Index names are schema-wide; free them for the parent's indexes
+    for name, _ddl in indexes:
+        swap.append(f'ALTER INDEX "{name}" RENAME TO "{name}{LEGACY_SUFFIX}"')
+    swap += [
+        f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS INCLUDING STORAGE INCLUDING COMMENTS) '
+        f'PARTITION BY RANGE ("{column}")',
+        f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY ("{column}", id)',
+    ]
+    # Definitions were captured under the original table name, now the parent
+    swap += [ddl for _name, ddl in indexes]
+    swap += [f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {ddl}' for name, ddl in foreign_keys]
+    swap += [
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{legacy}" FOR VALUES FROM (MINVALUE) TO ({bound})',
+        "COMMIT",
+    ]
+    op.execute(";\n".join(swap))
+
+    op.create_monthly_partitions(table, boundary, PARTITIONS_AHEAD)
+    op.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT IF EXISTS "{not_null_check}"')
+    op.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT IF EXISTS "{range_check}"')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    boundary = add_months(month_start(datetime.now(timezone.utc).date()), 1)
+    with op.get_context().autocommit_block():
+        for table, column, fill_nulls in TABLES:
+            if _is_plain_table(bind, table):
+                _convert(bind, table, column, fill_nulls, boundary)
+
+
+def _revert(bind, table: str, column: str) -> None:
+    legacy = f"{table}{LEGACY_SUFFIX}"
+    partitions = list_partitions(bind, table)
+    names = [name for name, _lower, _upper in partitions]
+    if legacy not in names:
+        raise RuntimeError(f"{table}: legacy partition {legacy} is gone (expired?); cannot downgrade")
+
+    # Index names to restore on the plain table
+    indexes = [
+        name for name, _ddl in _secondary_indexes(bind, legacy)
+        if name.endswith(LEGACY_SUFFIX) and name != f"{legacy}_key"
+    ]
+
+    statements = ["BEGIN", f'ALTER TABLE "{table}" DETACH PARTITION "{legacy}"']
+    for name in names:
+        if name == legacy:
+            continue
+        statements += [
+            f'ALTER TABLE "{table}" DETACH PARTITION "{name}"',
+            f'INSERT INTO "{legacy}" SELECT * FROM "{name}"',
+            f'DROP TABLE "{name}"',
+        ]
+    statements += [
+        f'DROP TABLE "{table}"',
+        f'ALTER TABLE "{legacy}" RENAME TO "{table}"',
+    ]
+    for name in indexes:
+        statements.append(f'ALTER INDEX "{name}" RENAME TO "{name[:-len(LEGACY_SUFFIX)]}"')
+    statements += [
+        f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{legacy}_key"',
+        f'DROP INDEX IF EXISTS "{legacy}_key"',
+        f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id)',
+    ]
+    if table == "audit_logs":
+        statements.append('CREATE INDEX "ix_audit_logs_created_at_id" ON "audit_logs" (created_at, id)')
+    statements.append("COMMIT")
+    op.execute(";\n".join(statements))
+
+
+def downgrade() -> None:
+    # Moves every row written since the upgrade back into one table under
+    # lock; plan a maintenance window
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        for table, column, _fill_nulls in TABLES:
+            if not _is_plain_table(bind, table) and bind.execute(
+                sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}
+            ).scalar():
+                _revert(bind, table, column)
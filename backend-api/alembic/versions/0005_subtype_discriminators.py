@@ -0,0 +1,73 @@
+"""subtype discriminator on projects and inventory_items
+
+Adds a nullable `subtype` column to projects (course / podcast) and
+inventory_items (equipment / supply) and classifies existing rows from the
+subtype tables: one kind -> that kind, several -> "mixed", none -> "base".
+app.database.polymorphic.load_subtypes uses it to query only the subtype
+tables a list needs; NULL (rows written by old code during the rollout) is
+treated as unknown and looked up in every subtype table.
+
+Revision ID: 0005_subtype_discriminators
+Revises: 0004_monthly_partitions
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_subtype_discriminators'
+down_revision: Union[str, None] = '0004_monthly_partitions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+# base table -> ((kind, subtype table, FK column), ...)
+FAMILIES = {
+    "projects": (("course", "courses", "project_id"), ("podcast", "podcasts", "project_id")),
+    "inventory_items": (("equipment", "equipments", "inventory_item_id"), ("supply", "supplies", "inventory_item_id")),
+}
+
+
+def _classify(bind, table: str, subtypes) -> None:
+    kinds = " UNION ALL ".join(
+        f"SELECT {fk} AS parent_id, '{kind}' AS kind FROM {subtype_table}"
+        for kind, subtype_table, fk in subtypes
+    )
+    # Batched by id so no single UPDATE holds row locks on the whole table
+    statement = sa.text(f"""
+        WITH batch AS (
+            SELECT id FROM {table} WHERE subtype IS NULL ORDER BY id LIMIT {BATCH_SIZE}
+        ),
+        found AS (
+            SELECT parent_id, CASE WHEN count(DISTINCT kind) > 1 THEN 'mixed' ELSE min(kind) END AS kind
+            FROM ({kinds}) AS k
+            WHERE parent_id IN (SELECT id FROM batch)
+            GROUP BY parent_id
+        )
+        UPDATE {table} AS t
+        SET subtype = COALESCE(found.kind, 'base')
+        FROM batch LEFT JOIN found ON found.parent_id = batch.id
+        WHERE t.id = batch.id
+    """)
+    while bind.execute(statement).rowcount:
+        pass
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table in FAMILIES:
+        op.add_column(table, sa.Column('subtype', sa.String(length=20), nullable=True))
+    # Commit each batch so the backfill does not run as one long transaction
+    with op.get_context().autocommit_block():
+        for table, subtypes in FAMILIES.items():
+            _classify(bind, table, subtypes)
+
+
+def downgrade() -> None:
+    for table in FAMILIES:
+        op.drop_column(table, 'subtype')
@@ -0,0 +1,42 @@
+"""index on ip_blocks.updated_at
+
+The IP blocklist (app.core.ip_blocks) refreshes incrementally by reading
+the rows changed since its last watermark, every few seconds on every
+worker. Without this index each refresh is a sequential scan of the table.
+
+Revision ID: 0006_ip_block_updated_at
+Revises: 0005_subtype_discriminators
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_ip_block_updated_at'
+down_revision: Union[str, None] = '0005_subtype_discriminators'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ip_blocks_updated_at",
+            "ip_blocks",
+            ["updated_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_ip_blocks_updated_at",
+            table_name="ip_blocks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
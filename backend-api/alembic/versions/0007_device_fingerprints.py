@@ -0,0 +1,51 @@
+"""device fingerprint on user_devices
+
+Adds user_devices.fingerprint (SHA-256 of the normalized user agent, see
+app.services.users.device_service) and a unique (user_id, fingerprint)
+index, so matching a login to its device is one index probe instead of
+comparing user_agent text and JSON blobs per user.
+
+Existing rows start NULL (NULLs never collide in the unique index) and are
+filled by scripts/backfill_device_fingerprints.py, in batches, with the
+same normalization the login uses.
+
+Revision ID: 0007_device_fingerprints
+Revises: 0006_ip_block_updated_at
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_device_fingerprints'
+down_revision: Union[str, None] = '0006_ip_block_updated_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_devices', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_user_devices_user_id_fingerprint",
+            "user_devices",
+            ["user_id", "fingerprint"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_user_devices_user_id_fingerprint",
+            table_name="user_devices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('user_devices', 'fingerprint')
@@ -0,0 +1,98 @@
+"""keep the subtype discriminator up to date with triggers
+
+0005 kept projects.subtype / inventory_items.subtype current through an ORM
+after_insert hook, which misses Core inserts (bulk imports, raw SQL) and
+re-parenting a subtype row by updating its FK. A parent left at "base"
+then had its subtype collections loaded empty by load_subtypes.
+
+An AFTER INSERT OR UPDATE OF <fk> trigger on every subtype table now
+classifies the parent the same way the hook did (NULL or "base" -> the
+kind, another kind -> "mixed"), whatever wrote the row. A parent already
+of that kind or "mixed" is not rewritten, so inserts into a classified
+parent leave no dead tuples. Rows misclassified so far are corrected from
+the subtype tables.
+
+A parent that loses its last subtype row (delete or re-parent) keeps its
+old kind; load_subtypes then queries a table with nothing for it, which
+costs a query but never hides rows.
+
+Revision ID: 0008_subtype_triggers
+Revises: 0007_device_fingerprints
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_subtype_triggers'
+down_revision: Union[str, None] = '0007_device_fingerprints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# base table -> ((kind, subtype table, FK column), ...)
+FAMILIES = {
+    "projects": (("course", "courses", "project_id"), ("podcast", "podcasts", "project_id")),
+    "inventory_items": (("equipment", "equipments", "inventory_item_id"), ("supply", "supplies", "inventory_item_id")),
+}
+
+# Arguments: base table, kind, FK column
+CLASSIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION classify_subtype_parent() RETURNS trigger AS $$
+DECLARE
+    parent_id uuid;
+BEGIN
+    EXECUTE format('SELECT ($1).%I', TG_ARGV[2]) USING NEW INTO parent_id;
+    IF parent_id IS NOT NULL THEN
+        EXECUTE format(
+            'UPDATE %I SET subtype = CASE WHEN subtype IS NULL OR subtype = %L THEN %L ELSE %L END '
+            'WHERE id = $1 AND subtype IS DISTINCT FROM %L AND subtype IS DISTINCT FROM %L',
+            TG_ARGV[0], 'base', TG_ARGV[1], 'mixed', TG_ARGV[1], 'mixed'
+        ) USING parent_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def _trigger_name(subtype_table: str) -> str:
+    return f"trg_{subtype_table}_classify_parent"
+
+
+def upgrade() -> None:
+    op.execute(CLASSIFY_FUNCTION)
+    for table, subtypes in FAMILIES.items():
+        for kind, subtype_table, fk in subtypes:
+            op.execute(f"""
+                CREATE TRIGGER {_trigger_name(subtype_table)}
+                AFTER INSERT OR UPDATE OF {fk} ON {subtype_table}
+                FOR EACH ROW EXECUTE FUNCTION classify_subtype_parent('{table}', '{kind}', '{fk}')
+            """)
+
+        # Parents whose stored kind disagrees with their subtype rows
+        kinds = " UNION ALL ".join(
+            f"SELECT {fk} AS parent_id, '{kind}' AS kind FROM {subtype_table}"
+            for kind, subtype_table, fk in subtypes
+        )
+        op.execute(sa.text(f"""
+            UPDATE {table} AS t
+            SET subtype = found.kind
+            FROM (
+                SELECT parent_id, CASE WHEN count(DISTINCT kind) > 1 THEN 'mixed' ELSE min(kind) END AS kind
+                FROM ({kinds}) AS k
+                WHERE parent_id IS NOT NULL
+                GROUP BY parent_id
+            ) AS found
+            WHERE t.id = found.parent_id AND t.subtype IS DISTINCT FROM found.kind
+        """))
+
+
+def downgrade() -> None:
+    for subtypes in FAMILIES.values():
+        for _, subtype_table, _ in subtypes:
+            op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(subtype_table)} ON {subtype_table}")
+    op.execute("DROP FUNCTION IF EXISTS classify_subtype_parent()")
@@ -0,0 +1,50 @@
+"""DEFAULT partition on every monthly-partitioned table
+
+Without one, an insert whose month has no partition yet fails outright;
+that happens as soon as app.jobs.cleanup_jobs.maintain_partitions stops
+running for longer than PARTITION_PREMAKE_MONTHS. Each partitioned table
+now gets <table>_default to catch those rows. ensure_partitions moves them
+into the month's partition when it is created (see
+app.database.partitioning for the failure mode this avoids).
+
+Revision ID: 0009_default_partitions
+Revises: 0008_subtype_triggers
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.partitioning import (
+    PARTITIONED_TABLES,
+    create_default_partition_sql,
+    default_partition_name,
+    is_partitioned,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_default_partitions'
+down_revision: Union[str, None] = '0008_subtype_triggers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        if is_partitioned(bind, table):
+            op.execute(create_default_partition_sql(table))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        default = default_partition_name(table)
+        if not bind.execute(sa.text("SELECT to_regclass(:name) IS NOT NULL"), {"name": default}).scalar():
+            continue
+        if bind.execute(sa.text(f'SELECT EXISTS (SELECT 1 FROM "{default}")')).scalar():
+            raise RuntimeError(f"{default} holds rows; run the partition maintenance job before downgrading")
+        op.execute(f'DROP TABLE "{default}"')
@@ -0,0 +1,24 @@
+"""
+API v1 router
+Aggregates the routers of every v1 module
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_permissions
+from app.api.v1.admin import reports, system
+from app.core.permissions import Permission
+from app.api.v1.auth import login, register
+
+api_router = APIRouter()
+
+api_router.include_router(login.router, prefix="/auth", tags=["auth"])
+api_router.include_router(register.router, prefix="/auth", tags=["auth"])
+
+api_router.include_router(
+    system.router,
+    prefix="/admin/system",
+    tags=["admin"],
+    dependencies=[Depends(require_permissions(Permission.ADMIN_ACCESS))],
+)
+api_router.include_router(reports.router, prefix="/admin/reports", tags=["admin"])
@@ -0,0 +1,101 @@
+"""
+Admin report endpoints
+Constant-memory exports of the large log and analytics tables
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+from app.api.deps import require_permissions
+from app.core.config import settings
+from app.core.exports import FORMATS, NDJSON, export_response
+from app.core.permissions import Permission
+from app.core.principals import Principal
+from app.database.session import open_read_session
+from app.models.audit.log import AuditLog
+from app.models.communication.advanced import NotificationLog
+from app.models.reports.analytics import AnalyticsEvent, SearchAnalytics
+from app.repositories.base import BaseRepository
+
+router = APIRouter()
+
+# Needed on top of REPORTS_EXPORT for datasets that hold audit trails
+DATASET_PERMISSIONS = {
+    "audit_logs": Permission.AUDIT_READ,
+}
+
+# dataset -> (model, partition column used for the since/until window).
+# Each partition's primary key is (partition column, id), so ordering by that
+# pair is an ordered walk of the partitions' indexes rather than a sort
+EXPORT_DATASETS = {
+    "audit_logs": (AuditLog, "created_at"),
+    "analytics_events": (AnalyticsEvent, "event_timestamp"),
+    "search_analytics": (SearchAnalytics, "searched_at"),
+    "notification_logs": (NotificationLog, "created_at"),
+}
+
+
+@router.get("/exports/{dataset}")
+def export_dataset(
+    dataset: str,
+    request: Request,
+    format: str = Query(NDJSON, description=f"One of {', '.join(FORMATS)}"),
+    since: Optional[datetime] = Query(None, description="Inclusive start of the window (required)"),
+    until: Optional[datetime] = Query(None, description="Exclusive end of the window (required)"),
+    chunk_size: int = Query(2000, ge=100, le=20000),
+    principal: Principal = Depends(require_permissions(Permission.REPORTS_EXPORT)),
+):
+    """
+    Stream one time window of a table as CSV, NDJSON or gzip-compressed NDJSON
+
+    Rows are read through a server-side cursor on a replica (the primary
+    with the read-your-writes header) and written out chunk by chunk, so
+    worker memory stays flat whatever the row count. The window is required
+    and capped at EXPORT_MAX_WINDOW_DAYS: it prunes the scan to the matching
+    monthly partitions, and the (time, id) order comes straight off their
+    primary keys, so the first row goes out without sorting the table.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail=f"Unknown dataset '{dataset}'")
+    required = DATASET_PERMISSIONS.get(dataset)
+    if required is not None and required not in principal.permissions:
+        raise HTTPException(status_code=403, detail=f"Missing permission: {required.key}")
+    if format not in FORMATS:
+        raise HTTPException(status_code=422, detail=f"Unsupported format '{format}'")
+    # Checked here rather than by Query(...) so permissions and the dataset
+    # are reported first
+    if since is None or until is None:
+        raise HTTPException(status_code=422, detail="Both 'since' and 'until' are required")
+    # Naive bounds are UTC, like the stored timestamps
+    since, until = (value if value.tzinfo else value.replace(tzinfo=timezone.utc) for value in (since, until))
+    if until <= since:
+        raise HTTPException(status_code=422, detail="'until' must be later than 'since'")
+    if until - since > timedelta(days=settings.export_max_window_days):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Export window is limited to {settings.export_max_window_days} days",
+        )
+
+    model, time_column_name = EXPORT_DATASETS[dataset]
+    table = model.__table__
+    columns = [column.name for column in table.columns]
+    time_column = table.c[time_column_name]
+
+    stmt = (
+        select(*table.columns)
+        .where(time_column >= since, time_column < until)
+        .order_by(time_column, table.c.id)
+    )
+
+    def rows() -> Iterator:
+        # Own session: the request-scoped one would close before the body is sent
+        db = open_read_session(request)
+        try:
+            yield from BaseRepository(db, model).stream(stmt, chunk_size=chunk_size)
+        finally:
+            db.close()
+
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    return export_response(rows, columns, format, filename=f"{dataset}_{stamp}")
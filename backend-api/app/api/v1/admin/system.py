@@ -0,0 +1,58 @@
+"""
+Admin system endpoints
+Runtime diagnostics for operators
+"""
+
+from fastapi import APIRouter
+
+from app.core.ip_blocks import blocklist
+from app.database.activity_buffer import activity_buffer
+from app.database.connection import async_engine, engine
+from app.database.pool_metrics import pool_snapshot
+from app.database.session import replica_engines
+from app.services.auth.security_service import password_hasher
+
+router = APIRouter()
+
+
+@router.get("/db-pool")
+async def db_pool_stats():
+    """
+    Connection pool telemetry for this worker process
+    Checkouts in use, overflow usage, checkout wait histogram and connection age
+    """
+    return {
+        "primary": pool_snapshot(engine),
+        "primary_async": pool_snapshot(async_engine.sync_engine),
+        "replicas": [
+            {"url": replica.url.render_as_string(hide_password=True), **pool_snapshot(replica)}
+            for replica in replica_engines
+        ],
+    }
+
+
+@router.get("/password-hasher")
+async def password_hasher_stats():
+    """
+    bcrypt executor telemetry for this worker process
+    Hashes in flight, rejections, queue-time histogram and run time
+    """
+    return password_hasher.snapshot()
+
+
+@router.get("/activity-buffer")
+async def activity_buffer_stats():
+    """
+    Write-behind buffer telemetry for this worker process
+    Rows waiting to be flushed, flush count, duration and last error
+    """
+    return activity_buffer.snapshot()
+
+
+@router.get("/ip-blocks")
+async def ip_block_stats():
+    """
+    In-memory IP blocklist of this worker process
+    Active blocks per family, refresh watermark and time since the last refresh
+    """
+    return blocklist.snapshot()
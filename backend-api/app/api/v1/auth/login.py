@@ -0,0 +1,131 @@
+"""
+Login endpoints
+Password checks run on the bounded bcrypt executor, never on the event loop.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+from jose import jwt
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+import asyncio
+
+from app.api.deps import CREDENTIALS_EXCEPTION, get_current_principal, oauth2_scheme
+from app.core.config import settings
+from app.core.ip_blocks import record_failure
+from app.core.middleware import client_ip
+from app.core.principals import Principal, bump_security_stamp, current_security_stamp, revoke_token
+from app.database.activity_buffer import activity_buffer
+from app.database.connection import get_async_db
+from app.models.user_management.user import User
+from app.schemas.auth.login import TokenResponse
+from app.services.auth.security_service import HasherBusy, create_access_token, dummy_hash, password_hasher
+from app.services.users.device_service import resolve_device
+
+router = APIRouter()
+
+users = User.__table__
+
+INVALID_LOGIN = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect username or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    request: Request,
+    form: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Exchange email or username and password for an access token
+
+    Failed attempts are counted and the account locked atomically in the
+    same UPDATE, so concurrent guesses cannot overshoot the limit. A hash
+    made with other rounds than BCRYPT_ROUNDS is replaced on success. A
+    plain successful login runs no UPDATE at all: last_login and
+    login_count are buffered and written in batches.
+
+    Every failure also counts against the client address; enough of them
+    across any accounts block the address itself (app.core.ip_blocks).
+
+    The login is matched to its UserDevice by user agent fingerprint (one
+    index probe, a new row on first sight) and the token carries its id.
+    """
+    row = (await db.execute(
+        select(
+            users.c.id, users.c.hashed_password, users.c.is_active,
+            users.c.locked_until, users.c.failed_login_attempts,
+        )
+        .where(or_(users.c.email == form.username, users.c.username == form.username))
+    )).first()
+
+    try:
+        # Unknown names cost a bcrypt too, so timing does not reveal which accounts exist
+        valid = await password_hasher.verify(form.password, row.hashed_password if row else dummy_hash())
+    except HasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    now = datetime.now(timezone.utc)
+    if row is None or not row.is_active:
+        await record_failure(client_ip(request.scope))
+        raise INVALID_LOGIN
+    if row.locked_until is not None and row.locked_until > now:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account is locked")
+
+    if not valid:
+        attempts = func.coalesce(users.c.failed_login_attempts, 0) + 1
+        locked_until = (await db.execute(
+            update(users)
+            .where(users.c.id == row.id)
+            .values(
+                failed_login_attempts=attempts,
+                locked_until=case(
+                    (attempts >= settings.login_max_failed_attempts, now + timedelta(minutes=settings.login_lockout_minutes)),
+                    else_=users.c.locked_until,
+                ),
+            )
+            .returning(users.c.locked_until)
+        )).scalar_one()
+        await db.commit()
+        if locked_until is not None and locked_until > now:
+            await asyncio.to_thread(bump_security_stamp, row.id)
+        await record_failure(client_ip(request.scope))
+        raise INVALID_LOGIN
+
+    # Security state is written now; last_login/login_count go through the write-behind buffer
+    values = {}
+    if row.failed_login_attempts:
+        values["failed_login_attempts"] = 0
+    if password_hasher.needs_rehash(row.hashed_password):
+        # Same password, new cost: a Core UPDATE so the security stamp (and live tokens) stay as they are
+        values["hashed_password"] = await password_hasher.hash(form.password)
+    if values:
+        await db.execute(update(users).where(users.c.id == row.id).values(**values))
+        await db.commit()
+    device = await resolve_device(db, row.id, request.headers.get("user-agent"), client_ip(request.scope))
+    if device is not None and device.is_blocked:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Device is blocked")
+    activity_buffer.record_login(row.id, now)
+    if device is not None:
+        activity_buffer.record_device_seen(device.id, now, login=True)
+
+    stamp = await asyncio.to_thread(current_security_stamp, row.id)
+    token, expires_in = create_access_token(row.id, stamp, device_id=device.id if device else None)
+    return TokenResponse(access_token=token, expires_in=expires_in)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(token: str = Depends(oauth2_scheme), principal: Principal = Depends(get_current_principal)):
+    """Revoke the bearer token until it expires"""
+    claims = jwt.get_unverified_claims(token)  # already verified by get_current_principal
+    if "jti" not in claims:
+        raise CREDENTIALS_EXCEPTION
+    revoke_token(claims["jti"], claims["exp"])
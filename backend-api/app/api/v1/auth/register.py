@@ -0,0 +1,60 @@
+"""
+Registration endpoints
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+
+from app.core.catalogs import lookup
+from app.database.connection import get_async_db
+from app.models.user_management.user import User
+from app.schemas.auth.register import RegisteredUser, RegisterRequest
+from app.services.auth.security_service import HasherBusy, password_hasher
+
+router = APIRouter()
+
+# User type given to self-registered accounts
+DEFAULT_USER_TYPE = "CLIENT"
+
+
+@router.post("/register", response_model=RegisteredUser, status_code=status.HTTP_201_CREATED)
+async def register(data: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
+    """Create a client account; the password is hashed on the bcrypt executor"""
+    taken = (await db.execute(
+        select(User.email, User.username).where(or_(User.email == data.email, User.username == data.username))
+    )).first()
+    if taken is not None:
+        field = "email" if taken.email == data.email else "username"
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"{field} already registered")
+
+    user_type = await asyncio.to_thread(lookup, "UserType", DEFAULT_USER_TYPE)
+    if user_type is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="User types are not seeded")
+
+    try:
+        hashed_password = await password_hasher.hash(data.password)
+    except HasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent registrations, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    user = User(
+        email=data.email,
+        username=data.username,
+        full_name=data.full_name,
+        hashed_password=hashed_password,
+        user_type_id=user_type.id,
+    )
+    db.add(user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent registration took the email or username after the check above
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="email or username already registered")
+    return RegisteredUser(id=user.id, email=user.email, username=user.username)
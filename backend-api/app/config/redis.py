@@ -0,0 +1,171 @@
+"""
+Redis client
+One shared client per worker process and flavour (asyncio for request
+handlers, blocking for sync code such as SQLAlchemy session hooks), created
+lazily from REDIS_URL. Everything Redis-backed is optional: with no
+REDIS_URL the helpers return None.
+
+Subscriber runs a pub/sub handler on a daemon thread; the caches use it to
+hear about changes committed by other workers.
+
+submit_background() runs the Redis round trips of SQLAlchemy commit hooks
+on a single writer thread. Under an AsyncSession those hooks run on the
+event loop, where a blocking INCR/PUBLISH (or a slow Redis) would stall
+every request of the worker.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import logging
+import os
+import threading
+import time
+
+import redis
+import redis.asyncio as redis_asyncio
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis_asyncio.Redis] = None
+_sync_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[redis_asyncio.Redis]:
+    """Shared asyncio Redis client, or None when Redis is not configured"""
+    global _client
+    if _client is None and settings.redis_url:
+        _client = redis_asyncio.Redis.from_url(settings.redis_url, decode_responses=True)
+    return _client
+
+
+def get_sync_redis() -> Optional[redis.Redis]:
+    """Shared blocking Redis client, or None when Redis is not configured"""
+    global _sync_client
+    if _sync_client is None and settings.redis_url:
+        _sync_client = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+    return _sync_client
+
+
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_pid: Optional[int] = None
+_writer_lock = threading.Lock()
+
+
+def _run_logged(func: Callable[..., Any], args: tuple) -> None:
+    try:
+        func(*args)
+    except Exception:
+        logger.exception(f"Background write {getattr(func, '__qualname__', func)} failed")
+
+
+def submit_background(func: Callable[..., Any], *args: Any) -> None:
+    """
+    Run `func(*args)` on this process's writer thread, in submission order
+
+    For blocking calls made from sync code that may be on the event loop
+    (commit hooks). Errors are logged. The thread is recreated after fork.
+    """
+    global _writer, _writer_pid
+    with _writer_lock:
+        if _writer is None or _writer_pid != os.getpid():
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background-writer")
+            _writer_pid = os.getpid()
+        _writer.submit(_run_logged, func, args)
+
+
+def flush_background() -> None:
+    """Wait for the queued background writes (shutdown, tests)"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = (_writer, None) if _writer_pid == os.getpid() else (None, None)
+    if writer is not None:
+        writer.shutdown(wait=True)
+
+
+def close_sync_redis() -> None:
+    """Close the blocking client; the next get_sync_redis() opens a new one (before fork)"""
+    global _sync_client
+    if _sync_client is not None:
+        sync_client, _sync_client = _sync_client, None
+        sync_client.close()
+
+
+async def close_redis() -> None:
+    """Close the shared clients and their connection pools"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+    close_sync_redis()
+
+
+class Subscriber(threading.Thread):
+    """
+    Daemon thread calling `handler(data)` for every message on `channel`
+
+    Reconnects with exponential backoff when Redis goes away. If `interval`
+    is given, `on_interval()` also runs every `interval` seconds, as a
+    safety net for messages published while disconnected.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        *,
+        name: str,
+        interval: Optional[float] = None,
+        on_interval: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(name=name, daemon=True)
+        self.channel = channel
+        self.handler = handler
+        self.interval = interval
+        self.on_interval = on_interval
+        self.stopping = threading.Event()
+
+    def run(self) -> None:
+        backoff = 1.0
+        while not self.stopping.is_set():
+            client = get_sync_redis()
+            if client is None:
+                return
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                backoff = 1.0
+                try:
+                    self._listen(pubsub)
+                finally:
+                    pubsub.close()
+            except Exception as e:
+                logger.warning(f"{self.name}: {e}; retrying in {backoff:.0f}s")
+                self.stopping.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self, pubsub) -> None:
+        due = time.monotonic() + self.interval if self.interval else None
+        while not self.stopping.is_set():
+            message = pubsub.get_message(timeout=1.0)
+            if message is not None:
+                try:
+                    self.handler(message["data"])
+                except Exception:
+                    logger.exception(f"{self.name}: handler failed for {message['data']!r}")
+            if due is not None and time.monotonic() >= due:
+                due = time.monotonic() + self.interval
+                try:
+                    self.on_interval()
+                except Exception:
+                    logger.exception(f"{self.name}: periodic check failed")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self.stopping.set()
+        self.join(timeout)
@@ -0,0 +1,385 @@
+"""
+Catalog cache
+Seeder/catalog tables (user types, statuses, priorities, service and event
+types, ...) read on almost every request and changed maybe weekly, served
+from two tiers:
+
+    1. an in-process LRU of immutable Catalog snapshots (dictionary hits)
+    2. Redis, shared by every worker: catalog:<name>:data holds the rows of
+       the version in catalog:<name>:version
+
+Any commit that touches a catalog model bumps its version in Redis and
+publishes "<name>:<version>" on the catalog:invalidate channel; every worker
+drops its local snapshot on receipt. CATALOG_CACHE_TTL bounds staleness if a
+message is missed. Without Redis the cache is per process and invalidated
+only by local commits.
+
+    user_type = lookup("UserType", "admin")
+    status = lookup("StatusOption", (status_type_id, "in_progress"))
+    role = lookup_id("EmployeeRole", user.employee_role_id)
+"""
+
+from sqlalchemy import Table, event
+from sqlalchemy.orm import ORMExecuteState, Session
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Type
+import enum
+import importlib
+import json
+import logging
+import threading
+import time
+import uuid
+
+from app.config.redis import Subscriber, get_sync_redis, submit_background
+from app.core.config import settings
+from app.repositories.read_models import read_model
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "catalog:invalidate"
+_SESSION_KEY = "catalogs_changed"
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    """A cached catalog: model name and the column(s) lookups are keyed by"""
+    model: str
+    key: Tuple[str, ...] = ("code",)
+
+
+CATALOGS: Dict[str, CatalogSpec] = {spec.model: spec for spec in (
+    CatalogSpec("UserType"),
+    CatalogSpec("EmployeeRole"),
+    CatalogSpec("StatusType"),
+    CatalogSpec("StatusOption", key=("status_type_id", "code")),
+    CatalogSpec("PriorityOption"),
+    CatalogSpec("ServiceCategory"),
+    CatalogSpec("ServiceType", key=("category_id", "code")),
+    CatalogSpec("DurationType"),
+    CatalogSpec("EventType"),
+    CatalogSpec("LinkPlatform"),
+    CatalogSpec("NotificationType"),
+    CatalogSpec("NotificationChannel"),
+    CatalogSpec("DeliverableType"),
+    CatalogSpec("InventoryType"),
+    CatalogSpec("UnitType"),
+)}
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """Immutable snapshot of one catalog at one version"""
+    name: str
+    version: int
+    rows: Tuple[Any, ...]
+    by_id: Mapping[Any, Any]
+    by_key: Mapping[Any, Any]
+    loaded_at: float = field(default_factory=time.monotonic, compare=False)
+
+    def get(self, key: Any) -> Optional[Any]:
+        return self.by_key.get(key)
+
+    def get_id(self, id: Any) -> Optional[Any]:
+        return self.by_id.get(id)
+
+
+# ----------------------------------------------------------------------
+# Row classes and (de)serialization
+# ----------------------------------------------------------------------
+
+_row_classes: Dict[str, Type] = {}
+
+
+def _table(name: str) -> Table:
+    return getattr(importlib.import_module("app.models"), name).__table__
+
+
+def _row_class(name: str) -> Type:
+    row_class = _row_classes.get(name)
+    if row_class is None:
+        row_class = read_model(f"{name}Entry", name, [column.key for column in _table(name).c])
+        _row_classes[name] = row_class
+    return row_class
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _decoder(column) -> Callable[[Any], Any]:
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is not None:
+        return enum_class
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda value: value
+    if python_type is uuid.UUID:
+        return uuid.UUID
+    if python_type is datetime:
+        return datetime.fromisoformat
+    if python_type is date:
+        return date.fromisoformat
+    if python_type is Decimal:
+        return Decimal
+    return lambda value: value
+
+
+def _build(name: str, version: int, rows: Iterable[Any]) -> Catalog:
+    spec = CATALOGS[name]
+    rows = tuple(rows)
+    if len(spec.key) == 1:
+        (column,) = spec.key
+        by_key = {getattr(row, column): row for row in rows}
+    else:
+        by_key = {tuple(getattr(row, column) for column in spec.key): row for row in rows}
+    return Catalog(name=name, version=version, rows=rows, by_id={row.id: row for row in rows}, by_key=by_key)
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+class CatalogCache:
+    """Two-tier catalog cache; thread-safe, one instance per process"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Catalog]" = OrderedDict()
+        self._local_versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str) -> Catalog:
+        if name not in CATALOGS:
+            raise KeyError(f"Unknown catalog '{name}'. Cached catalogs: {sorted(CATALOGS)}")
+        entry = self._entries.get(name)
+        if entry is not None and time.monotonic() - entry.loaded_at < self.ttl:
+            self.hits += 1
+            return entry
+
+        with self._lock:
+            self.misses += 1
+            version = self._current_version(name)
+            entry = self._entries.get(name)
+            if entry is None or entry.version != version:
+                entry = self._from_redis(name, version) or self._from_database(name, version)
+            else:
+                # Still current: restart its TTL
+                entry = Catalog(entry.name, entry.version, entry.rows, entry.by_id, entry.by_key)
+            self._entries[name] = entry
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return entry
+
+    def invalidate(self, name: str, version: Optional[int] = None) -> None:
+        """Drop the local snapshot (only if older than `version`, when given)"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and (version is None or entry.version < version):
+                del self._entries[name]
+
+    def bump(self, names: Iterable[str], background: bool = False) -> None:
+        """
+        A commit changed these catalogs: new version everywhere
+
+        This process drops its snapshots at once; with `background` the
+        Redis version bump and publish run on the background writer.
+        """
+        names = list(names)
+        for name in names:
+            with self._lock:
+                self._local_versions[name] = self._local_versions.get(name, 0) + 1
+            self.invalidate(name)
+        if get_sync_redis() is not None:
+            if background:
+                submit_background(self._publish_bump, names)
+            else:
+                self._publish_bump(names)
+
+    def _publish_bump(self, names: Iterable[str]) -> None:
+        client = get_sync_redis()
+        for name in names:
+            try:
+                version = client.incr(f"catalog:{name}:version")
+                client.publish(INVALIDATION_CHANNEL, f"{name}:{version}")
+            except Exception as e:
+                logger.warning(f"Catalog {name}: could not bump version in Redis: {e}")
+                continue
+            # A read between the local drop and the bump may have cached the previous version
+            self.invalidate(name, version)
+
+    def revalidate(self) -> int:
+        """Drop snapshots whose version is no longer current (inherited ones); returns how many"""
+        dropped = 0
+        for name, entry in list(self._entries.items()):
+            if self._current_version(name) != entry.version:
+                self.invalidate(name)
+                dropped += 1
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "catalogs": {name: {"version": entry.version, "rows": len(entry.rows)} for name, entry in self._entries.items()},
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # ------------------------------------------------------------------
+
+    def _current_version(self, name: str) -> int:
+        client = get_sync_redis()
+        if client is not None:
+            try:
+                return int(client.get(f"catalog:{name}:version") or 0)
+            except Exception as e:
+                logger.warning(f"Catalog {name}: Redis unavailable, using local version: {e}")
+        return -1 - self._local_versions.get(name, 0)
+
+    def _from_redis(self, name: str, version: int) -> Optional[Catalog]:
+        client = get_sync_redis()
+        if client is None or version < 0:
+            return None
+        try:
+            raw = client.get(f"catalog:{name}:data")
+        except Exception as e:
+            logger.warning(f"Catalog {name}: Redis read failed: {e}")
+            return None
+        if not raw:
+            return None
+        data = json.loads(raw)
+        if data.get("version") != version:
+            return None
+        row_class = _row_class(name)
+        table = row_class.table()
+        if data.get("columns") != list(row_class.__columns__):
+            return None  # written by a different schema version
+        decoders = [_decoder(table.c[column]) for column in row_class.__columns__]
+        rows = [
+            row_class(*(None if value is None else decode(value) for decode, value in zip(decoders, values)))
+            for values in data["rows"]
+        ]
+        return _build(name, version, rows)
+
+    def _from_database(self, name: str, version: int) -> Catalog:
+        from app.database.connection import engine
+
+        row_class = _row_class(name)
+        # Always the primary: a lagging replica could store pre-commit rows under the new version
+        with engine.connect() as conn:
+            rows = [row_class(*row) for row in conn.execute(row_class.select())]
+        catalog = _build(name, version, rows)
+
+        client = get_sync_redis()
+        if client is not None and version >= 0:
+            payload = json.dumps({
+                "version": version,
+                "columns": list(row_class.__columns__),
+                "rows": [[_encode(getattr(row, column)) for column in row_class.__columns__] for row in rows],
+            })
+            try:
+                client.set(f"catalog:{name}:data", payload)
+            except Exception as e:
+                logger.warning(f"Catalog {name}: Redis write failed: {e}")
+        return catalog
+
+
+catalog_cache = CatalogCache(maxsize=settings.catalog_cache_size, ttl=settings.catalog_cache_ttl)
+
+
+def get_catalog(name: str) -> Catalog:
+    return catalog_cache.get(name)
+
+
+def lookup(name: str, key: Any) -> Optional[Any]:
+    """Catalog row by its lookup key (code, or a tuple for composite keys)"""
+    return catalog_cache.get(name).get(key)
+
+
+def lookup_id(name: str, id: Any) -> Optional[Any]:
+    """Catalog row by primary key"""
+    return catalog_cache.get(name).get_id(id)
+
+
+def preload() -> int:
+    """Load every catalog; returns the total number of rows"""
+    return sum(len(get_catalog(name).rows) for name in CATALOGS)
+
+
+# ----------------------------------------------------------------------
+# Commit-driven invalidation
+# ----------------------------------------------------------------------
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_catalogs(session: Session, flush_context) -> None:
+    changed = {type(obj).__name__ for obj in chain(session.new, session.dirty, session.deleted)}
+    changed &= CATALOGS.keys()
+    if changed:
+        session.info.setdefault(_SESSION_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_changes(orm_execute_state: ORMExecuteState) -> None:
+    # session.execute(update(UserType)...) bypasses the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_.__name__ in CATALOGS:
+            orm_execute_state.session.info.setdefault(_SESSION_KEY, set()).add(mapper.class_.__name__)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_catalogs(session: Session) -> None:
+    changed = session.info.pop(_SESSION_KEY, None)
+    if changed:
+        # Runs on the event loop under AsyncSession: Redis goes to the background writer
+        catalog_cache.bump(changed, background=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_catalogs(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+# ----------------------------------------------------------------------
+# Cross-worker invalidation listener
+# ----------------------------------------------------------------------
+
+def _apply_invalidation(data: str) -> None:
+    name, _, version = data.rpartition(":")
+    if name in CATALOGS:
+        catalog_cache.invalidate(name, int(version))
+
+
+_listener: Optional[Subscriber] = None
+
+
+def start_invalidation_listener() -> bool:
+    """Subscribe this process to invalidations; False when Redis is not configured"""
+    global _listener
+    if get_sync_redis() is None:
+        return False
+    if _listener is None or not _listener.is_alive():
+        _listener = Subscriber(INVALIDATION_CHANNEL, _apply_invalidation, name="catalog-invalidation")
+        _listener.start()
+    return True
+
+
+def stop_invalidation_listener(timeout: float = 2.0) -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop(timeout)
+        _listener = None
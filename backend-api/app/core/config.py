@@ -20,18 +20,79 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", env="HOST")
     port: int = Field(default=8000, env="PORT")
     debug: bool = Field(default=False, env="DEBUG")
+    web_workers: int = Field(default=4, env="WEB_CONCURRENCY")
+    preload_app: bool = Field(default=True, env="PRELOAD_APP")
+    # Peers whose X-Forwarded-For / X-Forwarded-Proto uvicorn trusts (comma-separated; "*" trusts any client)
+    forwarded_allow_ips: str = Field(default="127.0.0.1", env="FORWARDED_ALLOW_IPS")
+
+    # Startup warm-up and graceful shutdown
+    warmup_db_connections: int = Field(default=2, env="WARMUP_DB_CONNECTIONS")
+    warmup_step_timeout: float = Field(default=10.0, env="WARMUP_STEP_TIMEOUT")
+    shutdown_drain_timeout: float = Field(default=25.0, env="SHUTDOWN_DRAIN_TIMEOUT")
     
     # Database Settings
     database_url: str = Field(env="DATABASE_URL")
     db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
     db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
-    
+    database_async_url: Optional[str] = Field(default=None, env="DATABASE_ASYNC_URL")
+
+    # Read replicas (SELECT-only units of work)
+    database_replica_urls: list[str] = Field(default=[], env="DATABASE_REPLICA_URLS")
+    db_replica_max_lag_seconds: float = Field(default=5.0, env="DB_REPLICA_MAX_LAG_SECONDS")
+    db_replica_lag_check_interval: float = Field(default=2.0, env="DB_REPLICA_LAG_CHECK_INTERVAL")
+
+    # Per-request SQL budget / N+1 detection (mode: off, log, raise)
+    sql_budget_mode: str = Field(default="log", env="SQL_BUDGET_MODE")
+    sql_budget_max_statements: int = Field(default=50, env="SQL_BUDGET_MAX_STATEMENTS")
+    sql_budget_max_db_ms: Optional[float] = Field(default=None, env="SQL_BUDGET_MAX_DB_MS")
+    sql_budget_max_lazy_loads: int = Field(default=5, env="SQL_BUDGET_MAX_LAZY_LOADS")
+
+    # Monthly partitions for log/event tables (expire action: detach, drop)
+    partition_premake_months: int = Field(default=3, env="PARTITION_PREMAKE_MONTHS")
+    partition_expire_action: str = Field(default="detach", env="PARTITION_EXPIRE_ACTION")
+    partition_detach_lock_timeout_ms: int = Field(default=2000, env="PARTITION_DETACH_LOCK_TIMEOUT_MS")
+    partition_detach_attempts: int = Field(default=5, env="PARTITION_DETACH_ATTEMPTS")
+
+    # Admin exports: longest since/until window a single export may cover
+    export_max_window_days: int = Field(default=31, env="EXPORT_MAX_WINDOW_DAYS")
+
     # Security Settings
     secret_key: str = Field(env="SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     jwt_expire_minutes: int = Field(default=30, env="JWT_EXPIRE_MINUTES")
     jwt_refresh_expire_days: int = Field(default=7, env="JWT_REFRESH_EXPIRE_DAYS")
     bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+
+    # Password hashing executor (mode: thread, process); workers default to the CPU count
+    password_hasher_mode: str = Field(default="thread", env="PASSWORD_HASHER_MODE")
+    password_hasher_workers: Optional[int] = Field(default=None, env="PASSWORD_HASHER_WORKERS")
+    password_hasher_max_pending: int = Field(default=64, env="PASSWORD_HASHER_MAX_PENDING")
+
+    # Write-behind buffer for login/device bookkeeping (seconds, rows per UPDATE, rows held in memory)
+    activity_flush_interval: float = Field(default=5.0, env="ACTIVITY_FLUSH_INTERVAL")
+    activity_flush_batch_size: int = Field(default=1000, env="ACTIVITY_FLUSH_BATCH_SIZE")
+    activity_max_pending: int = Field(default=100000, env="ACTIVITY_MAX_PENDING")
+
+    # Login lockout
+    login_max_failed_attempts: int = Field(default=5, env="LOGIN_MAX_FAILED_ATTEMPTS")
+    login_lockout_minutes: int = Field(default=15, env="LOGIN_LOCKOUT_MINUTES")
+
+    # Authenticated principal cache; TTL bounds trust in a cached principal while Redis is unreachable
+    principal_cache_size: int = Field(default=10000, env="PRINCIPAL_CACHE_SIZE")
+    principal_cache_ttl: float = Field(default=60.0, env="PRINCIPAL_CACHE_TTL")
+
+    # Parsed user agents kept in memory for device fingerprinting (distinct strings)
+    user_agent_cache_size: int = Field(default=4096, env="USER_AGENT_CACHE_SIZE")
+
+    # IpBlock enforcement: incremental and full refresh (seconds); proxies in front of the app that append to X-Forwarded-For (0 ignores the header)
+    ip_block_refresh_interval: float = Field(default=10.0, env="IP_BLOCK_REFRESH_INTERVAL")
+    ip_block_full_reload_interval: float = Field(default=600.0, env="IP_BLOCK_FULL_RELOAD_INTERVAL")
+    ip_block_forwarded_for_hops: int = Field(default=0, env="IP_BLOCK_FORWARDED_FOR_HOPS")
+
+    # Brute-force detection: failures per address within the window create an automatic IpBlock
+    brute_force_window_seconds: int = Field(default=300, env="BRUTE_FORCE_WINDOW_SECONDS")
+    brute_force_max_failures: int = Field(default=20, env="BRUTE_FORCE_MAX_FAILURES")
+    brute_force_block_minutes: int = Field(default=60, env="BRUTE_FORCE_BLOCK_MINUTES")
     
     # CORS Settings
     allowed_origins: list[str] = Field(default=["*"], env="ALLOWED_ORIGINS")
@@ -48,7 +109,32 @@ class Settings(BaseSettings):
     
     # Redis Settings (for caching/sessions)
     redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
-    
+    redis_socket_timeout: float = Field(default=2.0, env="REDIS_SOCKET_TIMEOUT")
+
+    # Catalog cache (in-process LRU over Redis); TTL bounds staleness if an invalidation is missed
+    catalog_cache_size: int = Field(default=64, env="CATALOG_CACHE_SIZE")
+    catalog_cache_ttl: float = Field(default=300.0, env="CATALOG_CACHE_TTL")
+
+    # Runtime configuration snapshot (Configuration table); key defaults to one derived from SECRET_KEY
+    config_encryption_key: Optional[str] = Field(default=None, env="CONFIG_ENCRYPTION_KEY")
+    config_version_check_interval: float = Field(default=60.0, env="CONFIG_VERSION_CHECK_INTERVAL")
+
+    @property
+    def async_database_url(self) -> str:
+        """Async driver URL; derived from DATABASE_URL unless set explicitly"""
+        if self.database_async_url:
+            return self.database_async_url
+        url = self.database_url
+        for sync_prefix, async_prefix in (
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+            ("postgres://", "postgresql+asyncpg://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(sync_prefix):
+                return async_prefix + url[len(sync_prefix):]
+        return url
+
     class Config:
         env_file = ".env"
         case_sensitive = False
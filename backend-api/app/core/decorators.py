@@ -0,0 +1,39 @@
+"""
+Endpoint decorators
+"""
+
+from typing import Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.database.query_tracker import SQLBudget
+
+F = TypeVar("F", bound=Callable)
+
+
+def sql_budget(
+    max_statements: int,
+    max_db_ms: Optional[float] = None,
+    max_lazy_loads_per_attribute: Optional[int] = None,
+) -> Callable[[F], F]:
+    """
+    Override the default per-request SQL budget for one endpoint
+
+        @router.get("/tasks")
+        @sql_budget(max_statements=4)
+        async def list_tasks(...): ...
+    """
+    budget = SQLBudget(
+        max_statements=max_statements,
+        max_db_ms=max_db_ms,
+        max_lazy_loads_per_attribute=(
+            max_lazy_loads_per_attribute
+            if max_lazy_loads_per_attribute is not None
+            else settings.sql_budget_max_lazy_loads
+        ),
+    )
+
+    def decorator(func: F) -> F:
+        func.__sql_budget__ = budget
+        return func
+
+    return decorator
@@ -0,0 +1,16 @@
+"""
+Application exceptions
+"""
+
+
+class SQLBudgetExceeded(Exception):
+    """A request exceeded its per-route SQL statement budget (strict mode)"""
+
+    def __init__(self, route: str, problems: list[str]):
+        self.route = route
+        self.problems = problems
+        super().__init__(f"SQL budget exceeded on {route}: {'; '.join(problems)}")
+
+
+class InvalidCursor(ValueError):
+    """A pagination cursor failed signature verification or could not be decoded"""
@@ -0,0 +1,350 @@
+"""
+IP blocking
+Active IpBlock rows held in memory as compressed radix tries (one for IPv4,
+one for IPv6), so checking a request is a walk of at most a few dozen
+nodes: microseconds, no database or Redis round trip.
+
+The blocklist refreshes incrementally: every IP_BLOCK_REFRESH_INTERVAL
+seconds it reads the rows whose updated_at passed the last watermark
+(minus a small overlap for transactions that committed late) and applies
+them. A full reload every IP_BLOCK_FULL_RELOAD_INTERVAL also catches hard
+deletes and compacts the tries. Expiry is checked at lookup time.
+
+Brute-force detection keeps a Redis sliding window (sorted set of failure
+timestamps) per address; BRUTE_FORCE_MAX_FAILURES within
+BRUTE_FORCE_WINDOW_SECONDS creates a block_type="automatic" row lasting
+BRUTE_FORCE_BLOCK_MINUTES. Without Redis the window is per process.
+"""
+
+from sqlalchemy import insert, or_, select
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import ipaddress
+import logging
+import math
+import time
+import uuid
+
+from app.config.redis import get_redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rows committed up to this long after their updated_at are still picked up
+WATERMARK_OVERLAP = timedelta(seconds=30)
+
+
+# ----------------------------------------------------------------------
+# Radix trie
+# ----------------------------------------------------------------------
+
+class _Node:
+    __slots__ = ("prefix", "length", "blocks", "children")
+
+    def __init__(self, prefix: int, length: int):
+        self.prefix = prefix        # the first `length` bits of the network
+        self.length = length
+        self.blocks: Optional[Dict[Any, float]] = None   # block id -> expiry (epoch, inf if permanent)
+        self.children: List[Optional["_Node"]] = [None, None]
+
+
+class CidrTrie:
+    """
+    Path-compressed binary trie of network prefixes
+
+    Chains of single-child nodes are collapsed into one node, so depth is
+    bounded by the number of distinct branching points, not by 32 or 128.
+    """
+
+    def __init__(self, bits: int):
+        self.bits = bits
+        self.root = _Node(0, 0)
+
+    def insert(self, prefix: int, length: int, block_id: Any, expires: float) -> None:
+        node = self.root
+        while True:
+            if node.length == length:
+                if node.blocks is None:
+                    node.blocks = {}
+                node.blocks[block_id] = expires
+                return
+            bit = (prefix >> (length - node.length - 1)) & 1
+            child = node.children[bit]
+            if child is None:
+                leaf = _Node(prefix, length)
+                leaf.blocks = {block_id: expires}
+                node.children[bit] = leaf
+                return
+            common = _common_length(child.prefix, child.length, prefix, length)
+            if common >= child.length:
+                node = child
+                continue
+            # Split the compressed edge where the two prefixes diverge
+            middle = _Node(prefix >> (length - common), common)
+            middle.children[(child.prefix >> (child.length - common - 1)) & 1] = child
+            node.children[bit] = middle
+            node = middle
+
+    def remove(self, prefix: int, length: int, block_id: Any) -> None:
+        """Drop one block; emptied nodes stay until the next full reload"""
+        node = self.root
+        while node is not None and node.length < length:
+            node = node.children[(prefix >> (length - node.length - 1)) & 1]
+            if node is not None and (node.length > length or prefix >> (length - node.length) != node.prefix):
+                return
+        if node is not None and node.length == length and node.blocks:
+            node.blocks.pop(block_id, None)
+
+    def match(self, address: int, now: float) -> Optional[Any]:
+        """Id of an unexpired block covering `address`, if any"""
+        bits = self.bits
+        node = self.root
+        while node is not None:
+            if node.length and address >> (bits - node.length) != node.prefix:
+                return None
+            if node.blocks:
+                for block_id, expires in node.blocks.items():
+                    if expires > now:
+                        return block_id
+            if node.length == bits:
+                return None
+            node = node.children[(address >> (bits - node.length - 1)) & 1]
+        return None
+
+
+def _common_length(a: int, a_length: int, b: int, b_length: int) -> int:
+    """Length of the longest common prefix of two prefixes"""
+    length = min(a_length, b_length)
+    return length - ((a >> (a_length - length)) ^ (b >> (b_length - length))).bit_length()
+
+
+def _network(row) -> Optional[Tuple[int, int, int]]:
+    """(ip version, prefix, prefix length) of an IpBlock row; None if unparsable"""
+    try:
+        if row.ip_range:
+            network = ipaddress.ip_network(row.ip_range.strip(), strict=False)
+        else:
+            network = ipaddress.ip_network(row.ip_address.strip())
+    except ValueError:
+        logger.warning(f"IpBlock {row.id}: cannot parse {row.ip_range or row.ip_address!r}, ignored")
+        return None
+    length = network.prefixlen
+    return network.version, int(network.network_address) >> (network.max_prefixlen - length), length
+
+
+def _expiry(expires_at: Optional[datetime]) -> float:
+    if expires_at is None:
+        return math.inf
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
+
+
+# ----------------------------------------------------------------------
+# Blocklist
+# ----------------------------------------------------------------------
+
+class Blocklist:
+    """Active blocks of this process; read and written on the event loop thread only"""
+
+    def __init__(self):
+        self._tries = {4: CidrTrie(32), 6: CidrTrie(128)}
+        self._entries: Dict[Any, Tuple[int, int, int]] = {}
+        self.watermark: Optional[datetime] = None
+        self.loaded_at = 0.0
+        self.full_loaded_at = 0.0
+        self.refreshing = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_blocked(self, ip: str) -> Optional[Any]:
+        """Id of the block covering `ip`, None if it is allowed (or not an IP)"""
+        if not self._entries:
+            return None
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if address.version == 6 and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+        return self._tries[address.version].match(int(address), time.time())
+
+    def apply(self, rows: Iterable[Any]) -> int:
+        """Add, update or drop blocks from IpBlock rows; returns the number applied"""
+        now = time.time()
+        applied = 0
+        for row in rows:
+            previous = self._entries.pop(row.id, None)
+            if previous is not None:
+                version, prefix, length = previous
+                self._tries[version].remove(prefix, length, row.id)
+            expires = _expiry(row.expires_at)
+            if row.is_active and expires > now:
+                network = _network(row)
+                if network is not None:
+                    version, prefix, length = network
+                    self._tries[version].insert(prefix, length, row.id, expires)
+                    self._entries[row.id] = network
+            if row.updated_at is not None and (self.watermark is None or row.updated_at > self.watermark):
+                self.watermark = row.updated_at
+            applied += 1
+        self.loaded_at = time.monotonic()
+        return applied
+
+    def replace(self, rows: Iterable[Any]) -> int:
+        """Full reload: rebuild compact tries from scratch"""
+        fresh = Blocklist()
+        count = fresh.apply(rows)
+        self._tries, self._entries, self.watermark = fresh._tries, fresh._entries, fresh.watermark
+        self.loaded_at = self.full_loaded_at = time.monotonic()
+        return count
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "blocks": len(self._entries),
+            "ipv4": sum(1 for version, _, _ in self._entries.values() if version == 4),
+            "ipv6": sum(1 for version, _, _ in self._entries.values() if version == 6),
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "seconds_since_refresh": round(time.monotonic() - self.loaded_at, 1) if self.loaded_at else None,
+            "seconds_since_full_reload": round(time.monotonic() - self.full_loaded_at, 1) if self.full_loaded_at else None,
+        }
+
+    def refresh_due(self) -> bool:
+        return not self.refreshing and time.monotonic() - self.loaded_at >= settings.ip_block_refresh_interval
+
+    async def refresh(self) -> int:
+        """Pull changed rows (or everything, when a full reload is due) and apply them here"""
+        self.refreshing = True
+        try:
+            full = self.watermark is None or time.monotonic() - self.full_loaded_at >= settings.ip_block_full_reload_interval
+            since = None if full else self.watermark - WATERMARK_OVERLAP
+            rows = await asyncio.to_thread(fetch_blocks, since)
+            return self.replace(rows) if full else self.apply(rows)
+        except Exception as e:
+            # Keep serving the current tries; retry after the next interval
+            self.loaded_at = time.monotonic()
+            logger.warning(f"IpBlock refresh failed: {str(e).splitlines()[0]}")
+            return 0
+        finally:
+            self.refreshing = False
+
+
+def fetch_blocks(since: Optional[datetime]) -> List[Any]:
+    """Active blocks (since=None) or every row changed after `since`"""
+    from app.database.connection import engine
+    from app.models.user_management.ip_block import IpBlock
+
+    table = IpBlock.__table__
+    stmt = select(
+        table.c.id, table.c.ip_address, table.c.ip_range, table.c.expires_at,
+        table.c.is_active, table.c.updated_at,
+    )
+    if since is None:
+        stmt = stmt.where(table.c.is_active.is_(True)).where(
+            or_(table.c.expires_at.is_(None), table.c.expires_at > datetime.now(timezone.utc))
+        )
+    else:
+        stmt = stmt.where(table.c.updated_at > since)
+    with engine.connect() as conn:
+        return conn.execute(stmt).all()
+
+
+blocklist = Blocklist()
+
+
+# ----------------------------------------------------------------------
+# Brute-force detection
+# ----------------------------------------------------------------------
+
+_local_failures: Dict[str, Deque[float]] = defaultdict(deque)
+_local_blocked_until: Dict[str, float] = {}
+
+
+async def _count_failure(key: str, now: float, window: float) -> int:
+    client = get_redis()
+    if client is not None:
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.zremrangebyscore(key, 0, now - window)
+            pipe.zadd(key, {f"{now:.6f}:{uuid.uuid4().hex[:8]}": now})
+            pipe.zcard(key)
+            pipe.expire(key, int(window) + 1)
+            return (await pipe.execute())[2]
+        except Exception as e:
+            logger.warning(f"Brute-force counter: Redis unavailable, counting locally: {e}")
+    failures = _local_failures[key]
+    failures.append(now)
+    while failures and failures[0] <= now - window:
+        failures.popleft()
+    return len(failures)
+
+
+async def _claim_block(ip: str, seconds: int) -> bool:
+    # One automatic block per address and period, however many workers see the storm
+    client = get_redis()
+    if client is not None:
+        try:
+            return bool(await client.set(f"bruteforce:blocked:{ip}", 1, nx=True, ex=seconds))
+        except Exception as e:
+            logger.warning(f"Brute-force guard: Redis unavailable, deduplicating locally: {e}")
+    now = time.time()
+    if _local_blocked_until.get(ip, 0) > now:
+        return False
+    _local_blocked_until[ip] = now + seconds
+    return True
+
+
+def _create_automatic_block(ip: str, failures: int, scope: str) -> Any:
+    from app.database.connection import engine
+    from app.models.user_management.ip_block import IpBlock
+
+    now = datetime.now(timezone.utc)
+    table = IpBlock.__table__
+    with engine.begin() as conn:
+        return conn.execute(
+            insert(table)
+            .values(
+                ip_address=ip,
+                reason=f"Too many failed {scope} attempts",
+                description=f"{failures} failures in {settings.brute_force_window_seconds}s",
+                block_type="automatic",
+                blocked_at=now,
+                expires_at=now + timedelta(minutes=settings.brute_force_block_minutes),
+                is_active=True,
+                failed_attempts=failures,
+                last_attempt=now,
+            )
+            .returning(
+                table.c.id, table.c.ip_address, table.c.ip_range, table.c.expires_at,
+                table.c.is_active, table.c.updated_at,
+            )
+        ).one()
+
+
+async def record_failure(ip: Optional[str], scope: str = "login") -> bool:
+    """
+    Count a failed attempt from `ip`; True if it just got blocked
+
+    Call from the event loop (the new block is applied to this worker's
+    blocklist at once; the others pick it up on their next refresh).
+    """
+    if not ip or blocklist.is_blocked(ip) is not None:
+        return False
+    now = time.time()
+    window = settings.brute_force_window_seconds
+    failures = await _count_failure(f"bruteforce:{scope}:{ip}", now, window)
+    if failures < settings.brute_force_max_failures:
+        return False
+    if not await _claim_block(ip, settings.brute_force_block_minutes * 60):
+        return False
+    try:
+        row = await asyncio.to_thread(_create_automatic_block, ip, failures, scope)
+    except Exception:
+        logger.exception(f"Could not create automatic IpBlock for {ip}")
+        return False
+    blocklist.apply([row])
+    logger.warning(f"Blocked {ip} for {settings.brute_force_block_minutes} min after {failures} failed {scope} attempts")
+    return True
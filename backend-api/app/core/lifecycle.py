@@ -0,0 +1,359 @@
+"""
+Application lifecycle
+Pluggable warm-up run by the lifespan handler before the worker reports
+ready, in-flight request tracking, and draining plus pool shutdown on exit.
+
+Register extra steps anywhere at import time:
+
+    @warmup_step("search_index")
+    async def warm_search_index(app):
+        ...
+
+Session and table event listeners (commit-driven cache invalidation,
+configuration reload, security stamps, subtype triggers for create_all)
+live next to the code they serve; install_session_hooks() registers them
+all, once, at app import, so every worker forked by the launcher has them.
+
+Steps run in registration order. A step may be sync (run in a worker thread)
+or async, gets the FastAPI app and may return a short detail for the logs.
+A failed step is logged and reported by /health but does not block
+readiness: anything it would have primed is simply paid by the first request.
+Steps marked `critical` are the exception: without them no request can be
+served correctly (no database, no configuration), so if one fails the
+worker stays in the "failed" phase, /health answers 503 and the
+orchestrator restarts it instead of routing traffic to it.
+"""
+
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class WarmupStep:
+    """
+    One warm-up step
+    `fork_safe` steps open no connections or threads, so the preloading
+    launcher can run them once in the parent before forking. A failed
+    `critical` step keeps the worker from reporting ready.
+    """
+    name: str
+    func: Callable[[Any], Any]
+    fork_safe: bool = False
+    critical: bool = False
+
+
+@dataclass
+class StepResult:
+    name: str
+    ok: bool
+    ms: float
+    detail: Optional[str] = None
+    error: Optional[str] = None
+    critical: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = {"ok": self.ok, "ms": round(self.ms, 1)}
+        if self.critical:
+            data["critical"] = True
+        if self.detail:
+            data["detail"] = self.detail
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+@dataclass
+class LifecycleState:
+    """Per-worker lifecycle phase: starting -> ready (or failed) -> draining -> stopped"""
+    phase: str = "starting"
+    steps: List[StepResult] = field(default_factory=list)
+    warmup_ms: float = 0.0
+    in_flight: int = 0
+    _idle: Optional[asyncio.Event] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.phase == "ready"
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        if self._idle is not None:
+            self._idle.clear()
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "warmup_ms": round(self.warmup_ms, 1),
+            "in_flight": self.in_flight,
+            "steps": {result.name: result.as_dict() for result in self.steps},
+        }
+
+
+state = LifecycleState()
+_steps: List[WarmupStep] = []
+
+
+def register_warmup_step(step: WarmupStep) -> WarmupStep:
+    """Add (or replace) a warm-up step"""
+    _steps[:] = [existing for existing in _steps if existing.name != step.name]
+    _steps.append(step)
+    return step
+
+
+def warmup_step(name: str, fork_safe: bool = False, critical: bool = False):
+    """Decorator form of register_warmup_step"""
+    def decorator(func: Callable[[Any], Any]):
+        register_warmup_step(WarmupStep(name=name, func=func, fork_safe=fork_safe, critical=critical))
+        return func
+    return decorator
+
+
+def warmup_steps(fork_safe_only: bool = False) -> List[WarmupStep]:
+    return [step for step in _steps if step.fork_safe or not fork_safe_only]
+
+
+# ----------------------------------------------------------------------
+# Session hooks
+# ----------------------------------------------------------------------
+
+# Modules that register Session / Table event listeners when imported
+SESSION_HOOK_MODULES = (
+    "app.core.catalogs",
+    "app.core.runtime_config",
+    "app.core.principals",
+    "app.database.polymorphic",
+)
+
+
+def install_session_hooks() -> None:
+    """
+    Register every commit hook the app relies on (idempotent)
+
+    Called at app import. Jobs and scripts that edit catalogs,
+    configuration or users through the ORM outside the app call it first.
+    """
+    for module in SESSION_HOOK_MODULES:
+        import_module(module)
+
+
+# ----------------------------------------------------------------------
+# Warm-up
+# ----------------------------------------------------------------------
+
+async def _run_step(step: WarmupStep, app) -> StepResult:
+    started = time.perf_counter()
+    try:
+        if inspect.iscoroutinefunction(step.func):
+            call = step.func(app)
+        else:
+            call = asyncio.to_thread(step.func, app)
+        detail = await asyncio.wait_for(call, timeout=settings.warmup_step_timeout)
+        return StepResult(step.name, True, (time.perf_counter() - started) * 1000,
+                          detail=str(detail) if detail is not None else None, critical=step.critical)
+    except asyncio.TimeoutError:
+        error = f"timed out after {settings.warmup_step_timeout}s"
+    except Exception as e:
+        # First line only; driver errors append multi-line hints
+        message = str(e).splitlines()
+        error = f"{type(e).__name__}: {message[0] if message else ''}"
+    return StepResult(step.name, False, (time.perf_counter() - started) * 1000, error=error, critical=step.critical)
+
+
+async def run_warmup(app) -> LifecycleState:
+    """Run every registered step, then mark this worker ready (failed if a critical step failed)"""
+    state.phase = "starting"
+    state.steps = []
+    started = time.perf_counter()
+    for step in warmup_steps():
+        result = await _run_step(step, app)
+        state.steps.append(result)
+        if result.ok:
+            logger.info(f"Warm-up step {step.name}: {result.ms:.0f} ms{f' ({result.detail})' if result.detail else ''}")
+        else:
+            logger.warning(f"Warm-up step {step.name} failed after {result.ms:.0f} ms: {result.error}")
+    state.warmup_ms = (time.perf_counter() - started) * 1000
+    state.phase = "failed" if any(result.critical and not result.ok for result in state.steps) else "ready"
+    return state
+
+
+# ----------------------------------------------------------------------
+# Shutdown
+# ----------------------------------------------------------------------
+
+async def drain(timeout: Optional[float] = None) -> bool:
+    """
+    Stop reporting ready and wait for in-flight requests to finish
+    Returns False when the timeout expired with requests still running.
+    """
+    timeout = settings.shutdown_drain_timeout if timeout is None else timeout
+    state.phase = "draining"
+    if state.in_flight == 0:
+        return True
+    state._idle = asyncio.Event()
+    try:
+        await asyncio.wait_for(state._idle.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        logger.warning(f"Shutdown drain timed out with {state.in_flight} request(s) in flight")
+        return False
+    finally:
+        state._idle = None
+
+
+async def close_pools() -> None:
+    """Close database pools (primary, async, replicas) and the Redis clients"""
+    from app.config.redis import close_redis, flush_background
+    from app.core.catalogs import stop_invalidation_listener
+    from app.core.runtime_config import stop_reload_listener
+    from app.database.activity_buffer import activity_buffer
+    from app.services.auth.security_service import password_hasher
+    from app.database.connection import async_engine, engine
+    from app.database.session import replica_engines
+
+    # Last write-behind flush and queued commit-hook writes (Redis bumps, config
+    # reload) while the primary pool and Redis are still open
+    await asyncio.to_thread(activity_buffer.stop)
+    await asyncio.to_thread(flush_background)
+    for pooled in (engine, *replica_engines):
+        pooled.dispose()
+    await async_engine.dispose()
+    await asyncio.to_thread(stop_invalidation_listener)
+    await asyncio.to_thread(stop_reload_listener)
+    password_hasher.shutdown()
+    await close_redis()
+    state.phase = "stopped"
+
+
+# ----------------------------------------------------------------------
+# Default steps
+# ----------------------------------------------------------------------
+
+# Not critical until every relationship in the model tree configures: a mapper
+# error would otherwise keep every worker unready. The critical steps below
+# (pools, configuration) only run Core queries.
+@warmup_step("configure_mappers", fork_safe=True)
+def _configure_mappers(app):
+    from app.models import configure_models
+    warm = configure_models()
+    return f"{warm['mappers']} mappers"
+
+
+@warmup_step("loading_profiles", fork_safe=True)
+def _compile_loading_profiles(app):
+    from app.database.loading_profiles import _profiles, loading_options
+    for name in list(_profiles):
+        loading_options(name)
+    return f"{len(_profiles)} profiles"
+
+
+def _open_connections(pooled, count: int) -> None:
+    # Hold all of them at once so the pool really grows to `count`
+    connections = []
+    try:
+        for _ in range(count):
+            conn = pooled.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+@warmup_step("database_pool", critical=True)
+def _open_database_pool(app):
+    from app.database.session import replica_engines
+    from app.database.connection import engine
+
+    count = min(settings.warmup_db_connections, settings.db_pool_size)
+    for pooled in (engine, *replica_engines):
+        _open_connections(pooled, count)
+    return f"{count} connection(s) x {1 + len(replica_engines)} engine(s)"
+
+
+@warmup_step("database_pool_async", critical=True)
+async def _open_async_database_pool(app):
+    from app.database.connection import async_engine
+
+    count = min(settings.warmup_db_connections, settings.db_pool_size)
+    connections = []
+    try:
+        for _ in range(count):
+            conn = await async_engine.connect()
+            connections.append(conn)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            await conn.close()
+    return f"{count} connection(s)"
+
+
+@warmup_step("redis")
+async def _ping_redis(app):
+    from app.config.redis import get_redis
+
+    client = get_redis()
+    if client is None:
+        return "not configured"
+    await client.ping()
+    return "pong"
+
+
+@warmup_step("catalogs")
+def _preload_catalogs(app):
+    # Subscribes this worker to invalidations, then fills both cache tiers.
+    # Snapshots inherited from the preloading launcher were loaded before the
+    # subscription, so any that changed meanwhile are dropped and reloaded.
+    from app.core.catalogs import CATALOGS, catalog_cache, preload, start_invalidation_listener
+
+    listening = start_invalidation_listener()
+    stale = catalog_cache.revalidate()
+    rows = preload()
+    return f"{rows} rows from {len(CATALOGS)} catalogs" + (f", {stale} reloaded" if stale else "") + ("" if listening else ", local only")
+
+
+@warmup_step("configuration", critical=True)
+def _load_configuration(app):
+    from app.core.runtime_config import reload_config, start_reload_listener
+
+    snapshot = reload_config()
+    listening = start_reload_listener()
+    keys = len(snapshot.values) + len(snapshot.secrets)
+    return f"{keys} keys, version {snapshot.version}" + ("" if listening else ", local only")
+
+
+@warmup_step("ip_blocks")
+async def _load_ip_blocks(app):
+    from app.core.ip_blocks import blocklist, fetch_blocks
+
+    count = blocklist.replace(await asyncio.to_thread(fetch_blocks, None))
+    return f"{count} active block(s)"
+
+
+@warmup_step("password_hasher")
+async def _start_password_hasher(app):
+    # Spawns the executor's workers and the dummy hash before the first login
+    from app.services.auth.security_service import dummy_hash, password_hasher
+
+    await password_hasher.verify("warm-up", await asyncio.to_thread(dummy_hash))
+    return f"{password_hasher.mode} x{password_hasher.workers}, rounds {password_hasher.rounds}"
+
+
+@warmup_step("openapi", fork_safe=True)
+def _render_openapi(app):
+    schema = app.openapi()
+    return f"{len(schema.get('paths', {}))} paths"
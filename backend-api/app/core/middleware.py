@@ -0,0 +1,139 @@
+"""
+ASGI middleware
+"""
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.ip_blocks import blocklist
+from app.core.lifecycle import state as lifecycle_state
+from app.database.query_tracker import SQLBudget, current_stats, start_tracking, stop_tracking
+
+logger = logging.getLogger(__name__)
+
+
+class SQLBudgetMiddleware:
+    """
+    Counts SQL statements and DB time per request
+    Emits a Server-Timing header and logs (or, in strict mode, raises from the
+    offending statement) when the route's budget or N+1 threshold is exceeded.
+    Routes override the defaults with @sql_budget.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or settings.sql_budget_mode == "off":
+            await self.app(scope, receive, send)
+            return
+
+        def resolve_budget() -> SQLBudget:
+            endpoint = scope.get("endpoint")
+            budget = getattr(endpoint, "__sql_budget__", None)
+            if budget is not None:
+                return budget
+            return SQLBudget(
+                max_statements=settings.sql_budget_max_statements,
+                max_db_ms=settings.sql_budget_max_db_ms,
+                max_lazy_loads_per_attribute=settings.sql_budget_max_lazy_loads,
+            )
+
+        token = start_tracking(f"{scope['method']} {scope['path']}", resolve_budget)
+        stats = current_stats()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_tracking(token)
+            if stats.statements:
+                problems = stats.violations()
+                if problems:
+                    endpoint = scope.get("endpoint")
+                    logger.warning(
+                        f"SQL budget exceeded on {stats.route} "
+                        f"({getattr(endpoint, '__qualname__', '?')}): {'; '.join(problems)}"
+                    )
+
+
+class InFlightMiddleware:
+    """
+    Counts HTTP requests in flight (streamed bodies included) so shutdown
+    can wait for them to finish before closing the pools
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        lifecycle_state.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lifecycle_state.request_finished()
+
+
+def client_ip(scope: Scope) -> Optional[str]:
+    """
+    Address of the client
+
+    With IP_BLOCK_FORWARDED_FOR_HOPS = N (the number of reverse proxies in
+    front of the app, each appending its peer to X-Forwarded-For), the
+    N-th entry from the right: the one written by our outermost proxy.
+    Entries further left are whatever the client sent and are never used.
+    A header with fewer entries did not come through the proxies, so the
+    socket peer is used instead.
+    """
+    hops = settings.ip_block_forwarded_for_hops
+    if hops > 0:
+        entries = []
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                entries.extend(entry.strip() for entry in value.decode("latin-1").split(","))
+        if len(entries) >= hops and entries[-hops]:
+            return entries[-hops]
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+class IpBlockMiddleware:
+    """
+    Rejects requests from blocked addresses with 403
+    The check is an in-memory trie lookup (app.core.ip_blocks); refreshes
+    run in the background once the interval has elapsed, never inline.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._refresh: Optional[asyncio.Task] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if blocklist.refresh_due() and (self._refresh is None or self._refresh.done()):
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._refresh = asyncio.create_task(blocklist.refresh())
+
+        ip = client_ip(scope)
+        if ip is not None and blocklist.is_blocked(ip) is not None:
+            response = JSONResponse({"detail": "Access from this address is blocked"}, status_code=403)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,222 @@
+"""
+Permissions
+Enumerated permission registry and the bitsets UserType.permissions compile to.
+
+UserType.permissions is free-form JSON. Each user type's document is
+compiled once into a PermissionSet (an int with one bit per Permission)
+and cached against the UserType catalog version, so a check is a single
+bit test and editing a user type recompiles it on every worker. Accepted
+documents:
+
+    ["projects.read", "tasks.*"]                      list of grants
+    {"projects": ["read", "update"], "tasks": "*"}    resource -> actions
+    {"*": true, "configuration": {"update": false}}   wildcard, explicit deny
+
+Explicit denies (false) win over any grant. Unknown names are logged and
+ignored.
+
+    perms = permissions_for_user_type(user.user_type_id)
+    perms.has(Permission.PROJECTS_APPROVE)
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from functools import reduce
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Permission(IntEnum):
+    """
+    Registry of every permission; the value is the bit position
+
+    Bits are never persisted (documents store names), so members can be
+    added or reordered freely.
+    """
+    USERS_READ = auto()
+    USERS_CREATE = auto()
+    USERS_UPDATE = auto()
+    USERS_DELETE = auto()
+    PROJECTS_READ = auto()
+    PROJECTS_CREATE = auto()
+    PROJECTS_UPDATE = auto()
+    PROJECTS_DELETE = auto()
+    PROJECTS_APPROVE = auto()
+    REQUESTS_READ = auto()
+    REQUESTS_CREATE = auto()
+    REQUESTS_UPDATE = auto()
+    REQUESTS_APPROVE = auto()
+    TASKS_READ = auto()
+    TASKS_CREATE = auto()
+    TASKS_UPDATE = auto()
+    TASKS_DELETE = auto()
+    TASKS_ASSIGN = auto()
+    DELIVERABLES_READ = auto()
+    DELIVERABLES_CREATE = auto()
+    DELIVERABLES_APPROVE = auto()
+    INVENTORY_READ = auto()
+    INVENTORY_CREATE = auto()
+    INVENTORY_UPDATE = auto()
+    INVENTORY_DELETE = auto()
+    RESERVATIONS_READ = auto()
+    RESERVATIONS_CREATE = auto()
+    RESERVATIONS_APPROVE = auto()
+    CALENDAR_READ = auto()
+    CALENDAR_CREATE = auto()
+    CALENDAR_UPDATE = auto()
+    NOTIFICATIONS_READ = auto()
+    NOTIFICATIONS_SEND = auto()
+    REPORTS_READ = auto()
+    REPORTS_EXPORT = auto()
+    AUDIT_READ = auto()
+    CONFIGURATION_READ = auto()
+    CONFIGURATION_UPDATE = auto()
+    CATALOGS_UPDATE = auto()
+    ADMIN_ACCESS = auto()
+
+    @property
+    def key(self) -> str:
+        """Name used in permission documents, e.g. "projects.approve" """
+        return self.name.lower().replace("_", ".", 1)
+
+
+BY_KEY: Dict[str, Permission] = {permission.key: permission for permission in Permission}
+BY_RESOURCE: Dict[str, Tuple[Permission, ...]] = {}
+for _permission in Permission:
+    _resource = _permission.key.split(".", 1)[0]
+    BY_RESOURCE[_resource] = BY_RESOURCE.get(_resource, ()) + (_permission,)
+
+
+def mask(permissions: Iterable[Permission]) -> int:
+    return reduce(lambda bits, permission: bits | (1 << permission), permissions, 0)
+
+
+ALL_BITS = mask(Permission)
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionSet:
+    """Compiled, immutable set of permissions"""
+    bits: int = 0
+
+    def has(self, permission: Permission) -> bool:
+        return (self.bits >> permission) & 1 == 1
+
+    __contains__ = has
+
+    def has_all(self, bits: int) -> bool:
+        """True if every bit of `bits` (see mask()) is set"""
+        return self.bits & bits == bits
+
+    def has_any(self, bits: int) -> bool:
+        return self.bits & bits != 0
+
+    def __or__(self, other: "PermissionSet") -> "PermissionSet":
+        return PermissionSet(self.bits | other.bits)
+
+    def __iter__(self) -> Iterator[Permission]:
+        return (permission for permission in Permission if self.has(permission))
+
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(permission.key for permission in self)
+
+
+NO_PERMISSIONS = PermissionSet(0)
+ALL_PERMISSIONS = PermissionSet(ALL_BITS)
+
+
+# ----------------------------------------------------------------------
+# Compilation
+# ----------------------------------------------------------------------
+
+def _expand(name: str) -> Tuple[Permission, ...]:
+    """"projects.read", "projects:read", "projects.*", "projects" or "*" -> permissions"""
+    name = name.strip().lower().replace(":", ".")
+    if name == "*":
+        return tuple(Permission)
+    resource, _, action = name.partition(".")
+    if action in ("", "*"):
+        if resource in BY_RESOURCE:
+            return BY_RESOURCE[resource]
+    elif name in BY_KEY:
+        return (BY_KEY[name],)
+    raise KeyError(name)
+
+
+def _walk(document: Any, prefix: str, grants: set, denies: set, unknown: list) -> None:
+    if isinstance(document, str):
+        document = [document]
+    if isinstance(document, (list, tuple)):
+        for item in document:
+            if isinstance(item, str):
+                name = f"{prefix}.{item}" if prefix else item
+                try:
+                    grants.update(_expand(name))
+                except KeyError:
+                    unknown.append(name)
+            else:
+                _walk(item, prefix, grants, denies, unknown)
+    elif isinstance(document, dict):
+        for key, value in document.items():
+            name = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, bool):
+                try:
+                    (grants if value else denies).update(_expand(name))
+                except KeyError:
+                    unknown.append(name)
+            else:
+                _walk(value, name, grants, denies, unknown)
+
+
+def compile_permissions(document: Any, *, label: str = "permissions") -> PermissionSet:
+    """Compile a permission document (JSON value or JSON text) into a PermissionSet"""
+    if document is None:
+        return NO_PERMISSIONS
+    if isinstance(document, (str, bytes)):
+        try:
+            document = json.loads(document)
+        except ValueError:
+            pass  # a bare permission name
+    grants: set = set()
+    denies: set = set()
+    unknown: list = []
+    _walk(document, "", grants, denies, unknown)
+    if unknown:
+        logger.warning(f"{label}: unknown permission(s) ignored: {sorted(set(unknown))}")
+    return PermissionSet(mask(grants) & ~mask(denies))
+
+
+# ----------------------------------------------------------------------
+# Per user type cache
+# ----------------------------------------------------------------------
+
+# user_type_id -> (UserType catalog version it was compiled from, compiled set)
+_compiled: Dict[Any, Tuple[int, PermissionSet]] = {}
+
+
+def permissions_for_user_type(user_type_id: Any) -> PermissionSet:
+    """Compiled permissions of a user type, recompiled when the UserType catalog changes"""
+    from app.core.catalogs import get_catalog
+
+    catalog = get_catalog("UserType")
+    entry = _compiled.get(user_type_id)
+    if entry is not None and entry[0] == catalog.version:
+        return entry[1]
+    user_type = catalog.get_id(user_type_id)
+    if user_type is None:
+        compiled = NO_PERMISSIONS
+    else:
+        compiled = compile_permissions(user_type.permissions, label=f"UserType {user_type.code}")
+    _compiled[user_type_id] = (catalog.version, compiled)
+    return compiled
+
+
+def permissions_for_code(code: str) -> Optional[PermissionSet]:
+    """Compiled permissions of a user type by code, or None if there is no such type"""
+    from app.core.catalogs import lookup
+
+    user_type = lookup("UserType", code)
+    return None if user_type is None else permissions_for_user_type(user_type.id)
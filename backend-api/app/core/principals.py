@@ -0,0 +1,300 @@
+"""
+Principal cache
+Who is calling, answered without touching the database on warm paths.
+
+A Principal is a compact, immutable snapshot of the authenticated user: ids,
+user type and role codes (from the catalog cache), compiled permissions and
+the active/verified/superuser/lock flags. Principals are cached per process
+by the token's `sub`, each tagged with the user's security stamp, a counter
+kept in Redis at auth:stamp:<user_id>:
+
+  - a request reads the stamp (and the token's revocation key) in one Redis
+    round trip; a cached principal with the same stamp is returned as is
+  - password, lock, activation, user type or role changes committed through
+    the ORM bump the stamp, so every worker reloads on the next request and
+    tokens issued under an older stamp ("sv" claim) stop being accepted
+  - logged-out tokens are revoked by `jti` until they would have expired
+
+PRINCIPAL_CACHE_TTL bounds how long a principal is trusted; while Redis is
+unreachable stamps are unknown and revocations are not checked. Without
+Redis configured, stamps and revocations are per process.
+"""
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+import threading
+import time
+import uuid
+
+from app.config.redis import get_sync_redis, submit_background
+from app.core.config import settings
+from app.core.permissions import ALL_PERMISSIONS, PermissionSet, permissions_for_user_type
+
+logger = logging.getLogger(__name__)
+
+_SESSION_KEY = "security_stamps_changed"
+
+# User columns whose change invalidates cached principals and issued tokens
+SECURITY_ATTRIBUTES = (
+    "hashed_password", "locked_until", "is_active", "is_verified", "is_superuser",
+    "user_type_id", "employee_role_id",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated user as seen by authorization code"""
+    id: uuid.UUID
+    user_type_id: uuid.UUID
+    user_type_code: Optional[str]
+    employee_role_id: Optional[uuid.UUID]
+    employee_role_code: Optional[str]
+    permissions: PermissionSet
+    is_active: bool
+    is_verified: bool
+    is_superuser: bool
+    locked_until: Optional[datetime]
+    security_stamp: int
+    catalog_version: int
+
+    @property
+    def is_locked(self) -> bool:
+        return self.locked_until is not None and self.locked_until > datetime.now(timezone.utc)
+
+
+def _stamp_key(user_id: Any) -> str:
+    return f"auth:stamp:{user_id}"
+
+
+def _revoked_key(jti: str) -> str:
+    return f"auth:revoked:{jti}"
+
+
+class PrincipalCache:
+    """Bounded, thread-safe LRU of principals keyed by user id"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[uuid.UUID, Tuple[float, Principal]]" = OrderedDict()
+        self._local_stamps: Dict[uuid.UUID, int] = {}
+        self._local_revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, user_id: uuid.UUID, jti: Optional[str] = None) -> Tuple[Optional[Principal], Optional[int], bool]:
+        """
+        (principal or None, current stamp, revoked) for a token's sub and jti
+
+        Returns None as principal when it must be (re)loaded. The stamp is
+        None while Redis is unreachable; cached principals are then trusted
+        until their TTL runs out.
+        """
+        stamp, revoked = self._state(user_id, jti)
+        if revoked:
+            return None, stamp, True
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            loaded_at, principal = entry
+            if (stamp is None or principal.security_stamp == stamp) and time.monotonic() - loaded_at < self.ttl:
+                self.hits += 1
+                return self._refresh_permissions(principal), stamp, False
+        self.misses += 1
+        return None, stamp, False
+
+    def put(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic(), principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _state(self, user_id: uuid.UUID, jti: Optional[str]) -> Tuple[Optional[int], bool]:
+        client = get_sync_redis()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.get(_stamp_key(user_id))
+                if jti:
+                    pipe.exists(_revoked_key(jti))
+                results = pipe.execute()
+                return int(results[0] or 0), bool(jti) and bool(results[1])
+            except Exception as e:
+                # Fail open on revocation: Redis is optional everywhere else too
+                logger.warning(f"Principal cache: Redis unavailable, stamps unknown: {e}")
+                return None, False
+        revoked = jti is not None and self._local_revoked.get(jti, 0) > time.time()
+        return self._local_stamps.get(user_id, 0), revoked
+
+    def _refresh_permissions(self, principal: Principal) -> Principal:
+        # A user type edit bumps the catalog version, not the users' stamps
+        if principal.is_superuser:
+            return principal
+        from app.core.catalogs import get_catalog
+
+        version = get_catalog("UserType").version
+        if version == principal.catalog_version:
+            return principal
+        principal = replace(
+            principal,
+            permissions=permissions_for_user_type(principal.user_type_id),
+            catalog_version=version,
+        )
+        self.put(principal)
+        return principal
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def bump(self, user_ids: Iterable[uuid.UUID], background: bool = False) -> None:
+        """
+        New security stamp for these users: cached principals and issued tokens become stale
+
+        This process forgets them at once; with `background` the Redis
+        stamps (other workers) are bumped on the background writer.
+        """
+        user_ids = list(user_ids)
+        with self._lock:
+            for user_id in user_ids:
+                self._local_stamps[user_id] = self._local_stamps.get(user_id, 0) + 1
+                self._entries.pop(user_id, None)
+        if get_sync_redis() is not None:
+            if background:
+                submit_background(self._publish_bump, user_ids)
+            else:
+                self._publish_bump(user_ids)
+
+    def _publish_bump(self, user_ids: Iterable[uuid.UUID]) -> None:
+        client = get_sync_redis()
+        for user_id in user_ids:
+            try:
+                client.incr(_stamp_key(user_id))
+            except Exception as e:
+                logger.warning(f"Principal cache: could not bump stamp for {user_id}: {e}")
+            # A load between the local drop and the bump cached the principal under the old stamp
+            with self._lock:
+                self._entries.pop(user_id, None)
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """Reject the token `jti` until its expiry (epoch seconds)"""
+        remaining = int(expires_at - time.time()) + 1
+        if remaining <= 0:
+            return
+        client = get_sync_redis()
+        if client is not None:
+            try:
+                client.set(_revoked_key(jti), 1, ex=remaining)
+                return
+            except Exception as e:
+                logger.warning(f"Principal cache: could not revoke token in Redis: {e}")
+        with self._lock:
+            now = time.time()
+            self._local_revoked = {key: exp for key, exp in self._local_revoked.items() if exp > now}
+            self._local_revoked[jti] = expires_at
+
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl)
+
+
+def load_principal(user_id: uuid.UUID, security_stamp: Optional[int]) -> Optional[Principal]:
+    """Build a principal from the primary (never a replica: a lagging lock must not be missed)"""
+    from app.core.catalogs import get_catalog, lookup_id
+    from app.database.connection import engine
+    from app.models.user_management.user import User
+
+    table = User.__table__
+    with engine.connect() as conn:
+        row = conn.execute(
+            select(
+                table.c.id, table.c.user_type_id, table.c.employee_role_id, table.c.is_active,
+                table.c.is_verified, table.c.is_superuser, table.c.locked_until,
+            ).where(table.c.id == user_id)
+        ).first()
+    if row is None:
+        return None
+
+    user_type = lookup_id("UserType", row.user_type_id)
+    role = lookup_id("EmployeeRole", row.employee_role_id) if row.employee_role_id else None
+    principal = Principal(
+        id=row.id,
+        user_type_id=row.user_type_id,
+        user_type_code=user_type.code if user_type else None,
+        employee_role_id=row.employee_role_id,
+        employee_role_code=role.code if role else None,
+        permissions=ALL_PERMISSIONS if row.is_superuser else permissions_for_user_type(row.user_type_id),
+        is_active=bool(row.is_active),
+        is_verified=bool(row.is_verified),
+        is_superuser=bool(row.is_superuser),
+        locked_until=row.locked_until,
+        security_stamp=-1 if security_stamp is None else security_stamp,
+        catalog_version=get_catalog("UserType").version,
+    )
+    principal_cache.put(principal)
+    return principal
+
+
+def resolve_principal(user_id: uuid.UUID, jti: Optional[str] = None) -> Tuple[Optional[Principal], Optional[int], bool]:
+    """(principal, current stamp, revoked) for a token; loads on a cache miss"""
+    principal, stamp, revoked = principal_cache.get(user_id, jti)
+    if principal is None and not revoked:
+        principal = load_principal(user_id, stamp)
+    return principal, stamp, revoked
+
+
+def current_security_stamp(user_id: uuid.UUID) -> Optional[int]:
+    """Stamp to embed in a new token ("sv"), None while Redis is unreachable"""
+    stamp, _revoked = principal_cache._state(user_id, None)
+    return stamp
+
+
+def bump_security_stamp(*user_ids: uuid.UUID) -> None:
+    principal_cache.bump(user_ids)
+
+
+def revoke_token(jti: str, expires_at: float) -> None:
+    principal_cache.revoke(jti, expires_at)
+
+
+# ----------------------------------------------------------------------
+# Commit-driven invalidation
+# ----------------------------------------------------------------------
+
+@event.listens_for(Session, "after_flush")
+def _collect_security_changes(session: Session, flush_context) -> None:
+    changed = set()
+    for obj in chain(session.dirty, session.deleted):
+        if type(obj).__name__ != "User":
+            continue
+        attrs = inspect(obj).attrs
+        if obj in session.deleted or any(attrs[name].history.has_changes() for name in SECURITY_ATTRIBUTES):
+            changed.add(obj.id)
+    if changed:
+        session.info.setdefault(_SESSION_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_security_stamps(session: Session) -> None:
+    changed = session.info.pop(_SESSION_KEY, None)
+    if changed:
+        # Runs on the event loop under AsyncSession: Redis goes to the background writer
+        principal_cache.bump(changed, background=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_security_changes(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
@@ -0,0 +1,317 @@
+"""
+Runtime configuration
+Immutable, typed snapshot of the Configuration table, hot-reloaded in every
+worker.
+
+Values are parsed once per snapshot according to their ConfigurationType
+(INTEGER -> int, BOOLEAN -> bool, JSON -> read-only mappings/tuples, the
+rest -> str), so a read is one dictionary lookup. Encrypted values
+(is_encrypted, Fernet tokens under CONFIG_ENCRYPTION_KEY) are kept as
+ciphertext and decrypted on first access only.
+
+A commit that touches Configuration or ConfigurationHistory bumps
+config:version in Redis and publishes it on config:reload (from the
+background writer, never on the event loop); each worker
+builds a new snapshot from the primary and swaps it in with a single
+reference assignment, so readers never see a half-built snapshot. Every
+CONFIG_VERSION_CHECK_INTERVAL seconds the listener also compares versions
+in case a message was missed. Without Redis only the committing process
+reloads.
+
+    if config_value("maintenance_mode", False):
+        ...
+    snapshot = get_config()
+    smtp_password = snapshot.get("smtp_password")   # decrypted here, once
+"""
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session
+from dataclasses import dataclass, field
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from app.config.redis import Subscriber, get_sync_redis, submit_background
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "config:version"
+RELOAD_CHANNEL = "config:reload"
+_SESSION_KEY = "configuration_changed"
+_TRACKED_MODELS = frozenset({"Configuration", "ConfigurationHistory"})
+_MISSING = object()
+
+
+# ----------------------------------------------------------------------
+# Parsing and encryption
+# ----------------------------------------------------------------------
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _parse_bool(raw: str) -> bool:
+    normalized = raw.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"not a boolean: {raw!r}")
+
+
+PARSERS: Dict[str, Callable[[str], Any]] = {
+    "STRING": str,
+    "URL": str,
+    "EMAIL": str,
+    "INTEGER": lambda raw: int(raw.strip()),
+    "BOOLEAN": _parse_bool,
+    "JSON": lambda raw: _freeze(json.loads(raw)),
+}
+
+
+def _fernet():
+    from cryptography.fernet import Fernet
+
+    key = settings.config_encryption_key
+    if not key:
+        key = base64.urlsafe_b64encode(hashlib.sha256(f"configuration:{settings.secret_key}".encode()).digest())
+    return Fernet(key)
+
+
+def encrypt_value(plaintext: str) -> str:
+    """Ciphertext to store in Configuration.value when is_encrypted is set"""
+    return _fernet().encrypt(plaintext.encode()).decode()
+
+
+def decrypt_value(ciphertext: str) -> str:
+    return _fernet().decrypt(ciphertext.encode()).decode()
+
+
+# ----------------------------------------------------------------------
+# Snapshot
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    One version of the Configuration table
+
+    `values` holds every parsed plain value; encrypted entries stay in
+    `secrets` (type, ciphertext) until first read, then are memoised.
+    """
+    version: int
+    values: Mapping[str, Any]
+    secrets: Mapping[str, tuple] = field(default_factory=dict, repr=False)
+    loaded_at: float = field(default_factory=time.time, compare=False)
+    _decrypted: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.values.get(key, _MISSING)
+        if value is _MISSING:
+            return self._secret(key, default)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.values or key in self.secrets
+
+    def keys(self) -> Iterable[str]:
+        return chain(self.values, self.secrets)
+
+    def _secret(self, key: str, default: Any) -> Any:
+        value = self._decrypted.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        entry = self.secrets.get(key)
+        if entry is None:
+            return default
+        type_name, ciphertext = entry
+        value = PARSERS[type_name](decrypt_value(ciphertext))
+        self._decrypted[key] = value
+        return value
+
+
+def build_snapshot(version: int, rows: Iterable[Any]) -> ConfigSnapshot:
+    """
+    Snapshot from rows with key, value, type and is_encrypted
+
+    Values that fail to parse are logged and left out, so readers get their
+    default instead of a wrongly typed value.
+    """
+    values: Dict[str, Any] = {}
+    secrets: Dict[str, tuple] = {}
+    for row in rows:
+        type_name = getattr(row.type, "value", row.type)
+        if row.value is None:
+            values[row.key] = None
+        elif row.is_encrypted:
+            secrets[row.key] = (type_name, row.value)
+        else:
+            try:
+                values[row.key] = PARSERS[type_name](row.value)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Configuration '{row.key}' ({type_name}) ignored: {e}")
+    return ConfigSnapshot(version=version, values=MappingProxyType(values), secrets=MappingProxyType(secrets))
+
+
+# ----------------------------------------------------------------------
+# Current snapshot
+# ----------------------------------------------------------------------
+
+_snapshot: Optional[ConfigSnapshot] = None
+_reload_lock = threading.Lock()
+_local_version = 0
+
+
+def _current_version() -> int:
+    client = get_sync_redis()
+    if client is not None:
+        try:
+            return int(client.get(VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"Configuration: Redis unavailable, using local version: {e}")
+    return _local_version
+
+
+def reload_config() -> ConfigSnapshot:
+    """
+    Build a snapshot from the primary and swap it in
+
+    Reloads are serialized and each reads the rows as they are now, so the
+    latest reload always wins, even when its version number is lower (the
+    Redis counter was reset, or a local fallback version was in use while
+    Redis was down).
+    """
+    global _snapshot
+    from app.database.connection import engine
+    from app.models import Configuration
+
+    table = Configuration.__table__
+    with _reload_lock:
+        version = _current_version()
+        with engine.connect() as conn:
+            rows = conn.execute(select(table.c.key, table.c.value, table.c.type, table.c.is_encrypted)).all()
+        _snapshot = build_snapshot(version, rows)
+        return _snapshot
+
+
+def get_config() -> ConfigSnapshot:
+    """Current snapshot; hold on to it for several consistent reads"""
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = reload_config()
+    return snapshot
+
+
+def config_value(key: str, default: Any = None) -> Any:
+    """One setting from the current snapshot"""
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = reload_config()
+    return snapshot.get(key, default)
+
+
+def _publish_change() -> None:
+    global _local_version
+    client = get_sync_redis()
+    version = None
+    if client is not None:
+        try:
+            version = client.incr(VERSION_KEY)
+            client.publish(RELOAD_CHANNEL, str(version))
+        except Exception as e:
+            logger.warning(f"Configuration: could not publish new version: {e}")
+    if version is None:
+        _local_version += 1
+    reload_config()
+
+
+# ----------------------------------------------------------------------
+# Commit-driven reload
+# ----------------------------------------------------------------------
+
+@event.listens_for(Session, "after_flush")
+def _collect_configuration_changes(session: Session, flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if type(obj).__name__ in _TRACKED_MODELS:
+            session.info[_SESSION_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_configuration_changes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_.__name__ in _TRACKED_MODELS:
+            orm_execute_state.session.info[_SESSION_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _reload_after_commit(session: Session) -> None:
+    if session.info.pop(_SESSION_KEY, False):
+        # Runs on the event loop under AsyncSession: the Redis round trips and
+        # the reload query go to the background writer. If it fails, the change
+        # is still committed and workers pick it up on their next version check.
+        submit_background(_publish_change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_configuration_changes(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+# ----------------------------------------------------------------------
+# Cross-worker reload listener
+# ----------------------------------------------------------------------
+
+def _on_reload_message(data: str) -> None:
+    if _snapshot is None or int(data) != _snapshot.version:
+        reload_config()
+
+
+def _check_version() -> None:
+    if _snapshot is None or _current_version() != _snapshot.version:
+        reload_config()
+
+
+_listener: Optional[Subscriber] = None
+
+
+def start_reload_listener() -> bool:
+    """Follow reloads published by other workers; False when Redis is not configured"""
+    global _listener
+    if get_sync_redis() is None:
+        return False
+    if _listener is None or not _listener.is_alive():
+        _listener = Subscriber(
+            RELOAD_CHANNEL,
+            _on_reload_message,
+            name="config-reload",
+            interval=settings.config_version_check_interval,
+            on_interval=_check_version,
+        )
+        _listener.start()
+    return True
+
+
+def stop_reload_listener(timeout: float = 2.0) -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop(timeout)
+        _listener = None
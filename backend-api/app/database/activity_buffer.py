@@ -0,0 +1,219 @@
+"""
+Write-behind activity buffer
+Login and device bookkeeping (User.last_login / login_count,
+UserDevice.last_seen / login_count) aggregated in memory and written in
+periodic batches instead of one UPDATE per login or request.
+
+Each flush sends, per table and per ACTIVITY_FLUSH_BATCH_SIZE rows, one
+
+    UPDATE users SET last_login = greatest(users.last_login, v.seen_at),
+                     login_count = coalesce(users.login_count, 0) + v.logins
+    FROM (VALUES (...), (...)) AS v (id, seen_at, logins)
+    WHERE users.id = v.id
+
+with rows sorted by id, so concurrent flushes from several workers lock in
+the same order. Neither column is indexed, so Postgres can apply them as
+HOT updates, and a user who logs in 50 times between flushes costs one row
+version instead of 50.
+
+Only counters and timestamps go through here. Anything security relevant
+(failed_login_attempts, locked_until, password) stays a synchronous UPDATE
+in the request. A crash loses at most one flush interval of bookkeeping.
+"""
+
+from sqlalchemy import DateTime, Integer, column, func, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import logging
+import os
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# id -> [latest timestamp, count]
+Pending = Dict[Any, List[Any]]
+
+
+def _merge(into: Pending, entries: Pending) -> None:
+    for key, (at, count) in entries.items():
+        current = into.get(key)
+        if current is None:
+            into[key] = [at, count]
+        else:
+            current[0] = max(current[0], at)
+            current[1] += count
+
+
+class ActivityBuffer:
+    """Per-process buffer with a background flusher thread (started on first use, fork-safe)"""
+
+    def __init__(self, interval: float, batch_size: int, max_pending: int):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._users: Pending = {}
+        self._devices: Pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.dropped = 0
+        self.last_flush_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Recording (request path: a dict update under a lock, no I/O)
+    # ------------------------------------------------------------------
+
+    def record_login(self, user_id: Any, at: Optional[datetime] = None) -> None:
+        self._record("_users", user_id, at, 1)
+
+    def record_device_seen(self, device_id: Any, at: Optional[datetime] = None, *, login: bool = False) -> None:
+        self._record("_devices", device_id, at, 1 if login else 0)
+
+    def _record(self, target: str, key: Any, at: Optional[datetime], count: int) -> None:
+        at = at or datetime.now(timezone.utc)
+        self._ensure_started()
+        with self._lock:
+            # Looked up under the lock: flush() swaps the dicts
+            pending: Pending = getattr(self, target)
+            current = pending.get(key)
+            if current is None:
+                if len(self._users) + len(self._devices) >= self.max_pending:
+                    self.dropped += 1
+                    return
+                pending[key] = [at, count]
+            else:
+                if at > current[0]:
+                    current[0] = at
+                current[1] += count
+            size = len(self._users) + len(self._devices)
+        if size >= self.batch_size:
+            self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write everything pending now; returns the number of rows updated"""
+        with self._lock:
+            users, self._users = self._users, {}
+            devices, self._devices = self._devices, {}
+        if not users and not devices:
+            return 0
+
+        from app.database.connection import engine
+        from app.models.user_management.user_device import UserDevice
+        from app.models.user_management.user import User
+
+        started = time.perf_counter()
+        try:
+            rows = 0
+            with engine.begin() as conn:
+                rows += self._flush_table(conn, User.__table__, "last_login", users)
+                rows += self._flush_table(conn, UserDevice.__table__, "last_seen", devices)
+        except Exception as e:
+            # Put it back for the next attempt; newer activity recorded meanwhile wins on merge
+            with self._lock:
+                _merge(self._users, users)
+                _merge(self._devices, devices)
+            self.last_error = str(e).splitlines()[0]
+            logger.warning(f"Activity flush failed, {len(users) + len(devices)} rows kept for retry: {self.last_error}")
+            return 0
+
+        self.flushes += 1
+        self.rows_flushed += rows
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        self.last_error = None
+        return rows
+
+    def _flush_table(self, conn, table, time_column: str, pending: Pending) -> int:
+        if not pending:
+            return 0
+        rows = sorted(((key, at, count) for key, (at, count) in pending.items()), key=lambda row: str(row[0]))
+        updated = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = values(
+                column("id", UUID(as_uuid=True)),
+                column("seen_at", DateTime(timezone=True)),
+                column("logins", Integer),
+                name="v",
+            ).data(rows[start:start + self.batch_size])
+            stmt = (
+                update(table)
+                .where(table.c.id == batch.c.id)
+                .values({
+                    time_column: func.greatest(table.c[time_column], batch.c.seen_at),
+                    "login_count": func.coalesce(table.c.login_count, 0) + batch.c.logins,
+                    # Bookkeeping is not an edit of the row
+                    "updated_at": table.c.updated_at,
+                })
+            )
+            updated += conn.execute(stmt).rowcount
+        return updated
+
+    # ------------------------------------------------------------------
+    # Flusher thread
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Inherited through fork(): the parent's pending rows are the parent's to flush
+            self._users, self._devices = {}, {}
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="activity-flusher", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Activity flusher failed")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flusher and write what is left (graceful shutdown)"""
+        if self._pid != os.getpid():
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+        self._pid = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            pending_users, pending_devices = len(self._users), len(self._devices)
+        return {
+            "pid": os.getpid(),
+            "pending_users": pending_users,
+            "pending_devices": pending_devices,
+            "flushes_total": self.flushes,
+            "rows_flushed_total": self.rows_flushed,
+            "dropped_total": self.dropped,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "last_error": self.last_error,
+        }
+
+
+activity_buffer = ActivityBuffer(
+    interval=settings.activity_flush_interval,
+    batch_size=settings.activity_flush_batch_size,
+    max_pending=settings.activity_max_pending,
+)
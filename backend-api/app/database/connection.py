@@ -2,30 +2,63 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
-from typing import Generator
+from typing import AsyncGenerator, Generator
+import asyncio
 import logging
 
 from app.core.config import settings
+from app.database.pool_metrics import InstrumentedQueuePool, instrument_engine
 
 logger = logging.getLogger(__name__)
 
 # Create database engine
 engine = create_engine(
     settings.database_url,
-    poolclass=QueuePool,
+    poolclass=InstrumentedQueuePool,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
     echo=settings.debug,  # Log SQL queries in debug mode
 )
+instrument_engine(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_pool_options(url: str) -> dict:
+    """
+    Pool sizing for the async engine
+    SQLite (aiosqlite) keeps SQLAlchemy's default pool for the URL (static
+    for in-memory databases, NullPool for files); neither takes a size.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {"pool_size": settings.db_pool_size, "max_overflow": settings.db_max_overflow}
+
+
+# Async engine for `async def` endpoints; same settings, separate pool
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_pre_ping=True,
+    echo=settings.debug,
+    **async_pool_options(settings.async_database_url),
+)
+
+# Create AsyncSessionLocal class
+# expire_on_commit=False: attribute access after commit would otherwise
+# trigger an implicit (and in async, illegal) refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create declarative base
 Base = declarative_base()
 
@@ -46,6 +79,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database dependency injection
+    Provides an AsyncSession for each request without blocking the event loop
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {e}")
+            await db.rollback()
+            raise
+
+
 async def init_db() -> None:
     """
     Initialize database
@@ -53,7 +100,8 @@ async def init_db() -> None:
     """
     try:
         # Import all models to ensure they are registered with Base
-        from app.models import user_management, requests, projects, tasks, inventory, communication
+        from app.models import load_all_models
+        load_all_models()
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
@@ -64,16 +112,24 @@ async def init_db() -> None:
         raise
 
 
-async def check_db_connection() -> bool:
+def _ping_db() -> None:
+    """Run a trivial query on a pooled connection (blocking)"""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def check_db_connection(timeout: float = 2.0) -> bool:
     """
     Check database connectivity
-    Returns True if connection is successful
+    Runs the ping in a worker thread so a slow or exhausted pool never
+    stalls the event loop; returns True if the connection is successful
     """
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
+        await asyncio.wait_for(asyncio.to_thread(_ping_db), timeout=timeout)
         return True
+    except asyncio.TimeoutError:
+        logger.error(f"Database connection check timed out after {timeout}s")
+        return False
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         return False
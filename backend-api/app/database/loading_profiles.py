@@ -0,0 +1,243 @@
+"""
+Named relationship-loading profiles
+Each profile declares exactly which relationships a view needs; everything
+else raises on access instead of silently lazy-loading, so a view runs in a
+fixed, small number of queries. Heavy Text columns are mapped as deferred
+column groups; a profile lists the groups its view renders and everything
+else stays out of the SELECT.
+
+    stmt = apply_profile(select(Project).where(Project.id == project_id), "project_detail")
+"""
+
+from sqlalchemy.orm import joinedload, raiseload, selectinload, undefer_group
+from sqlalchemy.orm.interfaces import LoaderOption
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple, Type
+
+from app.database.connection import Base
+
+
+@dataclass(frozen=True)
+class LoadingProfile:
+    """
+    Relationship paths to eager-load for one view
+
+    `selectin` / `joined` hold dotted paths ("project_members.user");
+    intermediate hops are loaded with selectinload unless listed in `joined`.
+    Use `joined` only for many-to-one paths; collections multiply rows.
+    `undefer` names deferred column groups to load: "syllabus" on the
+    profile's model, "courses.syllabus" on a related one.
+    """
+    name: str
+    model: str
+    selectin: Tuple[str, ...] = ()
+    joined: Tuple[str, ...] = ()
+    undefer: Tuple[str, ...] = ()
+    raise_unlisted: bool = True
+
+
+_profiles: Dict[str, LoadingProfile] = {}
+_compiled: Dict[str, Tuple[LoaderOption, ...]] = {}
+
+
+def register_profile(profile: LoadingProfile) -> LoadingProfile:
+    """Add (or replace) a profile in the registry"""
+    _profiles[profile.name] = profile
+    _compiled.pop(profile.name, None)
+    return profile
+
+
+def get_profile(name: str) -> LoadingProfile:
+    try:
+        return _profiles[name]
+    except KeyError:
+        raise KeyError(f"Unknown loading profile '{name}'. Registered: {sorted(_profiles)}") from None
+
+
+def loading_options(name: str) -> Tuple[LoaderOption, ...]:
+    """Loader options for a profile, compiled once and reused"""
+    options = _compiled.get(name)
+    if options is None:
+        options = _compile(get_profile(name))
+        _compiled[name] = options
+    return options
+
+
+def apply_profile(stmt, name: str):
+    """Apply a named profile to a select() / Query"""
+    return stmt.options(*loading_options(name))
+
+
+def _resolve_model(name: str) -> Type:
+    for mapper in Base.registry.mappers:
+        if mapper.class_.__name__ == name:
+            return mapper.class_
+    # Models may not be imported yet in scripts / workers
+    from app.models import load_all_models
+    load_all_models()
+    for mapper in Base.registry.mappers:
+        if mapper.class_.__name__ == name:
+            return mapper.class_
+    raise LookupError(f"Model '{name}' is not mapped")
+
+
+def deferred_groups(model: Type) -> Dict[str, List[str]]:
+    """Deferred column groups of a mapped class: {group: [attribute, ...]}"""
+    groups: Dict[str, List[str]] = {}
+    for prop in model.__mapper__.column_attrs:
+        if prop.deferred and prop.group:
+            groups.setdefault(prop.group, []).append(prop.key)
+    return groups
+
+
+def _undefer(model: Type, groups: Iterable[str]) -> List[LoaderOption]:
+    known = deferred_groups(model)
+    for group in groups:
+        if group not in known:
+            raise LookupError(f"{model.__name__} has no deferred group '{group}'. Groups: {sorted(known)}")
+    return [undefer_group(group) for group in groups]
+
+
+def _path_tree(selectin: Iterable[str], joined: Iterable[str], undefer: Iterable[str] = ()) -> dict:
+    """
+    Nest dotted paths into {key: [strategy, children, groups]}
+    Root-level groups are stored under the "" key.
+    """
+    tree: dict = {"": [None, {}, []]}
+    for strategy, paths in (("selectin", selectin), ("joined", joined)):
+        for path in paths:
+            node = tree
+            keys = path.split(".")
+            for depth, key in enumerate(keys):
+                entry = node.setdefault(key, ["selectin", {}, []])
+                if depth == len(keys) - 1:
+                    entry[0] = strategy
+                node = entry[1]
+    for path in undefer:
+        *keys, group = path.split(".")
+        node, entry = tree, tree[""]
+        for key in keys:
+            entry = node.setdefault(key, ["selectin", {}, []])
+            node = entry[1]
+        entry[2].append(group)
+    return tree
+
+
+def _build(model: Type, tree: dict, raise_unlisted: bool) -> List[LoaderOption]:
+    options: List[LoaderOption] = []
+    relationships = model.__mapper__.relationships
+    for key, (strategy, children, groups) in tree.items():
+        if key == "":
+            continue
+        if key not in relationships:
+            raise LookupError(f"{model.__name__} has no relationship '{key}'")
+        attribute = getattr(model, key)
+        loader = joinedload(attribute) if strategy == "joined" else selectinload(attribute)
+        related = relationships[key].mapper.class_
+        child_options = _undefer(related, groups) + _build(related, children, raise_unlisted)
+        if raise_unlisted:
+            child_options.append(raiseload("*"))
+        if child_options:
+            loader = loader.options(*child_options)
+        options.append(loader)
+    return options
+
+
+def _compile(profile: LoadingProfile) -> Tuple[LoaderOption, ...]:
+    model = _resolve_model(profile.model)
+    tree = _path_tree(profile.selectin, profile.joined, profile.undefer)
+    options = _undefer(model, tree[""][2]) + _build(model, tree, profile.raise_unlisted)
+    if profile.raise_unlisted:
+        options.append(raiseload("*"))
+    return tuple(options)
+
+
+# ==============================================
+# Profiles
+# ==============================================
+
+register_profile(LoadingProfile(
+    name="user_card",
+    model="User",
+    joined=("user_type", "employee_role"),
+))
+
+register_profile(LoadingProfile(
+    name="project_list",
+    model="Project",
+    joined=("project_type", "manager"),
+))
+
+register_profile(LoadingProfile(
+    name="project_detail",
+    model="Project",
+    joined=("project_type", "manager"),
+    selectin=("project_members.user", "courses", "podcasts", "project_documents"),
+    undefer=("courses.syllabus", "podcasts.notes"),
+))
+
+# Listings keep every deferred group unloaded
+register_profile(LoadingProfile(
+    name="course_list",
+    model="Course",
+    joined=("project", "instructor"),
+))
+
+register_profile(LoadingProfile(
+    name="course_detail",
+    model="Course",
+    joined=("project", "instructor"),
+    undefer=("syllabus", "materials"),
+))
+
+register_profile(LoadingProfile(
+    name="podcast_list",
+    model="Podcast",
+    joined=("project", "host"),
+))
+
+register_profile(LoadingProfile(
+    name="podcast_detail",
+    model="Podcast",
+    joined=("project", "host", "producer"),
+    undefer=("notes", "production"),
+))
+
+register_profile(LoadingProfile(
+    name="request_list",
+    model="Request",
+    joined=("client", "service_type"),
+))
+
+register_profile(LoadingProfile(
+    name="request_detail",
+    model="Request",
+    joined=("client", "service_type", "unit", "evaluated_by", "template"),
+    undefer=("details",),
+))
+
+register_profile(LoadingProfile(
+    name="career_detail",
+    model="Career",
+    undefer=("profile",),
+))
+
+register_profile(LoadingProfile(
+    name="task_board",
+    model="Task",
+    joined=("assigned_to", "project"),
+))
+
+register_profile(LoadingProfile(
+    name="task_detail",
+    model="Task",
+    joined=("assigned_to", "created_by", "project", "parent_task"),
+    selectin=("subtasks", "task_comments.author", "task_attachments", "deliverables", "task_assignments.user"),
+))
+
+register_profile(LoadingProfile(
+    name="calendar_event",
+    model="CalendarEvent",
+    joined=("event_type", "created_by"),
+    selectin=("attendees.user", "resources"),
+))
@@ -0,0 +1,60 @@
+"""
+Custom Alembic operations
+Imported by alembic/env.py so migrations can call them through `op`:
+
+    op.create_monthly_partitions("audit_logs", date(2026, 11, 1), months=3)
+    op.drop_monthly_partitions("audit_logs", date(2026, 11, 1), months=3)
+"""
+
+from alembic.operations import MigrateOperation, Operations
+from datetime import date
+
+from app.database.partitioning import add_months, create_partition_sql, month_start, partition_name
+
+
+@Operations.register_operation("create_monthly_partitions")
+class CreateMonthlyPartitionsOp(MigrateOperation):
+    """Create `months` consecutive monthly partitions starting at `start`"""
+
+    def __init__(self, table_name: str, start: date, months: int):
+        self.table_name = table_name
+        self.start = month_start(start)
+        self.months = months
+
+    @classmethod
+    def create_monthly_partitions(cls, operations, table_name: str, start: date, months: int):
+        return operations.invoke(cls(table_name, start, months))
+
+    def reverse(self):
+        return DropMonthlyPartitionsOp(self.table_name, self.start, self.months)
+
+
+@Operations.register_operation("drop_monthly_partitions")
+class DropMonthlyPartitionsOp(MigrateOperation):
+    """Drop the monthly partitions created by CreateMonthlyPartitionsOp"""
+
+    def __init__(self, table_name: str, start: date, months: int):
+        self.table_name = table_name
+        self.start = month_start(start)
+        self.months = months
+
+    @classmethod
+    def drop_monthly_partitions(cls, operations, table_name: str, start: date, months: int):
+        return operations.invoke(cls(table_name, start, months))
+
+    def reverse(self):
+        return CreateMonthlyPartitionsOp(self.table_name, self.start, self.months)
+
+
+@Operations.implementation_for(CreateMonthlyPartitionsOp)
+def create_monthly_partitions(operations, operation: CreateMonthlyPartitionsOp):
+    for offset in range(operation.months):
+        month = add_months(operation.start, offset)
+        operations.execute(create_partition_sql(operation.table_name, month))
+
+
+@Operations.implementation_for(DropMonthlyPartitionsOp)
+def drop_monthly_partitions(operations, operation: DropMonthlyPartitionsOp):
+    for offset in range(operation.months):
+        month = add_months(operation.start, offset)
+        operations.execute(f'DROP TABLE IF EXISTS "{partition_name(operation.table_name, month)}"')
@@ -0,0 +1,304 @@
+"""
+Monthly range partitioning for append-only log and event tables
+Models opt in through `partitioned_table_args`; partitions are named
+<table>_pYYYYMM and cover [first day of month, first day of next month) UTC.
+Retention is a metadata operation: expired partitions are detached or dropped
+(a plain DETACH under a short lock_timeout, retried while the lock is busy).
+
+Every table also has a DEFAULT partition (<table>_default), so an insert
+whose month has no partition yet (maintenance stopped running for longer
+than PARTITION_PREMAKE_MONTHS) is stored instead of failing. Postgres will
+not create a range partition while the default holds rows in that range,
+so ensure_partitions moves those rows into the new partition in the same
+transaction and logs a warning: rows in the default partition mean the
+maintenance job fell behind. The default stays empty in normal operation,
+which keeps the scan Postgres runs on it for every new partition cheap.
+"""
+
+from sqlalchemy import Table, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+import logging
+import re
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE of a lock_timeout expiry
+LOCK_NOT_AVAILABLE = "55P03"
+# Seconds; the wait before retry n is n times this
+DETACH_RETRY_DELAY = 1.0
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """Partitioning spec for one table"""
+    table: str
+    column: str
+    # Months of history kept online; None keeps every partition
+    retention_months: Optional[int] = None
+
+
+PARTITIONED_TABLES: Dict[str, PartitionedTable] = {
+    spec.table: spec
+    for spec in (
+        PartitionedTable("audit_logs", "created_at", retention_months=24),
+        PartitionedTable("analytics_events", "event_timestamp", retention_months=13),
+        PartitionedTable("search_analytics", "searched_at", retention_months=13),
+        PartitionedTable("search_histories", "searched_at", retention_months=6),
+        PartitionedTable("notification_logs", "created_at", retention_months=6),
+    )
+}
+
+
+def partitioned_table_args(table: str) -> dict:
+    """Dialect kwargs for a model's __table_args__"""
+    spec = PARTITIONED_TABLES[table]
+    return {"postgresql_partition_by": f"RANGE ({spec.column})"}
+
+
+# ==============================================
+# Month arithmetic
+# ==============================================
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def create_default_partition_sql(table: str) -> str:
+    return f'CREATE TABLE IF NOT EXISTS "{default_partition_name(table)}" PARTITION OF "{table}" DEFAULT'
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    month = month_start(month)
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+    )
+
+
+# ==============================================
+# Catalog inspection
+# ==============================================
+
+_BOUND_RE = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def _parse_bound(raw: str) -> Optional[date]:
+    raw = raw.strip()
+    if raw.upper() in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(raw.strip("'")).astimezone(timezone.utc).date()
+
+
+def _partition_bounds(conn: Connection, table: str) -> List[Tuple[str, str]]:
+    return conn.execute(text("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = CAST(:table AS regclass)
+        ORDER BY c.relname
+    """), {"table": table}).all()
+
+
+def list_partitions(conn: Connection, table: str) -> List[Tuple[str, Optional[date], Optional[date]]]:
+    """(name, lower, upper) for each attached range partition; None means MIN/MAXVALUE"""
+    partitions = []
+    for name, bound in _partition_bounds(conn, table):
+        match = _BOUND_RE.search(bound or "")
+        if match is None:
+            continue  # DEFAULT partition
+        partitions.append((name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+    return partitions
+
+
+def default_partition(conn: Connection, table: str) -> Optional[str]:
+    """Name of the attached DEFAULT partition, if any"""
+    for name, bound in _partition_bounds(conn, table):
+        if (bound or "").strip().upper() == "DEFAULT":
+            return name
+    return None
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    return bool(conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)
+        )
+    """), {"table": table}).scalar())
+
+
+# ==============================================
+# Maintenance
+# ==============================================
+
+def _default_has_rows(conn: Connection, spec: PartitionedTable, default: str, month: date) -> bool:
+    return bool(conn.execute(text(
+        f'SELECT EXISTS (SELECT 1 FROM "{default}" '
+        f'WHERE "{spec.column}" >= {_bound(month)} AND "{spec.column}" < {_bound(add_months(month, 1))})'
+    )).scalar())
+
+
+def move_from_default_sql(spec: PartitionedTable, default: str, month: date) -> str:
+    """
+    Create the partition for `month` out of the rows the default partition holds for it
+
+    One transaction: the new table is filled before it is attached, so the
+    ATTACH check on the default partition finds nothing left in the range.
+    """
+    month = month_start(month)
+    name = partition_name(spec.table, month)
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    in_range = f'"{spec.column}" >= {lower} AND "{spec.column}" < {upper}'
+    return ";\n".join((
+        "BEGIN",
+        f'CREATE TABLE "{name}" (LIKE "{spec.table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        f'WITH moved AS (DELETE FROM "{default}" WHERE {in_range} RETURNING *) INSERT INTO "{name}" SELECT * FROM moved',
+        f'ALTER TABLE "{spec.table}" ATTACH PARTITION "{name}" FOR VALUES FROM ({lower}) TO ({upper})',
+        "COMMIT",
+    ))
+
+
+def ensure_partitions(
+    conn: Connection,
+    spec: PartitionedTable,
+    today: Optional[date] = None,
+    months_ahead: Optional[int] = None,
+) -> List[str]:
+    """
+    Create the DEFAULT partition, this month's partition and `months_ahead`
+    future ones; returns those created
+
+    `conn` must be in autocommit mode (or outside a transaction) when the
+    default partition may hold rows: moving them runs its own transaction.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    months_ahead = settings.partition_premake_months if months_ahead is None else months_ahead
+    existing = list_partitions(conn, spec.table)
+    covered_until = max((upper for _, _, upper in existing if upper is not None), default=None)
+
+    created = []
+    default = default_partition(conn, spec.table)
+    if default is None:
+        conn.execute(text(create_default_partition_sql(spec.table)))
+        default = default_partition_name(spec.table)
+        created.append(default)
+
+    current = month_start(today)
+    last = add_months(current, months_ahead)
+    # Months below the newest upper bound already live in some partition; after a
+    # lapse in maintenance, the months between it and today are created too
+    month = current if covered_until is None else covered_until
+    while month <= last:
+        if default not in created and _default_has_rows(conn, spec, default, month):
+            logger.warning(
+                f"{default} holds rows for {month:%Y-%m}; moving them to {partition_name(spec.table, month)} "
+                "(partition maintenance fell behind)"
+            )
+            conn.execute(text(move_from_default_sql(spec, default, month)))
+        else:
+            conn.execute(text(create_partition_sql(spec.table, month)))
+        created.append(partition_name(spec.table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def expired_partitions(
+    conn: Connection,
+    spec: PartitionedTable,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Partitions whose whole range is older than the retention window"""
+    if spec.retention_months is None:
+        return []
+    today = today or datetime.now(timezone.utc).date()
+    cutoff = add_months(month_start(today), -spec.retention_months)
+    return [
+        name for name, _lower, upper in list_partitions(conn, spec.table)
+        if upper is not None and upper <= cutoff
+    ]
+
+
+def detach_partition_sql(table: str, partition: str, drop: bool = False, lock_timeout_ms: Optional[int] = None) -> str:
+    """
+    Detach (and optionally drop) one partition in a short transaction
+
+    DETACH ... CONCURRENTLY is refused while the table has a DEFAULT
+    partition, so this is a plain DETACH. It needs an ACCESS EXCLUSIVE lock
+    on the parent; lock_timeout bounds how long it (and every query queued
+    behind it) waits for that lock.
+    """
+    lock_timeout_ms = settings.partition_detach_lock_timeout_ms if lock_timeout_ms is None else lock_timeout_ms
+    statements = [
+        "BEGIN",
+        f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}",
+        f'ALTER TABLE "{table}" DETACH PARTITION "{partition}"',
+    ]
+    if drop:
+        statements.append(f'DROP TABLE IF EXISTS "{partition}"')
+    statements.append("COMMIT")
+    return ";\n".join(statements)
+
+
+def _lock_not_available(error: OperationalError) -> bool:
+    return getattr(error.orig, "pgcode", None) == LOCK_NOT_AVAILABLE
+
+
+def detach_partition(
+    conn: Connection,
+    table: str,
+    partition: str,
+    drop: bool = False,
+    attempts: Optional[int] = None,
+) -> None:
+    """
+    Detach (and optionally drop) one partition, retrying when the lock times out
+
+    `conn` must be in autocommit mode: the statement runs its own
+    transaction. Waits grow linearly between attempts; the last lock
+    timeout is raised.
+    """
+    attempts = settings.partition_detach_attempts if attempts is None else attempts
+    sql = detach_partition_sql(table, partition, drop)
+    for attempt in range(1, attempts + 1):
+        try:
+            conn.execute(text(sql))
+            return
+        except OperationalError as e:
+            # The failed statement leaves its transaction open and aborted
+            conn.execute(text("ROLLBACK"))
+            if not _lock_not_available(e) or attempt == attempts:
+                raise
+            logger.warning(f"Detaching {partition}: lock on {table} not acquired (attempt {attempt}/{attempts})")
+            time.sleep(attempt * DETACH_RETRY_DELAY)
+
+
+# Fresh databases built with metadata.create_all() need somewhere to insert
+@event.listens_for(Table, "after_create")
+def _create_initial_partitions(table: Table, connection: Connection, **kw):
+    spec = PARTITIONED_TABLES.get(table.name)
+    if spec is None or connection.dialect.name != "postgresql":
+        return
+    ensure_partitions(connection, spec)
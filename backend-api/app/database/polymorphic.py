@@ -0,0 +1,169 @@
+"""
+Batched subtype loading
+Course/Podcast specialise Project and Equipment/Supply specialise
+InventoryItem through their own tables (project_id / inventory_item_id).
+Walking a mixed list and touching each row's subtype relationship costs one
+query per row; load_subtypes() fills them for a whole list with one query
+per subtype present in it.
+
+The base tables carry a `subtype` discriminator ("course", "podcast",
+"mixed", "base" or NULL for rows not yet classified) so the loader only
+queries the subtype tables a list actually needs. A trigger on every
+subtype table (AFTER INSERT OR UPDATE OF the FK) keeps it up to date for
+any writer, ORM or Core, including re-parenting. A parent that loses its
+last subtype row keeps its old kind: one query that finds nothing, never a
+hidden row. Migration 0008 installs the triggers; databases built with
+metadata.create_all() get them when the subtype tables are created.
+
+    page = repo.paginate(profile="project_list")
+    load_subtypes(db, page.items)
+    for project in page.items:
+        project.courses, project.podcasts   # already loaded, no query
+"""
+
+from sqlalchemy import Table, event, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Type
+import importlib
+
+# Discriminator values besides the subtype names
+BASE = "base"
+MIXED = "mixed"
+
+# Keep IN lists well below driver and planner limits
+IN_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class Subtype:
+    """One specialisation table: model, FK back to the base row, collection on the base"""
+    kind: str
+    model: str
+    foreign_key: str
+    relationship: str
+
+
+@dataclass(frozen=True)
+class SubtypeFamily:
+    base: str
+    subtypes: Tuple[Subtype, ...]
+    discriminator: str = "subtype"
+
+
+FAMILIES: Dict[str, SubtypeFamily] = {
+    "Project": SubtypeFamily("Project", (
+        Subtype("course", "Course", "project_id", "courses"),
+        Subtype("podcast", "Podcast", "project_id", "podcasts"),
+    )),
+    "InventoryItem": SubtypeFamily("InventoryItem", (
+        Subtype("equipment", "Equipment", "inventory_item_id", "equipment"),
+        Subtype("supply", "Supply", "inventory_item_id", "supplies"),
+    )),
+}
+
+
+def _model(name: str) -> Type:
+    # Resolved through the lazy registry in app.models
+    return getattr(importlib.import_module("app.models"), name)
+
+
+def _chunks(values: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def load_subtypes(db: Session, objects: Sequence[Any], *options: Any) -> Dict[str, int]:
+    """
+    Populate every subtype collection of `objects` (Projects or InventoryItems)
+
+    Rows whose discriminator names one subtype only hit that subtype's
+    table; unclassified or mixed rows are looked up in all of them. Every
+    collection is set, empty where there is nothing, so raiseload profiles
+    never trip. `options` are loader options for the subtype queries.
+    Returns the number of subtype rows loaded per kind.
+    """
+    if not objects:
+        return {}
+    family = FAMILIES[type(objects[0]).__name__]
+
+    kinds = {subtype.kind for subtype in family.subtypes}
+    wanted: Dict[str, List[Any]] = defaultdict(list)
+    for obj in objects:
+        kind = getattr(obj, family.discriminator)
+        if kind == BASE:
+            continue
+        for subtype in family.subtypes:
+            # NULL (unclassified) and "mixed" rows may have any subtype
+            if kind == subtype.kind or kind not in kinds:
+                wanted[subtype.kind].append(obj.id)
+
+    loaded: Dict[str, int] = {}
+    found: Dict[str, Dict[Any, list]] = {}
+    for subtype in family.subtypes:
+        ids = wanted.get(subtype.kind)
+        by_parent: Dict[Any, list] = defaultdict(list)
+        if ids:
+            model = _model(subtype.model)
+            fk = getattr(model, subtype.foreign_key)
+            for chunk in _chunks(ids, IN_CHUNK):
+                for row in db.scalars(select(model).where(fk.in_(chunk)).options(*options)):
+                    by_parent[getattr(row, subtype.foreign_key)].append(row)
+        found[subtype.kind] = by_parent
+        loaded[subtype.kind] = sum(len(rows) for rows in by_parent.values())
+
+    for obj in objects:
+        for subtype in family.subtypes:
+            set_committed_value(obj, subtype.relationship, found[subtype.kind].get(obj.id, []))
+    return loaded
+
+
+# ----------------------------------------------------------------------
+# Discriminator maintenance
+# ----------------------------------------------------------------------
+
+# Arguments: base table, kind, FK column (kept in step with migration 0008)
+CLASSIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION classify_subtype_parent() RETURNS trigger AS $$
+DECLARE
+    parent_id uuid;
+BEGIN
+    EXECUTE format('SELECT ($1).%I', TG_ARGV[2]) USING NEW INTO parent_id;
+    IF parent_id IS NOT NULL THEN
+        -- NULL or "base" becomes this kind; a different kind already there makes it "mixed".
+        -- Parents already of this kind or "mixed" are not rewritten (no dead tuple per insert).
+        EXECUTE format(
+            'UPDATE %I SET subtype = CASE WHEN subtype IS NULL OR subtype = %L THEN %L ELSE %L END '
+            'WHERE id = $1 AND subtype IS DISTINCT FROM %L AND subtype IS DISTINCT FROM %L',
+            TG_ARGV[0], 'base', TG_ARGV[1], 'mixed', TG_ARGV[1], 'mixed'
+        ) USING parent_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def classify_trigger(base_table: str, subtype_table: str, subtype: Subtype) -> str:
+    """CREATE TRIGGER statement that classifies the parent of every written subtype row"""
+    return (
+        f'CREATE TRIGGER "trg_{subtype_table}_classify_parent" '
+        f'AFTER INSERT OR UPDATE OF "{subtype.foreign_key}" ON "{subtype_table}" '
+        f"FOR EACH ROW EXECUTE FUNCTION classify_subtype_parent('{base_table}', '{subtype.kind}', '{subtype.foreign_key}')"
+    )
+
+
+# Fresh databases built with metadata.create_all() get the triggers migration 0008 installs
+@event.listens_for(Table, "after_create")
+def _create_classify_trigger(table: Table, connection: Connection, **kw):
+    if connection.dialect.name != "postgresql":
+        return
+    for family in FAMILIES.values():
+        for subtype in family.subtypes:
+            if _model(subtype.model).__table__ is table:
+                connection.execute(text(CLASSIFY_FUNCTION))
+                connection.execute(text(classify_trigger(_model(family.base).__tablename__, table.name, subtype)))
+                return
@@ -0,0 +1,170 @@
+"""
+Connection pool telemetry
+Instrumented QueuePool recording checkouts in use, overflow usage,
+checkout wait-time histogram and connection age
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from bisect import bisect_left
+from typing import Any, Dict, List
+import os
+import threading
+import time
+
+# Upper bounds (ms) of the checkout wait-time histogram buckets; last bucket is +Inf
+WAIT_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+
+class PoolStats:
+    """Thread-safe counters for one pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self.connects = 0
+        self.max_checked_out = 0
+        self.max_overflow_used = 0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        # connection record id -> monotonic time the DBAPI connection was opened
+        self.connected_at: Dict[int, float] = {}
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_checkout(self, checked_out: int, overflow_used: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.max_checked_out = max(self.max_checked_out, checked_out)
+            self.max_overflow_used = max(self.max_overflow_used, overflow_used)
+
+    def record_connect(self, record_id: int) -> None:
+        with self._lock:
+            self.connects += 1
+            self.connected_at[record_id] = time.monotonic()
+
+    def record_close(self, record_id: int) -> None:
+        with self._lock:
+            self.connected_at.pop(record_id, None)
+
+    def record_invalidate(self, record_id: int) -> None:
+        with self._lock:
+            self.invalidations += 1
+            self.connected_at.pop(record_id, None)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long callers wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_timeout()
+            raise
+        finally:
+            self.stats.record_wait((time.perf_counter() - started) * 1000)
+
+    def recreate(self):
+        # Keep the same counters across dispose()/recreate()
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach checkout/connect/close listeners feeding the pool's stats"""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        engine.pool.stats.record_connect(id(connection_record))
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        current = engine.pool
+        current.stats.record_checkout(current.checkedout(), max(current.overflow(), 0))
+
+    @event.listens_for(engine, "close")
+    def _on_close(dbapi_connection, connection_record):
+        engine.pool.stats.record_close(id(connection_record))
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        engine.pool.stats.record_invalidate(id(connection_record))
+
+
+def pool_snapshot(engine: Engine) -> Dict[str, Any]:
+    """Point-in-time view of the engine's pool for this worker process"""
+    pool = engine.pool
+    snapshot: Dict[str, Any] = {
+        "pid": os.getpid(),
+        "pool_class": type(pool).__name__,
+    }
+    if not isinstance(pool, QueuePool):
+        return snapshot
+
+    size = pool.size()
+    max_overflow = pool._max_overflow
+    checked_out = pool.checkedout()
+    capacity = size + max(max_overflow, 0)
+    snapshot.update({
+        "size": size,
+        "max_overflow": max_overflow,
+        "capacity": capacity,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow_in_use": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 3) if capacity else None,
+    })
+
+    stats = getattr(pool, "stats", None)
+    if stats is None:
+        return snapshot
+
+    now = time.monotonic()
+    with stats._lock:
+        ages = [now - opened for opened in stats.connected_at.values()]
+        waits = sum(stats.wait_buckets)
+        labels = [f"le_{int(bound)}ms" for bound in WAIT_BUCKETS_MS] + ["le_inf"]
+        snapshot.update({
+            "checkouts_total": stats.checkouts,
+            "checkout_timeouts_total": stats.timeouts,
+            "connects_total": stats.connects,
+            "invalidations_total": stats.invalidations,
+            "max_checked_out": stats.max_checked_out,
+            "max_overflow_used": stats.max_overflow_used,
+            "checkout_wait_ms": {
+                "count": waits,
+                "avg": round(stats.wait_total_ms / waits, 3) if waits else 0.0,
+                "max": round(stats.wait_max_ms, 3),
+                "histogram": dict(zip(labels, stats.wait_buckets)),
+            },
+            "connection_age_seconds": {
+                "open": len(ages),
+                "min": round(min(ages), 1) if ages else None,
+                "max": round(max(ages), 1) if ages else None,
+                "avg": round(sum(ages) / len(ages), 1) if ages else None,
+            },
+        })
+    return snapshot
@@ -0,0 +1,133 @@
+"""
+Per-request SQL statement tracking
+Engine cursor hooks count statements and DB time for the active request;
+an ORM hook attributes lazy loads to the model attribute that fired them
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+import logging
+import time
+
+from app.core.config import settings
+from app.core.exceptions import SQLBudgetExceeded
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SQLBudget:
+    """Statement and DB-time limits for one route"""
+    max_statements: int
+    max_db_ms: Optional[float] = None
+    max_lazy_loads_per_attribute: int = 5
+
+
+@dataclass
+class QueryStats:
+    """Mutable per-request counters; shared by reference with threadpool workers"""
+    route: str
+    resolve_budget: Callable[[], SQLBudget]
+    statements: int = 0
+    db_ms: float = 0.0
+    lazy_loads: Counter = field(default_factory=Counter)
+    _budget: Optional[SQLBudget] = None
+
+    @property
+    def budget(self) -> SQLBudget:
+        # Resolved lazily: the route is only known once the router has matched
+        if self._budget is None:
+            self._budget = self.resolve_budget()
+        return self._budget
+
+    def violations(self) -> list[str]:
+        budget = self.budget
+        problems = []
+        if self.statements > budget.max_statements:
+            problems.append(f"{self.statements} statements > budget {budget.max_statements}")
+        if budget.max_db_ms is not None and self.db_ms > budget.max_db_ms:
+            problems.append(f"{self.db_ms:.1f} ms in DB > budget {budget.max_db_ms:.1f} ms")
+        for attribute, count in self.lazy_loads.most_common():
+            if count <= budget.max_lazy_loads_per_attribute:
+                break
+            problems.append(f"N+1: {attribute} lazy-loaded {count} times")
+        return problems
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_ms:.2f};desc="{self.statements} statements"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def start_tracking(route: str, resolve_budget: Callable[[], SQLBudget]) -> Any:
+    """Begin counting statements for the current request; returns a reset token"""
+    return _current_stats.set(QueryStats(route=route, resolve_budget=resolve_budget))
+
+
+def stop_tracking(token: Any) -> None:
+    _current_stats.reset(token)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def _raise_if_strict(stats: QueryStats) -> None:
+    if settings.sql_budget_mode != "raise":
+        return
+    problems = stats.violations()
+    if problems:
+        raise SQLBudgetExceeded(stats.route, problems)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+    # Fail on the offending statement so the traceback points at the caller
+    _raise_if_strict(stats)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.db_ms += elapsed_ms
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_lazy_load(orm_execute_state: ORMExecuteState):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    refresh_state = orm_execute_state.load_options._refresh_state
+    if orm_execute_state.is_column_load and refresh_state is not None and not refresh_state.expired:
+        # A deferred column group loaded row by row: undefer it in the profile
+        stats.lazy_loads[f"{refresh_state.class_.__name__}.<deferred>"] += 1
+        return
+    if orm_execute_state.lazy_loaded_from is None:
+        return
+    path = orm_execute_state.loader_strategy_path
+    owner = orm_execute_state.lazy_loaded_from.class_.__name__
+    attribute = getattr(path[-1], "key", "?") if path is not None else "?"
+    stats.lazy_loads[f"{owner}.{attribute}"] += 1
@@ -0,0 +1,218 @@
+"""
+Read-replica routing session
+Sends read-only units of work to replica engines and pins the session
+to the primary as soon as it writes
+"""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.dml import UpdateBase
+from contextlib import contextmanager
+from typing import Dict, Generator, List, Optional
+from fastapi import Request
+import logging
+import random
+import threading
+import time
+
+from app.core.config import settings
+from app.database.connection import engine
+from app.database.pool_metrics import InstrumentedQueuePool, instrument_engine
+
+logger = logging.getLogger(__name__)
+
+# Header a client sends right after a write to force its reads onto the primary
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+# Replication delay as seen by a Postgres hot standby; NULL on a primary
+_PG_REPLICA_LAG_SQL = text(
+    "SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+)
+
+
+def _create_replica_engine(url: str) -> Engine:
+    """Create a replica engine with the same pool settings as the primary"""
+    replica = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        echo=settings.debug,
+    )
+    instrument_engine(replica)
+    return replica
+
+
+class ReplicaLagMonitor:
+    """
+    Caches per-replica replication lag for a short interval so routing
+    decisions do not add a round-trip to every unit of work
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lag: Dict[Engine, float] = {}
+        self._checked_at: Dict[Engine, float] = {}
+        self._lock = threading.Lock()
+
+    def lag(self, replica: Engine) -> float:
+        """Return the cached lag in seconds, probing the replica when stale"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at.get(replica, float("-inf")) < self.check_interval:
+                return self._lag[replica]
+            # Claim the probe so concurrent callers keep using the cached value
+            self._checked_at[replica] = now
+            self._lag.setdefault(replica, 0.0)
+
+        lag = self._probe(replica)
+        with self._lock:
+            self._lag[replica] = lag
+        return lag
+
+    def is_healthy(self, replica: Engine) -> bool:
+        return self.lag(replica) <= self.max_lag_seconds
+
+    def _probe(self, replica: Engine) -> float:
+        if replica.dialect.name != "postgresql":
+            # Non-Postgres stand-ins (e.g. two local SQLite files) have no lag
+            return 0.0
+        try:
+            with replica.connect() as conn:
+                return float(conn.execute(_PG_REPLICA_LAG_SQL).scalar() or 0.0)
+        except Exception as e:
+            logger.warning(f"Replica lag probe failed for {replica.url!r}: {e}")
+            return float("inf")
+
+
+replica_engines: List[Engine] = [_create_replica_engine(url) for url in settings.database_replica_urls]
+
+lag_monitor = ReplicaLagMonitor(
+    max_lag_seconds=settings.db_replica_max_lag_seconds,
+    check_interval=settings.db_replica_lag_check_interval,
+)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica until it writes
+
+    - flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE and raw SQL
+      (text(), which may lock rows or call functions that write) go to the
+      primary and pin the session there
+    - a statement's `read_only` execution option overrides that guess:
+      text("SELECT ...").execution_options(read_only=True) may use a replica,
+      select(func.next_ticket()).execution_options(read_only=False) may not
+    - plain SELECTs go to one replica, chosen once per session so the unit
+      of work sees a single snapshot; lagging replicas are skipped
+    - with no healthy replica (or none configured) everything hits the primary
+    """
+
+    def __init__(
+        self,
+        *args,
+        primary: Optional[Engine] = None,
+        replicas: Optional[List[Engine]] = None,
+        monitor: Optional[ReplicaLagMonitor] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.primary = primary if primary is not None else engine
+        self.replicas = replicas if replicas is not None else replica_engines
+        self.monitor = monitor if monitor is not None else lag_monitor
+        self._read_your_writes = False
+        self._wrote = False
+        self._replica: Optional[Engine] = None
+
+    @property
+    def pinned_to_primary(self) -> bool:
+        return self._read_your_writes or self._wrote
+
+    def use_primary(self) -> None:
+        """Read-your-writes: route every remaining statement to the primary"""
+        self._read_your_writes = True
+
+    @contextmanager
+    def primary_reads(self) -> Generator["RoutingSession", None, None]:
+        """Temporarily route reads to the primary"""
+        previous = self._read_your_writes
+        self._read_your_writes = True
+        try:
+            yield self
+        finally:
+            self._read_your_writes = previous
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._is_write(clause):
+            self._wrote = True
+            return self.primary
+        if self.pinned_to_primary:
+            return self.primary
+        return self._pick_replica() or self.primary
+
+    def close(self) -> None:
+        super().close()
+        self._read_your_writes = False
+        self._wrote = False
+        self._replica = None
+
+    def _is_write(self, clause) -> bool:
+        if self._flushing or isinstance(clause, UpdateBase):
+            return True
+        read_only = clause.get_execution_options().get("read_only") if hasattr(clause, "get_execution_options") else None
+        if read_only is not None:
+            return not read_only
+        if isinstance(clause, Select):
+            return clause._for_update_arg is not None
+        return isinstance(clause, TextClause)
+
+    def _pick_replica(self) -> Optional[Engine]:
+        # Sticky for the session's lifetime so one unit of work sees one snapshot
+        if self._replica is None:
+            healthy = [replica for replica in self.replicas if self.monitor.is_healthy(replica)]
+            self._replica = random.choice(healthy) if healthy else None
+        return self._replica
+
+
+# Create ReadSessionLocal class
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+
+
+def wants_primary(request: Request) -> bool:
+    """True when the client sent the read-your-writes header"""
+    return request.headers.get(READ_YOUR_WRITES_HEADER, "").lower() in ("1", "true", "yes")
+
+
+def open_read_session(request: Optional[Request] = None) -> RoutingSession:
+    """
+    Replica-routing session for `request`, pinned to the primary when the
+    client asked to read its own writes; the caller closes it
+    """
+    db = ReadSessionLocal()
+    if request is not None and wants_primary(request):
+        db.use_primary()
+    return db
+
+
+def get_read_db(request: Request) -> Generator[RoutingSession, None, None]:
+    """
+    Replica-routing database dependency
+    For dashboards, reports, search and calendar views; honours the
+    read-your-writes header by pinning the whole request to the primary.
+    Streaming responses outlive the dependency: open their session with
+    open_read_session(request) inside the body generator instead.
+    """
+    db = open_read_session(request)
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Read session error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,79 @@
+"""
+Cleanup jobs
+Partition maintenance for the monthly-partitioned log and event tables
+
+    python -m app.jobs.cleanup_jobs            # create ahead, expire per settings
+    python -m app.jobs.cleanup_jobs --dry-run  # only report
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+import argparse
+import logging
+
+from app.core.config import settings
+from app.database.connection import engine
+from app.database.partitioning import (
+    PARTITIONED_TABLES,
+    detach_partition,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def maintain_partitions(
+    today: Optional[date] = None,
+    months_ahead: Optional[int] = None,
+    expire_action: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Pre-create upcoming monthly partitions and retire expired ones
+
+    expire_action is "detach" (table kept for archiving, no longer queried)
+    or "drop". Safe to run repeatedly; meant to be scheduled daily.
+    """
+    expire_action = expire_action or settings.partition_expire_action
+    if expire_action not in ("detach", "drop"):
+        raise ValueError(f"Unknown partition expire action '{expire_action}'")
+
+    report: Dict[str, Dict[str, List[str]]] = {}
+    # Moves out of the default partition and detaches run their own short transactions
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for spec in PARTITIONED_TABLES.values():
+            if not is_partitioned(conn, spec.table):
+                logger.warning(f"{spec.table} is not partitioned yet; run the migrations")
+                continue
+
+            expired = expired_partitions(conn, spec, today)
+            if dry_run:
+                report[spec.table] = {"created": [], "expired": expired}
+                continue
+
+            created = ensure_partitions(conn, spec, today, months_ahead)
+            for partition in expired:
+                detach_partition(conn, spec.table, partition, drop=expire_action == "drop")
+                logger.info(f"{expire_action} partition {partition}")
+            report[spec.table] = {"created": created, "expired": expired}
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mantenimiento de particiones mensuales")
+    parser.add_argument("--dry-run", action="store_true", help="Solo mostrar particiones expiradas")
+    parser.add_argument("--months-ahead", type=int, default=None, help="Meses a crear por adelantado")
+    parser.add_argument("--expire-action", choices=("detach", "drop"), default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    result = maintain_partitions(
+        months_ahead=args.months_ahead,
+        expire_action=args.expire_action,
+        dry_run=args.dry_run,
+    )
+    for table, changes in result.items():
+        print(f"{table}: creadas={changes['created'] or '-'} expiradas={changes['expired'] or '-'}")
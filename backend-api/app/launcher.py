@@ -0,0 +1,295 @@
+"""
+Preload-and-fork worker launcher
+The parent imports and fully warms the application (mappers configured,
+loading profiles compiled, OpenAPI rendered, catalogs loaded), freezes the
+GC and then forks the uvicorn workers, so the warmed heap is shared
+copy-on-write instead of being rebuilt by every worker. Connections used
+for the catalogs are closed before forking; each worker subscribes to
+catalog invalidations itself and drops any snapshot that changed since.
+
+    python -m app.launcher --host 0.0.0.0 --port 8000 --workers 4
+    python -m app.launcher --no-preload        # each worker imports the app itself
+"""
+
+from typing import Callable, Dict, Optional
+import argparse
+import gc
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.launcher")
+
+APP_PATH = "app.main:app"
+# Grace period for workers to drain in-flight requests on shutdown
+SHUTDOWN_TIMEOUT = 30.0
+# Pause before respawning a worker that died right after it started
+RESPAWN_BACKOFF = 1.0
+
+
+def memory_usage(pid: int) -> Dict[str, float]:
+    """RSS, PSS, shared and private (USS) memory of a process in MB (Linux)"""
+    fields = {"Rss": 0, "Pss": 0, "Shared_Clean": 0, "Shared_Dirty": 0, "Private_Clean": 0, "Private_Dirty": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in fields:
+                    fields[key] = int(rest.split()[0])
+    except OSError:
+        return {}
+    return {
+        "rss_mb": fields["Rss"] / 1024,
+        "pss_mb": fields["Pss"] / 1024,
+        "shared_mb": (fields["Shared_Clean"] + fields["Shared_Dirty"]) / 1024,
+        "uss_mb": (fields["Private_Clean"] + fields["Private_Dirty"]) / 1024,
+    }
+
+
+def preload():
+    """
+    Import and warm the application in the parent process
+    Returns (app, per-step timings in ms)
+    """
+    # No collections while the long-lived heap is being built; it is
+    # frozen wholesale right before forking
+    gc.disable()
+    timings: Dict[str, float] = {}
+
+    def step(name: str, func: Callable[[], object]) -> None:
+        # Best effort: a failed step is simply paid for again by each worker
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.warning(f"Preload step '{name}' failed: {e}")
+        timings[name] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    app = import_from_string(APP_PATH)
+    timings["import_app"] = (time.perf_counter() - started) * 1000
+
+    # The connection-free warm-up steps; workers re-run the rest in their lifespan
+    from app.core.lifecycle import warmup_steps
+    for warm in warmup_steps(fork_safe_only=True):
+        step(warm.name, lambda: warm.func(app))
+
+    # Catalog rows are read-only and the same for every worker: load them once here
+    from app.core.catalogs import preload as preload_catalogs
+    step("catalogs", preload_catalogs)
+
+    # Nothing pooled may cross the fork: children would share sockets
+    _dispose_engines()
+    from app.config.redis import close_sync_redis
+    close_sync_redis()
+
+    gc.collect()
+    gc.freeze()
+    return app, timings
+
+
+def _dispose_engines() -> None:
+    from app.database.connection import async_engine, engine
+    from app.database.session import replica_engines
+
+    for pooled in (engine, async_engine.sync_engine, *replica_engines):
+        pooled.dispose(close=False)
+
+
+class WorkerServer(uvicorn.Server):
+    """uvicorn server that reports when it starts accepting connections"""
+
+    def __init__(self, config: uvicorn.Config, on_ready: Callable[[], None]):
+        super().__init__(config)
+        self.on_ready = on_ready
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            self.on_ready()
+
+
+class Launcher:
+    """Binds the listening socket, optionally preloads, forks and supervises workers"""
+
+    def __init__(self, host: str, port: int, workers: int, preload_app: bool, json_events: bool = False):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.preload_app = preload_app
+        self.json_events = json_events
+        self.started_at = time.perf_counter()
+        self.app = None
+        self.children: Dict[int, int] = {}  # pid -> worker slot
+        self.spawned_at: Dict[int, float] = {}
+        self.shutting_down = False
+        self.sock: Optional[socket.socket] = None
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def emit(self, event: str, message: str, **data) -> None:
+        if self.json_events:
+            print(json.dumps({"event": event, **data}), flush=True)
+        else:
+            print(message, flush=True)
+
+    # ------------------------------------------------------------------
+    # Parent
+    # ------------------------------------------------------------------
+
+    def run(self) -> int:
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The preload-and-fork launcher needs os.fork (Linux/macOS)")
+
+        self.sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(2048)
+        self.sock.set_inheritable(True)
+
+        if self.preload_app:
+            self.app, timings = preload()
+            self.emit(
+                "preloaded",
+                f"🔥 App precargada en {sum(timings.values()):.0f} ms "
+                + ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items()),
+                seconds=time.perf_counter() - self.started_at,
+                timings_ms=timings,
+                parent_memory=memory_usage(os.getpid()),
+            )
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        for slot in range(self.workers):
+            self.spawn(slot)
+        return self.supervise()
+
+    def spawn(self, slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = self.run_worker(slot)
+            except BaseException:
+                logger.exception(f"Worker {slot} crashed")
+            finally:
+                os._exit(code)
+        self.children[pid] = slot
+        self.spawned_at[pid] = time.perf_counter()
+
+    def supervise(self) -> int:
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            slot = self.children.pop(pid, None)
+            if slot is None:
+                continue
+            lived = time.perf_counter() - self.spawned_at.pop(pid, 0.0)
+            if self.shutting_down:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            self.emit("worker_exit", f"⚠️  Worker {slot} (pid {pid}) terminó con código {code}; reiniciando",
+                      worker=slot, pid=pid, code=code)
+            if lived < RESPAWN_BACKOFF:
+                time.sleep(RESPAWN_BACKOFF)
+            self.spawn(slot)
+        return 0
+
+    def _handle_stop(self, signum, frame) -> None:
+        if self.shutting_down:
+            return
+        self.shutting_down = True
+        self.emit("stopping", "🛑 Deteniendo workers...")
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        while self.children and time.monotonic() < deadline:
+            try:
+                pid, _status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid:
+                self.children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Child
+    # ------------------------------------------------------------------
+
+    def run_worker(self, slot: int) -> int:
+        # uvicorn installs its own handlers once the loop is running
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        if self.preload_app:
+            gc.enable()
+
+        # Only the configured proxies may rewrite the client address (IP blocks rely on it)
+        config = uvicorn.Config(
+            self.app if self.preload_app else APP_PATH,
+            proxy_headers=True,
+            forwarded_allow_ips=settings.forwarded_allow_ips,
+        )
+
+        def on_ready() -> None:
+            pid = os.getpid()
+            seconds = time.perf_counter() - self.started_at
+            memory = memory_usage(pid)
+            self.emit(
+                "worker_ready",
+                f"✅ Worker {slot} (pid {pid}) listo en {seconds:.2f}s — "
+                f"RSS {memory.get('rss_mb', 0):.1f} MB, PSS {memory.get('pss_mb', 0):.1f} MB, "
+                f"privada {memory.get('uss_mb', 0):.1f} MB",
+                worker=slot,
+                pid=pid,
+                seconds=seconds,
+                preload=self.preload_app,
+                memory=memory,
+            )
+
+        server = WorkerServer(config, on_ready)
+        server.run(sockets=[self.sock])
+        return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lanzador de workers con precarga y fork")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=settings.web_workers)
+    parser.add_argument("--no-preload", dest="preload", action="store_false", default=settings.preload_app,
+                        help="Cada worker importa la app por su cuenta (como uvicorn --workers)")
+    parser.add_argument("--json-events", action="store_true", help="Eventos en JSON por línea (benchmarks)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    launcher = Launcher(args.host, args.port, args.workers, args.preload, json_events=args.json_events)
+    sys.exit(launcher.run())
+
+
+if __name__ == "__main__":
+    main()
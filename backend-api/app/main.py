@@ -10,10 +10,14 @@ import uvicorn
 import os
 from contextlib import asynccontextmanager
 
-# Import your app modules here when you create them
-# from app.api.router import api_router
-# from app.database.connection import database
-# from app.core.config import settings
+from app.api.api import api_router
+from app.core.lifecycle import close_pools, drain, install_session_hooks, run_warmup, state as lifecycle_state
+from app.core.middleware import InFlightMiddleware, IpBlockMiddleware, SQLBudgetMiddleware
+from app.database.connection import check_db_connection, engine
+from app.database.pool_metrics import pool_snapshot
+
+# Commit hooks (cache invalidation, config reload, security stamps) before any session is used
+install_session_hooks()
 
 
 @asynccontextmanager
@@ -21,13 +25,27 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     print("🚀 Starting FastAPI Backend...")
-    # Initialize database connections, background tasks, etc.
+    # Pools, mappers, caches and OpenAPI primed before /health reports ready
+    warm = await run_warmup(app)
+    failed = [step.name for step in warm.steps if not step.ok]
+    print(
+        f"🔥 Warm-up finished in {warm.warmup_ms:.0f} ms "
+        + ", ".join(f"{step.name}={step.ms:.0f}ms" for step in warm.steps)
+    )
+    if failed:
+        print(f"⚠️  Warm-up steps failed: {', '.join(failed)}")
+    if not warm.ready:
+        critical = [step.name for step in warm.steps if step.critical and not step.ok]
+        print(f"❌ Critical warm-up steps failed ({', '.join(critical)}): worker stays not ready")
     
     yield
     
     # Shutdown
     print("🛑 Shutting down FastAPI Backend...")
-    # Clean up resources
+    drained = await drain()
+    print("✅ In-flight requests drained" if drained else f"⚠️  {lifecycle_state.in_flight} request(s) still running")
+    await close_pools()
+    print("✅ Connection pools closed")
 
 
 # Create FastAPI application
@@ -49,17 +67,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL statement budget and N+1 detection
+app.add_middleware(SQLBudgetMiddleware)
+
+# Blocked addresses (IpBlock) are rejected before any other work
+app.add_middleware(IpBlockMiddleware)
+
+# In-flight request counter, drained on shutdown
+app.add_middleware(InFlightMiddleware)
+
 
 # Health check endpoint (required by docker-compose)
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for container orchestration"""
+    """Health check endpoint for container orchestration; 503 until warm-up completes"""
+    ready = lifecycle_state.ready
     return JSONResponse(
-        status_code=200,
+        status_code=200 if ready else 503,
         content={
-            "status": "healthy",
+            "status": "healthy" if ready else lifecycle_state.phase,
             "service": "fastapi-backend",
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "warmup": lifecycle_state.snapshot(),
+        }
+    )
+
+
+# Readiness probe: checks the database off the event loop
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness endpoint; 503 during warm-up, shutdown or while the database is unreachable"""
+    db_ok = await check_db_connection(timeout=2.0)
+    pool = pool_snapshot(engine)
+    ready = db_ok and lifecycle_state.ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "phase": lifecycle_state.phase,
+            "database": "ok" if db_ok else "unavailable",
+            "pool": {
+                "checked_out": pool.get("checked_out"),
+                "capacity": pool.get("capacity"),
+                "saturation": pool.get("saturation"),
+            },
         }
     )
 
@@ -90,8 +141,8 @@ async def api_v1_root():
         }
     }
 
-# Include API routers here when you create them
-# app.include_router(api_router, prefix="/api/v1")
+# Include API routers
+app.include_router(api_router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
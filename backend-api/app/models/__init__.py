@@ -4,105 +4,125 @@ Modelos de la aplicación Medialab
 
 Este módulo contiene todos los modelos de datos de la aplicación.
 Organizados por funcionalidad en submódulos para facilitar el mantenimiento.
+
+Los submódulos se importan bajo demanda: `from app.models import User` solo
+carga `user_management`. Antes de configurar los mappers (primera consulta o
+`configure_models()`) se cargan todos los dominios, porque las relaciones se
+declaran por nombre entre paquetes.
 """
 
+from importlib import import_module
+from typing import Dict, List
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, configure_mappers
+
 # Modelos base
 from .base import Base
 
-# Importaciones desde submódulos organizados
-from .user_management import User, UserType, EmployeeRole, UserDevice, IpBlock
-from .audit import AuditLog, AuditLogType, AuditRetentionPolicy, AuditAlert, AuditStatistics
-from .requests import Request, RequestComment, RequestAttachment, ProjectTemplate
-from .projects import (
-    ProjectStatus, ProjectPriority, ProjectType, Project,
-    ProjectMember, ProjectResource, ProjectDocument, Course, Podcast
-)
-from .tasks import (
-    TaskStatus, TaskPriority, TaskType, Task,
-    TaskComment, TaskAttachment, TaskTimeLog, TaskDependency, TaskAssignment,
-    Deliverable, TaskApproval, TaskLink
-)
-from .inventory import (
-    InventoryItemStatus, InventoryCategory, InventoryItem,
-    InventoryMovement, MaintenanceRecord, InventoryReservation,
-    Equipment, Supply
-)
-from .calendar import (
-    CalendarEvent, EventAttendee, EventResource, CalendarSubscription,
-    EventVisibility, EventStatus, AttendanceStatus, EventRole, ResourceType, ResourceStatus, SubscriptionType
-)
-from .reports import (
-    ReportTemplate, GeneratedReport, KPIDefinition, KPIValue,
-    ReportCategory, ReportType, GenerationType, GenerationStatus, KPICategory, CalculationFrequency
-)
-from .search import SearchIndex, SavedSearch, EntityType, SortDirection
-from .communication import (
-    Notification, UserNotificationPreference, Comment,
-    NotificationStatus, NotificationFrequency, CommentableType, CommentType
-)
-from .university import Unit, UnitType, Professor, ProfessorUnit
-from .app_settings import (
-    Configuration, ConfigurationHistory, StatusType, StatusOption, PriorityOption,
-    ServiceCategory, ServiceType, DurationType,
-    ConfigurationType, ChangeType, UserTypeSetting, DashboardType,
-    DeliverableType, PodcastEpisodeDraft, CourseClassDraft, DraftStatus
-)
-
-# Otros submódulos (por implementar)
-# Ya todos están implementados ✅
-
-__all__ = [
-    # Base
-    "Base",
-    
-    # Core
-    "Area", "Space", "ServiceType", "Service", "Requirement",
-    "Category", "Status", "Priority",
-    
-    # Gestión de Usuarios
-    "User", "UserType", "EmployeeRole", "UserDevice", "IpBlock",
-    
-    # Auditoría
-    "AuditLog", "AuditLogType", "AuditRetentionPolicy", "AuditAlert", "AuditStatistics",
-    
-    # Solicitudes
-    "Request", "RequestComment", "RequestAttachment", "ProjectTemplate",
-    
-    # Proyectos
-    "ProjectStatus", "ProjectPriority", "ProjectType", "Project",
-    "ProjectMember", "ProjectResource", "ProjectDocument", "Course", "Podcast",
-    
-    # Tareas
-    "TaskStatus", "TaskPriority", "TaskType", "Task",
-    "TaskComment", "TaskAttachment", "TaskTimeLog", "TaskDependency", "TaskAssignment",
-    "Deliverable", "TaskApproval", "TaskLink",
-    
-    # Inventario
-    "InventoryItemStatus", "InventoryCategory", "InventoryItem",
-    "InventoryMovement", "MaintenanceRecord", "InventoryReservation",
-    "Equipment", "Supply",
-    
-    # Calendario
-    "CalendarEvent", "EventAttendee", "EventResource", "CalendarSubscription",
-    "EventVisibility", "EventStatus", "AttendanceStatus", "EventRole", "ResourceType", "ResourceStatus", "SubscriptionType",
-    
-    # Reportes
-    "ReportTemplate", "GeneratedReport", "KPIDefinition", "KPIValue",
-    "ReportCategory", "ReportType", "GenerationType", "GenerationStatus", "KPICategory", "CalculationFrequency",
-    
-    # Búsqueda
-    "SearchIndex", "SavedSearch", "EntityType", "SortDirection",
-    
-    # Comunicación
-    "Notification", "UserNotificationPreference", "Comment",
-    "NotificationStatus", "NotificationFrequency", "CommentableType", "CommentType",
-    
-    # Universidad
-    "Unit", "UnitType", "Professor", "ProfessorUnit",
-    
-    # Configuración
-    "Configuration", "ConfigurationHistory", "StatusType", "StatusOption", "PriorityOption",
-    "ServiceCategory", "ServiceType", "DurationType",
-    "ConfigurationType", "ChangeType", "UserTypeSetting", "DashboardType",
-    "DeliverableType", "PodcastEpisodeDraft", "CourseClassDraft", "DraftStatus",
-]
+# Nombre exportado -> submódulo que lo define
+_EXPORTS: Dict[str, List[str]] = {
+    "user_management": ["User", "UserType", "EmployeeRole", "UserDevice", "IpBlock"],
+    "audit": ["AuditLog", "AuditLogType", "AuditRetentionPolicy", "AuditAlert", "AuditStatistics"],
+    "requests": ["Request", "RequestComment", "RequestAttachment", "ProjectTemplate"],
+    "projects": [
+        "ProjectStatus", "ProjectPriority", "ProjectType", "Project",
+        "ProjectMember", "ProjectResource", "ProjectDocument", "Course", "Podcast",
+    ],
+    "tasks": [
+        "TaskStatus", "TaskPriority", "TaskType", "Task",
+        "TaskComment", "TaskAttachment", "TaskTimeLog", "TaskDependency", "TaskAssignment",
+        "Deliverable", "TaskApproval", "TaskLink",
+    ],
+    "inventory": [
+        "InventoryItemStatus", "InventoryCategory", "InventoryItem",
+        "InventoryMovement", "MaintenanceRecord", "InventoryReservation",
+        "Equipment", "Supply", "InventoryType",
+    ],
+    "calendar": [
+        "CalendarEvent", "EventAttendee", "EventResource", "CalendarSubscription",
+        "EventVisibility", "EventStatus", "AttendanceStatus", "EventRole", "ResourceType", "ResourceStatus", "SubscriptionType",
+        "EventType", "LinkPlatform",
+    ],
+    "reports": [
+        "ReportTemplate", "GeneratedReport", "KPIDefinition", "KPIValue",
+        "ReportCategory", "ReportType", "GenerationType", "GenerationStatus", "KPICategory", "CalculationFrequency",
+    ],
+    "search": ["SearchIndex", "SavedSearch", "EntityType", "SortDirection"],
+    "communication": [
+        "Notification", "UserNotificationPreference", "Comment",
+        "NotificationStatus", "NotificationFrequency", "CommentableType", "CommentType",
+        "NotificationChannel", "NotificationType",
+    ],
+    "university": ["Unit", "UnitType", "Professor", "ProfessorUnit"],
+    "app_settings": [
+        "Configuration", "ConfigurationHistory", "StatusType", "StatusOption", "PriorityOption",
+        "ServiceCategory", "ServiceType", "DurationType",
+        "ConfigurationType", "ChangeType", "UserTypeSetting", "DashboardType",
+        "DeliverableType", "PodcastEpisodeDraft", "CourseClassDraft", "DraftStatus",
+    ],
+}
+
+DOMAIN_PACKAGES = tuple(_EXPORTS)
+
+_SOURCE = {name: package for package, names in _EXPORTS.items() for name in names}
+
+_load_lock = threading.RLock()
+_all_loaded = False
+
+
+def __getattr__(name: str):
+    """Importa el submódulo que define `name` la primera vez que se pide"""
+    package = _SOURCE.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{package}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SOURCE))
+
+
+def load_all_models() -> None:
+    """Importa todos los dominios (Alembic, create_all, configuración de mappers)"""
+    global _all_loaded
+    if _all_loaded:
+        return
+    with _load_lock:
+        if _all_loaded:
+            return
+        for package in DOMAIN_PACKAGES:
+            import_module(f".{package}", __name__)
+        _all_loaded = True
+
+
+@event.listens_for(Mapper, "before_configured")
+def _load_before_configure():
+    # Las relaciones por nombre ("User", "Project") deben poder resolverse.
+    # Los hooks de sesión viven en app.core / app.database y se registran al
+    # arrancar (app.core.lifecycle.install_session_hooks), no desde aquí.
+    load_all_models()
+
+
+def configure_models() -> Dict[str, float]:
+    """
+    Paso de calentamiento explícito: importa todos los modelos y configura
+    los mappers una sola vez, antes de atender tráfico o de hacer fork
+    """
+    started = time.perf_counter()
+    load_all_models()
+    imported = time.perf_counter()
+    configure_mappers()
+    configured = time.perf_counter()
+    return {
+        "mappers": len(Base.registry.mappers),
+        "import_ms": (imported - started) * 1000,
+        "configure_ms": (configured - imported) * 1000,
+    }
+
+
+__all__ = ["Base", "DOMAIN_PACKAGES", "load_all_models", "configure_models", *_SOURCE]
@@ -3,6 +3,7 @@ Modelo para configuraciones del sistema.
 """
 
 from sqlalchemy import Column, String, Text, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -50,14 +51,14 @@ class ConfigurationHistory(BaseModel):
     Modelo para historial de cambios de configuración.
     """
     __tablename__ = "configuration_histories"
-    configuration_id = Column(String(36), ForeignKey("configurations.id"), nullable=False, index=True)
-    changed_by_user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    configuration_id = Column(UUID(as_uuid=True), ForeignKey("configurations.id"), nullable=False, index=True)
+    changed_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     old_value = Column(Text, nullable=True)
     new_value = Column(Text, nullable=True)
     change_reason = Column(Text, nullable=True)
     change_type = Column(SQLEnum(ChangeType), nullable=False)
     requires_restart = Column(Boolean, default=False, nullable=False)
-    approved_by_user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    approved_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     rollback_available = Column(Boolean, default=True, nullable=False)
     
     # Relaciones
@@ -3,6 +3,7 @@ Modelos para categorías y tipos de servicios.
 """
 
 from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -33,7 +34,7 @@ class ServiceType(BaseModel):
     Modelo para tipos de servicios.
     """
     __tablename__ = "service_types"
-    category_id = Column(String(36), ForeignKey("service_categories.id"), nullable=False, index=True)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("service_categories.id"), nullable=False, index=True)
     code = Column(String(100), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
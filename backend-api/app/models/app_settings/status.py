@@ -3,6 +3,7 @@ Modelos para estados y opciones del sistema.
 """
 
 from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -29,7 +30,7 @@ class StatusOption(BaseModel):
     Modelo para opciones de estado.
     """
     __tablename__ = "status_options"
-    status_type_id = Column(Integer, ForeignKey("status_types.id"), nullable=False, index=True)
+    status_type_id = Column(UUID(as_uuid=True), ForeignKey("status_types.id"), nullable=False, index=True)
     code = Column(String(100), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     level = Column(Integer, nullable=False)
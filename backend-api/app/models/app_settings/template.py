@@ -3,7 +3,7 @@ Modelos para plantillas del sistema.
 """
 
 from sqlalchemy import Column, String, Text, Boolean, Integer, Date, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -40,14 +40,14 @@ class PodcastEpisodeDraft(BaseModel):
     Modelo para borradores de episodios de podcast.
     """
     __tablename__ = "podcast_episodes_drafts"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     episode_number = Column(Integer, nullable=True)
     guest_name = Column(String(255), nullable=True)
     topic = Column(String(500), nullable=True)
     scheduled_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
     status = Column(SQLEnum(DraftStatus), default=DraftStatus.DRAFT, nullable=False)
-    request_id = Column(String(36), ForeignKey("requests.id"), nullable=True, index=True)
+    request_id = Column(UUID(as_uuid=True), ForeignKey("requests.id"), nullable=True, index=True)
     
     # Relaciones    user = relationship("User", back_populates="deliverable_types")
     request = relationship("Request", back_populates="deliverable_types")
@@ -61,7 +61,7 @@ class CourseClassDraft(BaseModel):
     Modelo para borradores de clases de curso.
     """
     __tablename__ = "course_classes_drafts"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     course_name = Column(String(255), nullable=True)
     class_number = Column(Integer, nullable=True)
     class_title = Column(String(500), nullable=True)
@@ -69,7 +69,7 @@ class CourseClassDraft(BaseModel):
     scheduled_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
     status = Column(SQLEnum(DraftStatus), default=DraftStatus.DRAFT, nullable=False)
-    request_id = Column(String(36), ForeignKey("requests.id"), nullable=True, index=True)
+    request_id = Column(UUID(as_uuid=True), ForeignKey("requests.id"), nullable=True, index=True)
     deliverables = relationship("Deliverable", back_populates="deliverable_type")
     # Relaciones    user = relationship("User", back_populates="deliverable_types")
     request = relationship("Request", back_populates="deliverable_types")
@@ -2,12 +2,14 @@
 Modelo de logs de auditoría
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from datetime import datetime
 
-from ..base import BaseModel
+from app.database.partitioning import partitioned_table_args
+
+from ..base import BaseModel, uuid7
 
 
 class AuditLog(BaseModel):
@@ -16,7 +18,8 @@ class AuditLog(BaseModel):
     Critical for compliance and debugging
     """
     __tablename__ = "audit_logs"
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    __id_generator__ = staticmethod(uuid7)  # Ids ordenados por tiempo: inserciones al final del índice
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     action = Column(String(100), nullable=False, index=True)
     resource = Column(String(100), index=True)
     resource_id = Column(String(255), index=True)
@@ -35,11 +38,14 @@ class AuditLog(BaseModel):
     severity = Column(String(20), default="INFO")  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     category = Column(String(50), index=True)  # AUTH, PROJECT, TASK, INVENTORY, etc.
     
-    # Timestamp
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    # Timestamp (clave de partición mensual; forma parte de la PK)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, primary_key=True)
     
     # Relationships
     user = relationship("User", back_populates="audit_logs")
+
+    # Particionada por mes; la PK (created_at, id) sirve también a la paginación keyset
+    __table_args__ = (partitioned_table_args("audit_logs"),)
     
     def __repr__(self):
         return f"<AuditLog(action={self.action}, user={self.user_id}, resource={self.resource})>"
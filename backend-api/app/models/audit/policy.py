@@ -3,7 +3,7 @@ Modelos para políticas y configuración de auditoría.
 """
 
 from sqlalchemy import Column, String, Text, Boolean, Integer, Date, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -35,7 +35,7 @@ class AuditRetentionPolicy(BaseModel):
     Modelo para políticas de retención de logs de auditoría.
     """
     __tablename__ = "audit_retention_policies"
-    audit_log_type_id = Column(String(36), ForeignKey("audit_log_types.id"), nullable=False, index=True)
+    audit_log_type_id = Column(UUID(as_uuid=True), ForeignKey("audit_log_types.id"), nullable=False, index=True)
     retention_days = Column(Integer, nullable=False)
     archive_after_days = Column(Integer, nullable=True)
     auto_delete = Column(Boolean, default=False, nullable=False)
@@ -54,7 +54,7 @@ class AuditAlert(BaseModel):
     Modelo para alertas de auditoría.
     """
     __tablename__ = "audit_alerts"
-    audit_log_type_id = Column(String(36), ForeignKey("audit_log_types.id"), nullable=False, index=True)
+    audit_log_type_id = Column(UUID(as_uuid=True), ForeignKey("audit_log_types.id"), nullable=False, index=True)
     condition_rules = Column(JSON, nullable=False)
     alert_recipients = Column(JSON, nullable=False)
     alert_channels = Column(JSON, nullable=False)
@@ -76,7 +76,7 @@ class AuditStatistics(BaseModel):
     date = Column(Date, nullable=False, index=True)
     total_actions = Column(Integer, default=0, nullable=False)
     unique_users = Column(Integer, default=0, nullable=False)
-    most_active_user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    most_active_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     most_common_action = Column(String(255), nullable=True)
     peak_hour = Column(Integer, nullable=True)
     error_count = Column(Integer, default=0, nullable=False)
@@ -4,24 +4,68 @@ Base model with common fields
 
 from sqlalchemy import Column, DateTime, Boolean, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import declared_attr
+import os
+import threading
+import time
 import uuid
 from datetime import datetime
 
 from app.database.connection import Base
 
 
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7)
+
+    48-bit Unix millisecond timestamp, then a 12-bit per-millisecond sequence
+    and 62 random bits. Ids generated later sort later, so inserts append to
+    the right edge of the primary-key B-tree instead of splitting random pages.
+    Monotonic within a process, including when the clock steps backwards.
+    """
+    global _uuid7_last_ms, _uuid7_seq
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _uuid7_last_ms:
+            # Random start leaves headroom for ids created in the same millisecond
+            _uuid7_seq = int.from_bytes(os.urandom(2), "big") & 0x7FF
+            _uuid7_last_ms = ms
+        else:
+            _uuid7_seq += 1
+            if _uuid7_seq > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_seq = 0
+            ms = _uuid7_last_ms
+        seq = _uuid7_seq
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)
+
+
 class BaseModel(Base):
     """
     Base model with common fields for all tables
     """
     __abstract__ = True
-    
-    id = Column(
-        UUID(as_uuid=True), 
-        primary_key=True, 
-        default=uuid.uuid4,
-        index=True
-    )
+
+    # Id generator; append-heavy tables override this with uuid7
+    __id_generator__ = staticmethod(uuid.uuid4)
+
+    @declared_attr
+    def id(cls):
+        # The primary key already has a unique index; no extra index=True
+        return Column(
+            UUID(as_uuid=True),
+            primary_key=True,
+            default=cls.__id_generator__
+        )
+
     created_at = Column(
         DateTime(timezone=True), 
         server_default=func.now(),
@@ -64,14 +64,14 @@ class CalendarEvent(BaseModel):
     Modelo para eventos del calendario.
     """
     __tablename__ = "calendar_events"
-    event_type_id = Column(String(36), ForeignKey("event_types.id"), nullable=False, index=True)
+    event_type_id = Column(UUID(as_uuid=True), ForeignKey("event_types.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=False)
     all_day = Column(Boolean, default=False, nullable=False)
     location = Column(String(255), nullable=True)
-    created_by_user_id = Column(UUID, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     related_entity_type = Column(String(50), nullable=True)
     related_entity_id = Column(String(36), nullable=True)
     is_system_generated = Column(Boolean, default=False, nullable=False)
@@ -95,8 +95,8 @@ class EventAttendee(BaseModel):
     Modelo para asistentes de eventos.
     """
     __tablename__ = "event_attendees"
-    event_id = Column(String(36), ForeignKey("calendar_events.id"), nullable=False, index=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    event_id = Column(UUID(as_uuid=True), ForeignKey("calendar_events.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     attendance_status = Column(SQLEnum(AttendanceStatus), default=AttendanceStatus.PENDING, nullable=False)
     role = Column(SQLEnum(EventRole), default=EventRole.PARTICIPANT, nullable=False)
     is_required = Column(Boolean, default=False, nullable=False)
@@ -116,7 +116,7 @@ class EventResource(BaseModel):
     Modelo para recursos de eventos.
     """
     __tablename__ = "event_resources"
-    event_id = Column(String(36), ForeignKey("calendar_events.id"), nullable=False, index=True)
+    event_id = Column(UUID(as_uuid=True), ForeignKey("calendar_events.id"), nullable=False, index=True)
     resource_type = Column(SQLEnum(ResourceType), nullable=False)
     resource_id = Column(String(36), nullable=False, index=True)
     quantity_needed = Column(Integer, default=1, nullable=False)
@@ -3,7 +3,7 @@ Calendar Extended Models - Vistas personalizadas y eventos recurrentes
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class CalendarView(BaseModel):
     Configuraciones de vista personalizadas por usuario
     """
     __tablename__ = "calendar_views"
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Configuración de la vista
     name = Column(String(200), nullable=False)
@@ -52,7 +52,7 @@ class RecurringEvent(BaseModel):
     Configuración para eventos que se repiten según patrones
     """
     __tablename__ = "recurring_events"
-    parent_event_id = Column(Integer, ForeignKey("calendar_events.id"), nullable=False, index=True)
+    parent_event_id = Column(UUID(as_uuid=True), ForeignKey("calendar_events.id"), nullable=False, index=True)
     
     # Patrón de recurrencia
     recurrence_type = Column(String(50), nullable=False)  # 'daily', 'weekly', 'monthly', 'yearly', 'custom'
@@ -91,7 +91,7 @@ class PodcastEpisode(BaseModel):
     Episodios específicos dentro de una serie de podcast
     """
     __tablename__ = "podcast_episodes"
-    podcast_id = Column(Integer, ForeignKey("podcasts.id"), nullable=False, index=True)
+    podcast_id = Column(UUID(as_uuid=True), ForeignKey("podcasts.id"), nullable=False, index=True)
     
     # Información del episodio
     episode_number = Column(Integer)
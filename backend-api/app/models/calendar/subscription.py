@@ -3,6 +3,7 @@ Modelo para suscripciones de calendario.
 """
 
 from sqlalchemy import Column, String, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -22,7 +23,7 @@ class CalendarSubscription(BaseModel):
     Modelo para suscripciones de calendario.
     """
     __tablename__ = "calendar_subscriptions"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     subscription_type = Column(SQLEnum(SubscriptionType), nullable=False)
     subscription_target_id = Column(String(36), nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -3,11 +3,13 @@ Notification Extended Models - Lotes, logs, programación y plantillas
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from ..base import BaseModel
+from app.database.partitioning import partitioned_table_args
+
+from ..base import BaseModel, uuid7
 
 class NotificationBatch(BaseModel):
     """
@@ -19,8 +21,8 @@ class NotificationBatch(BaseModel):
     batch_type = Column(String(100), nullable=False)  # 'broadcast', 'targeted', 'automated'
     
     # Configuración del envío
-    template_id = Column(Integer, ForeignKey("notification_templates.id"), index=True, nullable=False)
-    channel_id = Column(Integer, ForeignKey("notification_channels.id"), nullable=False, index=True)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("notification_templates.id"), index=True, nullable=False)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     
     # Estadísticas
     total_recipients = Column(Integer, default=0)
@@ -39,7 +41,7 @@ class NotificationBatch(BaseModel):
     recipient_filters = Column(JSON)
     
     # Usuario que creó el lote
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -59,11 +61,12 @@ class NotificationLog(BaseModel):
     Registro detallado de cada notificación enviada
     """
     __tablename__ = "notification_logs"
-    notification_id = Column(Integer, ForeignKey("notifications.id"), index=True, nullable=False)
-    batch_id = Column(Integer, ForeignKey("notification_batches.id"), index=True, nullable=False)
+    __id_generator__ = staticmethod(uuid7)  # Ids ordenados por tiempo: inserciones al final del índice
+    notification_id = Column(UUID(as_uuid=True), ForeignKey("notifications.id"), index=True, nullable=False)
+    batch_id = Column(UUID(as_uuid=True), ForeignKey("notification_batches.id"), index=True, nullable=False)
     
     # Detalles del envío
-    recipient_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    recipient_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     channel_used = Column(String(50), nullable=False)
     
     # Resultado del envío
@@ -84,9 +87,12 @@ class NotificationLog(BaseModel):
     retry_count = Column(Integer, default=0)
     next_retry_at = Column(DateTime(timezone=True))
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    # Timestamps (created_at es la clave de partición mensual)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, primary_key=True)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Particionada por mes
+    __table_args__ = (partitioned_table_args("notification_logs"),)
     
     # Relaciones    notification = relationship("Notification", back_populates="notification_batches")
     batch = relationship("NotificationBatch", back_populates="logs")
@@ -105,8 +111,8 @@ class NotificationSchedule(BaseModel):
     description = Column(Text)
     
     # Configuración de la notificación
-    template_id = Column(Integer, ForeignKey("notification_templates.id"), nullable=False, index=True)
-    channel_id = Column(Integer, ForeignKey("notification_channels.id"), nullable=False, index=True)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("notification_templates.id"), nullable=False, index=True)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     
     # Programación
     schedule_type = Column(String(50), nullable=False)  # 'once', 'recurring', 'event_based'
@@ -132,7 +138,7 @@ class NotificationSchedule(BaseModel):
     next_execution_at = Column(DateTime(timezone=True))
     
     # Usuario que creó la programación
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -176,7 +182,7 @@ class ScheduledReport(BaseModel):
     next_execution_at = Column(DateTime(timezone=True))
     
     # Usuario que creó la programación
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -3,7 +3,7 @@ Modelo para comentarios del sistema.
 """
 
 from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -34,8 +34,8 @@ class Comment(BaseModel):
     __tablename__ = "comments"
     commentable_type = Column(SQLEnum(CommentableType), nullable=False, index=True)
     commentable_id = Column(String(36), nullable=False, index=True)
-    parent_comment_id = Column(String(36), ForeignKey("comments.id"), nullable=True, index=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    parent_comment_id = Column(UUID(as_uuid=True), ForeignKey("comments.id"), nullable=True, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     comment_type = Column(SQLEnum(CommentType), default=CommentType.GENERAL, nullable=False)
     is_internal = Column(Boolean, default=False, nullable=False)
@@ -3,6 +3,7 @@ Comment System Extended Models - Reacciones, plantillas y estado de lectura
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -14,8 +15,8 @@ class CommentReaction(BaseModel):
     Sistema de reacciones tipo "like", "dislike", emojis, etc.
     """
     __tablename__ = "comment_reactions"
-    comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    comment_id = Column(UUID(as_uuid=True), ForeignKey("comments.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Tipo de reacción
     reaction_type = Column(String(50), nullable=False)  # 'like', 'dislike', 'heart', 'thumbs_up', etc.
@@ -55,7 +56,7 @@ class CommentTemplate(BaseModel):
     department = Column(String(100))
     
     # Control de acceso
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     is_public = Column(Boolean, default=False)  # Si otros usuarios pueden usarla
     is_active = Column(Boolean, default=True)
     
@@ -78,8 +79,8 @@ class CommentReadStatus(BaseModel):
     Tracking de qué comentarios ha leído cada usuario
     """
     __tablename__ = "comment_read_status"
-    comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    comment_id = Column(UUID(as_uuid=True), ForeignKey("comments.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Estado de lectura
     is_read = Column(Boolean, default=False)
@@ -2,8 +2,8 @@
 Modelo para notificaciones del sistema.
 """
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, ForeignKey, Enum as SQLEnum, JSON, Time
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, ForeignKey, Enum as SQLEnum, JSON, Time, Index
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -31,9 +31,9 @@ class Notification(BaseModel):
     Modelo para notificaciones del sistema.
     """
     __tablename__ = "notifications"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    notification_type_id = Column(String(36), ForeignKey("notification_types.id"), nullable=False, index=True)
-    channel_id = Column(String(36), ForeignKey("notification_channels.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    notification_type_id = Column(UUID(as_uuid=True), ForeignKey("notification_types.id"), nullable=False, index=True)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
     data = Column(JSON, nullable=True)
@@ -49,6 +49,11 @@ class Notification(BaseModel):
     # Relaciones    user = relationship("User", back_populates="notifications")
     notification_type = relationship("NotificationType", back_populates="notifications")
     channel = relationship("NotificationChannel", back_populates="notifications")
+
+    # Índice para paginación keyset (created_at, id)
+    __table_args__ = (
+        Index("ix_notifications_created_at_id", "created_at", "id"),
+    )
     
     def __repr__(self):
         return f"<Notification(id={self.id}, user_id='{self.user_id}', title='{self.title[:50]}')>"
@@ -59,9 +64,9 @@ class UserNotificationPreference(BaseModel):
     Modelo para preferencias de notificación por usuario.
     """
     __tablename__ = "user_notification_preferences"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    notification_type_id = Column(String(36), ForeignKey("notification_types.id"), nullable=False, index=True)
-    channel_id = Column(String(36), ForeignKey("notification_channels.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    notification_type_id = Column(UUID(as_uuid=True), ForeignKey("notification_types.id"), nullable=False, index=True)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     is_enabled = Column(Boolean, default=True, nullable=False)
     frequency = Column(SQLEnum(NotificationFrequency), default=NotificationFrequency.INSTANT, nullable=False)
     quiet_hours_start = Column(Time, nullable=True)
@@ -3,7 +3,7 @@ Modelos SEEDER para notificaciones.
 """
 
 from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -58,8 +58,8 @@ class NotificationTemplate(BaseModel):
     Modelo para plantillas de notificación.
     """
     __tablename__ = "notification_templates"
-    notification_type_id = Column(String(36), ForeignKey("notification_types.id"), nullable=False, index=True)
-    channel_id = Column(String(36), ForeignKey("notification_channels.id"), nullable=False, index=True)
+    notification_type_id = Column(UUID(as_uuid=True), ForeignKey("notification_types.id"), nullable=False, index=True)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     subject_template = Column(String(500), nullable=True)
     body_template = Column(Text, nullable=False)
     variables = Column(JSON, nullable=True)
@@ -81,8 +81,8 @@ class NotificationTypeChannel(BaseModel):
     Tabla de relación entre tipos de notificación y canales.
     """
     __tablename__ = "notification_type_channels"
-    notification_type_id = Column(String(36), ForeignKey("notification_types.id"), nullable=False, index=True)
-    channel_id = Column(String(36), ForeignKey("notification_channels.id"), nullable=False, index=True)
+    notification_type_id = Column(UUID(as_uuid=True), ForeignKey("notification_types.id"), nullable=False, index=True)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("notification_channels.id"), nullable=False, index=True)
     is_default = Column(Boolean, default=False, nullable=False)
     
     def __repr__(self):
@@ -4,7 +4,7 @@ Especialización de InventoryItem para equipos
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Numeric
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -37,7 +37,7 @@ class Equipment(BaseModel):
     # Relación con el item de inventario base
     inventory_type = relationship("InventoryType", back_populates="equipment")
     task_assignments = relationship("ProjectUnit", back_populates="equipment")
-    inventory_item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=False, index=True)
+    inventory_item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False, index=True)
     inventory_item = relationship("InventoryItem", back_populates="equipment")
     
     # Fechas
@@ -2,8 +2,8 @@
 Modelo principal de item de inventario
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Numeric, ForeignKey
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Column, String, Text, DateTime, Enum, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -18,6 +18,8 @@ class InventoryItem(BaseModel):
     description = Column(Text)
     brand = Column(String(100))
     model = Column(String(100))
+    # Subtipo presente: equipment, supply, mixed o base (ver app.database.polymorphic)
+    subtype = Column(String(20), default="base")
     serial_number = Column(String(100), unique=True)
     barcode = Column(String(100), unique=True)
     
@@ -40,9 +42,9 @@ class InventoryItem(BaseModel):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relaciones
-    category_id = Column(Integer, ForeignKey("inventory_categories.id"), index=True, nullable=False)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("inventory_categories.id"), index=True, nullable=False)
     category = relationship("InventoryCategory", back_populates="items")
-    assigned_to_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    assigned_to_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     assigned_to = relationship("User", back_populates="assigned_inventory_items")
     
     # Relaciones con otros modelos
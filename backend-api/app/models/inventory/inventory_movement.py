@@ -3,6 +3,7 @@ Modelo de movimientos de inventario
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -22,13 +23,13 @@ class InventoryMovement(BaseModel):
     actual_return_date = Column(DateTime(timezone=True))
     
     # Relaciones
-    item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=False, index=True)
+    item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False, index=True)
     item = relationship("InventoryItem", back_populates="inventory_movements")
-    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)  # Usuario que realiza el movimiento
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)  # Usuario que realiza el movimiento
     user = relationship("User", foreign_keys=[user_id], back_populates="inventory_movements")
-    assigned_to_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)  # Usuario al que se asigna
+    assigned_to_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)  # Usuario al que se asigna
     assigned_to = relationship("User", foreign_keys=[assigned_to_id], back_populates="inventory_assignments")
-    processed_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)  # Quien procesa el movimiento
+    processed_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)  # Quien procesa el movimiento
     processed_by = relationship("User", foreign_keys=[processed_by_id], back_populates="inventory_processing")
 
     def __repr__(self):
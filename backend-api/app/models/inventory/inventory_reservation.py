@@ -2,7 +2,8 @@
 Modelo de reservas de inventario
 """
 
-from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -24,11 +25,11 @@ class InventoryReservation(BaseModel):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relaciones
-    item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=False, index=True)
+    item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False, index=True)
     item = relationship("InventoryItem", back_populates="reservations")
-    reserved_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    reserved_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     reserved_by = relationship("User", foreign_keys=[reserved_by_id], back_populates="inventory_reservations")
-    approved_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    approved_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     approved_by = relationship("User", foreign_keys=[approved_by_id], back_populates="inventory_reservation_approvals")
 
     def __repr__(self):
@@ -2,7 +2,8 @@
 Modelo de registros de mantenimiento
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -23,9 +24,9 @@ class MaintenanceRecord(BaseModel):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relaciones
-    item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=False, index=True)
+    item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False, index=True)
     item = relationship("InventoryItem", back_populates="maintenance_records")
-    performed_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    performed_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     performed_by = relationship("User", back_populates="maintenance_records")
 
     def __repr__(self):
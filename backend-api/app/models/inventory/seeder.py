@@ -3,6 +3,7 @@ Inventory Seeder Models - Catálogos de configuración para inventario
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -39,7 +40,7 @@ class SupplyDelivery(BaseModel):
     Registro de entregas específicas de suministros
     """
     __tablename__ = "supply_deliveries"
-    supply_id = Column(Integer, ForeignKey("supplies.id"), nullable=False, index=True)
+    supply_id = Column(UUID(as_uuid=True), ForeignKey("supplies.id"), nullable=False, index=True)
     delivery_date = Column(DateTime(timezone=True), nullable=False)
     quantity_delivered = Column(Integer, nullable=False)
     unit_cost = Column(Integer)  # En centavos
@@ -49,7 +50,7 @@ class SupplyDelivery(BaseModel):
     notes = Column(Text)
     
     # Usuario que registra la entrega
-    delivered_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    delivered_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     
     # Control de calidad
     quality_check_passed = Column(Boolean, default=True)
@@ -4,6 +4,7 @@ Especialización de InventoryItem para suministros consumibles
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Numeric
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -49,7 +50,7 @@ class Supply(BaseModel):
     
     # Relación con el item de inventario base
     inventory_type = relationship("InventoryType", back_populates="supplies")
-    inventory_item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=False, index=True)
+    inventory_item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False, index=True)
     inventory_item = relationship("InventoryItem", back_populates="supplies")
     deliveries = relationship("InventoryType", back_populates="supply")
     
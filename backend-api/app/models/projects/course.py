@@ -4,7 +4,8 @@ Especialización de Project para cursos educativos
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 
 from ..base import BaseModel
@@ -35,27 +36,27 @@ class Course(BaseModel):
     total_sessions = Column(Integer)  # Total de sesiones
     session_duration_hours = Column(Integer)  # Duración por sesión
     
-    # Contenido
-    syllabus = Column(Text)  # Programa del curso
-    learning_objectives = Column(Text)  # Objetivos de aprendizaje
-    prerequisites = Column(Text)  # Prerrequisitos
-    evaluation_methods = Column(Text)  # Métodos de evaluación
+    # Contenido (texto largo diferido por grupos; solo lo cargan las vistas de detalle)
+    syllabus = deferred(Column(Text), group="syllabus")  # Programa del curso
+    learning_objectives = deferred(Column(Text), group="syllabus")  # Objetivos de aprendizaje
+    prerequisites = deferred(Column(Text), group="syllabus")  # Prerrequisitos
+    evaluation_methods = deferred(Column(Text), group="syllabus")  # Métodos de evaluación
     
     # Recursos
-    required_materials = Column(Text)  # Materiales requeridos
-    recommended_readings = Column(Text)  # Lecturas recomendadas
+    required_materials = deferred(Column(Text), group="materials")  # Materiales requeridos
+    recommended_readings = deferred(Column(Text), group="materials")  # Lecturas recomendadas
     
     # Estado del curso
     is_certified = Column(Boolean, default=False)  # Si otorga certificación
     certification_entity = Column(String(200))  # Entidad que certifica
     
     # Relación con el proyecto base
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
     project = relationship("Project", back_populates="courses")
     
     # Relaciones adicionales
     classes = relationship("Career", back_populates="course", remote_side="Career.id")
-    instructor_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    instructor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     instructor = relationship("User", foreign_keys=[instructor_id], back_populates="instructed_courses")
     
     # Fechas
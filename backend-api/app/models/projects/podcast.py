@@ -4,8 +4,8 @@ Especialización de Project para producción de podcasts
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
-from sqlalchemy.dialects.postgresql import JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 
 from ..base import BaseModel
@@ -26,17 +26,17 @@ class Podcast(BaseModel):
     target_duration_minutes = Column(Integer)  # Duración objetivo
     actual_duration_minutes = Column(Integer)  # Duración real
     
-    # Contenido
+    # Contenido (texto largo diferido por grupos; solo lo cargan las vistas de detalle)
     topic = Column(String(200))  # Tema principal
-    guest_names = Column(Text)  # Nombres de invitados
-    guest_contacts = Column(Text)  # Contactos de invitados
-    episode_summary = Column(Text)  # Resumen del episodio
-    show_notes = Column(Text)  # Notas del programa
+    guest_names = deferred(Column(Text), group="production")  # Nombres de invitados
+    guest_contacts = deferred(Column(Text), group="production")  # Contactos de invitados
+    episode_summary = deferred(Column(Text), group="notes")  # Resumen del episodio
+    show_notes = deferred(Column(Text), group="notes")  # Notas del programa
     
     # Producción
     recording_date = Column(DateTime(timezone=True))
     recording_location = Column(String(200))
-    equipment_used = Column(Text)  # Equipos utilizados
+    equipment_used = deferred(Column(Text), group="production")  # Equipos utilizados
     
     # Estado de producción
     script_completed = Column(Boolean, default=False)
@@ -48,7 +48,7 @@ class Podcast(BaseModel):
     # Publicación
     publish_date = Column(DateTime(timezone=True))
     platform_urls = Column(JSON)  # JSON con URLs de plataformas
-    social_media_posts = Column(Text)  # Posts para redes sociales
+    social_media_posts = deferred(Column(Text), group="production")  # Posts para redes sociales
     
     # Métricas
     download_count = Column(Integer, default=0)
@@ -61,14 +61,14 @@ class Podcast(BaseModel):
     thumbnail_image_path = Column(String(500))  # Imagen del episodio
     
     # Relación con el proyecto base
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
     project = relationship("Project", back_populates="podcasts")
     
     # Relaciones adicionales
     episodes = relationship("CalendarView", back_populates="podcast")
-    host_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    host_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     host = relationship("User", foreign_keys=[host_id], back_populates="hosted_podcasts")
-    producer_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    producer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     producer = relationship("User", foreign_keys=[producer_id], back_populates="produced_podcasts")
     
     # Fechas
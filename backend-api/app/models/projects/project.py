@@ -2,7 +2,8 @@
 Modelo principal de proyecto
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Numeric, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Enum, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -17,6 +18,8 @@ class Project(BaseModel):
     code = Column(String(20), unique=True, nullable=False)  # Código único del proyecto
     description = Column(Text)
     objectives = Column(Text)
+    # Subtipo presente: course, podcast, mixed o base (ver app.database.polymorphic)
+    subtype = Column(String(20), default="base")
     
     # Estado y prioridad
     status = Column(Enum(ProjectStatus), default=ProjectStatus.DRAFT)
@@ -33,9 +36,9 @@ class Project(BaseModel):
     spent_budget = Column(Numeric(12, 2), default=0)
     
     # Relaciones
-    project_type_id = Column(Integer, ForeignKey("project_types.id"), nullable=True, index=True)
+    project_type_id = Column(UUID(as_uuid=True), ForeignKey("project_types.id"), nullable=True, index=True)
     project_type = relationship("ProjectType", back_populates="projects")
-    manager_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     manager = relationship("User", foreign_keys=[manager_id], back_populates="managed_projects")
     
     # Relaciones con otros modelos
@@ -3,6 +3,7 @@ Modelo de documentos de proyecto
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -23,9 +24,9 @@ class ProjectDocument(BaseModel):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relaciones
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
     project = relationship("Project", back_populates="project_documents")
-    uploaded_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    uploaded_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     uploaded_by = relationship("User", back_populates="uploaded_documents")
 
     def __repr__(self):
@@ -3,6 +3,7 @@ Modelo de recursos de proyecto
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -19,11 +20,11 @@ class ProjectResource(BaseModel):
     notes = Column(Text)
     
     # Relaciones
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
     project = relationship("Project", back_populates="project_resources")
     
     # Esto apuntará al item de inventario específico
-    inventory_item_id = Column(Integer, ForeignKey("inventory_items.id"), index=True, nullable=False)
+    inventory_item_id = Column(UUID(as_uuid=True), ForeignKey("inventory_items.id"), index=True, nullable=False)
     inventory_item = relationship("InventoryItem", back_populates="project_resources")
 
     def __repr__(self):
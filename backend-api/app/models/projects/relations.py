@@ -3,6 +3,7 @@ Project Extended Models - Relaciones proyecto-unidades y equipos-tareas
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -14,8 +15,8 @@ class ProjectUnit(BaseModel):
     Tabla intermedia para asociar proyectos con unidades universitarias
     """
     __tablename__ = "project_units"
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
-    unit_id = Column(Integer, ForeignKey("units.id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
+    unit_id = Column(UUID(as_uuid=True), ForeignKey("units.id"), nullable=False, index=True)
     
     # Tipo de relación
     relationship_type = Column(String(50), default='participant')  # 'lead', 'participant', 'collaborator'
@@ -57,8 +58,8 @@ class TaskEquipment(BaseModel):
     Equipos específicos asignados a tareas
     """
     __tablename__ = "task_equipments"
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
-    equipment_id = Column(Integer, ForeignKey("equipments.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
+    equipment_id = Column(UUID(as_uuid=True), ForeignKey("equipments.id"), nullable=False, index=True)
     
     # Detalles de la asignación
     quantity_required = Column(Integer, default=1)
@@ -74,7 +75,7 @@ class TaskEquipment(BaseModel):
     condition_on_return = Column(String(50))
     
     # Responsable de la asignación
-    assigned_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    assigned_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     
     # Notas y observaciones
     assignment_notes = Column(Text)
@@ -2,12 +2,14 @@
 Analytics Models - Eventos y métricas de analíticas del sistema
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from ..base import BaseModel
+from app.database.partitioning import partitioned_table_args
+
+from ..base import BaseModel, uuid7
 
 class AnalyticsEvent(BaseModel):
     """
@@ -15,11 +17,12 @@ class AnalyticsEvent(BaseModel):
     Registro de eventos para análisis de uso del sistema
     """
     __tablename__ = "analytics_events"
+    __id_generator__ = staticmethod(uuid7)  # Ids ordenados por tiempo: inserciones al final del índice
     event_type = Column(String(100), nullable=False, index=True)
     event_category = Column(String(50), nullable=False, index=True)  # 'user_action', 'system', 'error', etc.
     
     # Usuario asociado (opcional para eventos del sistema)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     session_id = Column(String(255), index=True)
     
     # Detalles del evento
@@ -33,10 +36,16 @@ class AnalyticsEvent(BaseModel):
     duration_ms = Column(Integer)  # Duración en milisegundos
     
     # Timestamps
-    event_timestamp = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    event_timestamp = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, primary_key=True, index=True)  # Clave de partición mensual
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relaciones    user = relationship("User", back_populates="analytics_events")
+
+    # Índice para paginación keyset (created_at, id); particionada por mes
+    __table_args__ = (
+        Index("ix_analytics_events_created_at_id", "created_at", "id"),
+        partitioned_table_args("analytics_events"),
+    )
     
     def __repr__(self):
         return f"<AnalyticsEvent(type='{self.event_type}', category='{self.event_category}')>"
@@ -52,7 +61,7 @@ class SearchAnalytics(BaseModel):
     results_count = Column(Integer, default=0)
     
     # Usuario y sesión
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     session_id = Column(String(255), index=True)
     
     # Métricas de rendimiento
@@ -67,7 +76,10 @@ class SearchAnalytics(BaseModel):
     page_context = Column(String(100))  # Desde dónde se hizo la búsqueda
     
     # Timestamps
-    searched_at = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    searched_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, primary_key=True, index=True)  # Clave de partición mensual
+
+    # Particionada por mes
+    __table_args__ = (partitioned_table_args("search_analytics"),)
     
     # Relaciones    user = relationship("User", back_populates="analytics_events")
     
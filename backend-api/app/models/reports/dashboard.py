@@ -3,7 +3,7 @@ Dashboard Models - Dashboards personalizados y widgets
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class CustomDashboard(BaseModel):
     Configuraciones de dashboard personalizadas por usuario
     """
     __tablename__ = "custom_dashboards"
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Información del dashboard
     name = Column(String(200), nullable=False)
@@ -51,7 +51,7 @@ class DashboardWidget(BaseModel):
     Componentes individuales que conforman un dashboard
     """
     __tablename__ = "dashboard_widgets"
-    dashboard_id = Column(Integer, ForeignKey("custom_dashboards.id"), nullable=False, index=True)
+    dashboard_id = Column(UUID(as_uuid=True), ForeignKey("custom_dashboards.id"), nullable=False, index=True)
     
     # Información del widget
     widget_type = Column(String(100), nullable=False)  # 'chart', 'table', 'kpi', 'calendar', etc.
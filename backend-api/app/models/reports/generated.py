@@ -3,7 +3,7 @@ Modelo para reportes generados.
 """
 
 from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -31,9 +31,9 @@ class GeneratedReport(BaseModel):
     Modelo para reportes generados.
     """
     __tablename__ = "generated_reports"
-    template_id = Column(String(36), ForeignKey("report_templates.id"), nullable=False, index=True)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("report_templates.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    generated_by_user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    generated_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     generation_type = Column(SQLEnum(GenerationType), nullable=False)
     parameters = Column(JSON, nullable=True)
     date_range = Column(JSON, nullable=True)
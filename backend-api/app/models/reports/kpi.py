@@ -3,7 +3,7 @@ Modelo para KPIs (Indicadores Clave de Rendimiento).
 """
 
 from sqlalchemy import Column, String, Text, Boolean, Numeric, ForeignKey, Enum as SQLEnum, JSON, Date, DateTime
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -57,7 +57,7 @@ class KPIValue(BaseModel):
     Modelo para valores de KPIs.
     """
     __tablename__ = "kpi_values"
-    kpi_definition_id = Column(String(36), ForeignKey("kpi_definitions.id"), nullable=False, index=True)
+    kpi_definition_id = Column(UUID(as_uuid=True), ForeignKey("kpi_definitions.id"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
     value = Column(Numeric(10, 2), nullable=False)
     target_value = Column(Numeric(10, 2), nullable=True)
@@ -45,7 +45,7 @@ class ReportTemplate(BaseModel):
     schedule_options = Column(JSON, nullable=True)
     access_roles = Column(JSON, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_by_user_id = Column(UUID, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     created_by_user = relationship("User", back_populates="created_report_templates")
     
     # Relaciones
@@ -4,7 +4,7 @@ Modelo de plantillas de proyecto
 
 from sqlalchemy import Column, String, Text, Integer, ForeignKey
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from ..base import BaseModel
 
@@ -19,7 +19,7 @@ class ProjectTemplate(BaseModel):
     # id, created_at, updated_at ya están en BaseModel
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    service_type_id = Column(Integer, ForeignKey("service_types.id"), nullable=False, index=True)
+    service_type_id = Column(UUID(as_uuid=True), ForeignKey("service_types.id"), nullable=False, index=True)
     
     # Template data (JSON structure with default values)
     template_data = Column(JSONB)  # JSON string with default values for project fields
@@ -2,8 +2,8 @@
 Modelo principal de solicitud
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Date, Boolean, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Date, Boolean
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
 from ..base import BaseModel
@@ -16,14 +16,14 @@ class Request(BaseModel):
     """
     __tablename__ = "requests"    # Basic Info
     title = Column(String(255), nullable=False)
-    description = Column(Text, nullable=False)
+    description = deferred(Column(Text, nullable=False), group="details")  # Long text, loaded with the "details" group
     
     # Requestor Info
-    client_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    unit_id = Column(Integer, ForeignKey("units.id"), nullable=True, index=True)
+    client_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    unit_id = Column(UUID(as_uuid=True), ForeignKey("units.id"), nullable=True, index=True)
     
     # Service Details
-    service_type_id = Column(Integer, ForeignKey("service_types.id"), nullable=False, index=True)
+    service_type_id = Column(UUID(as_uuid=True), ForeignKey("service_types.id"), nullable=False, index=True)
     priority = Column(String(50), default="medium")  # low, medium, high, urgent
     requested_date = Column(Date)
     
@@ -31,19 +31,19 @@ class Request(BaseModel):
     status = Column(String(50), default="pending")  # pending, in_review, approved, rejected, converted
     
     # Evaluation
-    evaluation_notes = Column(Text)
-    evaluated_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    evaluation_notes = deferred(Column(Text), group="details")
+    evaluated_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     evaluated_at = Column(DateTime(timezone=True))
     
     # Conversion
-    converted_project_id = Column(Integer, ForeignKey("projects.id"), nullable=True, index=True)
+    converted_project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True, index=True)
     
     # Template (if request is based on a template)
-    template_id = Column(Integer, ForeignKey("project_templates.id"), nullable=True, index=True)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("project_templates.id"), nullable=True, index=True)
     
     # Additional Info
     budget_estimate = Column(String(100))
-    special_requirements = Column(Text)
+    special_requirements = deferred(Column(Text), group="details")
     target_audience = Column(String(255))
     
     # Fechas
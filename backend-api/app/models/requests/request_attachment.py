@@ -3,6 +3,7 @@ Modelo de archivos adjuntos de solicitud
 """
 
 from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -13,8 +14,8 @@ class RequestAttachment(BaseModel):
     File attachments for requests
     """
     __tablename__ = "request_attachments"
-    request_id = Column(Integer, ForeignKey("requests.id"), nullable=False, index=True)
-    uploaded_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    request_id = Column(UUID(as_uuid=True), ForeignKey("requests.id"), nullable=False, index=True)
+    uploaded_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # File info
     filename = Column(String(255), nullable=False)
@@ -2,7 +2,8 @@
 Modelo de comentarios de solicitud
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -13,13 +14,13 @@ class RequestComment(BaseModel):
     Comments on requests during evaluation
     """
     __tablename__ = "request_comments"
-    request_id = Column(Integer, ForeignKey("requests.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    request_id = Column(UUID(as_uuid=True), ForeignKey("requests.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     comment = Column(Text, nullable=False)
     is_internal = Column(Boolean, default=False)  # Internal admin comment vs client visible
     
     # Threading
-    parent_comment_id = Column(Integer, ForeignKey("request_comments.id"), index=True, nullable=True)
+    parent_comment_id = Column(UUID(as_uuid=True), ForeignKey("request_comments.id"), index=True, nullable=True)
     
     # Fechas
     created_at = Column(DateTime(timezone=True), nullable=False)
@@ -3,11 +3,13 @@ Search Extended Models - Configuración, historial y sugerencias de búsqueda
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from ..base import BaseModel
+from app.database.partitioning import partitioned_table_args
+
+from ..base import BaseModel, uuid7
 
 class GlobalSearchConfig(BaseModel):
     """
@@ -49,7 +51,8 @@ class SearchHistory(BaseModel):
     Registro del historial de búsquedas por usuario
     """
     __tablename__ = "search_histories"
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    __id_generator__ = staticmethod(uuid7)  # Ids ordenados por tiempo: inserciones al final del índice
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Términos de búsqueda
     search_query = Column(String(500), nullable=False)
@@ -65,7 +68,10 @@ class SearchHistory(BaseModel):
     result_clicked_id = Column(String(100))
     
     # Timestamps
-    searched_at = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    searched_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, primary_key=True, index=True)  # Clave de partición mensual
+
+    # Particionada por mes
+    __table_args__ = (partitioned_table_args("search_histories"),)
     
     # Relaciones    user = relationship("User", back_populates="global_search_configs")
     
@@ -116,7 +122,7 @@ class QuickFilter(BaseModel):
     applies_to = Column(String(100), nullable=False)  # 'projects', 'tasks', 'inventory', etc.
     
     # Control de acceso
-    created_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     is_public = Column(Boolean, default=False)
     is_system = Column(Boolean, default=False)  # Filtros del sistema vs. usuarios
     
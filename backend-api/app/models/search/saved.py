@@ -3,7 +3,7 @@ Modelo para búsquedas guardadas.
 """
 
 from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -21,7 +21,7 @@ class SavedSearch(BaseModel):
     Modelo para búsquedas guardadas por los usuarios.
     """
     __tablename__ = "saved_searches"
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     search_query = Column(String(500), nullable=False)
     filters = Column(JSON, nullable=True)
@@ -2,7 +2,8 @@
 Modelo para aprobaciones de tareas.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -13,10 +14,10 @@ class TaskApproval(BaseModel):
     Modelo para aprobaciones de tareas en diferentes niveles.
     """
     __tablename__ = "task_approvals"
-    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     level = Column(Integer, nullable=False)
-    approval_status_id = Column(String(36), ForeignKey("status_options.id"), nullable=False, index=True)
-    reviewer_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    approval_status_id = Column(UUID(as_uuid=True), ForeignKey("status_options.id"), nullable=False, index=True)
+    reviewer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     feedback = Column(Text, nullable=True)
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
     
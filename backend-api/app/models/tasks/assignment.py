@@ -3,6 +3,7 @@ Modelo de asignaciones de tareas
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -29,11 +30,11 @@ class TaskAssignment(BaseModel):
     completed_at = Column(DateTime(timezone=True))
     
     # Relaciones
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     task = relationship("Task", back_populates="task_assignments")
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     user = relationship("User", back_populates="task_assignments")
-    assigned_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    assigned_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     assigned_by = relationship("User", foreign_keys=[assigned_by_id], back_populates="task_assignment_assignments")
 
     def __repr__(self):
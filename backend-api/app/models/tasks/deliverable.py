@@ -3,6 +3,7 @@ Modelo para entregables de tareas.
 """
 
 from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -13,10 +14,10 @@ class Deliverable(BaseModel):
     Modelo para entregables asociados a tareas.
     """
     __tablename__ = "deliverables"
-    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    deliverable_type_id = Column(String(36), ForeignKey("deliverable_types.id"), nullable=False, index=True)
-    deliverable_status_id = Column(String(36), ForeignKey("status_options.id"), nullable=False, index=True)
+    deliverable_type_id = Column(UUID(as_uuid=True), ForeignKey("deliverable_types.id"), nullable=False, index=True)
+    deliverable_status_id = Column(UUID(as_uuid=True), ForeignKey("status_options.id"), nullable=False, index=True)
     url = Column(String(500), nullable=True)
     file_path = Column(String(500), nullable=True)
     delivered_at = Column(DateTime(timezone=True), nullable=True)
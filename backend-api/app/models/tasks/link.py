@@ -3,6 +3,7 @@ Modelo para enlaces de tareas.
 """
 
 from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -13,9 +14,9 @@ class TaskLink(BaseModel):
     Modelo para enlaces asociados a tareas.
     """
     __tablename__ = "task_links"
-    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False, index=True)
-    link_platform_id = Column(String(36), ForeignKey("link_platforms.id"), nullable=False, index=True)
-    link_status_id = Column(String(36), ForeignKey("status_options.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
+    link_platform_id = Column(UUID(as_uuid=True), ForeignKey("link_platforms.id"), nullable=False, index=True)
+    link_status_id = Column(UUID(as_uuid=True), ForeignKey("status_options.id"), nullable=False, index=True)
     url = Column(Text, nullable=False)
     title = Column(String(255), nullable=True)
     
@@ -2,7 +2,8 @@
 Modelo principal de tarea
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -32,13 +33,13 @@ class Task(BaseModel):
     progress_percentage = Column(Integer, default=0)  # Porcentaje de avance
     
     # Relaciones
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True, index=True)
     project = relationship("Project", back_populates="tasks")
-    assigned_to_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    assigned_to_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     assigned_to = relationship("User", foreign_keys=[assigned_to_id], back_populates="assigned_tasks")
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     created_by = relationship("User", foreign_keys=[created_by_id], back_populates="created_tasks")
-    parent_task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True, index=True)  # Para subtareas
+    parent_task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=True, index=True)  # Para subtareas
     parent_task = relationship("Task", remote_side=[id], back_populates="subtasks")
     
     # Relaciones con otros modelos
@@ -54,5 +55,10 @@ class Task(BaseModel):
     equipment_assignments = relationship("ProjectUnit", back_populates="task")
     links = relationship("TaskLink", back_populates="task")
 
+    # Índice para paginación keyset (created_at, id)
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -3,6 +3,7 @@ Modelo de archivos adjuntos de tarea
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,9 +22,9 @@ class TaskAttachment(BaseModel):
     uploaded_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relaciones
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     task = relationship("Task", back_populates="task_attachments")
-    uploaded_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
+    uploaded_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=True)
     uploaded_by = relationship("User", back_populates="uploaded_attachments")
 
     def __repr__(self):
@@ -2,7 +2,8 @@
 Modelo de dependencias entre tareas
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -16,9 +17,9 @@ class TaskDependency(BaseModel):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relaciones
-    predecessor_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
+    predecessor_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     predecessor = relationship("Task", foreign_keys=[predecessor_id], back_populates="predecessor_dependencies")
-    successor_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
+    successor_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     successor = relationship("Task", foreign_keys=[successor_id], back_populates="successor_dependencies")
 
     def __repr__(self):
@@ -3,6 +3,7 @@ Modelo de registro de tiempo de tarea
 """
 
 from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -20,9 +21,9 @@ class TaskTimeLog(BaseModel):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relaciones
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False, index=True)
     task = relationship("Task", back_populates="task_time_logs")
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     user = relationship("User", back_populates="task_time_logs")
 
     def __repr__(self):
@@ -3,7 +3,8 @@ University Extended Models - Carreras y clases específicas
 """
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 
 from ..base import BaseModel
@@ -14,7 +15,7 @@ class Career(BaseModel):
     Programas académicos específicos de la universidad
     """
     __tablename__ = "careers"
-    faculty_id = Column(Integer, ForeignKey("faculties.id"), nullable=False, index=True)
+    faculty_id = Column(UUID(as_uuid=True), ForeignKey("faculties.id"), nullable=False, index=True)
     
     # Información básica
     name = Column(String(300), nullable=False)
@@ -30,10 +31,10 @@ class Career(BaseModel):
     modality = Column(String(50))  # 'presencial', 'virtual', 'mixta'
     language = Column(String(50), default='español')
     
-    # Información adicional
-    admission_requirements = Column(Text)
-    career_profile = Column(Text)
-    occupational_field = Column(Text)
+    # Información adicional (texto largo diferido en el grupo "profile")
+    admission_requirements = deferred(Column(Text), group="profile")
+    career_profile = deferred(Column(Text), group="profile")
+    occupational_field = deferred(Column(Text), group="profile")
     
     # Control
     is_active = Column(Boolean, default=True)
@@ -59,8 +60,8 @@ class Class(BaseModel):
     Clases individuales dentro de cursos y carreras
     """
     __tablename__ = "classes"
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, index=True)
-    career_id = Column(Integer, ForeignKey("careers.id"), nullable=True, index=True)  # Puede ser específica de carrera
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False, index=True)
+    career_id = Column(UUID(as_uuid=True), ForeignKey("careers.id"), nullable=True, index=True)  # Puede ser específica de carrera
     
     # Información de la clase
     name = Column(String(300), nullable=False)
@@ -82,7 +83,7 @@ class Class(BaseModel):
     preparation_notes = Column(Text)
     
     # Instructor
-    instructor_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    instructor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True, nullable=False)
     guest_instructor = Column(String(200))  # Para instructores externos
     
     # Estado
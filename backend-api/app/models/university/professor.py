@@ -3,6 +3,7 @@ Modelo para profesores de la universidad.
 """
 
 from sqlalchemy import Column, String, Boolean, Date, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..base import BaseModel
@@ -29,8 +30,8 @@ class ProfessorUnit(BaseModel):
     Modelo para la relación entre profesores y unidades.
     """
     __tablename__ = "professor_units"
-    professor_id = Column(String(36), ForeignKey("professors.id"), nullable=False, index=True)
-    unit_id = Column(String(36), ForeignKey("units.id"), nullable=False, index=True)
+    professor_id = Column(UUID(as_uuid=True), ForeignKey("professors.id"), nullable=False, index=True)
+    unit_id = Column(UUID(as_uuid=True), ForeignKey("units.id"), nullable=False, index=True)
     role_in_unit = Column(String(255), nullable=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
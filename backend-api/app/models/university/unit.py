@@ -3,6 +3,7 @@ Modelo de unidades universitarias
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -14,8 +15,8 @@ class Unit(BaseModel):
     Unidades universitarias (facultades, departamentos, centros, etc.)
     """
     __tablename__ = "units"
-    unit_type_id = Column(Integer, ForeignKey("unit_types.id"), nullable=False, index=True)
-    parent_unit_id = Column(Integer, ForeignKey("units.id"), nullable=True, index=True)
+    unit_type_id = Column(UUID(as_uuid=True), ForeignKey("unit_types.id"), nullable=False, index=True)
+    parent_unit_id = Column(UUID(as_uuid=True), ForeignKey("units.id"), nullable=True, index=True)
     
     # Información básica
     name = Column(String(255), nullable=False)
@@ -40,7 +40,7 @@ class IpBlock(BaseModel):
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
 
     def __repr__(self):
         return f"<IpBlock(id={self.id}, ip_address='{self.ip_address}', is_active={self.is_active})>"
\ No newline at end of file
@@ -3,7 +3,7 @@ Modelo principal de usuario
 """
 
 from sqlalchemy import Column, String, Boolean, Text, DateTime, ForeignKey, Integer
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,8 +21,8 @@ class User(BaseModel):
     full_name = Column(String(255))
     
     # User Classification
-    user_type_id = Column(Integer, ForeignKey("user_types.id"), nullable=False, index=True)
-    employee_role_id = Column(Integer, ForeignKey("employee_roles.id"), nullable=True, index=True)
+    user_type_id = Column(UUID(as_uuid=True), ForeignKey("user_types.id"), nullable=False, index=True)
+    employee_role_id = Column(UUID(as_uuid=True), ForeignKey("employee_roles.id"), nullable=True, index=True)
     
     # Status
     is_verified = Column(Boolean, default=False)
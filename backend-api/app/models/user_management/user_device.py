@@ -2,8 +2,8 @@
 Modelo de dispositivos de usuario
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Integer
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class UserDevice(BaseModel):
     User devices for tracking active logins and device management
     """
     __tablename__ = "user_devices"
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     device_name = Column(String(200))  # User-assigned name
     device_type = Column(String(50))  # mobile, desktop, tablet, etc.
     
@@ -24,6 +24,7 @@ class UserDevice(BaseModel):
     ip_address = Column(String(45))  # IPv6 compatible
     browser_info = Column(JSON)  # JSON string with browser details
     os_info = Column(JSON)  # JSON string with OS details
+    fingerprint = Column(String(64))  # SHA-256 of the normalized user agent (app.services.users.device_service)
     
     # Security
     is_trusted = Column(Boolean, default=False)
@@ -46,5 +47,10 @@ class UserDevice(BaseModel):
     
     # Relationships    user = relationship("User", back_populates="user_devices")
 
+    # One device per user and fingerprint: login matching is a single index probe
+    __table_args__ = (
+        Index("uq_user_devices_user_id_fingerprint", "user_id", "fingerprint", unique=True),
+    )
+
     def __repr__(self):
         return f"<UserDevice(id={self.id}, user_id={self.user_id}, device_type='{self.device_type}')>"
\ No newline at end of file
@@ -0,0 +1,254 @@
+"""
+Base repository
+Generic data access with keyset (seek) pagination on (created_at, id)
+and server-side cursor streaming for exports
+"""
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import starmap
+from typing import Any, Generic, Iterator, List, Optional, Type, TypeVar
+import base64
+import hashlib
+import hmac
+import json
+import uuid
+
+from app.core.config import settings
+from app.core.exceptions import InvalidCursor
+from app.database.connection import Base
+from app.database.loading_profiles import apply_profile
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+NEXT = "next"
+PREV = "prev"
+
+
+@dataclass
+class Page(Generic[ModelType]):
+    """One page of results plus opaque cursors for its neighbours"""
+    items: List[ModelType]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(settings.secret_key.encode(), payload.encode(), hashlib.sha256).digest()
+    return _b64encode(digest[:16])
+
+
+def cursor_scope(name: str, stmt: Optional[Select] = None) -> str:
+    """
+    Short digest of what a cursor pages over: the model (or read model)
+    name and the statement's WHERE clause with its bound values
+    """
+    parts = [name]
+    if stmt is not None and stmt.whereclause is not None:
+        compiled = stmt.whereclause.compile()
+        parts.append(compiled.string)
+        parts.append(repr(sorted(compiled.params.items())))
+    digest = hashlib.sha256("\x1f".join(parts).encode()).digest()
+    return _b64encode(digest[:12])
+
+
+def encode_cursor(created_at: datetime, id: Any, direction: str, scope: str = "") -> str:
+    """Opaque, signed cursor pointing just past (created_at, id) in `direction`"""
+    payload = _b64encode(json.dumps(
+        {"c": created_at.isoformat(), "i": str(id), "d": direction, "s": scope},
+        separators=(",", ":"),
+    ).encode())
+    return f"{payload}.{_sign(payload)}"
+
+
+def decode_cursor(cursor: str, scope: str = "") -> tuple[datetime, str, str]:
+    """
+    Verify and unpack a cursor into (created_at, id, direction)
+
+    `scope` must match the one the cursor was issued with, so a cursor from
+    one model or filter is not replayed against another.
+    """
+    try:
+        payload, signature = cursor.split(".", 1)
+    except ValueError:
+        raise InvalidCursor("Malformed cursor") from None
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursor("Cursor signature mismatch")
+    try:
+        data = json.loads(_b64decode(payload))
+        direction = data["d"]
+        if direction not in (NEXT, PREV):
+            raise ValueError(direction)
+        position = datetime.fromisoformat(data["c"]), data["i"], direction
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Undecodable cursor: {e}") from None
+    if data.get("s", "") != scope:
+        raise InvalidCursor("Cursor was issued for a different query")
+    return position
+
+
+class BaseRepository(Generic[ModelType]):
+    """
+    CRUD plus keyset pagination for one model
+
+    Pages are ordered newest first by (created_at, id). BaseModel.id is a
+    random UUID, so created_at carries the ordering and id only breaks ties.
+    Seeking with a row-value comparison costs the same at page 1 and page
+    5,000 provided the table has an index on (created_at, id).
+    """
+
+    model: Type[ModelType]
+
+    def __init__(self, db: Session, model: Optional[Type[ModelType]] = None):
+        self.db = db
+        if model is not None:
+            self.model = model
+
+    # ------------------------------------------------------------------
+    # CRUD
+    # ------------------------------------------------------------------
+
+    def query(self, profile: Optional[str] = None) -> Select:
+        stmt = select(self.model)
+        return apply_profile(stmt, profile) if profile else stmt
+
+    def get(self, id: Any, profile: Optional[str] = None) -> Optional[ModelType]:
+        # Partitioned tables have a composite (partition key, id) primary key
+        if profile is None and len(self.model.__mapper__.primary_key) == 1:
+            return self.db.get(self.model, id)
+        return self.db.scalars(self.query(profile).where(self.model.id == id)).first()
+
+    def add(self, obj: ModelType, flush: bool = True) -> ModelType:
+        self.db.add(obj)
+        if flush:
+            self.db.flush()
+        return obj
+
+    def create(self, **values: Any) -> ModelType:
+        return self.add(self.model(**values))
+
+    def update(self, obj: ModelType, **values: Any) -> ModelType:
+        for key, value in values.items():
+            setattr(obj, key, value)
+        self.db.flush()
+        return obj
+
+    def delete(self, obj: ModelType) -> None:
+        self.db.delete(obj)
+        self.db.flush()
+
+    # ------------------------------------------------------------------
+    # Keyset pagination
+    # ------------------------------------------------------------------
+
+    def paginate(
+        self,
+        stmt: Optional[Select] = None,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        profile: Optional[str] = None,
+        row_class: Optional[Type] = None,
+    ) -> Page[ModelType]:
+        """
+        Fetch one page after (or before) `cursor`
+
+        `stmt` may carry filters but no ORDER BY / LIMIT / OFFSET; those are
+        owned by the paginator. Without a cursor the newest page is returned.
+        With `row_class` (a read model that includes created_at and id) the
+        page is built from plain Core rows instead of ORM instances. Cursors
+        are bound to the model and the filters of `stmt`; passing one to a
+        different query raises InvalidCursor.
+        """
+        if row_class is not None:
+            if stmt is None:
+                stmt = row_class.select()
+            columns = row_class.table().c
+            created_at, id_column = columns.created_at, columns.id
+        else:
+            if stmt is None:
+                stmt = select(self.model)
+            if profile:
+                stmt = apply_profile(stmt, profile)
+            created_at, id_column = self.model.created_at, self.model.id
+        key = tuple_(created_at, id_column)
+        scope = cursor_scope((row_class or self.model).__name__, stmt)
+
+        direction = NEXT
+        if cursor is not None:
+            cursor_created_at, cursor_id, direction = decode_cursor(cursor, scope)
+            bound = tuple_(cursor_created_at, self._coerce_id(cursor_id))
+            stmt = stmt.where(key < bound if direction == NEXT else key > bound)
+
+        if direction == NEXT:
+            stmt = stmt.order_by(created_at.desc(), id_column.desc())
+        else:
+            stmt = stmt.order_by(created_at.asc(), id_column.asc())
+
+        if row_class is not None:
+            rows = list(starmap(row_class, self.db.execute(stmt.limit(limit + 1))))
+        else:
+            rows = list(self.db.scalars(stmt.limit(limit + 1)))
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == PREV:
+            rows.reverse()
+
+        if not rows:
+            return Page(items=[], next_cursor=None, prev_cursor=None)
+
+        first, last = rows[0], rows[-1]
+        # Moving backwards implies a newer-to-older page exists after this one
+        more_after = has_more if direction == NEXT else True
+        more_before = cursor is not None if direction == NEXT else has_more
+        return Page(
+            items=rows,
+            next_cursor=encode_cursor(last.created_at, last.id, NEXT, scope) if more_after else None,
+            prev_cursor=encode_cursor(first.created_at, first.id, PREV, scope) if more_before else None,
+        )
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream(
+        self,
+        stmt: Optional[Select] = None,
+        *,
+        chunk_size: int = 1000,
+    ) -> Iterator[RowMapping]:
+        """
+        Iterate rows through a server-side cursor, `chunk_size` at a time
+
+        Defaults to every column of the model's table as plain Core rows, so
+        nothing lands in the identity map and memory stays flat regardless of
+        row count. Pass a select() of columns to filter, order or project.
+        The session must stay open until the iterator is exhausted.
+        """
+        if stmt is None:
+            stmt = select(*self.model.__table__.columns)
+        result = self.db.execute(
+            stmt,
+            execution_options={"yield_per": chunk_size, "stream_results": True},
+        )
+        try:
+            yield from result.mappings()
+        finally:
+            result.close()
+
+    def _coerce_id(self, value: str) -> Any:
+        python_type = getattr(self.model.id.type, "python_type", str)
+        if python_type is uuid.UUID:
+            return uuid.UUID(value)
+        return python_type(value)
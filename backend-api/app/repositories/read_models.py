@@ -0,0 +1,153 @@
+"""
+Read models
+Slotted, change-tracking-free rows for large list and report endpoints.
+
+A read model declares the columns a view needs; rows come from a Core
+select() of exactly those columns and are built straight into a slotted
+dataclass (or validated in bulk into a Pydantic v2 schema). Nothing enters
+the identity map, no InstanceState is created and the mappers are never
+configured, so 10k rows cost a small fraction of 10k ORM instances.
+
+    TaskRow = read_model("TaskRow", "Task", ("id", "title", "status", "due_date"))
+    stmt = TaskRow.select().where(TaskRow.table().c.project_id == project_id)
+    rows = fetch_rows(db, TaskRow, stmt)
+"""
+
+from sqlalchemy import Select, Table, select
+from sqlalchemy.orm import Session
+from dataclasses import make_dataclass
+from functools import lru_cache
+from itertools import starmap
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Union
+import importlib
+
+from pydantic import BaseModel as Schema, TypeAdapter
+
+RowType = TypeVar("RowType")
+SchemaType = TypeVar("SchemaType", bound=Schema)
+
+
+def _resolve_table(source: Union[str, Table, Type]) -> Table:
+    # Model names resolve through the lazy registry in app.models
+    if isinstance(source, str):
+        source = getattr(importlib.import_module("app.models"), source)
+    if isinstance(source, Table):
+        return source
+    return source.__table__
+
+
+class ReadModel:
+    """Base of every generated read model"""
+    __slots__ = ()
+
+    # Set by read_model()
+    __source__: Union[str, Table, Type]
+    __columns__: tuple
+
+    @classmethod
+    def table(cls) -> Table:
+        """The underlying table, resolved on first use"""
+        table = cls.__dict__.get("_table")
+        if table is None:
+            table = _resolve_table(cls.__source__)
+            unknown = [column for column in cls.__columns__ if column not in table.c]
+            if unknown:
+                raise ValueError(f"{cls.__name__}: {table.name} has no column(s) {unknown}")
+            cls._table = table
+        return table
+
+    @classmethod
+    def select(cls) -> Select:
+        """select() of the declared columns, in declaration order"""
+        columns = cls.table().c
+        return select(*(columns[name] for name in cls.__columns__))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__columns__}
+
+
+def read_model(name: str, source: Union[str, Table, Type], columns: Sequence[str]) -> Type[ReadModel]:
+    """
+    Build a slotted row class for `columns` of a model (name or class) or table
+
+    Instances take the column values positionally, in `columns` order, so a
+    Core row unpacks straight into the generated __init__.
+    """
+    row_class = make_dataclass(name, [(column, Any) for column in columns], bases=(ReadModel,), slots=True)
+    row_class.__source__ = source
+    row_class.__columns__ = tuple(columns)
+    row_class.__module__ = __name__
+    return row_class
+
+
+def fetch_rows(db: Session, row_class: Type[RowType], stmt: Optional[Select] = None) -> List[RowType]:
+    """
+    Execute `stmt` (default: the read model's own select) and build rows
+
+    `stmt` must select the read model's columns in declaration order; start
+    from `RowClass.select()` and add filters, ordering and limits.
+    """
+    result = db.execute(row_class.select() if stmt is None else stmt)
+    return list(starmap(row_class, result))
+
+
+def iter_rows(
+    db: Session,
+    row_class: Type[RowType],
+    stmt: Optional[Select] = None,
+    *,
+    chunk_size: int = 1000,
+) -> Iterator[RowType]:
+    """Like fetch_rows, streamed through a server-side cursor `chunk_size` rows at a time"""
+    result = db.execute(
+        row_class.select() if stmt is None else stmt,
+        execution_options={"yield_per": chunk_size, "stream_results": True},
+    )
+    try:
+        for chunk in result.partitions():
+            yield from starmap(row_class, chunk)
+    finally:
+        result.close()
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[SchemaType]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def fetch_validated(db: Session, schema: Type[SchemaType], stmt: Select) -> List[SchemaType]:
+    """
+    Execute a Core select() and validate every row into a Pydantic v2 schema
+
+    The whole result goes through one list validator in a single call into
+    pydantic-core; select exactly the schema's fields (label columns to
+    match field names).
+    """
+    rows = [row._asdict() for row in db.execute(stmt)]
+    return _list_adapter(schema).validate_python(rows)
+
+
+# ----------------------------------------------------------------------
+# Read models for the large list and report views
+# ----------------------------------------------------------------------
+
+TaskRow = read_model("TaskRow", "Task", (
+    "id", "title", "task_type", "status", "priority",
+    "due_date", "start_date", "completed_date", "progress_percentage",
+    "project_id", "assigned_to_id", "parent_task_id", "created_at",
+))
+
+InventoryItemRow = read_model("InventoryItemRow", "InventoryItem", (
+    "id", "name", "brand", "model", "serial_number", "barcode", "status",
+    "location", "category_id", "assigned_to_id", "created_at",
+))
+
+AuditLogRow = read_model("AuditLogRow", "AuditLog", (
+    "id", "created_at", "user_id", "action", "resource", "resource_id",
+    "severity", "category", "ip_address",
+))
+
+CalendarEventRow = read_model("CalendarEventRow", "CalendarEvent", (
+    "id", "event_type_id", "title", "start_date", "end_date", "all_day",
+    "location", "status", "visibility", "created_by_user_id", "created_at",
+))
@@ -0,0 +1,11 @@
+"""
+Login schemas
+"""
+
+from pydantic import BaseModel
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int
@@ -0,0 +1,20 @@
+"""
+Registration schemas
+"""
+
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional
+import uuid
+
+
+class RegisterRequest(BaseModel):
+    email: EmailStr
+    username: str = Field(min_length=3, max_length=100)
+    password: str = Field(min_length=8, max_length=128)
+    full_name: Optional[str] = Field(default=None, max_length=255)
+
+
+class RegisteredUser(BaseModel):
+    id: uuid.UUID
+    email: str
+    username: str
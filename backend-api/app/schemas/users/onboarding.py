@@ -0,0 +1,20 @@
+"""
+Bulk onboarding schemas
+"""
+
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional
+
+
+class OnboardingUser(BaseModel):
+    """One record of a bulk import file (CSV column or JSON key per field)"""
+    email: EmailStr
+    username: str = Field(min_length=3, max_length=100)
+    password: Optional[str] = Field(default=None, min_length=8, max_length=128)
+    full_name: Optional[str] = Field(default=None, max_length=255)
+    user_type: Optional[str] = Field(default=None, max_length=50)
+    employee_role: Optional[str] = Field(default=None, max_length=50)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    language: Optional[str] = Field(default=None, max_length=10)
+    timezone: Optional[str] = Field(default=None, max_length=50)
+    is_verified: bool = False
@@ -0,0 +1,238 @@
+"""
+Password hashing service
+bcrypt off the event loop, with a concurrency cap and queue-time metrics.
+
+At BCRYPT_ROUNDS=12 one hash or verify is ~250 ms of CPU; done inline in an
+async handler it stalls every request on the worker. PasswordHasher runs
+them on a bounded executor instead:
+
+    thread    (default) bcrypt releases the GIL, so N threads hash in parallel
+              while the event loop keeps serving
+    process   separate interpreters, for when the GIL is not released or
+              CPU isolation from request handling is wanted
+
+At most PASSWORD_HASHER_WORKERS hashes run at once; at most
+PASSWORD_HASHER_MAX_PENDING wait behind them, beyond that callers get
+HasherBusy (a 503 for login) instead of an ever-growing queue.
+
+    hashed = await password_hasher.hash(password)
+    ok = await password_hasher.verify(password, user.hashed_password)
+    if ok and password_hasher.needs_rehash(user.hashed_password): ...
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import os
+import threading
+import time
+import uuid
+
+import bcrypt
+from jose import jwt
+
+from app.core.config import settings
+
+# Upper bounds (ms) of the queue-time histogram buckets; last bucket is +Inf
+QUEUE_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+# bcrypt only looks at the first 72 bytes; newer releases raise instead of truncating
+MAX_PASSWORD_BYTES = 72
+
+
+class HasherBusy(Exception):
+    """Too many hashes already queued; the caller should retry later"""
+
+
+def _encode(password: str) -> bytes:
+    return password.encode("utf-8")[:MAX_PASSWORD_BYTES]
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds)).decode("ascii")
+
+
+def _verify(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(_encode(password), hashed.encode("ascii"))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
+
+
+def _timed(func, args: tuple, submitted: float) -> Tuple[Any, float, float]:
+    # Runs on the executor (possibly another process): wall clock is comparable across processes
+    started = time.time()
+    result = func(*args)
+    return result, (started - submitted) * 1000, (time.time() - started) * 1000
+
+
+def hash_rounds(hashed: str) -> Optional[int]:
+    """Cost factor of a "$2b$12$..." hash, None if it is not bcrypt"""
+    parts = hashed.split("$")
+    if len(parts) < 4 or parts[1] not in ("2a", "2b", "2y"):
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
+
+
+class HasherStats:
+    """Thread-safe counters for one hasher"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.queue_buckets = [0] * (len(QUEUE_BUCKETS_MS) + 1)
+        self.queue_total_ms = 0.0
+        self.queue_max_ms = 0.0
+        self.run_total_ms = 0.0
+        self.run_max_ms = 0.0
+
+    def record(self, queue_ms: float, run_ms: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.queue_buckets[bisect_left(QUEUE_BUCKETS_MS, queue_ms)] += 1
+            self.queue_total_ms += queue_ms
+            self.queue_max_ms = max(self.queue_max_ms, queue_ms)
+            self.run_total_ms += run_ms
+            self.run_max_ms = max(self.run_max_ms, run_ms)
+
+    def record_rejected(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+
+class PasswordHasher:
+    """Bounded bcrypt executor; one per worker process, created lazily (fork-safe)"""
+
+    def __init__(self, mode: str, workers: int, max_pending: int, rounds: int):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown password hasher mode '{mode}' (thread, process)")
+        self.mode = mode
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self.stats = HasherStats()
+        self._executor: Optional[Executor] = None
+        self._pid: Optional[int] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        # A pool inherited through fork() has no live workers: build a new one
+        if self._executor is None or self._pid != os.getpid():
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            self._pid = os.getpid()
+        return self._executor
+
+    async def _submit(self, func, *args):
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                self.stats.record_rejected()
+                raise HasherBusy(f"{self._in_flight} password hashes in flight")
+            self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, queue_ms, run_ms = await loop.run_in_executor(self.executor, _timed, func, args, time.time())
+            self.stats.record(queue_ms, run_ms)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(_verify, password, hashed)
+
+    def hash_sync(self, password: str) -> str:
+        """Blocking hash, for scripts and other code outside the event loop"""
+        return _hash(password, self.rounds)
+
+    def verify_sync(self, password: str, hashed: str) -> bool:
+        return _verify(password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True when the hash was made with different rounds than BCRYPT_ROUNDS"""
+        return hash_rounds(hashed) != self.rounds
+
+    def snapshot(self) -> Dict[str, Any]:
+        stats = self.stats
+        with stats._lock:
+            labels = [f"le_{int(bound)}ms" for bound in QUEUE_BUCKETS_MS] + ["le_inf"]
+            completed = stats.completed
+            return {
+                "pid": os.getpid(),
+                "mode": self.mode,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "rounds": self.rounds,
+                "in_flight": self._in_flight,
+                "completed_total": completed,
+                "rejected_total": stats.rejected,
+                "queue_ms": {
+                    "avg": round(stats.queue_total_ms / completed, 3) if completed else 0.0,
+                    "max": round(stats.queue_max_ms, 3),
+                    "histogram": dict(zip(labels, stats.queue_buckets)),
+                },
+                "run_ms": {
+                    "avg": round(stats.run_total_ms / completed, 3) if completed else 0.0,
+                    "max": round(stats.run_max_ms, 3),
+                },
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+
+password_hasher = PasswordHasher(
+    mode=settings.password_hasher_mode,
+    workers=settings.password_hasher_workers or os.cpu_count() or 1,
+    max_pending=settings.password_hasher_max_pending,
+    rounds=settings.bcrypt_rounds,
+)
+
+
+@lru_cache(maxsize=1)
+def dummy_hash() -> str:
+    """Verified against when the login name is unknown, so both paths cost one bcrypt"""
+    return _hash("not a password", settings.bcrypt_rounds)
+
+
+def create_access_token(
+    user_id: uuid.UUID,
+    security_stamp: Optional[int],
+    device_id: Optional[uuid.UUID] = None,
+) -> Tuple[str, int]:
+    """
+    Signed access token and its lifetime in seconds
+
+    Carries jti and sv for app.core.principals and, when the login is tied
+    to a UserDevice, its id ("did") for device activity tracking.
+    """
+    lifetime = timedelta(minutes=settings.jwt_expire_minutes)
+    now = datetime.now(timezone.utc)
+    payload = {
+        "sub": str(user_id),
+        "jti": uuid.uuid4().hex,
+        "iat": now,
+        "exp": now + lifetime,
+    }
+    if security_stamp is not None:
+        payload["sv"] = security_stamp
+    if device_id is not None:
+        payload["did"] = str(device_id)
+    return jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm), int(lifetime.total_seconds())
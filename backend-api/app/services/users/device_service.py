@@ -0,0 +1,364 @@
+"""
+Device service
+Matches logins to UserDevice rows through a normalized fingerprint.
+
+The fingerprint is a SHA-256 of the parts of a user agent that stay put on
+one device: device type, OS family and major version, browser family.
+Browser versions are left out (they auto-update every few weeks) and so
+is the IP address (it changes with the network). The normalization is
+versioned ("v1:"), so changing it means bumping FINGERPRINT_VERSION and
+re-running the backfill, never silently re-keying live devices.
+
+With the unique (user_id, fingerprint) index, finding the device of a login
+and checking whether it is trusted or blocked is a single index probe.
+"""
+
+from sqlalchemy import DateTime, String, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import logging
+import re
+import uuid
+
+from app.core.config import settings
+from app.models.user_management.user_device import UserDevice
+
+logger = logging.getLogger(__name__)
+
+devices = UserDevice.__table__
+
+FINGERPRINT_VERSION = "v1"
+
+# Longer strings are padding or attacks; the first bytes hold everything parsed here
+MAX_USER_AGENT_LENGTH = 512
+
+
+@dataclass(frozen=True)
+class ParsedUserAgent:
+    device_type: str
+    os: str
+    os_version: Optional[str]
+    browser: str
+    browser_version: Optional[str]
+
+
+@dataclass(frozen=True)
+class DeviceMatch:
+    id: uuid.UUID
+    is_trusted: bool
+    is_blocked: bool
+    is_active: bool
+    created: bool = False
+
+
+# ----------------------------------------------------------------------
+# User agent parsing
+# ----------------------------------------------------------------------
+
+# First match wins, so specific tokens come before the engines they embed
+_BROWSERS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (name, re.compile(pattern, re.IGNORECASE)) for name, pattern in (
+        ("edge", r"\bEdg(?:e|A|iOS)?/(\d+)"),
+        ("opera", r"\b(?:OPR|Opera)/(\d+)"),
+        ("samsung", r"\bSamsungBrowser/(\d+)"),
+        ("firefox", r"\b(?:Firefox|FxiOS)/(\d+)"),
+        ("chrome", r"\b(?:Chrome|CriOS|Chromium)/(\d+)"),
+        ("safari", r"\bVersion/(\d+)[\d.]* (?:Mobile/\S+ )?Safari/"),
+        ("bot", r"(?:bot|crawler|spider)\b(?:/(\d+))?"),
+    )
+)
+
+_WINDOWS_VERSIONS = {"10.0": "10", "6.3": "8.1", "6.2": "8", "6.1": "7"}
+
+_OS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (name, re.compile(pattern, re.IGNORECASE)) for name, pattern in (
+        ("windows", r"\bWindows NT (\d+\.\d+)"),
+        ("ipados", r"\biPad\b.*? OS (\d+)"),
+        ("ios", r"\b(?:iPhone|CPU) OS (\d+)"),
+        ("android", r"\bAndroid (\d+)"),
+        ("chromeos", r"\bCrOS \S+ (\d+)"),
+        ("macos", r"\bMac OS X (\d+)"),
+        ("linux", r"\bLinux\b()"),
+    )
+)
+
+
+@lru_cache(maxsize=settings.user_agent_cache_size)
+def _parse(user_agent: str) -> ParsedUserAgent:
+    browser, browser_version = "other", None
+    for name, pattern in _BROWSERS:
+        found = pattern.search(user_agent)
+        if found:
+            browser, browser_version = name, found.group(1)
+            break
+
+    os_name, os_version = "other", None
+    for name, pattern in _OS:
+        found = pattern.search(user_agent)
+        if found:
+            os_name, os_version = name, found.group(1) or None
+            break
+    if os_name == "windows":
+        os_version = _WINDOWS_VERSIONS.get(os_version, os_version)
+
+    lowered = user_agent.lower()
+    if browser == "bot":
+        device_type = "bot"
+    elif "ipad" in lowered or "tablet" in lowered or (os_name == "android" and "mobile" not in lowered):
+        device_type = "tablet"
+    elif "mobi" in lowered or os_name in ("ios", "android"):
+        device_type = "mobile"
+    else:
+        device_type = "desktop"
+    return ParsedUserAgent(device_type, os_name, os_version, browser, browser_version)
+
+
+def parse_user_agent(user_agent: Optional[str]) -> Optional[ParsedUserAgent]:
+    """Parsed user agent, cached per distinct string (USER_AGENT_CACHE_SIZE entries)"""
+    if not user_agent or not user_agent.strip():
+        return None
+    return _parse(user_agent.strip()[:MAX_USER_AGENT_LENGTH])
+
+
+# ----------------------------------------------------------------------
+# Fingerprints
+# ----------------------------------------------------------------------
+
+def _digest(device_type: str, os_name: str, os_version: Optional[str], browser: str) -> str:
+    canonical = "|".join((FINGERPRINT_VERSION, device_type, os_name, os_version or "", browser)).lower()
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def fingerprint(user_agent: Optional[str]) -> Optional[str]:
+    """Fingerprint of a login's user agent; None when there is none to go on"""
+    parsed = parse_user_agent(user_agent)
+    if parsed is None:
+        return None
+    return _digest(parsed.device_type, parsed.os, parsed.os_version, parsed.browser)
+
+
+def fingerprint_row(row: Any) -> Optional[str]:
+    """
+    Fingerprint of a stored UserDevice row (for the backfill)
+
+    Uses user_agent when recorded; otherwise the browser_info / os_info
+    blobs ({"name": ..., "version": ...}) and device_type.
+    """
+    if row.user_agent:
+        return fingerprint(row.user_agent)
+    browser_info = row.browser_info if isinstance(row.browser_info, dict) else {}
+    os_info = row.os_info if isinstance(row.os_info, dict) else {}
+    browser = browser_info.get("name")
+    os_name = os_info.get("name")
+    if not browser or not os_name:
+        return None
+    os_version = str(os_info.get("version") or "").split(".")[0] or None
+    return _digest(row.device_type or "desktop", str(os_name), os_version, str(browser))
+
+
+# ----------------------------------------------------------------------
+# Lookup
+# ----------------------------------------------------------------------
+
+def _match_query(user_id: uuid.UUID, device_fingerprint: str):
+    return select(devices.c.id, devices.c.is_trusted, devices.c.is_blocked, devices.c.is_active).where(
+        devices.c.user_id == user_id, devices.c.fingerprint == device_fingerprint
+    )
+
+
+def _match(row, created: bool = False) -> DeviceMatch:
+    return DeviceMatch(row.id, bool(row.is_trusted), bool(row.is_blocked), row.is_active is not False, created)
+
+
+async def find_device(db: AsyncSession, user_id: uuid.UUID, user_agent: Optional[str]) -> Optional[DeviceMatch]:
+    """The user's device for this user agent, if known"""
+    device_fingerprint = fingerprint(user_agent)
+    if device_fingerprint is None:
+        return None
+    row = (await db.execute(_match_query(user_id, device_fingerprint))).first()
+    return _match(row) if row is not None else None
+
+
+async def resolve_device(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    user_agent: Optional[str],
+    ip_address: Optional[str],
+) -> Optional[DeviceMatch]:
+    """
+    Device of a successful login, registered on first sight (and committed)
+
+    Known devices cost one index probe and no write: last_seen and
+    login_count go through the activity buffer.
+    """
+    device_fingerprint = fingerprint(user_agent)
+    if device_fingerprint is None:
+        return None
+    row = (await db.execute(_match_query(user_id, device_fingerprint))).first()
+    if row is not None:
+        return _match(row)
+
+    parsed = parse_user_agent(user_agent)
+    now = datetime.now(timezone.utc)
+    row = (await db.execute(
+        pg_insert(devices)
+        .values(
+            user_id=user_id,
+            fingerprint=device_fingerprint,
+            device_type=parsed.device_type,
+            user_agent=user_agent,
+            ip_address=ip_address,
+            browser_info={"name": parsed.browser, "version": parsed.browser_version},
+            os_info={"name": parsed.os, "version": parsed.os_version},
+            first_seen=now,
+            last_seen=now,
+            login_count=0,
+            is_trusted=False,
+            is_active=True,
+            is_blocked=False,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "fingerprint"])
+        .returning(devices.c.id, devices.c.is_trusted, devices.c.is_blocked, devices.c.is_active)
+    )).first()
+    await db.commit()
+    if row is not None:
+        return _match(row, created=True)
+    # A concurrent login registered it first
+    row = (await db.execute(_match_query(user_id, device_fingerprint))).first()
+    return _match(row) if row is not None else None
+
+
+# ----------------------------------------------------------------------
+# Backfill
+# ----------------------------------------------------------------------
+
+def _assign(rows: List[Any]) -> Tuple[List[Tuple[uuid.UUID, str]], List[Tuple[uuid.UUID, Optional[str], datetime]]]:
+    """
+    (device id, fingerprint) for rows that still lack one, and the blocks
+    that move to another row: (device id, blocked_reason, blocked_at)
+
+    Several rows of one user can normalize to the same fingerprint; only
+    one can hold it. Rows that already have it win, then blocked ones, then
+    trusted ones, then the most recently seen. The rest keep NULL, but a
+    block on any of them is carried over to the row that holds the
+    fingerprint, so a blocked device stays blocked once logins match it.
+    """
+    epoch = datetime.min.replace(tzinfo=timezone.utc)
+    holders: Dict[Tuple[Any, str], Any] = {}
+    for row in rows:
+        if row.fingerprint is not None:
+            holders[(row.user_id, row.fingerprint)] = row
+    pending = sorted(
+        (row for row in rows if row.fingerprint is None),
+        key=lambda row: (bool(row.is_blocked), bool(row.is_trusted), row.last_seen or epoch),
+        reverse=True,
+    )
+    assigned = []
+    blocked: Dict[uuid.UUID, Tuple[uuid.UUID, Optional[str], datetime]] = {}
+    for row in pending:
+        device_fingerprint = fingerprint_row(row)
+        if device_fingerprint is None:
+            continue
+        holder = holders.get((row.user_id, device_fingerprint))
+        if holder is None:
+            holders[(row.user_id, device_fingerprint)] = row
+            assigned.append((row.id, device_fingerprint))
+        elif row.is_blocked and not holder.is_blocked and holder.id not in blocked:
+            blocked[holder.id] = (holder.id, row.blocked_reason, row.blocked_at or datetime.now(timezone.utc))
+    return assigned, list(blocked.values())
+
+
+def backfill_fingerprints(
+    engine,
+    batch_size: int = 500,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[int, int]:
+    """
+    Fill fingerprint on existing rows, batch_size users per transaction
+
+    Walks users with unfingerprinted devices in user_id order (keyset, so
+    rows that cannot be fingerprinted do not stall it) and updates each
+    batch with one UPDATE ... FROM (VALUES ...). A batch that collides with
+    a device registered meanwhile is recomputed. Blocks on rows left NULL
+    are copied to the row holding their fingerprint. Returns (rows
+    fingerprinted, rows left NULL); progress(users, rows) after each batch.
+    """
+    user_id_column = devices.c.user_id
+    last_user: Optional[uuid.UUID] = None
+    users_done = assigned_total = skipped_total = 0
+    retries = 0
+    while True:
+        try:
+            with engine.begin() as conn:
+                users_stmt = (
+                    select(user_id_column).distinct()
+                    .where(devices.c.fingerprint.is_(None))
+                    .order_by(user_id_column)
+                    .limit(batch_size)
+                )
+                if last_user is not None:
+                    users_stmt = users_stmt.where(user_id_column > last_user)
+                user_ids = conn.execute(users_stmt).scalars().all()
+                if not user_ids:
+                    return assigned_total, skipped_total
+
+                rows = conn.execute(
+                    select(
+                        devices.c.id, devices.c.user_id, devices.c.fingerprint, devices.c.user_agent,
+                        devices.c.browser_info, devices.c.os_info, devices.c.device_type,
+                        devices.c.is_trusted, devices.c.last_seen,
+                        devices.c.is_blocked, devices.c.blocked_reason, devices.c.blocked_at,
+                    ).where(user_id_column.in_(user_ids))
+                ).all()
+                assigned, blocked = _assign(rows)
+                if assigned:
+                    batch = values(
+                        column("id", UUID(as_uuid=True)),
+                        column("fingerprint", String(64)),
+                        name="v",
+                    ).data(assigned)
+                    conn.execute(
+                        update(devices)
+                        .where(devices.c.id == batch.c.id)
+                        .values(
+                            fingerprint=batch.c.fingerprint,
+                            # A backfill is not an edit of the row
+                            updated_at=devices.c.updated_at,
+                        )
+                    )
+                if blocked:
+                    blocks = values(
+                        column("id", UUID(as_uuid=True)),
+                        column("blocked_reason", String(200)),
+                        column("blocked_at", DateTime(timezone=True)),
+                        name="b",
+                    ).data(blocked)
+                    conn.execute(
+                        update(devices)
+                        .where(devices.c.id == blocks.c.id)
+                        .values(
+                            is_blocked=True,
+                            blocked_reason=blocks.c.blocked_reason,
+                            blocked_at=blocks.c.blocked_at,
+                        )
+                    )
+        except IntegrityError:
+            retries += 1
+            if retries > 3:
+                raise
+            logger.info("Device fingerprint batch collided with a new device, recomputing")
+            continue
+
+        retries = 0
+        last_user = user_ids[-1]
+        users_done += len(user_ids)
+        assigned_total += len(assigned)
+        skipped_total += sum(1 for row in rows if row.fingerprint is None) - len(assigned)
+        if progress is not None:
+            progress(users_done, assigned_total)
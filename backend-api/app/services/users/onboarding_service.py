@@ -0,0 +1,404 @@
+"""
+Bulk user onboarding
+Streaming import of users from CSV or JSON (array or JSON Lines), for the
+yearly intake of thousands of students and staff.
+
+Records are read lazily and processed in batches of `batch_size`:
+
+    1. validate (OnboardingUser), drop duplicates within the file and
+       resolve user_type / employee_role codes through the catalog cache
+    2. skip rows whose email or username is already taken (one SELECT)
+    3. hash the passwords on a process pool, in chunks per worker
+    4. insert the batch in one multi-row INSERT ... ON CONFLICT DO NOTHING
+
+Hashing of batch N+1 runs while batch N is inserted, so the import is
+bound by bcrypt throughput (about workers x 4 hashes/s at 12 rounds), not
+by round trips. Problems are reported per row (OnboardingReport.errors)
+and never abort the import: a batch the database rejects as a whole is
+retried row by row, each in its own savepoint, and a JSON Lines line that
+is not valid JSON is reported as that row's error.
+
+Rows without a password get an unusable hash and must set one through
+password reset. Users are written with Core, so ORM hooks (security stamps,
+catalog invalidation) do not run; none apply to new accounts.
+
+    with open("alumnos.csv", newline="") as f:
+        report = onboard_users(read_records(f, "csv"), default_user_type="STUDENT")
+"""
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from pydantic import ValidationError
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, TextIO, Tuple
+import csv
+import json
+import logging
+import os
+import time
+
+from app.core.catalogs import lookup
+from app.core.config import settings
+from app.models.user_management.user import User
+from app.schemas.users.onboarding import OnboardingUser
+from app.services.auth.security_service import _hash
+
+logger = logging.getLogger(__name__)
+
+users = User.__table__
+
+# Not a bcrypt hash: verification always fails until the password is reset
+UNUSABLE_PASSWORD = "!"
+
+# Password chunks per worker and batch; more chunks balance better, fewer cost less IPC
+CHUNKS_PER_WORKER = 4
+
+JSON_READ_SIZE = 64 * 1024
+# Largest single JSON value read_records buffers before giving up on the file
+JSON_MAX_RECORD_SIZE = 1024 * 1024
+
+# Characters that may continue a number ("1" -> "1.5", "2e" -> "2e3")
+_NUMBER_TAIL = frozenset("0123456789+-.eE")
+
+
+@dataclass(frozen=True)
+class UnreadableRecord:
+    """Stands in for a record the reader could not parse; reported as that row's error"""
+    error: str
+
+
+@dataclass
+class RowError:
+    row: int
+    error: str
+    email: Optional[str] = None
+    username: Optional[str] = None
+
+
+@dataclass
+class OnboardingReport:
+    processed: int = 0
+    created: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def fail(self, row: int, error: str, data: Optional[Mapping[str, Any]] = None) -> None:
+        data = data or {}
+        self.errors.append(RowError(row, error, data.get("email"), data.get("username")))
+
+
+@dataclass
+class _Batch:
+    """Validated rows of one batch waiting for their password hashes"""
+    rows: List[Tuple[int, Dict[str, Any]]]
+    passwords: List[Tuple[int, str]]          # (index in rows, plain password)
+    hashes: List[Future] = field(default_factory=list)
+
+
+# ----------------------------------------------------------------------
+# Input
+# ----------------------------------------------------------------------
+
+def _iter_json(stream: TextIO) -> Iterator[Any]:
+    """Items of a JSON array, or values of a JSON Lines file, without reading it whole"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if not started and buffer:
+            # "[" opens an array; anything else is a sequence of values (JSON Lines)
+            if buffer[0] == "[":
+                buffer = buffer[1:]
+            started = True
+            continue
+        if buffer[:1] == ",":
+            buffer = buffer[1:]
+            continue
+        if buffer[:1] == "]":
+            return
+        if buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A number at the buffer edge may continue in the next chunk; raw_decode
+                # also stops early on a partial fraction or exponent ("1." or "2e")
+                if eof or (end < len(buffer) and buffer[end] not in _NUMBER_TAIL):
+                    yield item
+                    buffer = buffer[end:]
+                    continue
+        if eof:
+            return
+        if len(buffer) > JSON_MAX_RECORD_SIZE:
+            # A broken value would otherwise pull the rest of the file into memory
+            raise json.JSONDecodeError(f"value longer than {JSON_MAX_RECORD_SIZE} characters", buffer[:80], 0)
+        chunk = stream.read(JSON_READ_SIZE)
+        eof = not chunk
+        buffer += chunk
+
+
+def read_records(stream: TextIO, format: str) -> Iterator[Tuple[int, Mapping[str, Any]]]:
+    """
+    (row number, record) pairs from a CSV (with header) or JSON stream
+
+    Row numbers count records from 1 (the CSV header is not a record); for
+    JSON Lines they are line numbers. Blank CSV cells are missing values.
+    A JSON Lines line that does not parse yields an UnreadableRecord and
+    reading goes on with the next line. A JSON array cannot be resumed after
+    a syntax error, so it yields one UnreadableRecord and stops there.
+    """
+    if format == "csv":
+        for number, record in enumerate(csv.DictReader(stream), start=1):
+            yield number, {
+                key.strip(): value.strip()
+                for key, value in record.items()
+                if key and isinstance(value, str) and value.strip()
+            }
+    elif format == "jsonl":
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                record = UnreadableRecord(f"invalid JSON: {e.msg} (column {e.colno})")
+            yield number, record
+    elif format == "json":
+        number = 0
+        try:
+            for number, record in enumerate(_iter_json(stream), start=1):
+                yield number, record
+        except json.JSONDecodeError as e:
+            yield number + 1, UnreadableRecord(f"invalid JSON: {e.msg}; the rest of the file was not read")
+    else:
+        raise ValueError(f"Unknown onboarding format '{format}' (csv, json, jsonl)")
+
+
+# ----------------------------------------------------------------------
+# Hashing
+# ----------------------------------------------------------------------
+
+def _hash_many(passwords: List[str], rounds: int) -> List[str]:
+    # Runs on a pool worker: one round trip per chunk instead of per password
+    return [_hash(password, rounds) for password in passwords]
+
+
+def _submit_hashes(pool: ProcessPoolExecutor, workers: int, batch: _Batch, rounds: int) -> None:
+    passwords = [password for _, password in batch.passwords]
+    if not passwords:
+        return
+    size = max(1, -(-len(passwords) // (workers * CHUNKS_PER_WORKER)))
+    batch.hashes = [
+        pool.submit(_hash_many, passwords[start:start + size], rounds)
+        for start in range(0, len(passwords), size)
+    ]
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+def _resolve(name: str, code: Optional[str]):
+    # Catalog cache hit: a dictionary lookup, no query
+    if code is None:
+        return None
+    row = lookup(name, code)
+    if row is None:
+        # Files are hand-written: accept "student" for "STUDENT"
+        row = lookup(name, code.upper())
+    return row
+
+
+def _validate(
+    records: List[Tuple[int, Mapping[str, Any]]],
+    report: OnboardingReport,
+    seen_emails: Set[str],
+    seen_usernames: Set[str],
+    default_user_type: Optional[str],
+) -> List[Tuple[int, OnboardingUser, Dict[str, Any]]]:
+    valid = []
+    for number, record in records:
+        report.processed += 1
+        if isinstance(record, UnreadableRecord):
+            report.fail(number, record.error)
+            continue
+        if not isinstance(record, Mapping):
+            report.fail(number, "record is not an object")
+            continue
+        try:
+            data = OnboardingUser.model_validate(record)
+        except ValidationError as e:
+            problems = "; ".join(f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}" for error in e.errors())
+            report.fail(number, problems, record)
+            continue
+
+        email_key, username_key = data.email.lower(), data.username.lower()
+        if email_key in seen_emails:
+            report.fail(number, "email repeated in the file", record)
+            continue
+        if username_key in seen_usernames:
+            report.fail(number, "username repeated in the file", record)
+            continue
+        seen_emails.add(email_key)
+        seen_usernames.add(username_key)
+
+        user_type = _resolve("UserType", data.user_type or default_user_type)
+        if user_type is None:
+            report.fail(number, f"unknown user_type '{data.user_type or default_user_type}'", record)
+            continue
+        employee_role = _resolve("EmployeeRole", data.employee_role)
+        if data.employee_role is not None and employee_role is None:
+            report.fail(number, f"unknown employee_role '{data.employee_role}'", record)
+            continue
+
+        valid.append((number, data, {
+            "email": data.email,
+            "username": data.username,
+            "hashed_password": UNUSABLE_PASSWORD,
+            "full_name": data.full_name,
+            "user_type_id": user_type.id,
+            "employee_role_id": employee_role.id if employee_role is not None else None,
+            "phone": data.phone,
+            "language": data.language or "es",
+            "timezone": data.timezone or "UTC",
+            "is_verified": data.is_verified,
+            "is_active": True,
+            "is_superuser": False,
+            "login_count": 0,
+            "failed_login_attempts": 0,
+        }))
+    return valid
+
+
+def _drop_existing(conn, valid, report: OnboardingReport):
+    """Rows whose email or username is free (checked before paying for their bcrypt)"""
+    if not valid:
+        return valid
+    emails = [values["email"] for _, _, values in valid]
+    usernames = [values["username"] for _, _, values in valid]
+    taken = conn.execute(
+        select(users.c.email, users.c.username).where(or_(users.c.email.in_(emails), users.c.username.in_(usernames)))
+    ).all()
+    taken_emails = {row.email for row in taken}
+    taken_usernames = {row.username for row in taken}
+    free = []
+    for number, data, values in valid:
+        if values["email"] in taken_emails:
+            report.fail(number, "email already registered", values)
+        elif values["username"] in taken_usernames:
+            report.fail(number, "username already registered", values)
+        else:
+            free.append((number, data, values))
+    return free
+
+
+def _insert(engine, batch: _Batch, report: OnboardingReport, dry_run: bool) -> None:
+    if batch.hashes:
+        hashed = [value for future in batch.hashes for value in future.result()]
+        for (index, _), value in zip(batch.passwords, hashed):
+            batch.rows[index][1]["hashed_password"] = value
+    if not batch.rows:
+        return
+    if dry_run:
+        report.created += len(batch.rows)
+        return
+
+    # Conflicts with accounts created after the pre-check come back as missing rows
+    statement = pg_insert(users).on_conflict_do_nothing().returning(users.c.email)
+    rejected: Set[int] = set()
+    try:
+        with engine.begin() as conn:
+            created = {row.email for row in conn.execute(statement, [values for _, values in batch.rows])}
+    except DBAPIError as e:
+        logger.warning(f"Onboarding batch rejected, retrying row by row: {str(e).splitlines()[0]}")
+        created = set()
+        with engine.begin() as conn:
+            for number, values in batch.rows:
+                try:
+                    with conn.begin_nested():
+                        created.update(row.email for row in conn.execute(statement, [values]))
+                except DBAPIError as row_error:
+                    rejected.add(number)
+                    report.fail(number, str(row_error.orig).splitlines()[0], values)
+
+    report.created += len(created)
+    for number, values in batch.rows:
+        if values["email"] not in created and number not in rejected:
+            report.fail(number, "email or username already registered", values)
+
+
+def _batches(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def onboard_users(
+    records: Iterable[Tuple[int, Mapping[str, Any]]],
+    *,
+    engine=None,
+    batch_size: int = 1000,
+    workers: Optional[int] = None,
+    default_user_type: Optional[str] = None,
+    dry_run: bool = False,
+    progress: Optional[Callable[[OnboardingReport], None]] = None,
+) -> OnboardingReport:
+    """
+    Create users from (row number, record) pairs, e.g. read_records()
+
+    dry_run validates, checks conflicts and hashes, but inserts nothing.
+    progress(report) is called after every batch.
+    """
+    if engine is None:
+        from app.database.connection import engine
+
+    report = OnboardingReport()
+    seen_emails: Set[str] = set()
+    seen_usernames: Set[str] = set()
+    workers = workers or os.cpu_count() or 1
+    rounds = settings.bcrypt_rounds
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        waiting: Optional[_Batch] = None
+        for records_batch in _batches(records, batch_size):
+            valid = _validate(records_batch, report, seen_emails, seen_usernames, default_user_type)
+            with engine.connect() as conn:
+                valid = _drop_existing(conn, valid, report)
+            batch = _Batch(
+                rows=[(number, values) for number, _, values in valid],
+                passwords=[(index, data.password) for index, (_, data, _) in enumerate(valid) if data.password],
+            )
+            _submit_hashes(pool, workers, batch, rounds)
+
+            # Insert the previous batch while the pool hashes this one
+            if waiting is not None:
+                _insert(engine, waiting, report, dry_run)
+                if progress is not None:
+                    progress(report)
+            waiting = batch
+
+        if waiting is not None:
+            _insert(engine, waiting, report, dry_run)
+            if progress is not None:
+                progress(report)
+
+    report.errors.sort(key=lambda error: error.row)
+    return report
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Rellena user_devices.fingerprint en filas existentes
+====================================================
+
+Calcula la huella de cada dispositivo con la misma normalización que usa el
+login (app.services.users.device_service) y la guarda por lotes de
+--batch-size usuarios, un lote por transacción. Se puede interrumpir y
+volver a lanzar: solo procesa filas con fingerprint NULL.
+
+Si varios dispositivos de un usuario dan la misma huella, solo uno la
+recibe (el de confianza o, si no, el visto más recientemente); el resto se
+queda en NULL y se informa al final.
+
+Ejecutar después de la migración 0007_device_fingerprints, y de nuevo tras
+cambiar FINGERPRINT_VERSION (vaciando antes la columna).
+
+Uso:
+    python scripts/backfill_device_fingerprints.py
+    python scripts/backfill_device_fingerprints.py --batch-size 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database.connection import engine
+from app.services.users.device_service import FINGERPRINT_VERSION, backfill_fingerprints
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rellena la huella de los dispositivos existentes")
+    parser.add_argument("--batch-size", type=int, default=500, help="Usuarios por lote (una transacción)")
+    args = parser.parse_args()
+
+    print(f"🔑 Huella de dispositivos {FINGERPRINT_VERSION}, lotes de {args.batch_size} usuarios")
+    started = time.perf_counter()
+
+    def progress(users: int, rows: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"   ⏳ {users} usuarios, {rows} dispositivos ({rows / elapsed if elapsed else 0:.0f}/s)")
+
+    assigned, skipped = backfill_fingerprints(engine, batch_size=args.batch_size, progress=progress)
+    print(f"✅ {assigned} dispositivos con huella en {time.perf_counter() - started:.1f}s")
+    if skipped:
+        print(f"⚠️  {skipped} sin huella (sin user agent ni datos de navegador/SO, o duplicados del mismo usuario)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: endpoint de listado síncrono vs asíncrono
+====================================================
+
+Levanta en memoria una app FastAPI con dos endpoints `async def` que ejecutan
+la misma consulta de listado:
+
+    /sync/list   -> Session bloqueante (get_db), congela el event loop
+    /async/list  -> AsyncSession (get_async_db), libera el loop mientras espera
+
+y los golpea con N clientes concurrentes durante unos segundos, reportando
+requests/s y latencias p50/p99 lado a lado.
+
+Uso:
+    python scripts/benchmarks/async_db_throughput.py
+    python scripts/benchmarks/async_db_throughput.py --concurrency 64 --duration 15
+    python scripts/benchmarks/async_db_throughput.py --query "SELECT id, email FROM users LIMIT 50"
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database.connection import async_engine, engine, get_async_db, get_db
+
+# Consulta por defecto: simula ~5 ms de trabajo en el servidor de base de datos
+DEFAULT_QUERY = "SELECT g AS id, pg_sleep(0.005) IS NULL AS ok FROM generate_series(1, 50) AS g LIMIT 50"
+
+
+def build_app(query: str) -> FastAPI:
+    """Construye la app de prueba con ambos endpoints"""
+    app = FastAPI()
+    statement = text(query)
+
+    @app.get("/sync/list")
+    async def sync_list(db: Session = Depends(get_db)):
+        rows = db.execute(statement).mappings().all()
+        return {"count": len(rows)}
+
+    @app.get("/async/list")
+    async def async_list(db: AsyncSession = Depends(get_async_db)):
+        rows = (await db.execute(statement)).mappings().all()
+        return {"count": len(rows)}
+
+    return app
+
+
+async def run_load(app: FastAPI, path: str, concurrency: int, duration: float) -> List[float]:
+    """Lanza `concurrency` clientes contra `path` durante `duration` segundos"""
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return latencies
+
+
+def summarize(name: str, latencies: List[float], duration: float) -> str:
+    """Formatea una fila de resultados"""
+    if not latencies:
+        return f"{name:<8} sin resultados"
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered) * 1000
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+    rps = len(ordered) / duration
+    return f"{name:<8} {rps:>10.1f} req/s   p50 {p50:>8.2f} ms   p99 {p99:>8.2f} ms   ({len(ordered)} requests)"
+
+
+async def main_async(args) -> None:
+    app = build_app(args.query)
+
+    # Calentamiento: abre conexiones en ambos pools antes de medir
+    await run_load(app, "/sync/list", min(args.concurrency, 4), 1.0)
+    await run_load(app, "/async/list", min(args.concurrency, 4), 1.0)
+
+    sync_latencies = await run_load(app, "/sync/list", args.concurrency, args.duration)
+    async_latencies = await run_load(app, "/async/list", args.concurrency, args.duration)
+
+    print(f"\nConcurrencia: {args.concurrency}   Duración: {args.duration}s")
+    print("-" * 80)
+    print(summarize("sync", sync_latencies, args.duration))
+    print(summarize("async", async_latencies, args.duration))
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput sync vs async de un endpoint de listado")
+    parser.add_argument("--concurrency", type=int, default=32, help="Clientes concurrentes")
+    parser.add_argument("--duration", type=float, default=10.0, help="Segundos por escenario")
+    parser.add_argument("--query", default=DEFAULT_QUERY, help="Consulta SQL del listado")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
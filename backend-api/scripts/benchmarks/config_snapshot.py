@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lectura de configuración, consulta a BD vs snapshot en memoria
+=========================================================================
+
+Crea una tabla temporal con la forma de `configurations`, la llena con
+--keys claves de todos los tipos (un 10% cifradas) y mide la latencia de
+leer una clave de tres formas:
+
+    BD + parseo        SELECT por clave y conversión según el tipo (lo de hoy)
+    snapshot           config.get(clave) sobre un ConfigSnapshot
+    snapshot cifrado   config.get(clave) de un valor cifrado ya descifrado
+
+Además informa cuánto cuesta construir un snapshot completo (lo que paga
+cada worker en una recarga) y el primer descifrado de un secreto.
+
+Por defecto usa DATABASE_URL; con --url sqlite:// corre sin servidor.
+
+Uso:
+    python scripts/benchmarks/config_snapshot.py
+    python scripts/benchmarks/config_snapshot.py --keys 500 --url sqlite://
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import Boolean, Column, Enum as SQLEnum, String, Text, create_engine, insert, select
+from sqlalchemy.orm import declarative_base
+
+from app.core.config import settings
+from app.core.runtime_config import PARSERS, build_snapshot, decrypt_value, encrypt_value
+from app.models.app_settings.configuration import ConfigurationType
+
+BenchBase = declarative_base()
+
+
+class BenchConfiguration(BenchBase):
+    """Misma forma que Configuration"""
+    __tablename__ = "bench_configurations"
+
+    id = Column(String(36), primary_key=True)
+    key = Column(String(255), nullable=False, unique=True, index=True)
+    value = Column(Text, nullable=True)
+    type = Column(SQLEnum(ConfigurationType), nullable=False)
+    is_encrypted = Column(Boolean, default=False, nullable=False)
+    description = Column(Text, nullable=True)
+
+
+SAMPLES = {
+    ConfigurationType.STRING: "Medialab",
+    ConfigurationType.INTEGER: "25",
+    ConfigurationType.BOOLEAN: "true",
+    ConfigurationType.JSON: json.dumps({"limits": [10, 20, 30], "enabled": True}),
+    ConfigurationType.URL: "https://medialab.example.org",
+    ConfigurationType.EMAIL: "soporte@medialab.example.org",
+}
+
+
+def fill(engine, keys: int) -> None:
+    """Crea y llena la tabla de prueba"""
+    BenchBase.metadata.drop_all(engine)
+    BenchBase.metadata.create_all(engine)
+    types = list(SAMPLES)
+    rows = []
+    for i in range(keys):
+        config_type = types[i % len(types)]
+        encrypted = i % 10 == 0
+        value = SAMPLES[config_type]
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "key": f"setting_{i}",
+            "value": encrypt_value(value) if encrypted else value,
+            "type": config_type,
+            "is_encrypted": encrypted,
+        })
+    with engine.begin() as conn:
+        conn.execute(insert(BenchConfiguration.__table__), rows)
+
+
+def read_from_database(engine, key: str):
+    """Lo que cuesta hoy: una consulta y el parseo"""
+    table = BenchConfiguration.__table__
+    with engine.connect() as conn:
+        row = conn.execute(
+            select(table.c.value, table.c.type, table.c.is_encrypted).where(table.c.key == key)
+        ).one()
+    value = decrypt_value(row.value) if row.is_encrypted else row.value
+    return PARSERS[row.type.value](value)
+
+
+def per_call_us(func, calls: int, repeat: int = 5) -> float:
+    """Mediana de microsegundos por llamada"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - started) / calls * 1_000_000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lectura de configuración: BD vs snapshot")
+    parser.add_argument("--keys", type=int, default=200, help="Claves en la tabla")
+    parser.add_argument("--calls", type=int, default=2000, help="Lecturas por medición en BD (x500 en memoria)")
+    parser.add_argument("--url", default=None, help="URL de base de datos (por defecto DATABASE_URL)")
+    parser.add_argument("--keep", action="store_true", help="No eliminar la tabla al terminar")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url or settings.database_url)
+    try:
+        fill(engine, args.keys)
+        table = BenchConfiguration.__table__
+        columns = (table.c.key, table.c.value, table.c.type, table.c.is_encrypted)
+
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            snapshot = build_snapshot(1, conn.execute(select(*columns)).all())
+        build_ms = (time.perf_counter() - started) * 1000
+
+        plain_key, secret_key = "setting_1", "setting_0"
+        started = time.perf_counter()
+        snapshot.get(secret_key)
+        first_decrypt_us = (time.perf_counter() - started) * 1_000_000
+
+        database = per_call_us(lambda: read_from_database(engine, plain_key), args.calls)
+        plain = per_call_us(lambda: snapshot.get(plain_key), args.calls * 500)
+        secret = per_call_us(lambda: snapshot.get(secret_key), args.calls * 500)
+
+        print(f"\n{args.keys} claves ({args.keys // 10 + (args.keys % 10 > 0)} cifradas)")
+        print(f"{'lectura':<28} {'por llamada':>14} {'vs BD':>10}")
+        print("-" * 56)
+        for name, us in (("BD + parseo", database), ("snapshot", plain), ("snapshot cifrado", secret)):
+            print(f"{name:<28} {us:>11.3f} µs {database / us:>9.0f}x")
+        print(f"\nconstruir snapshot (recarga): {build_ms:.1f} ms")
+        print(f"primer descifrado de un secreto: {first_decrypt_us:.0f} µs")
+    finally:
+        if not args.keep:
+            BenchBase.metadata.drop_all(engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: joins sobre FK VARCHAR(36) vs UUID nativo
+====================================================
+
+Crea una tabla padre (PK UUID) y dos tablas hijas idénticas cuya FK es
+VARCHAR(36) (antes de la migración 0003) o UUID (después), ambas indexadas.
+Para cada variante ejecuta EXPLAIN (ANALYZE, BUFFERS) de dos consultas típicas:
+
+    lookup  hijos de unos pocos padres filtrados por columnas del padre
+    join    agregado padre-hijo sobre un rango de padres
+
+y muestra tiempo, buffers leídos, índices usados y tamaño del índice de la FK.
+
+Uso:
+    python scripts/benchmarks/fk_join_types.py
+    python scripts/benchmarks/fk_join_types.py --parents 100000 --children-per-parent 20
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+
+PARENT = "bench_fk_parent"
+VARIANTS = {
+    # variante -> (tipo de la FK, expresión de join; VARCHAR necesita cast)
+    "varchar36": ("VARCHAR(36)", "c.parent_id = p.id::text"),
+    "uuid": ("UUID", "c.parent_id = p.id"),
+}
+
+QUERIES = {
+    "lookup": """
+        SELECT c.id, c.amount
+        FROM {child} c
+        JOIN {parent} p ON {join}
+        WHERE p.code IN (SELECT code FROM {parent} ORDER BY code LIMIT 5)
+    """,
+    "join": """
+        SELECT p.code, count(*), sum(c.amount)
+        FROM {parent} p
+        JOIN {child} c ON {join}
+        WHERE p.code BETWEEN 'p000100' AND 'p000600'
+        GROUP BY p.code
+    """,
+}
+
+
+def setup(conn, parents: int, per_parent: int) -> None:
+    """Crea las tablas de prueba"""
+    conn.execute(text(f"DROP TABLE IF EXISTS {PARENT} CASCADE"))
+    conn.execute(text(f"""
+        CREATE TABLE {PARENT} (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            code VARCHAR(20) NOT NULL UNIQUE
+        )
+    """))
+    conn.execute(text(f"""
+        INSERT INTO {PARENT} (code)
+        SELECT 'p' || lpad(g::text, 6, '0') FROM generate_series(1, :parents) AS g
+    """), {"parents": parents})
+
+    for variant, (fk_type, _join) in VARIANTS.items():
+        child = f"bench_fk_child_{variant}"
+        references = f"REFERENCES {PARENT} (id)" if fk_type == "UUID" else ""
+        cast = "" if fk_type == "UUID" else "::text"
+        conn.execute(text(f"DROP TABLE IF EXISTS {child}"))
+        conn.execute(text(f"""
+            CREATE TABLE {child} (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                parent_id {fk_type} NOT NULL {references},
+                amount INTEGER NOT NULL
+            )
+        """))
+        conn.execute(text(f"""
+            INSERT INTO {child} (parent_id, amount)
+            SELECT p.id{cast}, (random() * 1000)::int
+            FROM {PARENT} p, generate_series(1, :per_parent)
+        """), {"per_parent": per_parent})
+        conn.execute(text(f"CREATE INDEX ix_{child}_parent_id ON {child} (parent_id)"))
+        conn.execute(text(f"ANALYZE {child}"))
+    conn.execute(text(f"ANALYZE {PARENT}"))
+
+
+def _indexes_used(plan: dict) -> list[str]:
+    found = []
+    if "Index Name" in plan:
+        found.append(f"{plan['Node Type']} {plan['Index Name']}")
+    for child in plan.get("Plans", []):
+        found.extend(_indexes_used(child))
+    return found
+
+
+def explain(conn, sql: str) -> dict:
+    raw = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()
+    result = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    plan = result["Plan"]
+    return {
+        "ms": result["Execution Time"],
+        "buffers": plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0),
+        "indexes": _indexes_used(plan),
+        "top": plan["Node Type"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Joins con FK VARCHAR(36) vs UUID")
+    parser.add_argument("--parents", type=int, default=50_000, help="Filas en la tabla padre")
+    parser.add_argument("--children-per-parent", type=int, default=20, help="Hijos por padre")
+    parser.add_argument("--keep", action="store_true", help="No eliminar las tablas al terminar")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url)
+    with engine.begin() as conn:
+        print(f"Creando {args.parents:,} padres x {args.children_per_parent} hijos por variante...")
+        setup(conn, args.parents, args.children_per_parent)
+
+    with engine.connect() as conn:
+        for variant, (fk_type, join) in VARIANTS.items():
+            child = f"bench_fk_child_{variant}"
+            index_mb = conn.execute(
+                text(f"SELECT pg_relation_size('ix_{child}_parent_id')")
+            ).scalar() / 1024 / 1024
+            print(f"\n{variant} (FK {fk_type}, índice FK {index_mb:.1f} MB)")
+            print("-" * 72)
+            for name, template in QUERIES.items():
+                sql = template.format(child=child, parent=PARENT, join=join)
+                explain(conn, sql)  # calentar caché
+                stats = explain(conn, sql)
+                print(f"  {name:<7} {stats['ms']:>9.2f} ms  buffers={stats['buffers']:<7} raíz={stats['top']}")
+                for index in stats["indexes"] or ["(sin índices: seq scan)"]:
+                    print(f"           · {index}")
+
+    if not args.keep:
+        with engine.begin() as conn:
+            for variant in VARIANTS:
+                conn.execute(text(f"DROP TABLE IF EXISTS bench_fk_child_{variant}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {PARENT}"))
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: paginación OFFSET vs keyset (seek)
+=============================================
+
+Crea una tabla temporal con varios millones de filas (id UUID4 aleatorio,
+created_at) e índice (created_at, id), y mide la latencia de la página 1 y de
+una página profunda (por defecto la 5.000) con ambas estrategias:
+
+    OFFSET  ORDER BY created_at DESC, id DESC LIMIT n OFFSET (p-1)*n
+    keyset  WHERE (created_at, id) < (:c, :i) ORDER BY ... LIMIT n
+
+Requiere PostgreSQL 13+ (gen_random_uuid). La tabla se elimina al terminar
+salvo que se use --keep.
+
+Uso:
+    python scripts/benchmarks/keyset_pagination.py
+    python scripts/benchmarks/keyset_pagination.py --rows 5000000 --page 5000 --page-size 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+
+TABLE = "bench_keyset_pagination"
+
+
+def setup_table(conn, rows: int) -> None:
+    """Crea y llena la tabla de prueba"""
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    conn.execute(text(f"""
+        CREATE TABLE {TABLE} (
+            id UUID PRIMARY KEY,
+            created_at TIMESTAMPTZ NOT NULL,
+            payload TEXT
+        )
+    """))
+    conn.execute(text(f"""
+        INSERT INTO {TABLE} (id, created_at, payload)
+        SELECT gen_random_uuid(),
+               now() - (g * interval '1 second') - (random() * interval '1 second'),
+               md5(g::text)
+        FROM generate_series(1, :rows) AS g
+    """), {"rows": rows})
+    conn.execute(text(f"CREATE INDEX ix_{TABLE}_created_at_id ON {TABLE} (created_at, id)"))
+    conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+def timed(conn, sql: str, params: dict, repeat: int) -> float:
+    """Mediana en ms de `repeat` ejecuciones"""
+    samples = []
+    statement = text(sql)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(statement, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia OFFSET vs keyset por profundidad de página")
+    parser.add_argument("--rows", type=int, default=3_000_000, help="Filas en la tabla de prueba")
+    parser.add_argument("--page", type=int, default=5000, help="Página profunda a medir")
+    parser.add_argument("--page-size", type=int, default=50, help="Filas por página")
+    parser.add_argument("--repeat", type=int, default=7, help="Repeticiones por medición")
+    parser.add_argument("--keep", action="store_true", help="No eliminar la tabla al terminar")
+    parser.add_argument("--skip-setup", action="store_true", help="Reutilizar una tabla existente")
+    args = parser.parse_args()
+
+    if args.page * args.page_size > args.rows:
+        parser.error("--page * --page-size supera --rows")
+
+    engine = create_engine(settings.database_url)
+    order = "ORDER BY created_at DESC, id DESC"
+    offset_sql = f"SELECT id, created_at, payload FROM {TABLE} {order} LIMIT :n OFFSET :off"
+    keyset_sql = (
+        f"SELECT id, created_at, payload FROM {TABLE} "
+        f"WHERE (created_at, id) < (:c, :i) {order} LIMIT :n"
+    )
+
+    with engine.connect() as conn:
+        if not args.skip_setup:
+            print(f"Creando {args.rows:,} filas en {TABLE}...")
+            started = time.perf_counter()
+            setup_table(conn, args.rows)
+            conn.commit()
+            print(f"   listo en {time.perf_counter() - started:.1f}s")
+
+        n = args.page_size
+        deep_offset = (args.page - 1) * n
+        # Fila frontera: la última de la página anterior (equivale al cursor)
+        boundary = conn.execute(
+            text(f"SELECT created_at, id FROM {TABLE} {order} LIMIT 1 OFFSET :off"),
+            {"off": deep_offset - 1},
+        ).one()
+
+        results = {
+            ("OFFSET", 1): timed(conn, offset_sql, {"n": n, "off": 0}, args.repeat),
+            ("OFFSET", args.page): timed(conn, offset_sql, {"n": n, "off": deep_offset}, args.repeat),
+            ("keyset", 1): timed(conn, f"SELECT id, created_at, payload FROM {TABLE} {order} LIMIT :n", {"n": n}, args.repeat),
+            ("keyset", args.page): timed(
+                conn, keyset_sql, {"n": n, "c": boundary.created_at, "i": boundary.id}, args.repeat
+            ),
+        }
+
+        print(f"\nFilas: {args.rows:,}   Tamaño de página: {n}   Repeticiones: {args.repeat} (mediana)")
+        print("-" * 60)
+        print(f"{'estrategia':<10} {'página 1':>14} {f'página {args.page:,}':>18}")
+        for strategy in ("OFFSET", "keyset"):
+            print(
+                f"{strategy:<10} {results[(strategy, 1)]:>11.2f} ms "
+                f"{results[(strategy, args.page)]:>15.2f} ms"
+            )
+
+        if not args.keep:
+            conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+            conn.commit()
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
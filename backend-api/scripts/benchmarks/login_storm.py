@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tormenta de logins y latencia del resto de endpoints
+===============================================================
+
+Levanta un servidor uvicorn de un solo worker con dos endpoints:
+
+    POST /login   verifica una contraseña bcrypt (BCRYPT_ROUNDS=--rounds)
+    GET  /ping    no hace nada: representa cualquier endpoint no relacionado
+
+y, mientras --concurrency clientes hacen login sin pausa durante
+--duration segundos, un cliente aparte mide la latencia de /ping. Se repite
+para cada modo de verificación:
+
+    inline    bcrypt.checkpw directamente en el handler async (lo que se evita)
+    thread    PasswordHasher con pool de hilos (bcrypt libera el GIL)
+    process   PasswordHasher con pool de procesos
+
+Informa logins/s, p50/p99 del login y p50/p99/máx de /ping. Con inline el
+event loop queda bloqueado durante cada hash y /ping hereda esa latencia.
+
+Uso:
+    python scripts/benchmarks/login_storm.py
+    python scripts/benchmarks/login_storm.py --modes thread process --concurrency 32 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx
+
+PASSWORD = "correct horse battery staple"
+
+
+def serve(mode: str, port: int, rounds: int, workers: int) -> None:
+    """Servidor de prueba (se ejecuta en un subproceso)"""
+    import bcrypt
+    import uvicorn
+    from fastapi import FastAPI, Form
+
+    from app.services.auth.security_service import PasswordHasher
+
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds)).decode()
+    hasher = PasswordHasher(mode="thread" if mode == "inline" else mode, workers=workers, max_pending=10_000, rounds=rounds)
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login(password: str = Form(...)):
+        if mode == "inline":
+            ok = bcrypt.checkpw(password.encode(), hashed.encode())
+        else:
+            ok = await hasher.verify(password, hashed)
+        return {"ok": ok}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stats")
+    async def stats():
+        return hasher.snapshot()
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def storm(base_url: str, concurrency: int, duration: float) -> dict:
+    logins: list = []
+    pings: list = []
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        async def login_loop():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.post("/login", data={"password": PASSWORD})
+                response.raise_for_status()
+                logins.append((time.perf_counter() - started) * 1000)
+
+        async def ping_loop():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                (await client.get("/ping")).raise_for_status()
+                pings.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        await asyncio.gather(ping_loop(), *(login_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        hasher_stats = (await client.get("/stats")).json()
+
+    return {
+        "logins_per_s": len(logins) / elapsed,
+        "login_p50": statistics.median(logins),
+        "login_p99": percentile(logins, 0.99),
+        "ping_p50": statistics.median(pings),
+        "ping_p99": percentile(pings, 0.99),
+        "ping_max": max(pings),
+        "queue_avg": hasher_stats["queue_ms"]["avg"],
+    }
+
+
+def wait_ready(base_url: str, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("el servidor de prueba terminó al arrancar")
+        try:
+            httpx.get(f"{base_url}/ping", timeout=1).raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("el servidor de prueba no respondió a tiempo")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput de login y latencia de /ping bajo carga")
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"], choices=["inline", "thread", "process"])
+    parser.add_argument("--concurrency", type=int, default=16, help="Clientes haciendo login a la vez")
+    parser.add_argument("--duration", type=float, default=10.0, help="Segundos de carga por modo")
+    parser.add_argument("--rounds", type=int, default=12, help="Coste bcrypt")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Hilos/procesos del PasswordHasher")
+    parser.add_argument("--serve", nargs=2, metavar=("MODE", "PORT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve[0], int(args.serve[1]), args.rounds, args.workers)
+        return
+
+    print(f"bcrypt rounds={args.rounds}, {args.concurrency} clientes de login, {args.duration:.0f}s por modo, "
+          f"{args.workers} workers de hashing")
+    print(f"\n{'modo':<9} {'logins/s':>9} {'login p50':>11} {'login p99':>11} "
+          f"{'/ping p50':>11} {'/ping p99':>11} {'/ping máx':>11} {'cola media':>11}")
+    print("-" * 92)
+    for mode in args.modes:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = subprocess.Popen([
+            sys.executable, __file__, "--serve", mode, str(port),
+            "--rounds", str(args.rounds), "--workers", str(args.workers),
+        ])
+        try:
+            wait_ready(base_url, process)
+            result = asyncio.run(storm(base_url, args.concurrency, args.duration))
+        finally:
+            process.terminate()
+            process.wait()
+        print(
+            f"{mode:<9} {result['logins_per_s']:>9.1f} {result['login_p50']:>8.0f} ms {result['login_p99']:>8.0f} ms "
+            f"{result['ping_p50']:>8.1f} ms {result['ping_p99']:>8.1f} ms {result['ping_max']:>8.1f} ms "
+            f"{result['queue_avg']:>8.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
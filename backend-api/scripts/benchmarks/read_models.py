@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark: read models (Core + __slots__ / Pydantic) vs instancias ORM
+======================================================================
+
+Crea una tabla temporal con la forma de `tasks` (id, 20 columnas, auto-FK y
+dos relaciones), la llena con --rows filas y materializa el listado completo
+de cuatro formas:
+
+    ORM           session.scalars(select(BenchTask)).all()
+    Core Row      filas Core sin convertir (referencia)
+    read model    fetch_rows() -> dataclass con __slots__, 12 columnas
+    Pydantic v2   fetch_validated() -> lista validada en una sola llamada
+
+Para cada una informa la mediana de tiempo y el pico de memoria
+(tracemalloc, en una pasada aparte para no distorsionar los tiempos).
+
+Por defecto usa DATABASE_URL; con --url sqlite:// corre sin servidor.
+
+Uso:
+    python scripts/benchmarks/read_models.py
+    python scripts/benchmarks/read_models.py --rows 10000 100000 --url sqlite://
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from pydantic import BaseModel as Schema
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, create_engine, insert, select
+from sqlalchemy.orm import Session, declarative_base, relationship
+
+from app.core.config import settings
+from app.repositories.read_models import fetch_rows, fetch_validated, read_model
+
+BenchBase = declarative_base()
+
+
+class BenchTask(BenchBase):
+    """Misma forma que Task: muchas columnas y relaciones que un listado no usa"""
+    __tablename__ = "bench_read_model_tasks"
+
+    id = Column(String(36), primary_key=True)
+    title = Column(String(200), nullable=False)
+    description = Column(Text)
+    task_type = Column(String(20))
+    status = Column(String(20))
+    priority = Column(String(20))
+    due_date = Column(DateTime(timezone=True))
+    start_date = Column(DateTime(timezone=True))
+    completed_date = Column(DateTime(timezone=True))
+    estimated_hours = Column(Integer)
+    actual_hours = Column(Integer)
+    progress_percentage = Column(Integer)
+    project_id = Column(String(36))
+    assigned_to_id = Column(String(36))
+    created_by_id = Column(String(36))
+    parent_task_id = Column(String(36), ForeignKey("bench_read_model_tasks.id"))
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    is_active = Column(Boolean)
+
+    parent_task = relationship("BenchTask", remote_side=[id], back_populates="subtasks")
+    subtasks = relationship("BenchTask", back_populates="parent_task")
+
+
+BENCH_COLUMNS = (
+    "id", "title", "task_type", "status", "priority", "due_date", "start_date",
+    "completed_date", "progress_percentage", "project_id", "assigned_to_id", "created_at",
+)
+
+BenchTaskRow = read_model("BenchTaskRow", BenchTask, BENCH_COLUMNS)
+
+
+class BenchTaskSchema(Schema):
+    id: str
+    title: str
+    task_type: str
+    status: str
+    priority: str
+    due_date: datetime | None
+    start_date: datetime | None
+    completed_date: datetime | None
+    progress_percentage: int | None
+    project_id: str | None
+    assigned_to_id: str | None
+    created_at: datetime
+
+
+def fill(engine, rows: int) -> None:
+    """Crea y llena la tabla de prueba"""
+    BenchBase.metadata.drop_all(engine)
+    BenchBase.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    project_ids = [str(uuid.uuid4()) for _ in range(50)]
+    batch = []
+    with engine.begin() as conn:
+        for i in range(rows):
+            batch.append({
+                "id": str(uuid.uuid4()),
+                "title": f"Tarea {i}",
+                "description": "x" * 400,
+                "task_type": "edition",
+                "status": ("todo", "in_progress", "done")[i % 3],
+                "priority": "medium",
+                "due_date": now + timedelta(days=i % 30),
+                "start_date": now,
+                "completed_date": None,
+                "estimated_hours": 8,
+                "actual_hours": i % 8,
+                "progress_percentage": i % 100,
+                "project_id": project_ids[i % len(project_ids)],
+                "assigned_to_id": None,
+                "created_by_id": None,
+                "parent_task_id": None,
+                "created_at": now - timedelta(seconds=i),
+                "updated_at": now,
+                "is_active": True,
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(BenchTask.__table__), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(BenchTask.__table__), batch)
+
+
+def strategies(engine):
+    def orm():
+        with Session(engine) as db:
+            return db.scalars(select(BenchTask)).all()
+
+    def core_rows():
+        with Session(engine) as db:
+            return db.execute(BenchTaskRow.select()).all()
+
+    def slotted():
+        with Session(engine) as db:
+            return fetch_rows(db, BenchTaskRow)
+
+    def pydantic():
+        with Session(engine) as db:
+            return fetch_validated(db, BenchTaskSchema, BenchTaskRow.select())
+
+    return {
+        "ORM (instancias completas)": orm,
+        "Core Row (referencia)": core_rows,
+        "read model __slots__": slotted,
+        "Pydantic v2 (lista validada)": pydantic,
+    }
+
+
+def measure(func, repeat: int) -> tuple[float, float]:
+    """(mediana en ms, pico de memoria en MB)"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(samples), peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materializar listados: ORM vs read models")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Tamaños a medir")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por medición")
+    parser.add_argument("--url", default=None, help="URL de base de datos (por defecto DATABASE_URL)")
+    parser.add_argument("--keep", action="store_true", help="No eliminar la tabla al terminar")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url or settings.database_url)
+    try:
+        for rows in args.rows:
+            fill(engine, rows)
+            print(f"\n{rows:,} filas")
+            print(f"{'estrategia':<32} {'mediana':>12} {'pico memoria':>14} {'vs ORM':>8}")
+            print("-" * 70)
+            baseline = None
+            for name, func in strategies(engine).items():
+                ms, peak = measure(func, args.repeat)
+                baseline = baseline or ms
+                print(f"{name:<32} {ms:>9.1f} ms {peak:>11.1f} MB {baseline / ms:>7.1f}x")
+    finally:
+        if not args.keep:
+            BenchBase.metadata.drop_all(engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tiempo de arranque en frío y latencia de la primera petición
+=======================================================================
+
+Cada fase se mide en un proceso Python nuevo (sin caché de módulos), --runs
+veces, y se informa la mediana:
+
+    import app.models          registro perezoso, sin cargar dominios
+    load_all_models()          importa todos los dominios
+    configure_models()         importa y configura todos los mappers
+    import app.main            aplicación completa con routers
+    primera consulta ORM       compilar select(User), sin y con configure_models()
+    primera petición           GET /health y /openapi.json contra la app ASGI
+
+Uso:
+    python scripts/benchmarks/startup_time.py
+    python scripts/benchmarks/startup_time.py --runs 7
+    python scripts/benchmarks/startup_time.py --importtime   # top de python -X importtime
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+
+PRELUDE = """
+import json, time, sys
+sys.path.insert(0, {backend!r})
+started = time.perf_counter()
+"""
+
+PHASES = {
+    "import app.models": """
+import app.models
+result = {"ms": (time.perf_counter() - started) * 1000}
+""",
+    "load_all_models()": """
+from app.models import load_all_models
+load_all_models()
+result = {"ms": (time.perf_counter() - started) * 1000}
+""",
+    "configure_models()": """
+from app.models import configure_models
+try:
+    configure_models()
+    result = {"ms": (time.perf_counter() - started) * 1000}
+except Exception as e:
+    result = {"ms": (time.perf_counter() - started) * 1000, "error": type(e).__name__}
+""",
+    "import app.main": """
+import app.main
+result = {"ms": (time.perf_counter() - started) * 1000}
+""",
+    "primera consulta ORM (fría)": """
+from sqlalchemy import select
+from app.models import User
+t = time.perf_counter()
+try:
+    str(select(User).where(User.email == "x"))
+    result = {"ms": (time.perf_counter() - t) * 1000}
+except Exception as e:
+    result = {"ms": (time.perf_counter() - t) * 1000, "error": type(e).__name__}
+""",
+    "primera consulta ORM (calentada)": """
+from sqlalchemy import select
+from app.models import User, configure_models
+try:
+    configure_models()
+except Exception:
+    pass
+t = time.perf_counter()
+try:
+    str(select(User).where(User.email == "x"))
+    result = {"ms": (time.perf_counter() - t) * 1000}
+except Exception as e:
+    result = {"ms": (time.perf_counter() - t) * 1000, "error": type(e).__name__}
+""",
+    "primera petición /health": """
+import asyncio, httpx
+from app.main import app
+async def first():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        t = time.perf_counter()
+        await client.get("/health")
+        return (time.perf_counter() - t) * 1000
+result = {"ms": asyncio.run(first())}
+""",
+    "primera petición /openapi.json": """
+import asyncio, httpx
+from app.main import app
+async def first():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        t = time.perf_counter()
+        await client.get("/openapi.json")
+        first_ms = (time.perf_counter() - t) * 1000
+        t = time.perf_counter()
+        await client.get("/openapi.json")
+        return first_ms, (time.perf_counter() - t) * 1000
+first_ms, second_ms = asyncio.run(first())
+result = {"ms": first_ms, "second_ms": second_ms}
+""",
+}
+
+
+def run_phase(code: str) -> dict:
+    script = PRELUDE.format(backend=str(backend_dir)) + code + "\nprint(json.dumps(result))\n"
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {"ms": float("nan"), "error": completed.stderr.strip().splitlines()[-1]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def importtime_top(limit: int) -> None:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        rows.append((int(cumulative_us), int(self_us), name))
+    print(f"\nTop {limit} módulos por tiempo acumulado (python -X importtime)")
+    print("-" * 72)
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:limit]:
+        print(f"{cumulative_us / 1000:>9.1f} ms  (propio {self_us / 1000:>7.1f} ms)  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de arranque en frío por fase")
+    parser.add_argument("--runs", type=int, default=5, help="Procesos por fase")
+    parser.add_argument("--importtime", action="store_true", help="Mostrar los módulos más lentos de importar")
+    parser.add_argument("--top", type=int, default=15, help="Módulos a mostrar con --importtime")
+    args = parser.parse_args()
+
+    # Compilar .pyc primero para no medir la compilación de bytecode
+    subprocess.run([sys.executable, "-m", "compileall", "-q", "app"], cwd=backend_dir)
+
+    print(f"Mediana de {args.runs} procesos nuevos por fase\n")
+    print(f"{'fase':<36} {'mediana':>10} {'mín':>10}  notas")
+    print("-" * 72)
+    for name, code in PHASES.items():
+        samples = [run_phase(code) for _ in range(args.runs)]
+        times = [sample["ms"] for sample in samples]
+        notes = []
+        errors = {sample["error"] for sample in samples if "error" in sample}
+        if errors:
+            notes.append(f"error: {', '.join(sorted(errors))}")
+        if "second_ms" in samples[0]:
+            notes.append(f"segunda: {statistics.median(s['second_ms'] for s in samples):.1f} ms")
+        print(f"{name:<36} {statistics.median(times):>8.1f} ms {min(times):>8.1f} ms  {'; '.join(notes)}")
+
+    if args.importtime:
+        importtime_top(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: claves primarias UUIDv4 vs UUIDv7
+============================================
+
+Inserta las mismas filas en tablas de prueba cuya PK se genera con uuid4
+(aleatorio) y con uuid7 (ordenado por tiempo), y compara:
+
+    - filas/segundo de inserción (lotes de --batch filas)
+    - tamaño del índice de la PK y densidad de hojas (si pgstattuple existe)
+    - coste extra del índice redundante ix_<tabla>_id (--with-id-index)
+
+Uso:
+    python scripts/benchmarks/uuid_primary_keys.py
+    python scripts/benchmarks/uuid_primary_keys.py --rows 2000000 --batch 5000 --with-id-index
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import Column, DateTime, MetaData, Table, Text, create_engine, func, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.config import settings
+from app.models.base import uuid7
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+def build_table(metadata: MetaData, name: str) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", UUID(as_uuid=True), primary_key=True),
+        Column("created_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+        Column("payload", Text),
+    )
+
+
+def run(engine, label: str, generator, rows: int, batch: int, with_id_index: bool) -> dict:
+    """Inserta `rows` filas y devuelve métricas"""
+    name = f"bench_pk_{label}"
+    metadata = MetaData()
+    table = build_table(metadata, name)
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        metadata.create_all(conn)
+        if with_id_index:
+            conn.execute(text(f"CREATE INDEX ix_{name}_id ON {name} (id)"))
+
+    payload = "x" * 64
+    started = time.perf_counter()
+    inserted = 0
+    while inserted < rows:
+        size = min(batch, rows - inserted)
+        with engine.begin() as conn:
+            conn.execute(table.insert(), [{"id": generator(), "payload": payload} for _ in range(size)])
+        inserted += size
+    elapsed = time.perf_counter() - started
+
+    with engine.begin() as conn:
+        conn.execute(text(f"ANALYZE {name}"))
+        pk_bytes = conn.execute(text(f"SELECT pg_relation_size('{name}_pkey')")).scalar()
+        extra_bytes = (
+            conn.execute(text(f"SELECT pg_relation_size('ix_{name}_id')")).scalar() if with_id_index else 0
+        )
+        try:
+            density = conn.execute(
+                text(f"SELECT avg_leaf_density FROM pgstatindex('{name}_pkey')")
+            ).scalar()
+        except Exception:
+            density = None
+
+    return {
+        "label": label,
+        "rows_per_sec": rows / elapsed,
+        "seconds": elapsed,
+        "pk_mb": pk_bytes / 1024 / 1024,
+        "extra_mb": extra_bytes / 1024 / 1024,
+        "leaf_density": density,
+        "table": name,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inserción y tamaño de índice: uuid4 vs uuid7")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas por tabla")
+    parser.add_argument("--batch", type=int, default=2000, help="Filas por transacción")
+    parser.add_argument("--with-id-index", action="store_true", help="Añadir también el índice redundante sobre id")
+    parser.add_argument("--keep", action="store_true", help="No eliminar las tablas al terminar")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url)
+    with engine.begin() as conn:
+        try:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgstattuple"))
+        except Exception:
+            print("⚠️  pgstattuple no disponible: se omite la densidad de hojas")
+
+    results = []
+    for label, generator in GENERATORS.items():
+        print(f"Insertando {args.rows:,} filas con {label}...")
+        results.append(run(engine, label, generator, args.rows, args.batch, args.with_id_index))
+
+    print(f"\nFilas: {args.rows:,}   Lote: {args.batch}   Índice redundante: {'sí' if args.with_id_index else 'no'}")
+    print("-" * 72)
+    print(f"{'generador':<10} {'filas/s':>12} {'PK (MB)':>10} {'ix_id (MB)':>11} {'densidad hojas':>15}")
+    for r in results:
+        density = f"{r['leaf_density']:.1f}%" if r["leaf_density"] is not None else "n/d"
+        print(
+            f"{r['label']:<10} {r['rows_per_sec']:>12,.0f} {r['pk_mb']:>10.1f} "
+            f"{r['extra_mb']:>11.1f} {density:>15}"
+        )
+
+    if not args.keep:
+        with engine.begin() as conn:
+            for r in results:
+                conn.execute(text(f"DROP TABLE IF EXISTS {r['table']}"))
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
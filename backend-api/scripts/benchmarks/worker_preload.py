@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: workers con y sin precarga (preload-and-fork)
+========================================================
+
+Arranca `python -m app.launcher` con --workers N, primero con precarga y luego
+con --no-preload, y para cada modo informa:
+
+    - tiempo hasta que cada worker acepta conexiones
+    - RSS, PSS y memoria privada (USS) por worker tras calentar con peticiones
+    - PSS total (memoria real del conjunto, compartida repartida entre procesos)
+
+Solo Linux (lee /proc/<pid>/smaps_rollup).
+
+Uso:
+    python scripts/benchmarks/worker_preload.py
+    python scripts/benchmarks/worker_preload.py --workers 8 --requests 200
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.launcher import memory_usage
+
+WARM_PATHS = ("/health", "/openapi.json", "/api/v1/admin/system/db-pool")
+
+
+def run_mode(preload: bool, workers: int, port: int, requests: int, timeout: float) -> dict:
+    command = [
+        sys.executable, "-m", "app.launcher",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--json-events",
+    ]
+    if not preload:
+        command.append("--no-preload")
+
+    process = subprocess.Popen(command, cwd=backend_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    ready = {}
+    preloaded = None
+    deadline = time.monotonic() + timeout
+    try:
+        while len(ready) < workers and time.monotonic() < deadline:
+            line = process.stdout.readline()
+            if not line:
+                break
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if event.get("event") == "preloaded":
+                preloaded = event
+            elif event.get("event") == "worker_ready":
+                ready[event["pid"]] = event
+        if len(ready) < workers:
+            raise RuntimeError(f"Solo {len(ready)}/{workers} workers listos en {timeout:.0f}s")
+
+        # Tráfico repartido entre workers para tocar el código de las rutas
+        for i in range(requests):
+            path = WARM_PATHS[i % len(WARM_PATHS)]
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5).read()
+            except Exception:
+                pass
+        time.sleep(0.5)
+
+        return {
+            "preload": preload,
+            "preloaded": preloaded,
+            "workers": [
+                {"pid": pid, "seconds": event["seconds"], **memory_usage(pid)}
+                for pid, event in sorted(ready.items(), key=lambda item: item[1]["worker"])
+            ],
+            "parent": memory_usage(process.pid),
+        }
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=35)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def report(result: dict) -> None:
+    mode = "con precarga" if result["preload"] else "sin precarga"
+    workers = result["workers"]
+    print(f"\n{mode}")
+    print("-" * 72)
+    if result["preloaded"]:
+        print(f"  precarga en el padre: {result['preloaded']['seconds']:.2f}s")
+    print(f"  {'pid':>7} {'listo (s)':>10} {'RSS MB':>9} {'PSS MB':>9} {'USS MB':>9}")
+    for worker in workers:
+        print(
+            f"  {worker['pid']:>7} {worker['seconds']:>10.2f} {worker.get('rss_mb', 0):>9.1f} "
+            f"{worker.get('pss_mb', 0):>9.1f} {worker.get('uss_mb', 0):>9.1f}"
+        )
+    total_pss = sum(worker.get("pss_mb", 0) for worker in workers) + result["parent"].get("pss_mb", 0)
+    print(f"  último worker listo: {max(worker['seconds'] for worker in workers):.2f}s")
+    print(f"  PSS total (padre + workers): {total_pss:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria y tiempo hasta listo: precarga vs sin precarga")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--requests", type=int, default=100, help="Peticiones de calentamiento antes de medir")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    for preload in (True, False):
+        report(run_mode(preload, args.workers, args.port, args.requests, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
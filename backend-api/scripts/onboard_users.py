@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Alta masiva de usuarios desde CSV o JSON
+========================================
+
+Importa estudiantes, profesores y personal desde un archivo:
+
+    CSV     con cabecera: email,username,password,full_name,user_type,employee_role,...
+    JSON    array de objetos con las mismas claves
+    JSONL   un objeto por línea
+
+El archivo se lee en streaming y se procesa por lotes de --batch-size:
+validación, resolución de user_type/employee_role por código (caché de
+catálogos), hashing bcrypt en un pool de --workers procesos e INSERT
+multi-fila con ON CONFLICT DO NOTHING (ver
+app.services.users.onboarding_service). Los errores se informan por fila y
+no detienen la importación; con --errors se guardan en un CSV.
+
+Las filas sin contraseña se crean sin contraseña utilizable: el usuario
+debe fijarla con el flujo de recuperación.
+
+Uso:
+    python scripts/onboard_users.py alumnos.csv --user-type STUDENT
+    python scripts/onboard_users.py personal.json --workers 8 --errors errores.csv
+    python scripts/onboard_users.py alumnos.csv --user-type STUDENT --dry-run
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+# Add the backend-api directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.users.onboarding_service import OnboardingReport, onboard_users, read_records
+
+
+def detect_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".json":
+        return "json"
+    return "csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alta masiva de usuarios desde CSV o JSON")
+    parser.add_argument("path", type=Path, help="Archivo a importar")
+    parser.add_argument("--format", choices=["csv", "json", "jsonl"], help="Por defecto según la extensión")
+    parser.add_argument("--user-type", help="Código de UserType para filas sin user_type")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Filas por INSERT")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos de hashing (por defecto = CPUs)")
+    parser.add_argument("--errors", type=Path, help="CSV donde guardar las filas con error")
+    parser.add_argument("--dry-run", action="store_true", help="Valida y hashea sin insertar")
+    args = parser.parse_args()
+
+    file_format = args.format or detect_format(args.path)
+    print(f"📥 Importando {args.path} ({file_format}), lotes de {args.batch_size}"
+          + (" — simulación, no se inserta nada" if args.dry_run else ""))
+
+    def progress(report: OnboardingReport) -> None:
+        rate = report.created / report.elapsed if report.elapsed else 0
+        print(f"   ⏳ {report.processed} leídas, {report.created} creadas, {report.failed} con error ({rate:.0f}/s)")
+
+    with open(args.path, newline="", encoding="utf-8-sig") as stream:
+        report = onboard_users(
+            read_records(stream, file_format),
+            batch_size=args.batch_size,
+            workers=args.workers,
+            default_user_type=args.user_type,
+            dry_run=args.dry_run,
+            progress=progress,
+        )
+
+    print(f"✅ {report.created} usuarios {'válidos' if args.dry_run else 'creados'} de {report.processed} en {report.elapsed:.1f}s")
+    if report.errors:
+        print(f"⚠️  {report.failed} filas con error")
+        for error in report.errors[:10]:
+            print(f"   ❌ fila {error.row} ({error.email or error.username or '?'}): {error.error}")
+        if report.failed > 10:
+            print(f"   … y {report.failed - 10} más")
+        if args.errors:
+            with open(args.errors, "w", newline="", encoding="utf-8") as out:
+                writer = csv.writer(out)
+                writer.writerow(["row", "email", "username", "error"])
+                for error in report.errors:
+                    writer.writerow([error.row, error.email, error.username, error.error])
+            print(f"   📄 Errores guardados en {args.errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Write-behind activity buffer: the batched UPDATE ... FROM (VALUES ...) against
+sqlite, and against Postgres when TEST_POSTGRES_URL is set
+"""
+
+from datetime import datetime, timedelta, timezone
+import os
+import uuid
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, bindparam, create_engine, event, insert, select, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.expression import Values
+
+import app.database.connection as connection
+from app.database.activity_buffer import ActivityBuffer
+from app.models.user_management.user import User
+from app.models.user_management.user_device import UserDevice
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@compiles(Values, "sqlite")
+def _values_on_sqlite(element, compiler, **kw):
+    # sqlite has no column list on a VALUES alias: the same rows as a UNION ALL
+    rows = " UNION ALL ".join(
+        "SELECT " + ", ".join(
+            f"{compiler.process(bindparam(None, value, type_=column.type), **kw)} AS {column.name}"
+            for column, value in zip(element.columns, row)
+        )
+        for data in element._data
+        for row in data
+    )
+    return f"({rows}) AS {element.name}"
+
+
+def _greatest(*values):
+    # Postgres greatest() ignores NULLs
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def bare_tables():
+    """users and user_devices with the real columns but no foreign keys to the rest of the schema"""
+    metadata = MetaData()
+    return {
+        table.name: Table(table.name, metadata, *(Column(column.name, column.type, primary_key=column.primary_key) for column in table.c))
+        for table in (User.__table__, UserDevice.__table__)
+    }
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def database(request, monkeypatch):
+    """Engine holding bare users / user_devices tables, installed as the primary"""
+    tables = bare_tables()
+    if request.param == "sqlite":
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", lambda dbapi, record: dbapi.create_function("greatest", -1, _greatest))
+        schema = None
+    else:
+        url = os.environ.get("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        engine = create_engine(url)
+        schema = f"test_activity_{uuid.uuid4().hex[:8]}"
+        with engine.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+        event.listen(engine, "connect", lambda dbapi, record: dbapi.cursor().execute(f'SET search_path TO "{schema}"'))
+        engine.dispose()
+    next(iter(tables.values())).metadata.create_all(engine)
+    monkeypatch.setattr(connection, "engine", engine)
+    yield engine, tables
+    if schema is not None:
+        engine.dispose()
+        with create_engine(os.environ["TEST_POSTGRES_URL"]).begin() as conn:
+            conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+@pytest.fixture
+def buffer():
+    # No flusher thread: the tests flush by hand
+    activity = ActivityBuffer(interval=3600, batch_size=2, max_pending=1000)
+    activity._pid = os.getpid()
+    return activity
+
+
+def utc(value):
+    # sqlite hands back naive UTC timestamps
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def add_user(conn, users, last_login=None, login_count=None):
+    user_id = uuid.uuid4()
+    conn.execute(insert(users).values(
+        id=user_id, email=f"{user_id.hex}@example.com", username=user_id.hex, hashed_password="x",
+        user_type_id=uuid.uuid4(), last_login=last_login, login_count=login_count,
+        created_at=NOW - timedelta(days=30), updated_at=NOW - timedelta(days=30),
+    ))
+    return user_id
+
+
+def read(engine, table, key):
+    with engine.connect() as conn:
+        return conn.execute(select(table).where(table.c.id == key)).one()
+
+
+def test_flush_keeps_the_latest_time_and_adds_the_logins(database, buffer):
+    engine, tables = database
+    users = tables["users"]
+    with engine.begin() as conn:
+        regular = add_user(conn, users, last_login=NOW - timedelta(days=1), login_count=3)
+        first_login = add_user(conn, users)
+        ahead = add_user(conn, users, last_login=NOW + timedelta(hours=1), login_count=1)
+
+    buffer.record_login(regular, NOW - timedelta(hours=2))
+    buffer.record_login(regular, NOW)
+    buffer.record_login(regular, NOW - timedelta(days=2))
+    buffer.record_login(first_login, NOW)
+    # An older login flushed late must not move last_login backwards
+    buffer.record_login(ahead, NOW)
+
+    assert buffer.flush() == 3
+
+    row = read(engine, users, regular)
+    assert (utc(row.last_login), row.login_count) == (NOW, 6)
+    row = read(engine, users, first_login)
+    assert (utc(row.last_login), row.login_count) == (NOW, 1)
+    row = read(engine, users, ahead)
+    assert (utc(row.last_login), row.login_count) == (NOW + timedelta(hours=1), 2)
+    # Bookkeeping is not an edit of the row
+    assert utc(row.updated_at) == NOW - timedelta(days=30)
+    assert buffer.snapshot()["pending_users"] == 0 and buffer.rows_flushed == 3
+
+
+def test_device_activity_counts_only_logins(database, buffer):
+    engine, tables = database
+    devices = tables["user_devices"]
+    device_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(devices).values(
+            id=device_id, user_id=uuid.uuid4(), last_seen=NOW - timedelta(days=1), login_count=4,
+            created_at=NOW, updated_at=NOW,
+        ))
+
+    buffer.record_device_seen(device_id, NOW - timedelta(minutes=5))
+    buffer.record_device_seen(device_id, NOW, login=True)
+    buffer.record_device_seen(device_id, NOW - timedelta(minutes=1))
+
+    assert buffer.flush() == 1
+    row = read(engine, devices, device_id)
+    assert (utc(row.last_seen), row.login_count) == (NOW, 5)
+
+
+def test_unknown_ids_are_skipped(database, buffer):
+    engine, tables = database
+    with engine.begin() as conn:
+        known = add_user(conn, tables["users"], login_count=0)
+
+    buffer.record_login(uuid.uuid4(), NOW)
+    buffer.record_login(known, NOW)
+
+    assert buffer.flush() == 1
+
+
+def test_failed_flush_is_merged_with_newer_activity(database, buffer, monkeypatch):
+    engine, tables = database
+    users = tables["users"]
+    with engine.begin() as conn:
+        user_id = add_user(conn, users, last_login=NOW - timedelta(days=1), login_count=10)
+
+    buffer.record_login(user_id, NOW - timedelta(minutes=10))
+    buffer.record_login(user_id, NOW - timedelta(minutes=20))
+    # A database without the tables: the UPDATE fails
+    monkeypatch.setattr(connection, "engine", create_engine("sqlite://"))
+
+    assert buffer.flush() == 0
+    assert buffer.last_error and buffer.snapshot()["pending_users"] == 1
+
+    buffer.record_login(user_id, NOW)
+    monkeypatch.setattr(connection, "engine", engine)
+
+    assert buffer.flush() == 1
+    row = read(engine, users, user_id)
+    assert (utc(row.last_login), row.login_count) == (NOW, 13)
+    assert buffer.last_error is None
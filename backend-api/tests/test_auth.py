@@ -0,0 +1,249 @@
+"""
+Login, registration and logout against a scripted session (no database)
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+import app.api.v1.auth.login as login_module
+import app.api.v1.auth.register as register_module
+from app.database.connection import get_async_db
+from app.core.principals import principal_cache
+from app.main import app
+from app.models.user_management.user import User
+from app.services.auth.security_service import _hash, create_access_token, hash_rounds, password_hasher
+from tests.conftest import make_principal
+
+PASSWORD = "correct horse battery"
+
+
+class Result:
+    def __init__(self, row=None, scalar=None):
+        self.row = row
+        self.scalar = scalar
+
+    def first(self):
+        return self.row
+
+    def scalar_one(self):
+        return self.scalar
+
+
+class ScriptedSession:
+    """Returns the given results in order and records what the endpoint did"""
+
+    def __init__(self, *results, commit_error=None):
+        self.results = list(results)
+        self.statements = []
+        self.added = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.commit_error = commit_error
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return self.results.pop(0)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        if self.commit_error is not None:
+            raise self.commit_error
+        self.commits += 1
+        for obj in self.added:
+            obj.id = obj.id or uuid.uuid4()
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def session():
+    def use(*results, **kwargs) -> ScriptedSession:
+        db = ScriptedSession(*results, **kwargs)
+        app.dependency_overrides[get_async_db] = lambda: db
+        return db
+    yield use
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def side_effects(monkeypatch):
+    """Record address failures, stamp bumps and buffered activity instead of touching Redis or the database"""
+    calls = SimpleNamespace(failures=[], bumps=[], logins=[])
+
+    async def record_failure(address):
+        calls.failures.append(address)
+
+    async def no_device(*args):
+        return None
+
+    monkeypatch.setattr(login_module, "record_failure", record_failure)
+    monkeypatch.setattr(login_module, "bump_security_stamp", lambda *ids: calls.bumps.extend(ids))
+    monkeypatch.setattr(login_module, "resolve_device", no_device)
+    monkeypatch.setattr(login_module.activity_buffer, "record_login", lambda user_id, at=None: calls.logins.append(user_id))
+    return calls
+
+
+def user_row(password=PASSWORD, rounds=None, failed=0, locked_until=None, is_active=True):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        hashed_password=_hash(password, rounds or password_hasher.rounds),
+        is_active=is_active,
+        locked_until=locked_until,
+        failed_login_attempts=failed,
+    )
+
+
+def post_login(client, username="ana", password=PASSWORD):
+    return client.post("/api/v1/auth/login", data={"username": username, "password": password})
+
+
+# ----------------------------------------------------------------------
+# Login
+# ----------------------------------------------------------------------
+
+def test_login_success_buffers_activity_and_writes_nothing(client, session, side_effects):
+    row = user_row()
+    db = session(Result(row))
+
+    response = post_login(client)
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert len(db.statements) == 1 and db.commits == 0
+    assert side_effects.logins == [row.id]
+
+
+def test_login_unknown_user_verifies_against_the_dummy_hash(client, session, side_effects, monkeypatch):
+    verified = []
+    verify = password_hasher.verify
+
+    async def spy(password, hashed):
+        verified.append(hashed)
+        return await verify(password, hashed)
+
+    monkeypatch.setattr(password_hasher, "verify", spy)
+    session(Result(None))
+
+    response = post_login(client, username="nobody")
+
+    assert response.status_code == 401
+    assert verified == [login_module.dummy_hash()]
+    assert len(side_effects.failures) == 1
+
+
+def test_wrong_password_counts_the_attempt(client, session, side_effects):
+    db = session(Result(user_row(failed=1)), Result(scalar=None))
+
+    response = post_login(client, password="wrong password")
+
+    assert response.status_code == 401
+    assert db.commits == 1
+    assert "failed_login_attempts" in str(db.statements[1])
+    assert side_effects.bumps == [] and len(side_effects.failures) == 1
+
+
+def test_wrong_password_that_locks_the_account_bumps_the_stamp(client, session, side_effects):
+    row = user_row(failed=4)
+    session(Result(row), Result(scalar=datetime.now(timezone.utc) + timedelta(minutes=15)))
+
+    response = post_login(client, password="wrong password")
+
+    assert response.status_code == 401
+    assert side_effects.bumps == [row.id]
+
+
+def test_locked_account_is_refused_even_with_the_right_password(client, session, side_effects):
+    session(Result(user_row(locked_until=datetime.now(timezone.utc) + timedelta(minutes=5))))
+
+    response = post_login(client)
+
+    assert response.status_code == 403
+    assert side_effects.logins == []
+
+
+def test_login_rehashes_a_hash_made_with_other_rounds(client, session, side_effects):
+    db = session(Result(user_row(rounds=password_hasher.rounds + 1, failed=2)), Result())
+
+    response = post_login(client)
+
+    assert response.status_code == 200
+    update = db.statements[1].compile().params
+    assert update["failed_login_attempts"] == 0
+    assert hash_rounds(update["hashed_password"]) == password_hasher.rounds
+
+
+# ----------------------------------------------------------------------
+# Registration
+# ----------------------------------------------------------------------
+
+class PlainUser:
+    """Stands in for the User model, so the scripted session needs no mapper configuration"""
+    email = User.__table__.c.email
+    username = User.__table__.c.username
+
+    def __init__(self, **values):
+        self.id = None
+        self.__dict__.update(values)
+
+
+@pytest.fixture
+def client_type(monkeypatch):
+    monkeypatch.setattr(register_module, "lookup", lambda catalog, code: SimpleNamespace(id=uuid.uuid4()))
+    monkeypatch.setattr(register_module, "User", PlainUser)
+
+
+def post_register(client, username="nuevo"):
+    return client.post("/api/v1/auth/register", json={
+        "email": f"{username}@example.com", "username": username, "password": PASSWORD,
+    })
+
+
+def test_register_creates_the_account(client, session, client_type):
+    db = session(Result(None))
+
+    response = post_register(client)
+
+    assert response.status_code == 201
+    assert response.json()["username"] == "nuevo"
+    assert db.commits == 1
+    assert hash_rounds(db.added[0].hashed_password) == password_hasher.rounds
+
+
+def test_register_taken_email_is_a_conflict(client, session, client_type):
+    session(Result(SimpleNamespace(email="nuevo@example.com", username="otro")))
+
+    response = post_register(client)
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "email already registered"
+
+
+def test_register_concurrent_duplicate_is_a_conflict(client, session, client_type):
+    db = session(Result(None), commit_error=IntegrityError("INSERT INTO users", {}, Exception("duplicate key")))
+
+    response = post_register(client)
+
+    assert response.status_code == 409
+    assert db.rollbacks == 1
+
+
+# ----------------------------------------------------------------------
+# Logout
+# ----------------------------------------------------------------------
+
+def test_logout_revokes_the_token(client):
+    # Superusers skip the catalog version check, which would load UserType
+    principal = make_principal(is_superuser=True)
+    principal_cache.put(principal)
+    token, _ = create_access_token(principal.id, 0)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 204
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 401
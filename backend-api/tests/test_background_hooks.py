@@ -0,0 +1,97 @@
+"""
+Commit hooks: Redis round trips run on the background writer, not the caller's thread
+"""
+
+import threading
+import uuid
+
+import pytest
+
+import app.config.redis as redis_config
+import app.core.catalogs as catalogs
+import app.core.principals as principals
+import app.core.runtime_config as runtime_config
+from app.config.redis import flush_background
+
+
+class RecordingRedis:
+    def __init__(self):
+        self.calls = []
+        self.counters = {}
+
+    def _record(self, command, key):
+        self.calls.append((command, key, threading.current_thread().name))
+
+    def incr(self, key):
+        self._record("incr", key)
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+    def publish(self, channel, message):
+        self._record("publish", channel)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = RecordingRedis()
+    for module in (catalogs, principals, runtime_config):
+        monkeypatch.setattr(module, "get_sync_redis", lambda: client)
+    yield client
+    flush_background()
+
+
+def writer_threads(client):
+    return {thread for _, _, thread in client.calls}
+
+
+def test_catalog_bump_from_a_hook_drops_locally_and_publishes_in_the_background(redis_client):
+    cache = catalogs.CatalogCache(maxsize=8, ttl=60)
+
+    cache.bump(["UserType"], background=True)
+    assert cache._local_versions["UserType"] == 1
+    flush_background()
+
+    assert [call[:2] for call in redis_client.calls] == [
+        ("incr", "catalog:UserType:version"), ("publish", catalogs.INVALIDATION_CHANNEL),
+    ]
+    assert threading.current_thread().name not in writer_threads(redis_client)
+
+
+def test_security_stamp_bump_from_a_hook_runs_in_the_background(redis_client):
+    cache = principals.PrincipalCache(maxsize=8, ttl=60)
+    user_id = uuid.uuid4()
+
+    cache.bump([user_id], background=True)
+    assert cache._local_stamps[user_id] == 1
+    flush_background()
+
+    assert [call[:2] for call in redis_client.calls] == [("incr", principals._stamp_key(user_id))]
+    assert threading.current_thread().name not in writer_threads(redis_client)
+
+
+def test_configuration_commit_reloads_in_the_background(redis_client, monkeypatch):
+    reloaded = []
+    monkeypatch.setattr(runtime_config, "reload_config", lambda: reloaded.append(threading.current_thread().name))
+    session = type("FakeSession", (), {"info": {runtime_config._SESSION_KEY: True}})()
+
+    runtime_config._reload_after_commit(session)
+    flush_background()
+
+    assert [call[:2] for call in redis_client.calls] == [
+        ("incr", runtime_config.VERSION_KEY), ("publish", runtime_config.RELOAD_CHANNEL),
+    ]
+    assert reloaded and reloaded[0] != threading.current_thread().name
+
+
+def test_background_errors_are_logged_and_later_writes_still_run(caplog):
+    ran = []
+
+    def broken():
+        raise RuntimeError("redis went away")
+
+    redis_config.submit_background(broken)
+    redis_config.submit_background(ran.append, 1)
+    flush_background()
+
+    assert ran == [1]
+    assert "broken" in caplog.text
@@ -0,0 +1,94 @@
+"""
+Catalog cache: every registered catalog resolves to a model and loads
+"""
+
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+from sqlalchemy import JSON, create_engine, insert
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+import app.database.connection as connection
+from app.core.catalogs import CATALOGS, CatalogCache, _table
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+def sample_value(table, column, ids):
+    for foreign_key in column.foreign_keys:
+        return ids[foreign_key.column.table.name]
+    if isinstance(column.type, JSON):
+        return {}
+    python_type = column.type.python_type
+    if python_type is str:
+        return f"{table.name}-{column.name}"[:column.type.length or 255]
+    if python_type is bool:
+        return True
+    if python_type is int:
+        return 1
+    if python_type is datetime:
+        return datetime.now(timezone.utc)
+    if python_type is uuid.UUID:
+        return uuid.uuid4()
+    return None
+
+
+@pytest.fixture
+def catalog_database(monkeypatch):
+    """sqlite database holding one row per catalog table; returns {table name: row id}"""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    tables = [_table(name) for name in CATALOGS]
+    tables[0].metadata.create_all(engine, tables=tables)
+    ids = {}
+    with engine.begin() as conn:
+        for table in tables:
+            ids[table.name] = uuid.uuid4()
+            values = {column.name: sample_value(table, column, ids) for column in table.c if column.name != "id"}
+            conn.execute(insert(table).values(id=ids[table.name], **values))
+    monkeypatch.setattr(connection, "engine", engine)
+    return ids
+
+
+def test_every_catalog_resolves_to_a_table():
+    for name in CATALOGS:
+        assert _table(name) is not None, name
+
+
+def test_every_catalog_loads(catalog_database):
+    cache = CatalogCache(maxsize=len(CATALOGS), ttl=60)
+    for name, spec in CATALOGS.items():
+        catalog = cache.get(name)
+        assert len(catalog.rows) == 1, name
+        row = catalog.rows[0]
+        assert catalog.get_id(row.id) is row
+        key = getattr(row, spec.key[0]) if len(spec.key) == 1 else tuple(getattr(row, column) for column in spec.key)
+        assert catalog.get(key) is row
+
+
+def test_bump_reloads_from_the_database(catalog_database):
+    cache = CatalogCache(maxsize=4, ttl=60)
+    before = cache.get("UserType")
+    cache.bump(["UserType"])
+    after = cache.get("UserType")
+    assert after is not before
+    assert after.version != before.version
+
+
+def test_revalidate_drops_snapshots_changed_since_they_were_loaded(catalog_database):
+    # What a worker does with the snapshots it inherited from the preloading launcher
+    cache = CatalogCache(maxsize=4, ttl=60)
+    cache.get("UserType")
+    cache.get("EmployeeRole")
+    assert cache.revalidate() == 0
+
+    with cache._lock:
+        cache._local_versions["UserType"] = cache._local_versions.get("UserType", 0) + 1
+
+    assert cache.revalidate() == 1
+    assert set(cache._entries) == {"EmployeeRole"}
@@ -0,0 +1,41 @@
+"""
+Engine construction for the configured database URLs
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Settings
+from app.database.connection import async_pool_options
+
+
+def async_engine_for(database_url: str):
+    async_url = Settings(database_url=database_url, secret_key="x").async_database_url
+    return create_async_engine(async_url, pool_pre_ping=True, **async_pool_options(async_url))
+
+
+@pytest.mark.parametrize("url", ["sqlite:///:memory:", "sqlite:///./medialab.db"])
+def test_sqlite_urls_build_an_aiosqlite_engine(url):
+    # Connects to nothing; pool size arguments would fail right here
+    engine = async_engine_for(url)
+    assert engine.dialect.driver == "aiosqlite"
+
+
+def test_in_memory_sqlite_async_engine_runs_queries():
+    async def select_one():
+        engine = async_engine_for("sqlite:///:memory:")
+        try:
+            async with engine.connect() as conn:
+                return (await conn.execute(text("SELECT 1"))).scalar_one()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(select_one()) == 1
+
+
+def test_postgres_async_engine_is_sized_from_settings():
+    options = async_pool_options("postgresql+asyncpg://user@db/medialab")
+    assert set(options) == {"pool_size", "max_overflow"}
@@ -0,0 +1,75 @@
+"""
+Device fingerprints: user agent normalization and backfill assignment
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import uuid
+
+from app.services.users.device_service import _assign, fingerprint, fingerprint_row, parse_user_agent
+
+CHROME_WINDOWS = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{}.0.0.0 Safari/537.36"
+SAFARI_IPHONE = "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1"
+EDGE_WINDOWS = CHROME_WINDOWS.format(120) + " Edg/120.0.2210.61"
+
+
+def test_parse_user_agent():
+    parsed = parse_user_agent(SAFARI_IPHONE)
+    assert (parsed.device_type, parsed.os, parsed.os_version, parsed.browser) == ("mobile", "ios", "17", "safari")
+    parsed = parse_user_agent(EDGE_WINDOWS)
+    assert (parsed.device_type, parsed.os, parsed.os_version, parsed.browser) == ("desktop", "windows", "10", "edge")
+    assert parse_user_agent("  ") is None
+
+
+def test_fingerprint_ignores_browser_version_and_whitespace():
+    assert fingerprint(CHROME_WINDOWS.format(119)) == fingerprint(CHROME_WINDOWS.format(120))
+    assert fingerprint(f"  {CHROME_WINDOWS.format(120)} ") == fingerprint(CHROME_WINDOWS.format(120))
+    assert fingerprint(EDGE_WINDOWS) != fingerprint(CHROME_WINDOWS.format(120))
+    assert fingerprint(None) is None
+
+
+def test_fingerprint_row_from_stored_blobs_matches_the_user_agent():
+    row = SimpleNamespace(
+        user_agent=None, device_type="mobile",
+        browser_info={"name": "Safari", "version": "17.1"}, os_info={"name": "iOS", "version": "17.1"},
+    )
+    assert fingerprint_row(row) == fingerprint(SAFARI_IPHONE)
+
+
+def device(user_id, fingerprint=None, *, trusted=False, blocked=False, seen_days_ago=0, user_agent=SAFARI_IPHONE):
+    return SimpleNamespace(
+        id=uuid.uuid4(), user_id=user_id, fingerprint=fingerprint, user_agent=user_agent,
+        browser_info=None, os_info=None, device_type=None,
+        is_trusted=trusted, last_seen=datetime.now(timezone.utc) - timedelta(days=seen_days_ago),
+        is_blocked=blocked, blocked_reason="stolen" if blocked else None,
+        blocked_at=datetime.now(timezone.utc) if blocked else None,
+    )
+
+
+def test_assign_prefers_blocked_then_trusted_then_recent():
+    user_id = uuid.uuid4()
+    trusted = device(user_id, trusted=True)
+    blocked = device(user_id, blocked=True, seen_days_ago=30)
+    recent = device(user_id)
+
+    assigned, blocks = _assign([trusted, recent, blocked])
+
+    assert assigned == [(blocked.id, fingerprint(SAFARI_IPHONE))]
+    assert blocks == []
+
+
+def test_assign_carries_a_block_to_the_row_already_holding_the_fingerprint():
+    user_id = uuid.uuid4()
+    holder = device(user_id, fingerprint(SAFARI_IPHONE), trusted=True)
+    blocked = device(user_id, blocked=True)
+
+    assigned, blocks = _assign([holder, blocked])
+
+    assert assigned == []
+    assert blocks == [(holder.id, "stolen", blocked.blocked_at)]
+
+
+def test_assign_keeps_users_apart():
+    first, second = device(uuid.uuid4()), device(uuid.uuid4())
+    assigned, _ = _assign([first, second])
+    assert {device_id for device_id, _ in assigned} == {first.id, second.id}
@@ -0,0 +1,84 @@
+"""
+Admin exports: the required since/until window and the query it produces
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.api.v1.admin.reports as reports
+from app.core.config import settings
+from app.core.permissions import Permission
+
+
+EXPORT_URL = "/api/v1/admin/reports/exports/analytics_events"
+WINDOW = {"since": "2026-09-01T00:00:00+00:00", "until": "2026-10-01T00:00:00+00:00"}
+
+
+class Session:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    """Statements the export streams, with no database behind them"""
+    captured = []
+
+    class Repository:
+        def __init__(self, db, model):
+            pass
+
+        def stream(self, stmt, chunk_size):
+            captured.append(stmt)
+            return iter(())
+
+    monkeypatch.setattr(reports, "open_read_session", lambda request: Session())
+    monkeypatch.setattr(reports, "BaseRepository", Repository)
+    return captured
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"since": WINDOW["since"]},
+    {"until": WINDOW["until"]},
+    {"since": WINDOW["until"], "until": WINDOW["since"]},
+    {"since": "2026-01-01T00:00:00+00:00", "until": "2026-10-01T00:00:00+00:00"},
+    {"since": "2026-10-01T00:00:00", "until": WINDOW["since"]},
+])
+def test_export_needs_a_bounded_window(client, login_as, statements, params):
+    login_as(Permission.REPORTS_EXPORT)
+
+    response = client.get(EXPORT_URL, params=params)
+
+    assert response.status_code == 422
+    assert statements == []
+
+
+def test_export_window_limit_comes_from_settings(client, login_as, statements, monkeypatch):
+    login_as(Permission.REPORTS_EXPORT)
+    monkeypatch.setattr(settings, "export_max_window_days", 400)
+
+    response = client.get(EXPORT_URL, params={"since": "2026-01-01T00:00:00+00:00", "until": WINDOW["until"]})
+
+    assert response.status_code == 200
+
+
+def test_naive_bounds_are_read_as_utc(client, login_as, statements):
+    login_as(Permission.REPORTS_EXPORT)
+
+    response = client.get(EXPORT_URL, params={"since": "2026-09-01T00:00:00", "until": WINDOW["until"]})
+
+    assert response.status_code == 200
+    assert statements[0].compile().params["event_timestamp_1"].tzinfo is not None
+
+
+def test_export_query_is_windowed_and_follows_the_primary_key(client, login_as, statements):
+    login_as(Permission.REPORTS_EXPORT)
+
+    response = client.get(EXPORT_URL, params=WINDOW)
+
+    assert response.status_code == 200
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "analytics_events.event_timestamp >= %(event_timestamp_1)s" in sql
+    assert "analytics_events.event_timestamp < %(event_timestamp_2)s" in sql
+    assert sql.endswith("ORDER BY analytics_events.event_timestamp, analytics_events.id")
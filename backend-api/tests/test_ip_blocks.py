@@ -0,0 +1,144 @@
+"""
+In-memory IP blocklist, brute-force window and client address resolution
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import asyncio
+import ipaddress
+import random
+
+from app.core import ip_blocks
+from app.core.config import settings
+from app.core.ip_blocks import Blocklist, CidrTrie
+from app.core.middleware import client_ip
+
+NOW = datetime.now(timezone.utc)
+
+
+def block(id, ip_range=None, ip_address=None, expires_at=None, is_active=True, updated_at=NOW):
+    return SimpleNamespace(
+        id=id, ip_range=ip_range, ip_address=ip_address or (ip_range or "").split("/")[0],
+        expires_at=expires_at, is_active=is_active, updated_at=updated_at,
+    )
+
+
+def prefix(network: str):
+    network = ipaddress.ip_network(network)
+    return int(network.network_address) >> (network.max_prefixlen - network.prefixlen), network.prefixlen
+
+
+class TestCidrTrie:
+    def test_nested_prefixes_match_the_covering_block(self):
+        trie = CidrTrie(32)
+        trie.insert(*prefix("10.0.0.0/8"), "wide", float("inf"))
+        trie.insert(*prefix("10.1.2.0/24"), "narrow", float("inf"))
+        assert trie.match(int(ipaddress.ip_address("10.9.9.9")), 0) == "wide"
+        assert trie.match(int(ipaddress.ip_address("10.1.2.3")), 0) in ("wide", "narrow")
+        assert trie.match(int(ipaddress.ip_address("11.0.0.1")), 0) is None
+
+    def test_remove_keeps_other_blocks(self):
+        trie = CidrTrie(32)
+        trie.insert(*prefix("10.0.0.0/8"), "wide", float("inf"))
+        trie.insert(*prefix("10.1.2.0/24"), "narrow", float("inf"))
+        trie.remove(*prefix("10.0.0.0/8"), "wide")
+        assert trie.match(int(ipaddress.ip_address("10.9.9.9")), 0) is None
+        assert trie.match(int(ipaddress.ip_address("10.1.2.3")), 0) == "narrow"
+
+    def test_expired_blocks_do_not_match(self):
+        trie = CidrTrie(32)
+        trie.insert(*prefix("192.0.2.0/24"), "old", 100.0)
+        assert trie.match(int(ipaddress.ip_address("192.0.2.1")), 50.0) == "old"
+        assert trie.match(int(ipaddress.ip_address("192.0.2.1")), 150.0) is None
+
+    def test_agrees_with_linear_scan(self):
+        rng = random.Random(7)
+        trie = CidrTrie(32)
+        networks = []
+        for index in range(2000):
+            length = rng.choice([8, 12, 16, 20, 24, 28, 32])
+            network = ipaddress.IPv4Network((rng.getrandbits(32) >> (32 - length) << (32 - length), length))
+            networks.append(network)
+            trie.insert(*prefix(str(network)), index, float("inf"))
+        for _ in range(2000):
+            address = ipaddress.IPv4Address(rng.getrandbits(32)) if rng.random() < 0.5 \
+                else rng.choice(networks).network_address
+            expected = any(address in network for network in networks)
+            assert (trie.match(int(address), 0) is not None) == expected
+
+
+class TestBlocklist:
+    def test_single_address_range_and_ipv6(self):
+        blocklist = Blocklist()
+        blocklist.replace([
+            block(1, ip_address="192.168.1.5"),
+            block(2, ip_range="2001:db8::/32"),
+            block(3, ip_range="10.0.0.0/8"),
+        ])
+        assert blocklist.is_blocked("192.168.1.5") == 1
+        assert blocklist.is_blocked("192.168.1.6") is None
+        assert blocklist.is_blocked("2001:db8::1") == 2
+        assert blocklist.is_blocked("::ffff:10.1.1.1") == 3
+        assert blocklist.is_blocked("not an ip") is None
+
+    def test_inactive_expired_and_unparsable_rows_are_skipped(self):
+        blocklist = Blocklist()
+        blocklist.replace([
+            block(1, ip_range="10.0.0.0/8", is_active=False),
+            block(2, ip_range="172.16.0.0/12", expires_at=NOW - timedelta(minutes=1)),
+            block(3, ip_address="bogus"),
+        ])
+        assert len(blocklist) == 0
+        assert blocklist.is_blocked("10.1.1.1") is None
+
+    def test_apply_updates_and_unblocks(self):
+        blocklist = Blocklist()
+        blocklist.replace([block(1, ip_range="10.0.0.0/8")])
+        blocklist.apply([block(1, ip_range="10.0.0.0/8", is_active=False, updated_at=NOW + timedelta(seconds=5))])
+        assert blocklist.is_blocked("10.1.1.1") is None
+        assert blocklist.watermark == NOW + timedelta(seconds=5)
+
+        blocklist.apply([block(1, ip_range="192.0.2.0/24")])
+        assert blocklist.is_blocked("192.0.2.9") == 1
+        assert blocklist.is_blocked("10.1.1.1") is None
+
+    def test_block_expires_at_lookup_time(self, monkeypatch):
+        blocklist = Blocklist()
+        blocklist.replace([block(1, ip_address="198.51.100.7", expires_at=NOW + timedelta(minutes=5))])
+        assert blocklist.is_blocked("198.51.100.7") == 1
+        later = (NOW + timedelta(minutes=6)).timestamp()
+        monkeypatch.setattr(ip_blocks.time, "time", lambda: later)
+        assert blocklist.is_blocked("198.51.100.7") is None
+
+
+def test_sliding_window_counts_only_recent_failures():
+    async def count(at):
+        return await ip_blocks._count_failure("bruteforce:test:203.0.113.1", at, 5)
+
+    async def scenario():
+        return [await count(at) for at in (0, 1, 2, 6, 7)]
+
+    assert asyncio.run(scenario()) == [1, 2, 3, 2, 2]
+
+
+class TestClientIp:
+    def scope(self, forwarded=None, peer="10.0.0.2"):
+        headers = [(b"x-forwarded-for", value.encode()) for value in forwarded or []]
+        return {"type": "http", "headers": headers, "client": (peer, 1234)}
+
+    def test_header_ignored_by_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "ip_block_forwarded_for_hops", 0)
+        assert client_ip(self.scope(["1.2.3.4"])) == "10.0.0.2"
+
+    def test_rightmost_entry_with_one_proxy(self, monkeypatch):
+        monkeypatch.setattr(settings, "ip_block_forwarded_for_hops", 1)
+        # The client sent "6.6.6.6"; nginx appended the real peer
+        assert client_ip(self.scope(["6.6.6.6, 198.51.100.20"])) == "198.51.100.20"
+
+    def test_hops_count_across_repeated_headers(self, monkeypatch):
+        monkeypatch.setattr(settings, "ip_block_forwarded_for_hops", 2)
+        assert client_ip(self.scope(["6.6.6.6, 198.51.100.20", "10.0.0.9"])) == "198.51.100.20"
+
+    def test_short_header_falls_back_to_peer(self, monkeypatch):
+        monkeypatch.setattr(settings, "ip_block_forwarded_for_hops", 2)
+        assert client_ip(self.scope(["6.6.6.6"])) == "10.0.0.2"
@@ -0,0 +1,205 @@
+"""
+Onboarding: streaming JSON parsing across read chunk boundaries, CSV and
+JSON Lines records, and the import pipeline against sqlite
+"""
+
+from types import SimpleNamespace
+import io
+import json
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+
+import app.services.users.onboarding_service as onboarding_service
+from app.services.auth.security_service import hash_rounds
+from app.services.users.onboarding_service import (
+    UNUSABLE_PASSWORD,
+    UnreadableRecord,
+    _iter_json,
+    onboard_users,
+    read_records,
+    users,
+)
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+RECORDS = [
+    {"email": "ana@example.com", "username": "ana", "first_name": "Ana María", "note": "dice \"hola\"\n"},
+    {"email": "luis@example.com", "username": "luis", "tags": ["a", "b"], "nested": {"x": [1, {"y": None}]}},
+    {"email": "eva@example.com", "username": "eva", "active": True, "score": -12.5e-3, "year": 2026},
+]
+NUMBERS = [0, 7, 123456, -42, 1.5, -0.25, 2e3, 6.02E+23, 1e-7, True, False, None]
+
+# Chunks shorter than most tokens, so every token gets split at every offset
+CHUNK_SIZES = range(1, 40)
+
+
+@pytest.fixture(params=CHUNK_SIZES)
+def chunk_size(request, monkeypatch):
+    monkeypatch.setattr(onboarding_service, "JSON_READ_SIZE", request.param)
+    return request.param
+
+
+def parse(text):
+    return list(_iter_json(io.StringIO(text)))
+
+
+def test_array_items_survive_any_chunk_boundary(chunk_size):
+    assert parse(json.dumps(RECORDS)) == RECORDS
+    assert parse(json.dumps(RECORDS, indent=2)) == RECORDS
+
+
+def test_json_lines_survive_any_chunk_boundary(chunk_size):
+    text = "\n".join(json.dumps(record) for record in RECORDS) + "\n"
+
+    assert parse(text) == RECORDS
+    assert parse(text.rstrip("\n")) == RECORDS
+
+
+def test_numbers_at_the_chunk_edge_are_not_cut(chunk_size):
+    assert parse(json.dumps(NUMBERS)) == NUMBERS
+    assert parse(" ".join(json.dumps(value) for value in NUMBERS)) == NUMBERS
+
+
+def test_empty_inputs(chunk_size):
+    assert parse("") == []
+    assert parse("  \n ") == []
+    assert parse("[]") == []
+    assert parse(" [ ] ") == []
+
+
+def test_truncated_json_is_an_error(chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        parse(json.dumps(RECORDS)[:-3])
+
+
+def test_read_records_numbers_json_records_from_one():
+    stream = io.StringIO(json.dumps(RECORDS))
+
+    assert list(read_records(stream, "json")) == list(enumerate(RECORDS, start=1))
+
+
+def test_read_records_csv_drops_blank_cells_and_strips_values():
+    stream = io.StringIO("email, username ,first_name\n ana@example.com ,ana,\nluis@example.com,luis, Luis \n")
+
+    assert list(read_records(stream, "csv")) == [
+        (1, {"email": "ana@example.com", "username": "ana"}),
+        (2, {"email": "luis@example.com", "username": "luis", "first_name": "Luis"}),
+    ]
+
+
+def test_read_records_rejects_unknown_formats():
+    with pytest.raises(ValueError):
+        list(read_records(io.StringIO(""), "xml"))
+
+
+def test_jsonl_bad_line_is_that_rows_error_and_reading_goes_on():
+    stream = io.StringIO('{"email": "ana@example.com"}\n{"email": bad}\n\n{"email": "eva@example.com"}\n')
+
+    records = list(read_records(stream, "jsonl"))
+
+    assert [number for number, _ in records] == [1, 2, 4]
+    assert records[0][1] == {"email": "ana@example.com"} and records[2][1] == {"email": "eva@example.com"}
+    assert records[1][1] == UnreadableRecord("invalid JSON: Expecting value (column 11)")
+
+
+def test_json_array_syntax_error_ends_the_file_with_an_unreadable_record():
+    stream = io.StringIO('[{"email": "ana@example.com"}, {"email": bad}, {"email": "eva@example.com"}]')
+
+    records = list(read_records(stream, "json"))
+
+    assert records[0] == (1, {"email": "ana@example.com"})
+    assert records[1][0] == 2 and isinstance(records[1][1], UnreadableRecord)
+    assert len(records) == 2
+
+
+def test_oversized_json_value_stops_reading(monkeypatch):
+    monkeypatch.setattr(onboarding_service, "JSON_READ_SIZE", 16)
+    monkeypatch.setattr(onboarding_service, "JSON_MAX_RECORD_SIZE", 64)
+    stream = io.StringIO('[{"email": "ana@example.com"}, {"note": "' + "x" * 1000)
+
+    records = list(read_records(stream, "json"))
+
+    assert isinstance(records[-1][1], UnreadableRecord)
+    assert stream.tell() < 200
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+STUDENT = SimpleNamespace(id=uuid.uuid4())
+
+
+@pytest.fixture
+def users_database(tmp_path, monkeypatch):
+    """sqlite users table holding one existing account; catalog lookups know STUDENT only"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'onboarding.db'}")
+    users.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(users).values(
+            id=uuid.uuid4(), email="taken@example.com", username="taken", hashed_password="x", user_type_id=STUDENT.id,
+        ))
+    monkeypatch.setattr(onboarding_service, "lookup", lambda name, code: STUDENT if (name, code) == ("UserType", "STUDENT") else None)
+    return engine
+
+
+def line(**record):
+    return json.dumps(record) + "\n"
+
+
+def test_onboarding_reports_bad_rows_and_creates_the_rest(users_database):
+    stream = io.StringIO(
+        line(email="ana@example.com", username="ana", password="contraseña segura")
+        + '{"email": bad}\n'
+        + line(email="eva@example.com", username="eva")
+        + line(email="taken@example.com", username="otra")
+        + line(email="ANA@example.com", username="ana2")
+        + line(email="luis@example.com", username="luis", user_type="PROFESSOR")
+        + line(email="no-es-un-email", username="x")
+        + line(email="marta@example.com", username="marta", password="otra contraseña")
+    )
+    batches = []
+
+    report = onboard_users(
+        read_records(stream, "jsonl"),
+        engine=users_database,
+        batch_size=3,
+        workers=1,
+        default_user_type="student",
+        progress=lambda report: batches.append(report.created),
+    )
+
+    assert report.processed == 8
+    assert report.created == 3
+    assert [(error.row, error.error.split(":")[0]) for error in report.errors] == [
+        (2, "invalid JSON"),
+        (4, "email already registered"),
+        (5, "email repeated in the file"),
+        (6, "unknown user_type 'PROFESSOR'"),
+        (7, "email"),
+    ]
+    assert batches == [2, 2, 3]
+
+    with users_database.connect() as conn:
+        created = {row.username: row for row in conn.execute(select(users).where(users.c.username != "taken"))}
+    assert set(created) == {"ana", "eva", "marta"}
+    assert hash_rounds(created["ana"].hashed_password) == onboarding_service.settings.bcrypt_rounds
+    assert created["eva"].hashed_password == UNUSABLE_PASSWORD
+    assert created["marta"].user_type_id == STUDENT.id
+
+
+def test_dry_run_inserts_nothing(users_database):
+    records = [(1, {"email": "ana@example.com", "username": "ana"})]
+
+    report = onboard_users(records, engine=users_database, workers=1, default_user_type="STUDENT", dry_run=True)
+
+    assert report.created == 1
+    with users_database.connect() as conn:
+        assert conn.execute(select(users.c.username)).scalars().all() == ["taken"]
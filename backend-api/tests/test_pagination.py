@@ -0,0 +1,168 @@
+"""
+Keyset pagination: signed cursors and page walks over an in-memory sqlite table
+"""
+
+from datetime import datetime, timedelta
+import uuid
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, Uuid, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from app.core.exceptions import InvalidCursor
+from app.repositories.base import NEXT, PREV, BaseRepository, cursor_scope, decode_cursor, encode_cursor
+
+START = datetime(2026, 10, 1, 9, 0, 0)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False)
+    group = Column(Integer, nullable=False)
+
+
+class OtherItem(Base):
+    __tablename__ = "other_items"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False)
+    group = Column(Integer, nullable=False)
+
+
+@pytest.fixture
+def repository():
+    """23 items over 10 timestamps, so several rows share a created_at and id breaks the tie"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add_all(
+            Item(id=uuid.uuid4(), created_at=START + timedelta(minutes=n % 10), group=n % 2)
+            for n in range(23)
+        )
+        db.commit()
+        yield BaseRepository(db, Item)
+
+
+def newest_first(db, stmt=None):
+    stmt = select(Item) if stmt is None else stmt
+    return list(db.scalars(stmt.order_by(Item.created_at.desc(), Item.id.desc())))
+
+
+def walk(repository, stmt=None, limit=5):
+    pages = [repository.paginate(stmt, limit=limit)]
+    while pages[-1].next_cursor:
+        pages.append(repository.paginate(stmt, cursor=pages[-1].next_cursor, limit=limit))
+    return pages
+
+
+# ----------------------------------------------------------------------
+# Cursors
+# ----------------------------------------------------------------------
+
+def test_cursor_round_trips():
+    id = uuid.uuid4()
+    cursor = encode_cursor(START, id, PREV)
+
+    assert decode_cursor(cursor) == (START, str(id), PREV)
+
+
+def test_tampered_cursor_is_rejected():
+    payload, signature = encode_cursor(START, uuid.uuid4(), NEXT).split(".")
+    forged = encode_cursor(START + timedelta(days=1), uuid.uuid4(), NEXT).split(".")[0]
+
+    with pytest.raises(InvalidCursor):
+        decode_cursor(f"{forged}.{signature}")
+    with pytest.raises(InvalidCursor):
+        decode_cursor(payload)
+
+
+def test_cursor_with_unknown_direction_is_rejected():
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor(START, uuid.uuid4(), "sideways"))
+
+
+def test_cursor_is_bound_to_its_scope():
+    scope = cursor_scope("Item", select(Item).where(Item.group == 1))
+    cursor = encode_cursor(START, uuid.uuid4(), NEXT, scope)
+
+    assert decode_cursor(cursor, scope)[0] == START
+    for other in (cursor_scope("OtherItem", select(Item).where(Item.group == 1)),
+                  cursor_scope("Item", select(Item).where(Item.group == 0)),
+                  cursor_scope("Item")):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, other)
+
+
+def test_scope_depends_on_the_filter_not_the_statement_object():
+    assert cursor_scope("Item", select(Item).where(Item.group == 1)) == cursor_scope("Item", select(Item).where(Item.group == 1))
+    assert cursor_scope("Item", select(Item)) == cursor_scope("Item")
+
+
+# ----------------------------------------------------------------------
+# Page walks
+# ----------------------------------------------------------------------
+
+def test_walking_forward_visits_every_row_once_in_order(repository):
+    pages = walk(repository)
+
+    assert [len(page.items) for page in pages] == [5, 5, 5, 5, 3]
+    assert [item.id for page in pages for item in page.items] == [item.id for item in newest_first(repository.db)]
+    assert pages[0].prev_cursor is None
+    assert all(page.prev_cursor for page in pages[1:])
+    assert pages[-1].next_cursor is None
+
+
+def test_walking_backward_returns_the_same_pages(repository):
+    pages = walk(repository)
+
+    page = pages[-1]
+    for expected in reversed(pages[:-1]):
+        page = repository.paginate(cursor=page.prev_cursor, limit=5)
+        assert [item.id for item in page.items] == [item.id for item in expected.items]
+        assert page.next_cursor
+    assert page.prev_cursor is None
+
+
+def test_filters_are_kept_across_pages(repository):
+    stmt = select(Item).where(Item.group == 1)
+
+    pages = walk(repository, stmt, limit=4)
+
+    assert [item.id for page in pages for item in page.items] == [item.id for item in newest_first(repository.db, stmt)]
+
+
+def test_exact_multiple_of_the_limit_has_no_empty_last_page(repository):
+    stmt = select(Item).where(Item.group == 0)   # 12 rows
+
+    pages = walk(repository, stmt, limit=4)
+
+    assert [len(page.items) for page in pages] == [4, 4, 4]
+
+
+def test_empty_result_has_no_cursors(repository):
+    page = repository.paginate(select(Item).where(Item.group == 7))
+
+    assert page.items == [] and page.next_cursor is None and page.prev_cursor is None
+
+
+def test_cursor_from_another_filter_is_rejected(repository):
+    cursor = repository.paginate(select(Item).where(Item.group == 1), limit=4).next_cursor
+
+    assert repository.paginate(select(Item).where(Item.group == 1), cursor=cursor, limit=4).items
+    with pytest.raises(InvalidCursor):
+        repository.paginate(select(Item).where(Item.group == 0), cursor=cursor, limit=4)
+    with pytest.raises(InvalidCursor):
+        repository.paginate(cursor=cursor, limit=4)
+
+
+def test_cursor_from_another_model_is_rejected(repository):
+    cursor = repository.paginate(limit=4).next_cursor
+
+    with pytest.raises(InvalidCursor):
+        BaseRepository(repository.db, OtherItem).paginate(cursor=cursor, limit=4)
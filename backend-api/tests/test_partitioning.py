@@ -0,0 +1,184 @@
+"""
+Partition maintenance against a scripted catalog (no Postgres)
+"""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import app.database.partitioning as partitioning
+import app.jobs.cleanup_jobs as cleanup_jobs
+from app.database.partitioning import PARTITIONED_TABLES, detach_partition, ensure_partitions, expired_partitions
+
+SPEC = PARTITIONED_TABLES["audit_logs"]
+
+
+class Result:
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self.value = scalar
+
+    def all(self):
+        return self.rows
+
+    def scalar(self):
+        return self.value
+
+
+class Catalog:
+    """Answers the catalog queries ensure_partitions runs and records the DDL"""
+
+    def __init__(self, bounds, default_rows_in=()):
+        self.bounds = bounds
+        self.default_rows_in = set(default_rows_in)
+        self.ddl = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if "pg_inherits" in sql:
+            return Result(self.bounds)
+        if "pg_partitioned_table" in sql:
+            return Result(scalar=True)
+        if sql.startswith("SELECT EXISTS"):
+            return Result(scalar=any(f">= '{month} " in sql for month in self.default_rows_in))
+        self.ddl.append(sql)
+        return Result()
+
+
+def bounds(*months):
+    return [
+        (f"audit_logs_p{lower:%Y%m}", f"FOR VALUES FROM ('{lower} 00:00:00+00') TO ('{upper} 00:00:00+00')")
+        for lower, upper in months
+    ]
+
+
+def test_creates_the_default_partition_when_missing():
+    catalog = Catalog(bounds((date(2026, 10, 1), date(2026, 11, 1))))
+
+    created = ensure_partitions(catalog, SPEC, today=date(2026, 10, 17), months_ahead=1)
+
+    assert created == ["audit_logs_default", "audit_logs_p202611"]
+    assert catalog.ddl[0].endswith('PARTITION OF "audit_logs" DEFAULT')
+
+
+def test_fills_the_gap_after_a_lapse_and_moves_rows_out_of_the_default():
+    catalog = Catalog(
+        bounds((date(2026, 7, 1), date(2026, 8, 1))) + [("audit_logs_default", "DEFAULT")],
+        default_rows_in={"2026-09-01"},
+    )
+
+    created = ensure_partitions(catalog, SPEC, today=date(2026, 10, 17), months_ahead=0)
+
+    assert created == ["audit_logs_p202608", "audit_logs_p202609", "audit_logs_p202610"]
+    moved = [sql for sql in catalog.ddl if "DELETE FROM" in sql]
+    assert len(moved) == 1
+    assert '"audit_logs_p202609"' in moved[0] and moved[0].startswith("BEGIN")
+    assert moved[0].index("INSERT INTO") < moved[0].index("ATTACH PARTITION")
+
+
+# ----------------------------------------------------------------------
+# Expiry
+# ----------------------------------------------------------------------
+
+class BusyCatalog(Catalog):
+    """The DETACH times out waiting for its lock the first `busy` times"""
+
+    def __init__(self, bounds, busy=0, pgcode="55P03"):
+        super().__init__(bounds)
+        self.busy = busy
+        self.pgcode = pgcode
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if "DETACH PARTITION" in sql and self.busy:
+            self.busy -= 1
+            self.ddl.append(sql)
+            raise OperationalError(sql, params, SimpleNamespace(pgcode=self.pgcode))
+        return super().execute(statement, params)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    waits = []
+    monkeypatch.setattr(partitioning.time, "sleep", waits.append)
+    return waits
+
+
+RETAINED = bounds(
+    (date(2024, 9, 1), date(2024, 10, 1)),
+    (date(2024, 10, 1), date(2024, 11, 1)),
+    (date(2024, 11, 1), date(2024, 12, 1)),
+) + [("audit_logs_default", "DEFAULT")]
+
+
+def test_expired_partitions_are_older_than_the_retention_window():
+    # audit_logs keeps 24 months: on 2026-11-17 everything before 2024-11 expires
+    expired = expired_partitions(Catalog(RETAINED), SPEC, today=date(2026, 11, 17))
+
+    assert expired == ["audit_logs_p202409", "audit_logs_p202410"]
+
+
+def test_detach_is_plain_and_bounded_by_a_lock_timeout():
+    catalog = Catalog([])
+
+    detach_partition(catalog, "audit_logs", "audit_logs_p202409", drop=True)
+
+    [sql] = catalog.ddl
+    assert "CONCURRENTLY" not in sql
+    assert sql.startswith("BEGIN") and sql.endswith("COMMIT")
+    assert sql.index("SET LOCAL lock_timeout") < sql.index('DETACH PARTITION "audit_logs_p202409"') < sql.index("DROP TABLE")
+
+
+def test_detach_retries_while_the_lock_is_busy(no_sleep):
+    catalog = BusyCatalog([], busy=2)
+
+    detach_partition(catalog, "audit_logs", "audit_logs_p202409", attempts=3)
+
+    assert [sql.split(";")[0] for sql in catalog.ddl] == ["BEGIN", "ROLLBACK", "BEGIN", "ROLLBACK", "BEGIN"]
+    assert no_sleep == [partitioning.DETACH_RETRY_DELAY, 2 * partitioning.DETACH_RETRY_DELAY]
+
+
+def test_detach_gives_up_after_the_last_attempt(no_sleep):
+    catalog = BusyCatalog([], busy=5)
+
+    with pytest.raises(OperationalError):
+        detach_partition(catalog, "audit_logs", "audit_logs_p202409", attempts=2)
+
+    assert catalog.ddl[-1] == "ROLLBACK"
+
+
+def test_other_errors_are_not_retried(no_sleep):
+    catalog = BusyCatalog([], busy=1, pgcode="42P01")
+
+    with pytest.raises(OperationalError):
+        detach_partition(catalog, "audit_logs", "audit_logs_p202409", attempts=3)
+
+    assert no_sleep == []
+
+
+def test_maintenance_detaches_expired_partitions_of_a_table_with_a_default(monkeypatch):
+    catalog = Catalog(RETAINED)
+
+    class Engine:
+        def connect(self):
+            return self
+
+        def execution_options(self, **options):
+            return self
+
+        def __enter__(self):
+            return catalog
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(cleanup_jobs, "engine", Engine())
+    monkeypatch.setattr(cleanup_jobs, "PARTITIONED_TABLES", {"audit_logs": SPEC})
+
+    report = cleanup_jobs.maintain_partitions(today=date(2026, 11, 17), months_ahead=0, expire_action="drop")
+
+    assert report["audit_logs"]["expired"] == ["audit_logs_p202409", "audit_logs_p202410"]
+    detached = [sql for sql in catalog.ddl if "DETACH PARTITION" in sql]
+    assert len(detached) == 2 and all("DROP TABLE" in sql and "CONCURRENTLY" not in sql for sql in detached)
@@ -0,0 +1,48 @@
+"""
+Authorization of the admin endpoints
+"""
+
+import pytest
+
+from app.core.permissions import Permission
+
+
+EXPORT_URL = "/api/v1/admin/reports/exports/analytics_events"
+
+
+def test_export_requires_authentication(client):
+    response = client.get(EXPORT_URL)
+    assert response.status_code == 401
+
+
+def test_export_requires_reports_export_permission(client, login_as):
+    login_as(Permission.REPORTS_READ)
+    response = client.get(EXPORT_URL)
+    assert response.status_code == 403
+
+
+def test_audit_log_export_also_requires_audit_read(client, login_as):
+    login_as(Permission.REPORTS_EXPORT)
+    response = client.get("/api/v1/admin/reports/exports/audit_logs")
+    assert response.status_code == 403
+    assert "audit.read" in response.json()["detail"]
+
+
+def test_unknown_dataset_is_checked_after_permissions(client, login_as):
+    login_as(Permission.REPORTS_EXPORT)
+    response = client.get("/api/v1/admin/reports/exports/users")
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("path", ["db-pool", "password-hasher", "activity-buffer", "ip-blocks"])
+def test_system_telemetry_requires_admin_access(client, login_as, path):
+    assert client.get(f"/api/v1/admin/system/{path}").status_code == 401
+    login_as(Permission.REPORTS_EXPORT)
+    assert client.get(f"/api/v1/admin/system/{path}").status_code == 403
+
+
+def test_system_telemetry_with_admin_access(client, login_as):
+    login_as(Permission.ADMIN_ACCESS)
+    response = client.get("/api/v1/admin/system/ip-blocks")
+    assert response.status_code == 200
+    assert "blocks" in response.json()
@@ -0,0 +1,169 @@
+"""
+Batched subtype loading: a constant number of queries for a mixed list,
+and the discriminator triggers (on Postgres when TEST_POSTGRES_URL is set)
+"""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import Column, ForeignKey, String, Uuid, create_engine, event, text
+from sqlalchemy.orm import DeclarativeBase, Session, relationship
+
+import app.database.polymorphic as polymorphic
+from app.database.polymorphic import BASE, CLASSIFY_FUNCTION, FAMILIES, MIXED, classify_trigger, load_subtypes
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+# Stand-ins with the shape of the real families: the real models only load
+# once every relationship in the tree configures
+class Project(Base):
+    __tablename__ = "projects"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    subtype = Column(String(20))
+    courses = relationship("Course", lazy="raise")
+    podcasts = relationship("Podcast", lazy="raise")
+
+
+class Course(Base):
+    __tablename__ = "courses"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    project_id = Column(Uuid, ForeignKey("projects.id"))
+
+
+class Podcast(Base):
+    __tablename__ = "podcasts"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    project_id = Column(Uuid, ForeignKey("projects.id"))
+
+
+class InventoryItem(Base):
+    __tablename__ = "inventory_items"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    subtype = Column(String(20))
+    equipment = relationship("Equipment", lazy="raise")
+    supplies = relationship("Supply", lazy="raise")
+
+
+class Equipment(Base):
+    __tablename__ = "equipments"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    inventory_item_id = Column(Uuid, ForeignKey("inventory_items.id"))
+
+
+class Supply(Base):
+    __tablename__ = "supplies"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    inventory_item_id = Column(Uuid, ForeignKey("inventory_items.id"))
+
+
+MODELS = {model.__name__: model for model in (Project, Course, Podcast, InventoryItem, Equipment, Supply)}
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(polymorphic, "_model", MODELS.__getitem__)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, sql, *args: statements.append(sql))
+    with Session(engine) as session:
+        session.statements = statements
+        yield session
+
+
+def mixed_list(db, base, subtypes, copies):
+    """`copies` parents of every kind: one per subtype, mixed, base-only and unclassified"""
+    first, second = subtypes
+    for _ in range(copies):
+        for kind, children in ((first.kind, [first]), (second.kind, [second]), (MIXED, [first, second]), (BASE, []), (None, [first])):
+            parent = base(id=uuid.uuid4(), subtype=kind)
+            db.add(parent)
+            for subtype in children:
+                db.add(MODELS[subtype.model](**{subtype.foreign_key: parent.id}))
+    db.commit()
+
+
+@pytest.mark.parametrize("family", ["Project", "InventoryItem"])
+@pytest.mark.parametrize("copies", [1, 40])
+def test_mixed_list_loads_in_one_query_per_subtype(db, family, copies):
+    subtypes = FAMILIES[family].subtypes
+    mixed_list(db, MODELS[family], subtypes, copies)
+    db.expire_all()
+    parents = db.query(MODELS[family]).all()
+    del db.statements[:]
+
+    loaded = load_subtypes(db, parents)
+
+    assert len(db.statements) == len(subtypes)
+    first, second = subtypes
+    # first: its own, mixed and unclassified parents; second: its own and mixed
+    assert loaded == {first.kind: 3 * copies, second.kind: 2 * copies}
+    for parent in parents:
+        counts = [len(getattr(parent, subtype.relationship)) for subtype in subtypes]
+        expected = {first.kind: [1, 0], second.kind: [0, 1], MIXED: [1, 1], BASE: [0, 0], None: [1, 0]}
+        assert counts == expected[parent.subtype]
+    assert len(db.statements) == len(subtypes)
+
+
+def test_single_kind_list_skips_the_other_subtype_table(db):
+    subtypes = FAMILIES["Project"].subtypes
+    mixed_list(db, Project, subtypes, 3)
+    courses_only = db.query(Project).filter(Project.subtype.in_(["course", BASE])).all()
+    del db.statements[:]
+
+    load_subtypes(db, courses_only)
+
+    assert len(db.statements) == 1 and "courses" in db.statements[0]
+    assert all(project.podcasts == [] for project in courses_only)
+
+
+# ----------------------------------------------------------------------
+# Triggers on a real Postgres
+# ----------------------------------------------------------------------
+
+@pytest.fixture
+def postgres():
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    engine = create_engine(url)
+    schema = f"test_polymorphic_{uuid.uuid4().hex[:8]}"
+    with engine.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+        conn.execute(text(f'SET search_path TO "{schema}"'))
+        conn.execute(text("CREATE TABLE projects (id uuid PRIMARY KEY, subtype varchar(20))"))
+        conn.execute(text(CLASSIFY_FUNCTION))
+        for subtype in FAMILIES["Project"].subtypes:
+            table = MODELS[subtype.model].__tablename__
+            conn.execute(text(f"CREATE TABLE {table} (id uuid PRIMARY KEY, project_id uuid REFERENCES projects (id))"))
+            conn.execute(text(classify_trigger("projects", table, subtype)))
+    with engine.connect() as conn:
+        conn.execute(text(f'SET search_path TO "{schema}"'))
+        conn.commit()
+        yield conn
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+def test_triggers_classify_parents(postgres):
+    conn = postgres
+    parent = uuid.uuid4()
+
+    def insert(table):
+        conn.execute(text(f"INSERT INTO {table} (id, project_id) VALUES (:id, :parent)"), {"id": uuid.uuid4(), "parent": parent})
+        conn.commit()
+        return conn.execute(text("SELECT subtype, xmin::text FROM projects WHERE id = :id"), {"id": parent}).one()
+
+    conn.execute(text("INSERT INTO projects (id, subtype) VALUES (:id, 'base')"), {"id": parent})
+    conn.commit()
+
+    assert insert("courses").subtype == "course"
+    mixed = insert("podcasts")
+    assert mixed.subtype == MIXED
+    # Already mixed: the trigger does not rewrite the row
+    assert insert("courses") == mixed
+    assert insert("podcasts") == mixed
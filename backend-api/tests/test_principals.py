@@ -0,0 +1,168 @@
+"""
+Principal cache: security stamps bumped by ORM commits, and tokens issued
+under an older stamp or revoked at logout
+"""
+
+from datetime import datetime, timedelta, timezone
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from sqlalchemy import Boolean, Column, DateTime, String, Uuid, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session
+
+import app.core.principals as principals
+from app.api.deps import get_current_principal
+from app.core.config import settings
+from app.core.principals import SECURITY_ATTRIBUTES, bump_security_stamp, principal_cache, revoke_token
+from app.services.auth.security_service import create_access_token
+from tests.conftest import make_principal
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class User(Base):
+    """Stand-in with the columns the commit hook watches (it matches on the class name)"""
+    __tablename__ = "users"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    full_name = Column(String(255))
+    hashed_password = Column(String(255))
+    locked_until = Column(DateTime(timezone=True))
+    is_active = Column(Boolean, default=True)
+    is_verified = Column(Boolean, default=False)
+    is_superuser = Column(Boolean, default=False)
+    user_type_id = Column(Uuid)
+    employee_role_id = Column(Uuid)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def cached(db):
+    """A committed user whose principal (superuser: no catalog lookups) is in the cache"""
+    user = User(id=uuid.uuid4(), hashed_password="x", user_type_id=uuid.uuid4())
+    db.add(user)
+    db.commit()
+    stamp, _ = principal_cache._state(user.id, None)
+    principal = make_principal(id=user.id, is_superuser=True, security_stamp=stamp)
+    principal_cache.put(principal)
+    return user, principal
+
+
+def cached_principal(user_id):
+    principal, _stamp, _revoked = principal_cache.get(user_id)
+    return principal
+
+
+# ----------------------------------------------------------------------
+# Commit-driven invalidation
+# ----------------------------------------------------------------------
+
+def test_stand_in_has_every_security_attribute():
+    assert set(SECURITY_ATTRIBUTES) <= set(User.__table__.c.keys())
+
+
+@pytest.mark.parametrize("attribute, value", [
+    ("hashed_password", "new hash"),
+    ("is_active", False),
+    ("user_type_id", uuid.uuid4()),
+])
+def test_committed_security_change_drops_the_cached_principal(db, cached, attribute, value):
+    user, principal = cached
+    assert cached_principal(user.id) == principal
+
+    setattr(user, attribute, value)
+    db.commit()
+
+    assert cached_principal(user.id) is None
+    assert principal_cache._state(user.id, None)[0] == principal.security_stamp + 1
+
+
+def test_other_changes_keep_the_cached_principal(db, cached):
+    user, principal = cached
+
+    user.full_name = "Ana María"
+    db.commit()
+
+    assert cached_principal(user.id) == principal
+
+
+def test_rolled_back_change_keeps_the_cached_principal(db, cached):
+    user, principal = cached
+
+    user.hashed_password = "new hash"
+    db.flush()
+    db.rollback()
+
+    assert cached_principal(user.id) == principal
+
+
+# ----------------------------------------------------------------------
+# Tokens
+# ----------------------------------------------------------------------
+
+@pytest.fixture
+def reloads(monkeypatch):
+    """Cache misses rebuild the principal at the current stamp instead of reading the database"""
+    loaded = []
+
+    def load_principal(user_id, security_stamp):
+        principal = make_principal(id=user_id, is_superuser=True, security_stamp=security_stamp)
+        principal_cache.put(principal)
+        loaded.append(principal)
+        return principal
+
+    monkeypatch.setattr(principals, "load_principal", load_principal)
+    return loaded
+
+
+def token_for(principal):
+    token, _lifetime = create_access_token(principal.id, principal_cache._state(principal.id, None)[0])
+    return token
+
+
+def test_token_from_before_a_stamp_bump_is_rejected(reloads):
+    principal = make_principal(is_superuser=True)
+    principal_cache.put(principal)
+    old_token = token_for(principal)
+    assert get_current_principal(old_token) == principal
+
+    bump_security_stamp(principal.id)
+
+    with pytest.raises(HTTPException) as rejected:
+        get_current_principal(old_token)
+    assert rejected.value.status_code == 401
+    # The same user signing in again gets a token at the new stamp
+    assert get_current_principal(token_for(principal)).security_stamp == 1
+    assert len(reloads) == 1
+
+
+def test_revoked_token_is_rejected_and_others_are_not(reloads):
+    principal = make_principal(is_superuser=True)
+    principal_cache.put(principal)
+    revoked, other = token_for(principal), token_for(principal)
+    claims = jwt.decode(revoked, settings.secret_key, algorithms=[settings.jwt_algorithm])
+
+    revoke_token(claims["jti"], claims["exp"])
+
+    with pytest.raises(HTTPException):
+        get_current_principal(revoked)
+    assert get_current_principal(other) == principal
+
+
+def test_locked_principal_is_forbidden(reloads):
+    principal = make_principal(is_superuser=True, locked_until=datetime.now(timezone.utc) + timedelta(hours=1))
+    principal_cache.put(principal)
+
+    with pytest.raises(HTTPException) as rejected:
+        get_current_principal(token_for(principal))
+    assert rejected.value.status_code == 403
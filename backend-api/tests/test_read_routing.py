@@ -0,0 +1,139 @@
+"""
+Replica routing with two sqlite files standing in for the primary and a replica
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, insert, select, text
+from sqlalchemy.orm import DeclarativeBase
+from starlette.requests import Request
+
+from app.database.session import READ_YOUR_WRITES_HEADER, ReplicaLagMonitor, RoutingSession, open_read_session
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(20), nullable=False)
+
+
+class LagMonitor(ReplicaLagMonitor):
+    """Lag set by the test instead of probed"""
+
+    def __init__(self, lag=0.0):
+        super().__init__(max_lag_seconds=5.0, check_interval=0.0)
+        self.current_lag = lag
+
+    def _probe(self, replica):
+        return self.current_lag
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """Primary and replica files, each holding one row that names it"""
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engines[name])
+        with engines[name].begin() as conn:
+            conn.execute(insert(Item).values(id=1, source=name))
+    return engines
+
+
+@pytest.fixture
+def monitor():
+    return LagMonitor()
+
+
+@pytest.fixture
+def session(databases, monitor):
+    db = RoutingSession(primary=databases["primary"], replicas=[databases["replica"]], monitor=monitor)
+    yield db
+    db.close()
+
+
+def source(db, stmt=None):
+    return db.execute(stmt if stmt is not None else select(Item.source).where(Item.id == 1)).scalar()
+
+
+def test_plain_reads_go_to_the_replica(session):
+    assert source(session) == "replica"
+    assert session.get(Item, 1).source == "replica"
+    assert not session.pinned_to_primary
+
+
+def test_a_flush_pins_the_session_to_the_primary(session):
+    assert source(session) == "replica"
+
+    session.add(Item(id=2, source="new"))
+    session.flush()
+
+    assert session.pinned_to_primary
+    assert source(session) == "primary"
+    assert session.execute(select(Item.source).where(Item.id == 2)).scalar() == "new"
+
+
+def test_core_writes_pin_the_session(session):
+    session.execute(insert(Item).values(id=3, source="core"))
+
+    assert source(session) == "primary"
+
+
+def test_locking_reads_go_to_the_primary(session):
+    assert source(session, select(Item.source).where(Item.id == 1).with_for_update()) == "primary"
+
+
+def test_raw_sql_goes_to_the_primary_unless_marked_read_only(session):
+    # SELECT ... FOR UPDATE or a SELECT calling a writing function look like reads
+    assert source(session, text("SELECT source FROM items WHERE id = 1")) == "primary"
+    session.close()
+
+    read_only = text("SELECT source FROM items WHERE id = 1").execution_options(read_only=True)
+    assert source(session, read_only) == "replica"
+
+
+def test_statements_marked_as_writes_go_to_the_primary(session):
+    stmt = select(Item.source).where(Item.id == 1).execution_options(read_only=False)
+
+    assert source(session, stmt) == "primary"
+    assert session.pinned_to_primary
+
+
+def test_lagging_replica_falls_back_to_the_primary(session, monitor):
+    monitor.current_lag = 30.0
+
+    assert source(session) == "primary"
+    assert not session.pinned_to_primary
+
+
+def test_replica_choice_is_sticky_and_reset_on_close(session, monitor):
+    assert source(session) == "replica"
+    monitor.current_lag = 30.0
+    assert source(session) == "replica"
+
+    session.close()
+
+    assert source(session) == "primary"
+
+
+def test_primary_reads_block(session):
+    with session.primary_reads():
+        assert source(session) == "primary"
+    assert source(session) == "replica"
+
+
+def request_with(headers):
+    return Request({"type": "http", "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()]})
+
+
+@pytest.mark.parametrize("header, pinned", [({}, False), ({READ_YOUR_WRITES_HEADER: "1"}, True), ({READ_YOUR_WRITES_HEADER: "no"}, False)])
+def test_read_your_writes_header_pins_the_request(header, pinned):
+    db = open_read_session(request_with(header))
+    try:
+        assert db.pinned_to_primary is pinned
+    finally:
+        db.close()
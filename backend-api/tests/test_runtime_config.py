@@ -0,0 +1,63 @@
+"""
+Runtime configuration: reloads follow the Redis version both ways
+"""
+
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+import app.core.runtime_config as runtime_config
+import app.database.connection as connection
+from app.models import Configuration
+from app.models.app_settings.configuration import ConfigurationType
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+table = Configuration.__table__
+
+
+@pytest.fixture
+def config_database(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    table.create(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(
+            id=uuid.uuid4(), key="max_upload_mb", value="10", type=ConfigurationType.INTEGER,
+            is_encrypted=False, created_at=now, updated_at=now,
+        ))
+    monkeypatch.setattr(connection, "engine", engine)
+    monkeypatch.setattr(runtime_config, "_snapshot", None)
+    return engine
+
+
+def test_reload_applies_a_lower_version_after_a_counter_reset(config_database, monkeypatch):
+    monkeypatch.setattr(runtime_config, "_current_version", lambda: 42)
+    assert runtime_config.reload_config()["max_upload_mb"] == 10
+
+    with config_database.begin() as conn:
+        conn.execute(update(table).values(value="20"))
+    monkeypatch.setattr(runtime_config, "_current_version", lambda: 1)
+    snapshot = runtime_config.reload_config()
+
+    assert snapshot.version == 1
+    assert runtime_config.config_value("max_upload_mb") == 20
+
+
+def test_reload_message_with_a_lower_version_reloads(config_database, monkeypatch):
+    monkeypatch.setattr(runtime_config, "_current_version", lambda: 42)
+    runtime_config.reload_config()
+
+    monkeypatch.setattr(runtime_config, "_current_version", lambda: 1)
+    runtime_config._on_reload_message("1")
+
+    assert runtime_config.get_config().version == 1